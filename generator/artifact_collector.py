@@ -119,6 +119,7 @@ class ArtifactCollector:
             orchestrator_dir / 'config_loader.py',
             orchestrator_dir / 'metrics_collector.py',
             orchestrator_dir / 'manifest_manager.py',
+            orchestrator_dir / 'manifest_store.py',
             orchestrator_dir / 'validator.py',
             orchestrator_dir / 'archiver.py',
             orchestrator_dir / 'usage_reconciler.py',
@@ -731,16 +731,16 @@ import time
 logger = get_logger(__name__)
 reconciler = UsageReconciler()
 
-# Load manifest directly from standalone experiment path
+# Query the manifest database of the standalone experiment
+# (manifest.json next to it is only an export)
+from src.orchestrator.manifest_store import ManifestStore
 manifest_path = Path("runs/manifest.json")
-if not manifest_path.exists():
+if not manifest_path.exists() and not manifest_path.with_suffix(".db").exists():
     print("No runs found in this experiment.")
     sys.exit(0)
 
-with open(manifest_path, 'r') as f:
-    manifest = json.load(f)
-
-all_runs = manifest.get("runs", [])
+with ManifestStore(manifest_path) as store:
+    all_runs = store.find()
 
 if not all_runs:
     print("No runs found in this experiment.")
@@ -1032,6 +1032,7 @@ import time
 from datetime import datetime, timedelta
 sys.path.insert(0, str(Path.cwd()))
 
+from src.orchestrator.manifest_store import ManifestStore
 from src.orchestrator.usage_reconciler import UsageReconciler
 from src.utils.logger import get_logger
 
@@ -1052,19 +1053,18 @@ def get_run_age(run_id, framework):
     # Get age of run from manifest
     try:
         manifest_path = Path("runs/manifest.json")
-        if not manifest_path.exists():
+        if not manifest_path.exists() and not manifest_path.with_suffix(".db").exists():
             return None
         
-        with open(manifest_path, 'r') as f:
-            manifest = json.load(f)
+        with ManifestStore(manifest_path) as store:
+            run_entry = store.get(run_id)
         
-        for run_entry in manifest.get("runs", []):
-            if run_entry['run_id'] == run_id and run_entry['framework'] == framework:
-                start_time_str = run_entry.get('start_time')
-                if start_time_str:
-                    start_time_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                    start_timestamp = start_time_dt.timestamp()
-                    return time.time() - start_timestamp
+        if run_entry and run_entry['framework'] == framework:
+            start_time_str = run_entry.get('start_time')
+            if start_time_str:
+                start_time_dt = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
+                start_timestamp = start_time_dt.timestamp()
+                return time.time() - start_timestamp
         return None
     except Exception:
         return None
@@ -1072,14 +1072,12 @@ def get_run_age(run_id, framework):
 try:
     # First, get list of pending runs to show total count
     manifest_path = Path("runs/manifest.json")
-    if not manifest_path.exists():
+    if not manifest_path.exists() and not manifest_path.with_suffix(".db").exists():
         print("✅ No runs found in this experiment.")
         sys.exit(0)
     
-    with open(manifest_path, 'r') as f:
-        manifest = json.load(f)
-    
-    all_runs = manifest.get("runs", [])
+    with ManifestStore(manifest_path) as store:
+        all_runs = store.find()
     if not all_runs:
         print("✅ No runs found in this experiment.")
         sys.exit(0)
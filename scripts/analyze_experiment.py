@@ -15,10 +15,16 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any
 from collections import defaultdict
 import statistics
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.run_metrics_table import RunMetricsTable, as_json_number, load_run_metrics_table
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -26,77 +32,47 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_run_metrics(run_dir: Path) -> Dict[str, Any]:
-    """Load metrics from a single run directory."""
-    metrics_file = run_dir / "metrics.json"
-    if not metrics_file.exists():
-        logger.warning(f"Metrics file not found: {metrics_file}")
-        return None
-    
-    try:
-        with open(metrics_file, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load {metrics_file}: {e}")
-        return None
+# Metric → step field summed when a run has no top-level value
+STEP_TOTALS = {
+    "duration_total": "duration_seconds",
+    "cost_total": "cost",
+    "api_calls_total": "api_calls",
+    "tokens_total": "tokens_used",
+}
 
 
-def aggregate_framework_metrics(framework_dir: Path) -> Dict[str, Any]:
+def aggregate_framework_metrics(run_table: RunMetricsTable, framework_name: str) -> Dict[str, Any]:
     """Aggregate metrics across all runs for a framework."""
-    logger.info(f"Analyzing framework: {framework_dir.name}")
-    
-    # Find all run directories (UUIDs)
-    run_dirs = [d for d in framework_dir.iterdir() if d.is_dir()]
-    logger.info(f"Found {len(run_dirs)} runs for {framework_dir.name}")
+    logger.info(f"Analyzing framework: {framework_name}")
     
-    # Collect metrics from all runs
-    all_runs = []
-    for run_dir in run_dirs:
-        metrics = load_run_metrics(run_dir)
-        if metrics:
-            all_runs.append(metrics)
+    runs = run_table.for_framework(framework_name)
+    logger.info(f"Found {len(runs)} runs for {framework_name}")
     
-    if not all_runs:
-        logger.warning(f"No valid metrics found for {framework_dir.name}")
+    if not len(runs):
+        logger.warning(f"No valid metrics found for {framework_name}")
         return {}
     
-    logger.info(f"Loaded {len(all_runs)} valid runs for {framework_dir.name}")
+    logger.info(f"Loaded {len(runs)} valid runs for {framework_name}")
     
     # Aggregate statistics
     aggregated = {
-        "num_runs": len(all_runs),
-        "execution_time": aggregate_metric(all_runs, "duration_total"),
-        "total_cost_usd": aggregate_metric(all_runs, "cost_total"),
-        "api_calls": aggregate_metric(all_runs, "api_calls_total"),
-        "tokens_total": aggregate_metric(all_runs, "tokens_total"),
+        "num_runs": len(runs),
+        "execution_time": aggregate_metric(runs, "duration_total"),
+        "total_cost_usd": aggregate_metric(runs, "cost_total"),
+        "api_calls": aggregate_metric(runs, "api_calls_total"),
+        "tokens_total": aggregate_metric(runs, "tokens_total"),
     }
     
     return aggregated
 
 
-def aggregate_metric(runs: List[Dict], metric_name: str) -> Dict[str, float]:
+def aggregate_metric(runs: RunMetricsTable, metric_name: str) -> Dict[str, float]:
     """Calculate statistics for a specific metric across runs."""
-    values = []
-    
-    for run in runs:
-        # Try to find the metric in the run data
-        value = None
-        
-        # Check top-level
-        if metric_name in run:
-            value = run[metric_name]
-        # Check if it's a computed total from steps
-        elif metric_name == "duration_total" and "steps" in run:
-            value = sum(step.get("duration_seconds", 0) for step in run["steps"])
-        elif metric_name == "cost_total" and "steps" in run:
-            value = sum(step.get("cost", 0) for step in run["steps"])
-        elif metric_name == "api_calls_total" and "steps" in run:
-            value = sum(step.get("api_calls", 0) for step in run["steps"])
-        elif metric_name == "tokens_total" and "steps" in run:
-            value = sum(step.get("tokens_used", 0) for step in run["steps"])
-        
-        if value is not None:
-            values.append(value)
+    # Top-level value, else the total over the run's steps
+    values = runs.top(metric_name)
+    if metric_name in STEP_TOTALS:
+        values = np.where(np.isnan(values), runs.step_sum(STEP_TOTALS[metric_name]), values)
+    values = [as_json_number(value) for value in values[~np.isnan(values)]]
     
     if not values:
         logger.warning(f"No values found for metric: {metric_name}")
@@ -200,11 +176,14 @@ def main():
     framework_dirs = [d for d in runs_dir.iterdir() if d.is_dir()]
     logger.info(f"Found {len(framework_dirs)} frameworks: {[d.name for d in framework_dirs]}")
     
+    # Parse run files once (only new or changed ones since the last analysis)
+    run_table = load_run_metrics_table(runs_dir)
+    
     # Aggregate metrics for each framework
     frameworks_data = {}
     for framework_dir in framework_dirs:
         framework_name = framework_dir.name
-        aggregated = aggregate_framework_metrics(framework_dir)
+        aggregated = aggregate_framework_metrics(run_table, framework_name)
         if aggregated:
             frameworks_data[framework_name] = aggregated
     
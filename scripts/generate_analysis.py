@@ -30,6 +30,8 @@ from collections import defaultdict
 from typing import Optional
 import json
 
+import numpy as np
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -42,6 +44,7 @@ from src.analysis.report_generator import (
 from src.analysis.visualization_factory import VisualizationFactory
 from src.orchestrator.config_loader import load_config
 from src.utils.logger import get_logger
+from src.utils.run_metrics_table import as_json_number, load_run_metrics_table
 from src.orchestrator.manifest_manager import get_manifest, find_runs
 from src.utils.experiment_paths import ExperimentPaths, ExperimentNotFoundError
 
@@ -84,6 +87,23 @@ def load_run_data(runs_dir: Path, experiment_name: Optional[str] = None) -> tupl
     
     logger.info("Found %d runs in manifest", len(all_runs))
     
+    # Parse run files once (only new or changed ones since the last analysis)
+    run_table = load_run_metrics_table(runs_dir)
+    table_rows = run_table.row_index()
+    
+    # Map lowercase step fields to uppercase metric names
+    metric_mapping = {
+        'api_calls': 'API_CALLS',
+        'tokens_in': 'TOK_IN',
+        'tokens_out': 'TOK_OUT',
+        'duration_seconds': 'duration_seconds'
+    }
+    step_numbers = run_table.step('step_number')
+    step_values = {
+        metric_name: run_table.step(step_field)
+        for step_field, metric_name in metric_mapping.items()
+    }
+    
     # Load metrics for each run
     for run_entry in all_runs:
         framework_name = run_entry['framework']
@@ -97,52 +117,39 @@ def load_run_data(runs_dir: Path, experiment_name: Optional[str] = None) -> tupl
             logger.warning("Metrics file not found for run %s: %s", run_id, metrics_file)
             continue
         
-        try:
-            with open(metrics_file, 'r', encoding='utf-8') as f:
-                metrics = json.load(f)
-            
-            # ✅ FILTER: Only include runs with verified reconciliation status
-            reconciliation = metrics.get('usage_api_reconciliation', {})
-            verification_status = reconciliation.get('verification_status', 'none')
-            
-            if verification_status != 'verified':
-                logger.warning(
-                    "Skipping run %s: reconciliation status '%s' (not verified)",
-                    run_id, verification_status
-                )
-                continue
-            
-            # Extract aggregate metrics for analysis (only numeric metrics)
-            if 'aggregate_metrics' in metrics:
-                frameworks_data[framework_name].append(metrics['aggregate_metrics'])
-            else:
-                logger.warning("No aggregate_metrics found in run %s", run_id)
-            
-            # Load step-by-step data for timeline charts
-            # Collect values from ALL runs for later aggregation
-            if 'steps' in metrics and isinstance(metrics['steps'], list):
-                for step in metrics['steps']:
-                    step_num = step.get('step_number')
-                    if step_num is not None:
-                        # Map lowercase step fields to uppercase metric names
-                        metric_mapping = {
-                            'api_calls': 'API_CALLS',
-                            'tokens_in': 'TOK_IN',
-                            'tokens_out': 'TOK_OUT',
-                            'duration_seconds': 'duration_seconds'
-                        }
-                        # Collect all step-level metrics across runs
-                        for step_field, metric_name in metric_mapping.items():
-                            if step_field in step:
-                                # Append value to list for aggregation
-                                timeline_data[framework_name][step_num][metric_name].append(step[step_field])
-        
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse %s: %s", metrics_file, e)
+        row = table_rows.get((framework_name, run_id))
+        if row is None:
+            logger.error("Failed to parse %s", metrics_file)
             continue
-        except (IOError, KeyError) as e:
-            logger.error("Error loading %s: %s", metrics_file, e)
+        
+        # ✅ FILTER: Only include runs with verified reconciliation status
+        verification_status = str(run_table['reconciliation_status'][row]) or 'none'
+        
+        if verification_status != 'verified':
+            logger.warning(
+                "Skipping run %s: reconciliation status '%s' (not verified)",
+                run_id, verification_status
+            )
             continue
+        
+        # Extract aggregate metrics for analysis (only numeric metrics)
+        if run_table['has_aggregate'][row]:
+            frameworks_data[framework_name].append(run_table.aggregate_row(row))
+        else:
+            logger.warning("No aggregate_metrics found in run %s", run_id)
+        
+        # Load step-by-step data for timeline charts
+        # Collect values from ALL runs for later aggregation
+        for step in range(len(step_numbers))[run_table.step_slice(row)]:
+            if np.isnan(step_numbers[step]):
+                continue
+            step_num = as_json_number(step_numbers[step])
+            for metric_name, values in step_values.items():
+                if not np.isnan(values[step]):
+                    # Append value to list for aggregation
+                    timeline_data[framework_name][step_num][metric_name].append(
+                        as_json_number(values[step])
+                    )
     
     if not frameworks_data:
         logger.error("No valid metrics loaded from manifest runs")
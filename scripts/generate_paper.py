@@ -32,6 +32,7 @@ except ImportError:
 
 from src.paper_generation.paper_generator import PaperGenerator
 from src.paper_generation.models import PaperConfig
+from src.paper_generation.prose_cache import PROSE_CACHE_MODES
 from src.paper_generation.exceptions import PaperGenerationError
 
 
@@ -132,6 +133,28 @@ Examples:
         help='Temperature for AI generation (0.0-1.0, default: 0.7)'
     )
     
+    parser.add_argument(
+        '--prose-cache',
+        choices=PROSE_CACHE_MODES,
+        default='readwrite',
+        help='Prompt-hash response cache: reuse unchanged sections (readwrite, default), '
+             'disable it (off), or rebuild fully offline from the cache (replay)'
+    )
+    
+    parser.add_argument(
+        '--prose-cache-dir',
+        type=Path,
+        default=None,
+        help='Prose cache directory (default: <experiment_dir>/.prose_cache, shared by all output dirs)'
+    )
+    
+    parser.add_argument(
+        '--section-workers',
+        type=int,
+        default=4,
+        help='Sections generated concurrently (default: 4, 1 = sequential)'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -187,7 +210,10 @@ def main():
             temperature=args.temperature,
             prose_level=args.prose_level,
             skip_latex=args.skip_latex,
-            figures_only=args.figures_only
+            figures_only=args.figures_only,
+            prose_cache=args.prose_cache,
+            prose_cache_dir=args.prose_cache_dir or args.experiment_dir / ".prose_cache",
+            section_workers=args.section_workers
         )
         
         logger.info("Configuration:")
@@ -197,6 +223,7 @@ def main():
         logger.info("  Prose level: %s", config.prose_level)
         logger.info("  Skip LaTeX: %s", config.skip_latex)
         logger.info("  Figures only: %s", config.figures_only)
+        logger.info("  Prose cache: %s (%s)", config.prose_cache, config.prose_cache_dir)
         
         # Create generator
         generator = PaperGenerator(config)
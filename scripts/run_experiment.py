@@ -134,6 +134,9 @@ def run_experiment(experiment_name: str, framework: str = "all", experiments_bas
             # Execute run
             result = runner.execute_single_run()
             
+            # Keep manifest.json current for external tools
+            runner.export_manifest()
+            
             # Update registry
             registry.increment_run_count(experiment_name, fw_name)
             
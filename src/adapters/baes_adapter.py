@@ -19,11 +19,19 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
 from src.adapters.base_adapter import BaseAdapter
+from src.adapters.baes_kernel_worker import (
+    BAeSKernelWorker,
+    KernelWorkerError,
+    KernelWorkerTimeout
+)
 from src.utils.logger import get_logger
 from src.utils.text import parse_json_from_output
 
 logger = get_logger(__name__, component="adapter")
 
+KERNEL_REQUEST_TIMEOUT = 300  # 5 minute timeout per request
+MAX_WORKER_FAILURES = 2  # Worker crashes before falling back to cold starts for the run
+
 
 class BAeSAdapter(BaseAdapter):
     """Adapter for Business Autonomous Entities (BAEs) framework.
@@ -34,6 +42,12 @@ class BAeSAdapter(BaseAdapter):
     - Uses the official BAEs CLI interface
     - Handles any natural language request dynamically
     - Future-proof against internal API changes
+    
+    By default requests are served by a persistent kernel worker
+    (BAeSKernelWorker) that keeps the kernel warm between steps; if the
+    worker cannot start or dies before receiving a request, the request
+    falls back to a cold CLI start. Set ``persistent_kernel: false`` in the framework config to
+    always use the CLI.
     """
     
     def __init__(
@@ -54,6 +68,9 @@ class BAeSAdapter(BaseAdapter):
         self.hitl_text = None
         self.current_step = 0
         self.last_execution_error = None  # Track last framework execution error for debugging
+        self.process = None  # Kernel worker process (terminated by the runner on timeout)
+        self.kernel_worker = None
+        self._worker_failures = 0
         
     def start(self) -> None:
         """Initialize BAEs adapter with shared framework resources."""
@@ -121,6 +138,128 @@ class BAeSAdapter(BaseAdapter):
         return None
     
     def _execute_kernel_request(self, request: str, start_servers: bool = False) -> dict:
+        """Execute a BAEs kernel request.
+        
+        Uses the persistent kernel worker when enabled, falling back to a
+        cold CLI start if the worker is unavailable.
+        
+        Args:
+            request: Natural language request
+            start_servers: Whether to start API/UI servers
+            
+        Returns:
+            Dictionary with 'success' and 'result' or 'error'
+        """
+        if self.config.get('persistent_kernel', True):
+            result = self._execute_with_worker(request, start_servers)
+            if result is not None:
+                return result
+        
+        return self._execute_cli_request(request, start_servers)
+    
+    def _ensure_kernel_worker(self) -> BAeSKernelWorker:
+        """Return a healthy kernel worker, (re)starting it if needed.
+        
+        Returns:
+            Running kernel worker
+            
+        Raises:
+            KernelWorkerError: If the worker cannot be started
+        """
+        worker = self.kernel_worker
+        if worker is not None and worker.is_alive() and worker.ping():
+            return worker
+        
+        if worker is not None:
+            logger.warning("BAEs kernel worker unhealthy, restarting",
+                          extra={'run_id': self.run_id, 'step': self.current_step})
+            worker.stop()
+        
+        worker = BAeSKernelWorker(self.python_path, self.framework_dir, self.run_id)
+        self.kernel_worker = worker
+        self.process = None
+        worker.start()
+        self.process = worker.process
+        return worker
+    
+    def _execute_with_worker(self, request: str, start_servers: bool) -> Optional[dict]:
+        """Execute a request on the persistent kernel worker.
+        
+        Args:
+            request: Natural language request
+            start_servers: Whether to start API/UI servers
+            
+        Returns:
+            Result dictionary, or None if the caller should fall back to a
+            cold CLI start (the worker failed before the request reached it)
+        """
+        if self._worker_failures >= MAX_WORKER_FAILURES:
+            return None
+        
+        context_store_path = str(self.database_dir / "context_store.json")
+        try:
+            worker = self._ensure_kernel_worker()
+        except KernelWorkerError as e:
+            # Failed (re)start: the request never reached a worker
+            return self._handle_worker_failure(e, request_sent=False)
+        
+        try:
+            return worker.execute(
+                request,
+                context_store_path,
+                start_servers,
+                timeout=KERNEL_REQUEST_TIMEOUT
+            )
+        except KernelWorkerTimeout:
+            # The worker may be stuck inside the kernel; replace it next time
+            worker.stop()
+            return {
+                'success': False,
+                'error': 'Request execution timed out after 5 minutes'
+            }
+        except KernelWorkerError as e:
+            return self._handle_worker_failure(e, request_sent=e.request_sent)
+    
+    def _handle_worker_failure(self, error: KernelWorkerError, request_sent: bool) -> Optional[dict]:
+        """Record a kernel worker failure and stop the worker.
+        
+        Args:
+            error: Worker failure
+            request_sent: Whether the request had been delivered to the worker
+            
+        Returns:
+            None to fall back to a cold CLI start if the request never reached
+            the worker, otherwise a failed result (the request may have run,
+            so a CLI replay could apply it twice)
+        """
+        self._worker_failures += 1
+        self.last_execution_error = {
+            'type': 'KERNEL_WORKER_FAILURE',
+            'error': str(error)
+        }
+        logger.warning(
+            "BAEs kernel worker crashed during the request" if request_sent
+            else "BAEs kernel worker failed, falling back to cold start",
+            extra={
+                'run_id': self.run_id,
+                'step': self.current_step,
+                'metadata': {
+                    'error': str(error),
+                    'failures': self._worker_failures
+                }
+            }
+        )
+        if self.kernel_worker is not None:
+            self.kernel_worker.stop()
+        
+        if request_sent:
+            return {
+                'success': False,
+                'error': f'Kernel worker crashed during the request: {error}'
+            }
+        return None
+    
+    def _execute_cli_request(self, request: str, start_servers: bool = False) -> dict:
         """Execute a BAEs kernel request using the non-interactive CLI.
         
         Args:
@@ -148,11 +287,11 @@ class BAeSAdapter(BaseAdapter):
             cmd.append("--start-servers")
         
         try:
-            result = subprocess.run(
+            # Tracked child: killed with its process group if the step is cancelled
+            result = self.run_child_process(
                 cmd,
-                capture_output=True,
                 text=True,
-                timeout=300,  # 5 minute timeout per request
+                timeout=KERNEL_REQUEST_TIMEOUT,
                 cwd=str(self.framework_dir),
                 env=os.environ.copy()
             )
@@ -315,6 +454,13 @@ class BAeSAdapter(BaseAdapter):
     def stop(self) -> None:
         logger.info("Stopping BAEs framework", extra={'run_id': self.run_id})
         
+        if self.kernel_worker is not None:
+            # Release the run's warm kernels (and their servers) before exiting
+            self.kernel_worker.evict()
+            self.kernel_worker.stop()
+            self.kernel_worker = None
+            self.process = None
+        
         # Deprecated kernel cleanup (kept for compatibility but not used with CLI)
         if hasattr(self, '_kernel') and self._kernel:
             if hasattr(self._kernel, '_managed_system_manager'):
@@ -0,0 +1,285 @@
+"""
+Persistent BAEs kernel worker client.
+
+Starts baes_kernel_wrapper.py in ``--serve`` mode with the framework venv's
+Python and keeps it alive for the whole run, so interpreter startup and
+kernel imports are paid once instead of once per request. Requests and
+responses are framed as one JSON object per line over the worker's
+stdin/stdout pipes.
+
+The BAeSAdapter falls back to the one-shot CLI execution path when the worker
+fails before a request was delivered (failed start, broken pipe). A crash
+after delivery is reported as a failed request instead, since replaying it
+could execute it twice.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.deadline import terminate_process_tree
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="adapter")
+
+WRAPPER_SCRIPT = Path(__file__).parent / "baes_kernel_wrapper.py"
+STARTUP_TIMEOUT = 60  # seconds (covers kernel imports on a cold venv)
+PING_TIMEOUT = 5  # seconds
+STOP_GRACE_PERIOD = 5  # seconds
+STDERR_TAIL_LINES = 200
+
+
+class KernelWorkerError(RuntimeError):
+    """Raised when the kernel worker crashed or violated the protocol."""
+
+    def __init__(self, message: str, request_sent: bool = False):
+        """
+        Args:
+            message: Error description
+            request_sent: True if the request reached the worker's stdin, so
+                          it may have started (or even finished) executing
+        """
+        super().__init__(message)
+        self.request_sent = request_sent
+
+
+class KernelWorkerTimeout(KernelWorkerError):
+    """Raised when the kernel worker did not answer before the deadline."""
+
+
+class BAeSKernelWorker:
+    """Long-lived BAEs kernel process serving JSON-line requests."""
+
+    def __init__(
+        self,
+        python_path: Path,
+        framework_dir: Path,
+        run_id: str,
+        wrapper_script: Path = WRAPPER_SCRIPT
+    ):
+        """
+        Initialize kernel worker (the process is started by start()).
+
+        Args:
+            python_path: Python executable of the BAEs framework venv
+            framework_dir: Path to BAEs framework directory
+            run_id: Run identifier for logging
+            wrapper_script: Path to baes_kernel_wrapper.py
+        """
+        self.python_path = Path(python_path)
+        self.framework_dir = Path(framework_dir)
+        self.run_id = run_id
+        self.wrapper_script = Path(wrapper_script)
+        self.process: Optional[subprocess.Popen] = None
+        self._responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def start(self, timeout: float = STARTUP_TIMEOUT) -> None:
+        """
+        Start the worker process and wait until it answers a ping.
+
+        Args:
+            timeout: Seconds to wait for the first ping response
+
+        Raises:
+            KernelWorkerError: If the process cannot be started or does not respond
+        """
+        cmd = [
+            str(self.python_path),
+            str(self.wrapper_script.absolute()),
+            "--serve",
+            str(self.framework_dir.absolute())
+        ]
+        try:
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                cwd=str(self.framework_dir),
+                env=os.environ.copy(),
+                start_new_session=True
+            )
+        except OSError as e:
+            raise KernelWorkerError(f"Failed to start kernel worker: {e}") from e
+
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+        self.request({'op': 'ping'}, timeout=timeout)
+        logger.info("BAEs kernel worker started",
+                   extra={'run_id': self.run_id,
+                         'metadata': {'pid': self.process.pid}})
+
+    def _read_stdout(self) -> None:
+        """Forward protocol lines to the response queue (None on EOF)."""
+        for line in self.process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    def _read_stderr(self) -> None:
+        """Keep the tail of the worker's stderr for error reporting."""
+        for line in self.process.stderr:
+            self._stderr_tail.append(line.rstrip('\n'))
+
+    def is_alive(self) -> bool:
+        """Return True if the worker process is running."""
+        return self.process is not None and self.process.poll() is None
+
+    def stderr_tail(self, lines: int = 20) -> str:
+        """Return the last lines the worker wrote to stderr."""
+        return '\n'.join(list(self._stderr_tail)[-lines:])
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send one message and wait for its response.
+
+        Args:
+            message: Protocol message (an 'id' is assigned automatically)
+            timeout: Seconds to wait for the response
+
+        Returns:
+            Decoded response dictionary
+
+        Raises:
+            KernelWorkerTimeout: If no response arrives before the deadline
+            KernelWorkerError: If the worker died or sent an invalid response
+                               (request_sent tells whether the message was delivered)
+        """
+        with self._lock:
+            if not self.is_alive():
+                raise KernelWorkerError("Kernel worker is not running")
+
+            self._next_id += 1
+            message = dict(message, id=self._next_id)
+            try:
+                self.process.stdin.write(json.dumps(message) + '\n')
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                raise KernelWorkerError(f"Kernel worker pipe closed: {e}") from e
+
+            while True:
+                try:
+                    line = self._responses.get(timeout=timeout)
+                except queue.Empty:
+                    raise KernelWorkerTimeout(
+                        f"Kernel worker did not respond within {timeout}s",
+                        request_sent=True
+                    )
+                if line is None:
+                    raise KernelWorkerError(
+                        f"Kernel worker exited unexpectedly: {self.stderr_tail()}",
+                        request_sent=True
+                    )
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise KernelWorkerError(f"Invalid worker response: {e}",
+                                            request_sent=True) from e
+                # Responses to earlier (abandoned) requests are discarded
+                if response.get('id') == message['id']:
+                    response.pop('id', None)
+                    return response
+
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """
+        Check that the worker is alive and responsive.
+
+        Args:
+            timeout: Seconds to wait for the ping response
+
+        Returns:
+            True if the worker answered the ping
+        """
+        try:
+            return self.request({'op': 'ping'}, timeout=timeout).get('success', False)
+        except KernelWorkerError:
+            return False
+
+    def execute(
+        self,
+        request: str,
+        context_store_path: str,
+        start_servers: bool,
+        timeout: float
+    ) -> Dict[str, Any]:
+        """
+        Execute a natural language request in the warm kernel.
+
+        The current environment is forwarded with every request because the
+        orchestrator updates sprint-specific paths between steps.
+
+        Args:
+            request: Natural language request
+            context_store_path: Path to context store JSON file
+            start_servers: Whether to start API/UI servers
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Dictionary with 'success' and 'result' or 'error' (same shape as
+            the wrapper's one-shot mode)
+
+        Raises:
+            KernelWorkerTimeout: If the request exceeds the timeout
+            KernelWorkerError: If the worker crashed; with request_sent set
+                               the request may already have run
+        """
+        return self.request(
+            {
+                'op': 'execute',
+                'request': request,
+                'context_store_path': context_store_path,
+                'start_servers': start_servers,
+                'env': dict(os.environ)
+            },
+            timeout=timeout
+        )
+
+    def evict(self, context_store_path: Optional[str] = None,
+              timeout: float = STOP_GRACE_PERIOD) -> int:
+        """
+        Drop warm kernels (and the servers they manage) in the worker.
+
+        Args:
+            context_store_path: Kernel to evict (default: all kernels)
+            timeout: Seconds to wait for the response
+
+        Returns:
+            Number of kernels evicted (0 if the worker is not running)
+        """
+        try:
+            response = self.request({'op': 'evict', 'context_store_path': context_store_path},
+                                    timeout=timeout)
+        except KernelWorkerError:
+            return 0
+        return (response.get('result') or {}).get('evicted', 0)
+
+    def stop(self, grace_period: float = STOP_GRACE_PERIOD) -> None:
+        """
+        Stop the worker, asking it to exit before terminating it.
+
+        Args:
+            grace_period: Seconds to wait for a clean exit before signalling
+        """
+        if not self.is_alive():
+            return
+
+        try:
+            self.request({'op': 'shutdown'}, timeout=grace_period)
+            self.process.wait(timeout=grace_period)
+        except (KernelWorkerError, subprocess.TimeoutExpired):
+            pass
+
+        terminate_process_tree(self.process, grace_period, run_id=self.run_id)
+        logger.info("BAEs kernel worker stopped",
+                   extra={'run_id': self.run_id,
+                         'metadata': {'pid': self.process.pid}})
@@ -1,12 +1,58 @@
 """
 Wrapper script to execute BAEs kernel in its isolated virtual environment.
 This script is executed by the BAeSAdapter using subprocess with the venv's Python.
+
+Two modes are supported:
+- One-shot: ``wrapper.py <framework_dir> <context_store_path> <request> <start_servers>``
+  executes a single request and prints the JSON result.
+- Persistent worker: ``wrapper.py --serve <framework_dir>`` keeps the kernel
+  imported (and the kernel of the current context store warm) and serves
+  requests framed as one JSON object per line on stdin, answering one JSON
+  line per request on stdout. See handle_message() for the protocol.
 """
 import sys
 import json
 import os
 from pathlib import Path
 
+# Warm kernels for the persistent worker, keyed by context store path.
+# Holds at most one kernel: the orchestrator gives every sprint a new
+# context store, so a new path means the previous kernel is finished.
+_kernels = {}
+
+
+def create_kernel(framework_dir: str, context_store_path: str):
+    """Import the BAEs kernel from the framework directory and create one.
+    
+    Shared by the one-shot and persistent modes so both set up kernels the
+    same way.
+    
+    Args:
+        framework_dir: Path to BAEs framework directory
+        context_store_path: Path to context store JSON file
+        
+    Returns:
+        EnhancedRuntimeKernel instance
+    """
+    if framework_dir not in sys.path:
+        sys.path.insert(0, framework_dir)
+    from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
+    return EnhancedRuntimeKernel(context_store_path)
+
+
+def success_response(result) -> dict:
+    """Build the response for a successful operation."""
+    return {'success': True, 'result': result}
+
+
+def error_response(error: Exception) -> dict:
+    """Build the response for a failed operation."""
+    return {
+        'success': False,
+        'error': str(error),
+        'error_type': type(error).__name__
+    }
+
 
 def execute_request(framework_dir: str, context_store_path: str, request: str, start_servers: bool) -> dict:
     """Execute a natural language request using BAEs kernel.
@@ -18,16 +64,10 @@ def execute_request(framework_dir: str, context_store_path: str, request: str, s
         start_servers: Whether to start API/UI servers
         
     Returns:
-        Dictionary with success status and result
+        Dictionary with success status and result (see success_response/error_response)
     """
-    # Add framework to path
-    sys.path.insert(0, framework_dir)
-    
     try:
-        from baes.core.enhanced_runtime_kernel import EnhancedRuntimeKernel
-        
-        # Initialize kernel
-        kernel = EnhancedRuntimeKernel(context_store_path)
+        kernel = create_kernel(framework_dir, context_store_path)
         
         # Process request
         result = kernel.process_natural_language_request(
@@ -35,20 +75,140 @@ def execute_request(framework_dir: str, context_store_path: str, request: str, s
             start_servers=start_servers
         )
         
-        return {
-            'success': True,
-            'result': result
-        }
+        return success_response(result)
         
     except Exception as e:
-        return {
-            'success': False,
-            'error': str(e),
-            'error_type': type(e).__name__
-        }
+        return error_response(e)
+
+
+def _get_kernel(framework_dir: str, context_store_path: str):
+    """Return a warm kernel for the context store, creating it on first use.
+    
+    Switching to a new context store (next sprint) evicts the previous
+    kernel first, so it does not stay resident or keep its servers (and
+    their ports) running while the next sprint executes.
+    """
+    kernel = _kernels.get(context_store_path)
+    if kernel is None:
+        evict_kernels()
+        kernel = create_kernel(framework_dir, context_store_path)
+        _kernels[context_store_path] = kernel
+    return kernel
+
+
+def evict_kernels(context_store_path: str = None) -> int:
+    """Drop warm kernels and stop the servers they manage.
+    
+    Args:
+        context_store_path: Kernel to evict (default: all kernels)
+        
+    Returns:
+        Number of kernels evicted
+    """
+    if context_store_path is None:
+        paths = list(_kernels)
+    else:
+        paths = [context_store_path] if context_store_path in _kernels else []
+    
+    for path in paths:
+        kernel = _kernels.pop(path)
+        manager = getattr(kernel, '_managed_system_manager', None)
+        if manager is not None and hasattr(manager, 'stop_servers'):
+            try:
+                manager.stop_servers()
+            except Exception as e:
+                print(f"Failed to stop servers of kernel {path}: {e}", file=sys.stderr)
+    return len(paths)
+
+
+def handle_message(framework_dir: str, message: dict) -> dict:
+    """Handle one protocol message of the persistent worker.
+    
+    Every response has the one-shot mode's shape ({"success": true,
+    "result": ...} or {"success": false, "error": str, "error_type": str})
+    plus the request id.
+    
+    Messages:
+        {"id": n, "op": "ping"}
+            -> result {"pid": <pid>, "kernels": <count>}
+        {"id": n, "op": "execute", "request": str, "context_store_path": str,
+         "start_servers": bool, "env": {...}}
+            -> result of the kernel request
+        {"id": n, "op": "evict", "context_store_path": str or null}
+            -> result {"evicted": <count>} (null evicts every kernel)
+        {"id": n, "op": "shutdown"}
+            -> result {"evicted": <count>} (all kernels are evicted)
+    
+    Args:
+        framework_dir: Path to BAEs framework directory
+        message: Decoded request message
+        
+    Returns:
+        Response dictionary (echoing the request id)
+    """
+    op = message.get('op')
+    try:
+        if op == 'ping':
+            response = success_response({'pid': os.getpid(), 'kernels': len(_kernels)})
+        elif op == 'evict':
+            response = success_response({'evicted': evict_kernels(message.get('context_store_path'))})
+        elif op == 'shutdown':
+            response = success_response({'evicted': evict_kernels()})
+        elif op == 'execute':
+            # Environment mirrors the orchestrator's (sprint paths change between steps)
+            os.environ.update(message.get('env') or {})
+            kernel = _get_kernel(framework_dir, message['context_store_path'])
+            response = success_response(kernel.process_natural_language_request(
+                request=message['request'],
+                start_servers=message.get('start_servers', False)
+            ))
+        else:
+            raise ValueError(f'Unknown op: {op}')
+    except Exception as e:
+        response = error_response(e)
+    
+    response['id'] = message.get('id')
+    return response
+
+
+def serve(framework_dir: str) -> None:
+    """Run the persistent worker loop until shutdown or EOF on stdin.
+    
+    The original stdout is reserved for protocol responses; anything the
+    kernel prints (including child processes) is redirected to stderr.
+    
+    Args:
+        framework_dir: Path to BAEs framework directory
+    """
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as e:
+            message = {}
+            response = dict(error_response(ValueError(f'Invalid JSON: {e}')), id=None)
+        else:
+            if not isinstance(message, dict):
+                message = {}
+            response = handle_message(framework_dir, message)
+        
+        protocol_out.write(json.dumps(response, default=str) + '\n')
+        protocol_out.flush()
+        
+        if message.get('op') == 'shutdown':
+            break
 
 
 if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--serve':
+        serve(sys.argv[2])
+        sys.exit(0)
+    
     if len(sys.argv) != 5:
         print(json.dumps({
             'success': False,
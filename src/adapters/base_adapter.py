@@ -6,6 +6,7 @@ Defines the contract that all framework adapters must implement.
 
 from abc import ABC, abstractmethod
 import subprocess
+import threading
 import time
 import os
 import re
@@ -14,6 +15,10 @@ from pathlib import Path
 from typing import Any, Dict, Tuple, Optional
 from datetime import datetime, timezone
 from src.utils.logger import get_logger
+from src.utils.openai_client import get_openai_client, OpenAIClientError
+from src.utils.call_ledger import record_call
+from src.utils.content_store import IncrementalCopier
+from src.utils.deadline import StepCancelled, terminate_process_tree
 
 logger = get_logger(__name__, component="adapter")
 
@@ -43,11 +48,17 @@ class BaseAdapter(ABC):
         self.run_id = run_id
         self.workspace_path = workspace_path
         self.current_step = 0
+        self.current_phase: Optional[str] = None  # Recorded in the call ledger (e.g. GHSpec phases)
         self._step_start_time: Optional[float] = None  # Track step execution start time
         
         # Sprint-aware properties (US1: Sprint Architecture)
         self._sprint_num = sprint_num
         self._run_dir = Path(run_dir) if run_dir else None
+        
+        # Step cancellation (set by the runner when a step misses its deadline)
+        self.cancel_event = threading.Event()
+        self._child_processes: set = set()
+        self._child_processes_lock = threading.Lock()
     
     # =============================================================================
     # Sprint-Aware Properties (US1: Sprint Architecture)
@@ -81,6 +92,18 @@ class BaseAdapter(ABC):
         from src.utils.isolation import get_previous_sprint_artifacts
         return get_previous_sprint_artifacts(self._run_dir, self._sprint_num)
     
+    def artifact_copier(self) -> IncrementalCopier:
+        """
+        Create a copier for the current sprint's generated artifacts.
+        
+        Files unchanged since the previous sprint's snapshot are cloned from
+        their blobs; only changed files are copied from the framework output.
+        
+        Returns:
+            IncrementalCopier for this sprint
+        """
+        return IncrementalCopier(self._run_dir, self._sprint_num)
+    
     @property
     def sprint_log_dir(self) -> Optional[Path]:
         """
@@ -97,6 +120,88 @@ class BaseAdapter(ABC):
         sprint_path = sprint_dir(self._run_dir, self._sprint_num)
         return sprint_path / "logs"
     
+    # =============================================================================
+    # Step Cancellation
+    # =============================================================================
+    
+    def run_child_process(
+        self,
+        cmd: list,
+        timeout: Optional[float] = None,
+        grace_period: float = 5.0,
+        **kwargs: Any
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a framework subprocess that cancel() can kill.
+        
+        Drop-in replacement for subprocess.run(cmd, capture_output=True, ...):
+        the child leads its own session (so its whole process group can be
+        signalled) and is tracked on the adapter while it runs.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before the process group is killed and
+                subprocess.TimeoutExpired is raised
+            grace_period: Seconds between SIGTERM and SIGKILL on timeout
+            **kwargs: Further subprocess.Popen arguments (cwd, env, text, stdin)
+            
+        Returns:
+            CompletedProcess with captured stdout and stderr
+            
+        Raises:
+            StepCancelled: If the step was cancelled before or while it ran
+            subprocess.TimeoutExpired: If the process exceeded `timeout`
+        """
+        self.raise_if_cancelled()
+        kwargs.pop('capture_output', None)
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            start_new_session=True, **kwargs
+        )
+        with self._child_processes_lock:
+            self._child_processes.add(process)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            terminate_process_tree(process, grace_period, run_id=self.run_id)
+            process.communicate()
+            raise
+        finally:
+            with self._child_processes_lock:
+                self._child_processes.discard(process)
+        self.raise_if_cancelled()
+        return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+    
+    def raise_if_cancelled(self) -> None:
+        """
+        Cooperative cancellation point for step code.
+        
+        Raises:
+            StepCancelled: If cancel() was called for the current step
+        """
+        if self.cancel_event.is_set():
+            raise StepCancelled(f"Step {self.current_step} of run {self.run_id} was cancelled")
+    
+    def cancel(self, grace_period: float) -> None:
+        """
+        Cancel the running step (called by the runner on timeout).
+        
+        Sets cancel_event, then terminates the process group of every child
+        started with run_child_process() and of `self.process` (if any),
+        escalating to SIGKILL after the grace period.
+        
+        Args:
+            grace_period: Seconds between SIGTERM and SIGKILL
+        """
+        self.cancel_event.set()
+        with self._child_processes_lock:
+            processes = list(self._child_processes)
+        process = getattr(self, 'process', None)
+        if process is not None and process not in processes:
+            processes.append(process)
+        for process in processes:
+            terminate_process_tree(process, grace_period, run_id=self.run_id)
+    
     # =============================================================================
     # API Key Validation (FR-011: Validate Unique API Keys)
     # =============================================================================
@@ -191,6 +296,12 @@ class BaseAdapter(ABC):
         - Model from parameter or config (gpt-4o-mini default)
         - Temperature: Only included if explicitly provided (otherwise uses OpenAI's default)
         
+        When the adapter has a run directory, the call's token usage, latency
+        and model are appended to the run's call ledger (llm_calls.jsonl).
+        
+        The request is made exactly once (max_retries=0): any API failure
+        propagates immediately, as required by the fail-fast contract (T063).
+        
         Args:
             system_prompt: System role instructions
             user_prompt: User message/request
@@ -203,6 +314,8 @@ class BaseAdapter(ABC):
             
         Raises:
             RuntimeError: If API key not found or API call fails
+            StepCancelled: If the step was cancelled (checked before and after
+                the request, so a timed-out step stops at its next call)
             
         Example:
             response = self.call_openai_chat_completion(
@@ -210,7 +323,7 @@ class BaseAdapter(ABC):
                 user_prompt="Write a hello world function"
             )
         """
-        import requests
+        self.raise_if_cancelled()
         
         # Get API key from environment
         api_key_env = self.config.get('api_key_env')
@@ -224,23 +337,10 @@ class BaseAdapter(ABC):
         # Use provided model or default to gpt-4o-mini
         model_name = model or "gpt-4o-mini"
         
-        # Build request
-        url = "https://api.openai.com/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "model": model_name,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        }
-        
-        # Only include temperature if explicitly provided
-        if temperature is not None:
-            payload["temperature"] = temperature
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
         
         logger.debug(
             "Calling OpenAI Chat Completion API",
@@ -257,12 +357,27 @@ class BaseAdapter(ABC):
         )
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=timeout)
-            response.raise_for_status()
-            
-            result = response.json()
+            # Shared pooled client: keep-alive connections and per-key limits,
+            # but no retries (T063 fail-fast: a retry would mask the failure)
+            started_at = time.time()
+            result = get_openai_client().chat_completion(
+                api_key,
+                messages,
+                model=model_name,
+                temperature=temperature,
+                timeout=timeout,
+                max_retries=0
+            )
+            ended_at = time.time()
             assistant_message = result['choices'][0]['message']['content']
             
+            if self._run_dir:
+                record_call(
+                    self._run_dir, result, model_name, started_at, ended_at,
+                    step=self.current_step, sprint=self._sprint_num, phase=self.current_phase
+                )
+            self.raise_if_cancelled()
+            
             logger.debug(
                 "OpenAI API call successful",
                 extra={
@@ -276,7 +391,7 @@ class BaseAdapter(ABC):
             
             return assistant_message
             
-        except requests.exceptions.RequestException as e:
+        except (OpenAIClientError, KeyError, IndexError) as e:
             logger.error(
                 "OpenAI API call failed",
                 extra={
@@ -1104,6 +1219,7 @@ class BaseAdapter(ABC):
             return 0
         
         copied_count = 0
+        copier = self.artifact_copier()
         
         try:
             # Choose iteration method based on recursive flag
@@ -1118,8 +1234,8 @@ class BaseAdapter(ABC):
                     # Create parent directories if needed
                     dest.parent.mkdir(parents=True, exist_ok=True)
                     
-                    # Copy file
-                    shutil.copy2(item, dest)
+                    # Clone unchanged files from the previous sprint's blobs, copy the rest
+                    copier.copy(item, dest)
                     copied_count += 1
                     
                     logger.debug(f"Copied artifact: {rel_path}",
@@ -1130,7 +1246,8 @@ class BaseAdapter(ABC):
                              'metadata': {
                                  'source': str(source_dir),
                                  'dest': str(dest_dir),
-                                 'files_copied': copied_count
+                                 'files_copied': copied_count,
+                                 'files_reused': copier.reused
                              }})
             
             return copied_count
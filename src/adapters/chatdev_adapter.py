@@ -148,6 +148,9 @@ class ChatDevAdapter(BaseAdapter):
         # Copy to workspace directory (where validation expects files)
         workspace_dir = Path(self.workspace_path)
         
+        # Files unchanged since the previous sprint are cloned from their blobs
+        copier = self.artifact_copier()
+        
         # Copy each matching project directory
         for project_dir in project_dirs:
             try:
@@ -156,11 +159,11 @@ class ChatDevAdapter(BaseAdapter):
                 for item in project_dir.iterdir():
                     dest = workspace_dir / item.name
                     if item.is_file():
-                        shutil.copy2(item, dest)
+                        copier.copy(item, dest)
                     elif item.is_dir():
                         if dest.exists():
                             shutil.rmtree(dest)
-                        shutil.copytree(item, dest)
+                        shutil.copytree(item, dest, copy_function=copier.copy)
                 
                 file_count = len(list(workspace_dir.rglob('*')))
                 logger.info("Copied ChatDev artifacts to workspace",
@@ -168,7 +171,8 @@ class ChatDevAdapter(BaseAdapter):
                                 'metadata': {
                                     'source': str(project_dir),
                                     'destination': str(workspace_dir),
-                                    'files_copied': file_count
+                                    'files_copied': file_count,
+                                    'files_reused': copier.reused
                                 }})
             except Exception as e:
                 logger.error("Failed to copy ChatDev artifacts",
@@ -314,10 +318,10 @@ class ChatDevAdapter(BaseAdapter):
                                'total_env_vars': len(env)}})
         
         try:
-            result = subprocess.run(
+            # Tracked child: killed with its process group if the step is cancelled
+            result = self.run_child_process(
                 cmd,
                 cwd=self.framework_dir,
-                capture_output=True,
                 stdin=subprocess.DEVNULL,
                 text=True,
                 timeout=600,  # 10 minutes per step
@@ -0,0 +1,220 @@
+"""
+Token-budgeted context packing for GHSpec prompts.
+
+Spec sections, plan sections and previous-sprint code files are split into
+chunks and indexed by keyword once (a ContextIndex per document or per
+sprint's artifacts). For each prompt, chunks are ranked by BM25 relevance to
+the task (its target file, description and goal; or an error message) and
+packed greedily until a token budget is used up. Prompt size is bounded by
+the budget, however many sections or files earlier sprints produced.
+
+Token counts use a local estimate (about four characters per token for
+English text and code), so packing never calls a tokenizer service.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Average characters per token of GPT tokenizers on English text and code
+CHARS_PER_TOKEN = 4
+
+# Lines per chunk when splitting code files
+CODE_CHUNK_LINES = 60
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Score multiplier for chunks of the task's target file
+TARGET_FILE_BOOST = 3.0
+
+TRUNCATION_MARKER = "\n\n[... excerpt truncated ...]"
+
+TERM_RE = re.compile(r'[a-z][a-z0-9]+')
+
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'into', 'are', 'was',
+    'will', 'should', 'must', 'have', 'has', 'not', 'all', 'any', 'each', 'use',
+    'file', 'create', 'implement', 'add', 'task'
+})
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of text (no tokenizer needed)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def terms(text: str) -> List[str]:
+    """Lower-cased keyword terms of text (identifiers are split on _ and /)."""
+    return [t for t in TERM_RE.findall(text.lower().replace('_', ' ')) if t not in STOP_WORDS]
+
+
+@dataclass
+class ContextChunk:
+    """
+    One packable piece of context.
+
+    Attributes:
+        source: Document or file the chunk comes from (e.g. "spec.md", "models/user.py")
+        text: Chunk text as it is placed in the prompt
+        position: Order of the chunk within its index (ties keep document order)
+    """
+    source: str
+    text: str
+    position: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+def truncate_chunk(chunk: ContextChunk, budget_tokens: int) -> ContextChunk:
+    """Copy of a chunk cut to fit budget_tokens, ending with a truncation marker."""
+    keep = max(budget_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER), 0)
+    return ContextChunk(source=chunk.source, text=chunk.text[:keep] + TRUNCATION_MARKER, position=chunk.position)
+
+
+def markdown_chunks(content: str, source: str) -> List[ContextChunk]:
+    """
+    Split a markdown document into sections at ## (or deeper) headers.
+
+    Args:
+        content: Markdown text
+        source: Document name recorded on the chunks
+
+    Returns:
+        Non-empty sections in document order
+    """
+    sections = re.split(r'\n(?=##+ )', content)
+    return [
+        ContextChunk(source=source, text=section.strip(), position=i)
+        for i, section in enumerate(s for s in sections if s.strip())
+    ]
+
+
+def code_chunks(root: Path, dirs: Sequence[str], suffixes: Iterable[str]) -> List[ContextChunk]:
+    """
+    Split the code files under root/dirs into line windows.
+
+    Args:
+        root: Artifacts directory
+        dirs: Subdirectories to scan (missing ones are skipped)
+        suffixes: File suffixes to include (e.g. ".py")
+
+    Returns:
+        Chunks rendered as "File: path (lines a-b)" plus a fenced excerpt,
+        ordered by path and line
+    """
+    suffixes = set(suffixes)
+    chunks: List[ContextChunk] = []
+    for code_dir in dirs:
+        base = root / code_dir
+        if not base.exists():
+            continue
+        for file_path in sorted(base.rglob("*")):
+            if not file_path.is_file() or file_path.suffix not in suffixes:
+                continue
+            relative = file_path.relative_to(root).as_posix()
+            lines = file_path.read_text(encoding='utf-8', errors='ignore').splitlines()
+            for start in range(0, max(len(lines), 1), CODE_CHUNK_LINES):
+                window = lines[start:start + CODE_CHUNK_LINES]
+                end = start + len(window)
+                text = f"File: {relative} (lines {start + 1}-{end})\n```\n" + "\n".join(window) + "\n```"
+                chunks.append(ContextChunk(source=relative, text=text, position=len(chunks)))
+    return chunks
+
+
+class ContextIndex:
+    """Keyword (BM25) index over a fixed set of chunks."""
+
+    def __init__(self, chunks: List[ContextChunk]):
+        """
+        Index chunks (terms are counted once, at construction).
+
+        Args:
+            chunks: Chunks to rank; source paths are indexed with the text
+        """
+        self.chunks = chunks
+        self._term_counts = [Counter(terms(f"{c.source} {c.text}")) for c in chunks]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._average_length = (sum(self._lengths) / len(chunks)) if chunks else 0.0
+        document_frequency: Counter = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+        n = len(chunks)
+        self._idf: Dict[str, float] = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def score(self, query: str, target_file: Optional[str] = None) -> List[float]:
+        """
+        BM25 score of every chunk for a query.
+
+        Args:
+            query: Task text (target file, description, goal, error message)
+            target_file: Chunks of this file (or its stem) are boosted
+
+        Returns:
+            One score per chunk, in index order
+        """
+        query_terms = set(terms(query))
+        target_stem = Path(target_file).stem.lower() if target_file else None
+        scores = []
+        for chunk, counts, length in zip(self.chunks, self._term_counts, self._lengths):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self._average_length) if self._average_length else BM25_K1
+            score = sum(
+                self._idf[t] * counts[t] * (BM25_K1 + 1) / (counts[t] + norm)
+                for t in query_terms if t in counts
+            )
+            if target_stem and Path(chunk.source).stem.lower() == target_stem:
+                score = (score + 1.0) * TARGET_FILE_BOOST
+            scores.append(score)
+        return scores
+
+    def pack(
+        self,
+        query: str,
+        budget_tokens: int,
+        target_file: Optional[str] = None,
+        include_unmatched: bool = False
+    ) -> List[ContextChunk]:
+        """
+        Most relevant chunks that fit within a token budget.
+
+        Chunks are taken greedily by descending score (ties in document
+        order); a chunk that does not fit is skipped and smaller ones may
+        still be added. If the best chunk alone exceeds the budget, it is
+        truncated to the budget instead.
+
+        Args:
+            query: Task text to rank chunks against
+            budget_tokens: Maximum estimated tokens of the packed chunks
+            target_file: Task's target file (its chunks are boosted)
+            include_unmatched: Also pack chunks that match no query term
+
+        Returns:
+            Packed chunks in document order
+        """
+        scores = self.score(query, target_file)
+        ranked = sorted(range(len(self.chunks)), key=lambda i: (-scores[i], i))
+        packed, used = [], 0
+        for i in ranked:
+            if scores[i] <= 0 and not include_unmatched:
+                break
+            chunk = self.chunks[i]
+            if not packed and chunk.tokens > budget_tokens:
+                chunk = truncate_chunk(chunk, budget_tokens)
+            if used + chunk.tokens <= budget_tokens:
+                packed.append(chunk)
+                used += chunk.tokens
+        return sorted(packed, key=lambda c: c.position)
+
+
+def render_chunks(chunks: List[ContextChunk], separator: str = "\n\n") -> str:
+    """Join packed chunks into prompt text."""
+    return separator.join(chunk.text for chunk in chunks)
@@ -9,13 +9,59 @@ import time
 import os
 import re
 import shutil
+import hashlib
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from src.adapters.base_adapter import BaseAdapter
+from src.adapters.context_packer import (
+    ContextIndex,
+    code_chunks,
+    markdown_chunks,
+    render_chunks
+)
+from src.adapters.prompt_layout import PromptLayout, split_template
+from src.adapters.task_graph import (
+    build_task_dependencies,
+    extract_task_references,
+    run_task_graph
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__, component="adapter")
 
+# Tasks implemented concurrently in Phase 4 (override with task_concurrency in config)
+DEFAULT_TASK_CONCURRENCY = 4
+
+# Estimated-token budgets of packed prompt context (override with
+# excerpt_budget_tokens / previous_code_budget_tokens in config)
+DEFAULT_EXCERPT_BUDGET_TOKENS = 500
+DEFAULT_PREVIOUS_CODE_BUDGET_TOKENS = 1500
+
+# Previous sprint code considered for incremental context
+PREVIOUS_CODE_DIRS = ("models", "api", "tests")
+PREVIOUS_CODE_SUFFIXES = ('.py', '.js', '.ts', '.java', '.go')
+
+# Files listed by name in the tasks phase before the list is summarized
+MAX_CODE_SUMMARY_FILES = 40
+
+# Per-call placeholders of the implement and bugfix user prompt templates; all
+# other template text is identical across a phase's calls and goes first
+TASK_PROMPT_FIELDS = (
+    'task_description', 'file_path', 'task_goal',
+    'spec_excerpt', 'plan_excerpt', 'current_file_content'
+)
+BUGFIX_PROMPT_FIELDS = (
+    'error_message', 'file_path', 'current_file_content',
+    'spec_excerpt', 'original_task_description'
+)
+
+# Ordering hints in tasks.md, e.g. "**Depends on**: Task 2", "After TASK-003"
+DEPENDENCY_HINT_RE = re.compile(
+    r'\b(?:depends\s+on|dependencies|dependency|requires|after)\b\**\s*:?\**\s*(.+)',
+    re.IGNORECASE
+)
+
 
 class GHSpecAdapter(BaseAdapter):
     """
@@ -32,7 +78,13 @@ class GHSpecAdapter(BaseAdapter):
     - **Single-threaded execution only**: This adapter does not support concurrent 
       experiment runs. All experiment executions must be sequential. The adapter 
       maintains instance-level state (cached constitution, templates, phase context) 
-      that is not thread-safe.
+      that is not thread-safe. The only internal concurrency is Phase 4, where
+      independent tasks are generated on a bounded thread pool
+      (`task_concurrency`, default 4) and committed in task order.
+    - **Bounded prompt context**: Spec/plan excerpts and previous sprint code
+      are ranked by relevance and packed into token budgets
+      (`excerpt_budget_tokens`, `previous_code_budget_tokens`), so prompts do
+      not grow with the number of sprints.
     - **Fail-fast on API errors**: Any OpenAI API failure (network error, rate limit, 
       timeout) immediately aborts the entire experiment run without retries. This 
       ensures clear failure attribution and data integrity.
@@ -99,6 +151,12 @@ class GHSpecAdapter(BaseAdapter):
         # Tech stack constraints (optional)
         self.tech_stack_constraints = None
         
+        # Keyword indexes for context packing, built once per document
+        # {(source, content digest): ContextIndex} and per previous sprint
+        self._context_indexes: Dict[Tuple[str, str], ContextIndex] = {}
+        self._context_index_lock = threading.Lock()
+        self._previous_sprint_context = None  # (artifacts path, context, code index)
+        
     def start(self) -> None:
         """
         Initialize GitHub Spec-kit framework and setup workspace structure.
@@ -475,6 +533,7 @@ class GHSpecAdapter(BaseAdapter):
         
         # Load template with caching
         system_prompt, user_prompt_template = self._load_prompt_template(phase)
+        self.current_phase = phase
         
         # Inject constitution into system prompt (T021: Constitution integration)
         system_prompt_with_constitution = f"""{system_prompt}
@@ -563,6 +622,7 @@ Follow these coding standards and principles throughout the specification:
         
         # Load template
         system_prompt, user_prompt_template = self._load_prompt_template(phase)
+        self.current_phase = phase
         
         # Inject constitution + tech stack constraints (T030: Tech stack injection)
         tech_stack_guidance = ""
@@ -674,6 +734,7 @@ Follow these coding standards and principles in your technical plan:
         
         # Load template
         system_prompt, user_prompt_template = self._load_prompt_template(phase)
+        self.current_phase = phase
         
         # Inject constitution
         system_prompt_with_constitution = f"""{system_prompt}
@@ -962,6 +1023,7 @@ Generate tasks that adhere to these coding standards:
         
         # Load prompt template with caching (T005/T006)
         system_prompt, user_prompt_template = self._load_prompt_template(phase)
+        self.current_phase = phase
         
         # Build complete user prompt with context
         user_prompt = self._build_phase_prompt(phase, user_prompt_template, command_text)
@@ -1203,7 +1265,7 @@ Previous Sprint Plan:
 {previous_context['plan']}
 
 Existing Code Files:
-{previous_context['code_files']}
+{self._pack_previous_code(spec_content) or previous_context['code_files']}
 
 Instructions for Technical Plan:
 1. MUST use the exact same tech stack as previous sprint
@@ -1299,6 +1361,11 @@ Instructions for Task Breakdown:
         - Previous sprint's generated code (to build upon)
         - Key entities/models from previous sprint
         
+        Previous sprint code is split into chunks and keyword-indexed once per
+        artifacts directory (the loaded context is cached); 'code_files' holds
+        the code packed into `previous_code_budget_tokens`. Use
+        _pack_previous_code() to pack the code most relevant to a query.
+        
         Returns:
             Dictionary with previous sprint context, or None if unavailable
         """
@@ -1313,6 +1380,10 @@ Instructions for Task Breakdown:
                                }})
             return None
         
+        cached = self._previous_sprint_context
+        if cached is not None and cached[0] == prev_artifacts:
+            return cached[1]
+        
         try:
             context = {}
             
@@ -1336,35 +1407,36 @@ Instructions for Task Breakdown:
                 context['plan'] = "No previous plan found"
                 context['tech_stack'] = "No tech stack defined"
             
-            # Load previous generated code files
-            prev_models_dir = prev_artifacts / "models"
-            prev_api_dir = prev_artifacts / "api"
-            prev_tests_dir = prev_artifacts / "tests"
-            
+            # Index previous generated code (chunked by file and line window)
+            code_index = ContextIndex(code_chunks(prev_artifacts, PREVIOUS_CODE_DIRS, PREVIOUS_CODE_SUFFIXES))
             code_files = []
-            for code_dir in [prev_models_dir, prev_api_dir, prev_tests_dir]:
-                if code_dir.exists():
-                    for file_path in code_dir.rglob("*"):
-                        if file_path.is_file() and file_path.suffix in ['.py', '.js', '.ts', '.java', '.go']:
+            for code_dir in PREVIOUS_CODE_DIRS:
+                if (prev_artifacts / code_dir).exists():
+                    for file_path in sorted((prev_artifacts / code_dir).rglob("*")):
+                        if file_path.is_file() and file_path.suffix in PREVIOUS_CODE_SUFFIXES:
                             code_files.append({
-                                'path': str(file_path.relative_to(prev_artifacts)),
-                                'content': file_path.read_text(encoding='utf-8', errors='ignore')
+                                'path': file_path.relative_to(prev_artifacts).as_posix(),
+                                'size': file_path.stat().st_size
                             })
             
-            # Create code summary (limit to avoid token explosion)
+            # Pack code into the token budget; list files (capped) for the tasks phase
             if code_files:
-                context['code_files'] = "\n\n".join([
-                    f"File: {f['path']}\n```\n{f['content'][:500]}...\n```"
-                    for f in code_files[:5]  # Limit to first 5 files
-                ])
+                context['code_files'] = render_chunks(code_index.pack(
+                    "", self._context_budget('previous_code_budget_tokens'), include_unmatched=True
+                ))
+                listed = code_files[:MAX_CODE_SUMMARY_FILES]
                 context['code_summary'] = "\n".join([
-                    f"- {f['path']} ({len(f['content'])} bytes)"
-                    for f in code_files
+                    f"- {f['path']} ({f['size']} bytes)"
+                    for f in listed
                 ])
+                if len(code_files) > len(listed):
+                    context['code_summary'] += f"\n- ... and {len(code_files) - len(listed)} more files"
             else:
                 context['code_files'] = "No code files found from previous sprint"
                 context['code_summary'] = "No code files found"
             
+            self._previous_sprint_context = (prev_artifacts, context, code_index)
+            
             logger.info("Loaded previous sprint context for incremental development",
                        extra={'run_id': self.run_id,
                              'metadata': {
@@ -1372,7 +1444,8 @@ Instructions for Task Breakdown:
                                  'prev_sprint': self.sprint_num - 1,
                                  'has_spec': 'spec' in context,
                                  'has_plan': 'plan' in context,
-                                 'code_files_count': len(code_files)
+                                 'code_files_count': len(code_files),
+                                 'code_chunks': len(code_index.chunks)
                              }})
             
             return context
@@ -1386,6 +1459,54 @@ Instructions for Task Breakdown:
                              }})
             return None
     
+    def _pack_previous_code(self, query: str) -> Optional[str]:
+        """
+        Previous sprint code most relevant to a query, within the code budget.
+        
+        Args:
+            query: Text to rank code chunks against (e.g. the new spec, or
+                the files and descriptions of all tasks of the phase)
+            
+        Returns:
+            Packed code excerpts (the default 'code_files' when nothing
+            matches), or None if no previous sprint code is indexed (call
+            _get_previous_sprint_context() first)
+        """
+        if self._previous_sprint_context is None:
+            return None
+        _, context, code_index = self._previous_sprint_context
+        if not code_index.chunks:
+            return None
+        packed = code_index.pack(query, self._context_budget('previous_code_budget_tokens'))
+        return render_chunks(packed) if packed else context['code_files']
+    
+    def _context_budget(self, key: str) -> int:
+        """Token budget for packed context (framework config override or default)."""
+        defaults = {
+            'excerpt_budget_tokens': DEFAULT_EXCERPT_BUDGET_TOKENS,
+            'previous_code_budget_tokens': DEFAULT_PREVIOUS_CODE_BUDGET_TOKENS
+        }
+        return int(self.config.get(key, defaults[key]))
+    
+    def _context_index(self, source: str, content: str) -> ContextIndex:
+        """
+        Keyword index of a markdown document's sections, built once per content.
+        
+        Args:
+            source: Document name (e.g. "spec.md")
+            content: Document text
+            
+        Returns:
+            Cached ContextIndex (shared by concurrent task threads)
+        """
+        key = (source, hashlib.sha256(content.encode('utf-8')).hexdigest())
+        with self._context_index_lock:
+            index = self._context_indexes.get(key)
+            if index is None:
+                index = ContextIndex(markdown_chunks(content, source))
+                self._context_indexes[key] = index
+        return index
+    
     def _extract_entities_from_spec(self, spec_content: str) -> str:
         """Extract Key Entities section from spec.md."""
         match = re.search(r'## Key Entities\s+(.*?)(?=\n##|\Z)', spec_content, re.DOTALL)
@@ -1578,12 +1699,14 @@ Instructions for Task Breakdown:
         
         Workflow:
         1. Parse tasks.md into structured task list
-        2. For each task:
+        2. Build the task dependency graph (same-file tasks and explicit
+           "Depends on" hints are ordered; everything else is independent)
+        3. For each task, on up to `task_concurrency` worker threads:
            a. Build context-rich prompt (spec excerpt + plan excerpt + current file)
            b. Call OpenAI API
            c. Handle clarifications if needed
-           d. Save generated code to file
-        3. Aggregate token usage across all tasks
+        4. In task order: save generated code to file and log completion
+        5. Aggregate token usage across all tasks
         
         Args:
             command_text: User's original feature request (for logging)
@@ -1608,16 +1731,17 @@ Instructions for Task Breakdown:
         
         # Load implement template with caching (T005/T006)
         system_prompt, user_prompt_template = self._load_prompt_template('implement')
-        
-        # T025: Inject constitution into implementation prompts
-        system_prompt_with_constitution = f"""{system_prompt}
-
-## Project Constitution
-
-Follow these coding standards when generating code:
-
-{self.constitution_excerpt}
-"""
+        self.current_phase = 'implement'
+        
+        # T025: Inject constitution into implementation prompts. Content shared by
+        # all tasks (constitution, previous sprint code, fixed instructions) forms
+        # one prompt prefix so the API can serve it from its prompt cache
+        stable_instructions, task_template = split_template(user_prompt_template, TASK_PROMPT_FIELDS)
+        layout = self._build_prompt_layout(
+            'implement', system_prompt,
+            "Follow these coding standards when generating code:",
+            [self._incremental_task_context(tasks), stable_instructions]
+        )
         
         total_hitl_count = 0
         total_tokens_in = 0
@@ -1628,38 +1752,57 @@ Follow these coding standards when generating code:
         # Track overall start time (before first task)
         overall_start_timestamp = int(time.time())
         
-        # Process each task
-        for i, task in enumerate(tasks, 1):
-            logger.info(f"Processing task {i}/{len(tasks)}: {task['id']}",
-                       extra={'run_id': self.run_id, 'step': self.current_step,
-                             'metadata': {'task_id': task['id'], 'file': task['file']}})
-            
-            # Build task-specific prompt
-            user_prompt = self._build_task_prompt(
-                task, spec_content, plan_content, user_prompt_template
-            )
-            
-            # Track start time for Usage API
-            api_call_start = int(time.time())
+        # Independent tasks run concurrently; same-file tasks and explicit
+        # dependencies are ordered, and results are committed in task order
+        dependencies = build_task_dependencies(tasks)
+        task_concurrency = int(self.config.get('task_concurrency', DEFAULT_TASK_CONCURRENCY))
+        task_positions = {task['id']: i for i, task in enumerate(tasks, 1)}
+        
+        logger.info("Task dependency graph built",
+                   extra={'run_id': self.run_id, 'step': self.current_step,
+                         'metadata': {
+                             'task_concurrency': task_concurrency,
+                             'dependencies': {
+                                 tasks[i]['id']: sorted(tasks[d]['id'] for d in deps)
+                                 for i, deps in enumerate(dependencies) if deps
+                             }
+                         }})
+        
+        def implement_task(task: dict) -> Tuple[str, int]:
+            # Build task-specific prompt (variable part last)
+            user_prompt = layout.user_prompt(self._build_task_prompt(
+                task, spec_content, plan_content, task_template
+            ))
             
             # Call OpenAI API with constitution-enhanced prompt (T025)
-            response_text = self._call_openai(system_prompt_with_constitution, user_prompt)
+            response_text = self._call_openai(layout.system_prompt, user_prompt)
             
             # Check for clarification
             hitl_count = 0
             if self._needs_clarification(response_text):
-                # T040: Log clarification attempt
-                logger.info(f"Clarification needed for task {task['id']}",
-                           extra={'run_id': self.run_id, 'step': self.current_step,
-                                 'metadata': {'iteration': 1, 'task_id': task['id']}})
-                
                 # T037: Handle HITL with iteration-specific text (iteration 1 for task implementation)
                 clarification_text = self._handle_clarification(response_text, iteration=1)
                 user_prompt_with_hitl = f"{user_prompt}\n\n---\n\n{clarification_text}"
                 
-                response_text = self._call_openai(system_prompt_with_constitution, user_prompt_with_hitl)
+                response_text = self._call_openai(layout.system_prompt, user_prompt_with_hitl)
                 hitl_count = 1
             
+            return response_text, hitl_count
+        
+        def commit_task(task: dict, outcome: Tuple[str, int]) -> None:
+            nonlocal total_hitl_count
+            response_text, hitl_count = outcome
+            
+            logger.info(f"Processing task {task_positions[task['id']]}/{len(tasks)}: {task['id']}",
+                       extra={'run_id': self.run_id, 'step': self.current_step,
+                             'metadata': {'task_id': task['id'], 'file': task['file']}})
+            
+            if hitl_count:
+                # T040: Log clarification attempt
+                logger.info(f"Clarification needed for task {task['id']}",
+                           extra={'run_id': self.run_id, 'step': self.current_step,
+                                 'metadata': {'iteration': 1, 'task_id': task['id']}})
+            
             # Save generated code (skip if file path is a directory or invalid)
             file_path_str = task['file'].strip()
             # Skip directory-only paths (ending with /) or paths without extensions
@@ -1670,25 +1813,21 @@ Follow these coding standards when generating code:
                            extra={'run_id': self.run_id, 'step': self.current_step})
             
             # BREAKING CHANGE (v2.0.0): Token collection removed (reconciled post-run)
-            api_call_end = int(time.time())
-            tokens_in, tokens_out, api_calls, cached_tokens = 0, 0, 0, 0
-            
-            # Aggregate totals
             total_hitl_count += hitl_count
-            total_tokens_in += tokens_in
-            total_tokens_out += tokens_out
-            total_api_calls += api_calls
-            total_cached_tokens += cached_tokens
             
             logger.info(f"Task {task['id']} completed",
                        extra={'run_id': self.run_id, 'step': self.current_step,
                              'metadata': {
                                  'file': task['file'],
-                                 'tokens_in': tokens_in,
-                                 'tokens_out': tokens_out,
+                                 'tokens_in': 0,
+                                 'tokens_out': 0,
                                  'hitl': hitl_count
                              }})
         
+        # T063: fail-fast - the first failing task (in task order) aborts the phase
+        run_task_graph(tasks, dependencies, implement_task, commit_task,
+                       max_workers=task_concurrency)
+        
         logger.info("Task implementation completed",
                    extra={'run_id': self.run_id, 'step': self.current_step,
                          'metadata': {
@@ -1724,8 +1863,12 @@ Follow these coding standards when generating code:
         - **File Path**: /path/to/file.ext
         - - **File**: /path/to/file.ext (bullet point)
         
+        Dependency hints in the task block ("Depends on Task 2", "After
+        TASK-003") are captured for parallel scheduling.
+        
         Returns:
-            List of task dictionaries with keys: id, description, file, goal
+            List of task dictionaries with keys: id, description, file, goal,
+            label (author's task number or None), depends_on (referenced task numbers)
         """
         tasks_content = self.tasks_md_path.read_text(encoding='utf-8')
         tasks = []
@@ -1746,6 +1889,11 @@ Follow these coding standards when generating code:
                 # Remove checkbox and clean up
                 desc_text = line[5:].strip()  # Remove '- [ ]'
                 
+                # Keep the author's task number for dependency references
+                label_match = re.match(r'(?:\*\*)?(?:TASK-|Task\s+|T)(\d+(?:\.\d+)?)',
+                                       desc_text, re.IGNORECASE)
+                label = label_match.group(1) if label_match else None
+                
                 # Remove bold markers and extract core description
                 # Handle: **Task N**: desc, **TASK-NNN** desc, Task N: desc
                 desc_text = re.sub(r'\*\*Task \d+(\.\d+)?\*\*:?\s*', '', desc_text, flags=re.IGNORECASE)
@@ -1798,6 +1946,18 @@ Follow these coding standards when generating code:
                         )
                         break
                 
+                # Explicit ordering hints ("Depends on Task 2", "After TASK-003")
+                depends_on = []
+                hint_lines = [desc_text]
+                for j in range(i + 1, min(i + 11, len(lines))):
+                    if lines[j].strip().startswith('- [ ]'):
+                        break
+                    hint_lines.append(lines[j])
+                for hint_line in hint_lines:
+                    hint_match = DEPENDENCY_HINT_RE.search(hint_line)
+                    if hint_match:
+                        depends_on.extend(extract_task_references(hint_match.group(1)))
+                
                 # Only add tasks with file paths
                 if file_path and desc_text:
                     # Generate consistent task ID
@@ -1807,7 +1967,9 @@ Follow these coding standards when generating code:
                         'id': task_id,
                         'description': desc_text,
                         'file': file_path,
-                        'goal': desc_text  # Use description as goal
+                        'goal': desc_text,  # Use description as goal
+                        'label': label,
+                        'depends_on': depends_on
                     })
             
             i += 1
@@ -1822,27 +1984,30 @@ Follow these coding standards when generating code:
         template: str
     ) -> str:
         """
-        Build context-rich prompt for a specific task.
+        Build the task-specific part of an implementation prompt.
         
         Context includes:
         - Task details (id, description, goal, file)
         - Relevant spec excerpt (extracted via keywords)
         - Relevant plan excerpt (extracted via keywords)
         - Current file content (if file exists)
-        - Previous sprint code (for incremental development, sprint > 1)
+        
+        Previous sprint code is shared by all tasks and is part of the phase's
+        PromptLayout instead (see _incremental_task_context).
         
         Args:
             task: Task dictionary from _parse_tasks()
             spec_content: Full specification text
             plan_content: Full technical plan text
-            template: User prompt template from implement_template.md
+            template: Variable part of the implement_template.md user prompt
+                (see split_template)
             
         Returns:
-            Complete user prompt with all context filled in
+            Task prompt with all context filled in
         """
         # Extract relevant sections from spec and plan
-        spec_excerpt = self._extract_relevant_section(spec_content, task)
-        plan_excerpt = self._extract_relevant_section(plan_content, task)
+        spec_excerpt = self._extract_relevant_section(spec_content, task, "spec.md")
+        plan_excerpt = self._extract_relevant_section(plan_content, task, "plan.md")
         
         # Read current file content if it exists
         file_full_path = self.src_dir / task['file']
@@ -1852,27 +2017,47 @@ Follow these coding standards when generating code:
             current_file_content = "# File does not exist yet - create from scratch"
         
         # Fill template with context
-        prompt = (template
-                 .replace('{task_description}', task['description'])
-                 .replace('{file_path}', task['file'])
-                 .replace('{task_goal}', task['goal'])
-                 .replace('{spec_excerpt}', spec_excerpt)
-                 .replace('{plan_excerpt}', plan_excerpt)
-                 .replace('{current_file_content}', current_file_content))
+        return (template
+                .replace('{task_description}', task['description'])
+                .replace('{file_path}', task['file'])
+                .replace('{task_goal}', task['goal'])
+                .replace('{spec_excerpt}', spec_excerpt)
+                .replace('{plan_excerpt}', plan_excerpt)
+                .replace('{current_file_content}', current_file_content))
+    
+    def _incremental_task_context(self, tasks: Optional[List[dict]] = None) -> str:
+        """
+        Previous sprint code shown to every implementation task (sprint > 1).
         
-        # Add previous sprint context for incremental development
-        if self.sprint_num > 1:
-            previous_context = self._get_previous_sprint_context()
-            if previous_context and previous_context.get('code_files'):
-                incremental_context = f"""
-
----
+        The code is packed once for the whole phase, ranked against the files
+        and descriptions of all its tasks, so every task shares the same
+        prompt prefix and its size stays within `previous_code_budget_tokens`.
+        
+        Args:
+            tasks: Tasks of the phase (None packs the default 'code_files')
+            
+        Returns:
+            Incremental development context, or "" in the first sprint or when
+            the previous sprint has no code
+        """
+        if self.sprint_num <= 1:
+            return ""
+        previous_context = self._get_previous_sprint_context()
+        if not previous_context or not previous_context.get('code_files'):
+            return ""
+        
+        code = None
+        if tasks:
+            query = "\n".join(f"{task['file']} {task['description']}" for task in tasks)
+            code = self._pack_previous_code(query)
+        
+        return f"""---
 INCREMENTAL DEVELOPMENT CONTEXT
 
 This is sprint {self.sprint_num}. You are building upon existing code from previous sprint.
 
 Previous Sprint Code:
-{previous_context['code_files']}
+{code or previous_context['code_files']}
 
 CRITICAL INSTRUCTIONS:
 1. If modifying an existing file, preserve its structure and patterns
@@ -1880,69 +2065,74 @@ CRITICAL INSTRUCTIONS:
 3. Use the same language/framework as previous sprint ({previous_context.get('tech_stack', 'see previous code')})
 4. Import/reference existing models and components - don't duplicate them
 5. Add functionality incrementally - don't rewrite everything
----
-"""
-                prompt += incremental_context
+---"""
+    
+    def _build_prompt_layout(
+        self,
+        phase: str,
+        system_prompt: str,
+        constitution_instruction: str,
+        stable_context: list
+    ) -> PromptLayout:
+        """
+        Build the prompt prefix shared by all calls of a per-task phase.
         
-        return prompt
+        Args:
+            phase: Phase name ('implement', 'bugfix')
+            system_prompt: Template system prompt
+            constitution_instruction: Sentence introducing the constitution
+            stable_context: User prompt parts identical for every call
+            
+        Returns:
+            PromptLayout whose system prompt includes the constitution
+        """
+        layout = PromptLayout(
+            phase=phase,
+            system_prompt=f"""{system_prompt}
+
+## Project Constitution
+
+{constitution_instruction}
+
+{self.constitution_excerpt}
+""",
+            stable_context=stable_context
+        )
+        logger.info(f"Prompt layout for {phase} phase",
+                   extra={'run_id': self.run_id, 'step': self.current_step,
+                         'metadata': {
+                             'phase': phase,
+                             'prefix_key': layout.prefix_key(),
+                             'prefix_chars': layout.prefix_chars()
+                         }})
+        return layout
     
-    def _extract_relevant_section(self, full_content: str, task: dict) -> str:
+    def _extract_relevant_section(self, full_content: str, task: dict, source: str = "document") -> str:
         """
         Extract relevant excerpt from spec/plan for this specific task.
         
-        Uses keyword matching to find sections related to:
+        Ranks the document's sections (split at ## headers, indexed once per
+        document) by keyword relevance (BM25) to:
         - File name/path keywords (e.g., "user", "auth", "model")
         - Task description keywords
         - Task goal keywords
         
-        Strategy:
-        1. Split document into sections (by ## headers)
-        2. Score each section based on keyword matches
-        3. Return top 2-3 sections concatenated
-        4. Limit to ~500 words to manage context window
+        and packs the best sections greedily into `excerpt_budget_tokens`
+        (estimated tokens), kept in document order.
         
         Args:
             full_content: Complete spec.md or plan.md content
             task: Task dictionary with description, file, goal
+            source: Document name (keys the cached index)
             
         Returns:
-            Relevant excerpt (truncated if needed)
+            Relevant excerpt within the token budget
         """
-        # Extract keywords from task
-        keywords = set()
-        
-        # From file path: "backend/models/user.py" → ["user", "model"]
-        file_parts = task['file'].lower().replace('/', ' ').replace('.', ' ').split()
-        keywords.update(file_parts)
-        
-        # From description and goal
-        desc_words = task['description'].lower().split()
-        goal_words = task['goal'].lower().split()
-        keywords.update(w for w in desc_words if len(w) > 3)
-        keywords.update(w for w in goal_words if len(w) > 3)
-        
-        # Split content into sections by headers
-        sections = re.split(r'\n##+ ', full_content)
-        
-        # Score each section
-        scored_sections = []
-        for section in sections:
-            section_lower = section.lower()
-            score = sum(1 for keyword in keywords if keyword in section_lower)
-            if score > 0:
-                scored_sections.append((score, section))
-        
-        # Sort by score and take top 3
-        scored_sections.sort(reverse=True, key=lambda x: x[0])
-        top_sections = [s[1] for s in scored_sections[:3]]
-        
-        # Concatenate and truncate
-        excerpt = '\n\n## '.join(top_sections)
-        
-        # Limit to ~2000 characters (~500 words)
-        if len(excerpt) > 2000:
-            excerpt = excerpt[:2000] + "\n\n[... excerpt truncated ...]"
+        index = self._context_index(source, full_content)
+        query = f"{task['file']} {task['description']} {task['goal']}"
+        packed = index.pack(query, self._context_budget('excerpt_budget_tokens'), target_file=task['file'])
         
+        excerpt = render_chunks(packed)
         return excerpt if excerpt else "No relevant sections found - use general context"
     
     def _read_file_if_exists(self, file_path: Path) -> str:
@@ -1978,7 +2168,10 @@ CRITICAL INSTRUCTIONS:
         
         Raises:
             ValueError: If path is invalid (directory, empty, etc.)
+            StepCancelled: If the step timed out (no writes after cancellation)
         """
+        self.raise_if_cancelled()
+        
         # Strip leading / if present (AI often generates absolute paths)
         if relative_path.startswith('/'):
             relative_path = relative_path.lstrip('/')
@@ -2061,16 +2254,15 @@ CRITICAL INSTRUCTIONS:
         
         # Load bugfix template with caching (T005/T006)
         system_prompt, user_prompt_template = self._load_prompt_template('bugfix')
-        
-        # T026: Inject constitution into bugfix prompts
-        system_prompt_with_constitution = f"""{system_prompt}
-
-## Project Constitution
-
-Apply these coding standards when fixing code:
-
-{self.constitution_excerpt}
-"""
+        self.current_phase = 'bugfix'
+        
+        # T026: Inject constitution into bugfix prompts (shared prefix, see implement phase)
+        stable_instructions, bugfix_template = split_template(user_prompt_template, BUGFIX_PROMPT_FIELDS)
+        layout = self._build_prompt_layout(
+            'bugfix', system_prompt,
+            "Apply these coding standards when fixing code:",
+            [stable_instructions]
+        )
         
         # T053: Iterative bugfix loop (max 3 iterations)
         while remaining_errors and current_iteration < max_iterations:
@@ -2104,13 +2296,15 @@ Apply these coding standards when fixing code:
                                  }})
                 
                 # Build bugfix prompt
-                user_prompt = self._build_bugfix_prompt(task, spec_content, user_prompt_template)
+                user_prompt = layout.user_prompt(
+                    self._build_bugfix_prompt(task, spec_content, bugfix_template)
+                )
                 
                 # Track start time
                 api_call_start = int(time.time())
                 
                 # Call OpenAI API with constitution-enhanced prompt (T026)
-                response_text = self._call_openai(system_prompt_with_constitution, user_prompt)
+                response_text = self._call_openai(layout.system_prompt, user_prompt)
                 
                 # Check for clarification (rare in bugfix, but possible)
                 hitl_count = 0
@@ -2127,7 +2321,7 @@ Apply these coding standards when fixing code:
                     # T037: Handle HITL with iteration-specific text (iteration 1 for bugfix)
                     clarification_text = self._handle_clarification(response_text, iteration=1)
                     user_prompt_with_hitl = f"{user_prompt}\n\n---\n\n{clarification_text}"
-                    response_text = self._call_openai(system_prompt_with_constitution, user_prompt_with_hitl)
+                    response_text = self._call_openai(layout.system_prompt, user_prompt_with_hitl)
                     hitl_count = 1
                 
                 # T052: Apply fix and capture before/after for diff logging
@@ -2337,10 +2531,11 @@ Apply these coding standards when fixing code:
         Args:
             bugfix_task: Bugfix task dictionary from _derive_bugfix_tasks()
             spec_content: Full specification content
-            template: User prompt template from bugfix_template.md
+            template: Variable part of the bugfix_template.md user prompt
+                (see split_template)
             
         Returns:
-            Complete user prompt for bugfix
+            Error-specific part of the bugfix prompt
         """
         # Read current file content
         file_path = self.src_dir / bugfix_task['file']
@@ -2370,8 +2565,9 @@ Apply these coding standards when fixing code:
         """
         Extract relevant specification sections for bugfix context (T056).
         
-        Matches file paths and error keywords to specification sections to provide
-        targeted context for bug fixing.
+        Ranks specification sections by keyword relevance to the file path
+        and error message and packs the best ones into
+        `excerpt_budget_tokens` (estimated tokens).
         
         Args:
             spec_content: Full specification content
@@ -2379,43 +2575,13 @@ Apply these coding standards when fixing code:
             error_message: Error message/traceback
             
         Returns:
-            Relevant specification excerpt (max ~30 lines)
+            Relevant specification excerpt within the token budget
         """
-        # Extract keywords from file path and error message
-        keywords = set(file_path.lower().replace('/', ' ').replace('_', ' ').split())
-        
-        # Extract meaningful words from error message (filter common words)
-        error_words = error_message.lower().split()
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        meaningful_words = [w for w in error_words if len(w) > 3 and w not in stop_words]
-        keywords.update(meaningful_words[:15])  # First 15 meaningful words
-        
-        # Find relevant lines (scoring approach)
-        spec_lines = spec_content.split('\n')
-        line_scores = []
-        
-        for i, line in enumerate(spec_lines):
-            line_lower = line.lower()
-            score = sum(1 for keyword in keywords if keyword in line_lower)
-            
-            # Boost score for headers (likely important sections)
-            if line.startswith('#'):
-                score *= 2
-            
-            if score > 0:
-                line_scores.append((score, i, line))
-        
-        # Sort by score and take top lines
-        line_scores.sort(reverse=True, key=lambda x: x[0])
-        top_lines = line_scores[:30]  # Max 30 relevant lines
-        
-        # Sort by original line number to preserve document flow
-        top_lines.sort(key=lambda x: x[1])
-        
-        # Extract lines
-        excerpt_lines = [line for _, _, line in top_lines]
-        spec_excerpt = '\n'.join(excerpt_lines)
+        index = self._context_index("spec.md", spec_content)
+        packed = index.pack(f"{file_path} {error_message}", self._context_budget('excerpt_budget_tokens'),
+                            target_file=file_path)
         
+        spec_excerpt = render_chunks(packed)
         if not spec_excerpt:
             spec_excerpt = "Refer to general specification requirements"
         
@@ -0,0 +1,113 @@
+"""
+Cache-friendly prompt layout for per-task LLM calls.
+
+OpenAI caches prompt prefixes automatically: when a request starts with the
+same tokens (at least 1,024) as a recent one, those tokens are billed and
+processed as cached input. Per-task prompts only benefit when everything that
+is identical for every task of a phase comes first and byte-for-byte the same,
+and the task-specific content comes last.
+
+A PromptLayout is built once per phase from the system prompt (template +
+constitution) and the stable context (e.g. previous sprint code and the
+template's fixed instructions); each call then only appends its variable
+part. split_template() separates a user prompt template into the blocks that
+do not mention per-call fields (stable) and those that do (variable).
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+# Placeholder such as {file_path} or {current_file_content or "..."}
+PLACEHOLDER_RE = re.compile(r'\{(\w+)[^{}\n]*\}')
+
+
+def _template_blocks(template: str) -> List[str]:
+    """Split a template into blank-line separated blocks, never inside ``` fences."""
+    blocks = []
+    current: List[str] = []
+    in_fence = False
+    for line in template.split('\n'):
+        if line.strip().startswith('```'):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append('\n'.join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append('\n'.join(current))
+    
+    # A label block ("CURRENT FILE CONTENT:") belongs to the block it introduces
+    # (or, at the end of the template, to the block before it)
+    merged: List[str] = []
+    pending = None
+    for block in blocks:
+        if pending is not None:
+            block = f"{pending}\n\n{block}"
+            pending = None
+        if block.rstrip().endswith(':'):
+            pending = block
+        else:
+            merged.append(block)
+    if pending is not None:
+        if merged:
+            merged[-1] = f"{merged[-1]}\n\n{pending}"
+        else:
+            merged.append(pending)
+    return merged
+
+
+def split_template(template: str, fields: Iterable[str]) -> Tuple[str, str]:
+    """
+    Separate a user prompt template into stable and variable parts.
+
+    Blocks that mention none of the per-call fields keep their relative
+    order and move to the front; blocks with per-call fields keep theirs and
+    move to the end.
+
+    Args:
+        template: User prompt template with {placeholders}
+        fields: Placeholder names that change from call to call
+
+    Returns:
+        Tuple of (stable text, variable template)
+    """
+    fields = set(fields)
+    stable, variable = [], []
+    for block in _template_blocks(template):
+        mentioned = {match.group(1) for match in PLACEHOLDER_RE.finditer(block)}
+        (variable if mentioned & fields else stable).append(block)
+    return '\n\n'.join(stable), '\n\n'.join(variable)
+
+
+@dataclass
+class PromptLayout:
+    """
+    System prompt and stable user context shared by every call of a phase.
+
+    Attributes:
+        phase: Phase name (recorded with each call for cache hit reporting)
+        system_prompt: System message (template system prompt + constitution)
+        stable_context: User prompt parts identical for every call, in order
+    """
+    phase: str
+    system_prompt: str
+    stable_context: List[str] = field(default_factory=list)
+
+    def user_prompt(self, variable: str) -> str:
+        """User prompt for one call: the stable context, then the variable part."""
+        return '\n\n'.join([*(part for part in self.stable_context if part), variable])
+
+    def prefix_key(self) -> str:
+        """Short digest of the shared prefix (identical for every call of the phase)."""
+        digest = hashlib.sha256(self.system_prompt.encode('utf-8'))
+        for part in self.stable_context:
+            digest.update(b'\0' + part.encode('utf-8'))
+        return digest.hexdigest()[:12]
+
+    def prefix_chars(self) -> int:
+        """Length of the shared prefix in characters."""
+        return len(self.system_prompt) + sum(len(part) + 2 for part in self.stable_context if part)
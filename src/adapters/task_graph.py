@@ -0,0 +1,160 @@
+"""
+Dependency-aware parallel execution of implementation tasks.
+
+Used by GHSpecAdapter's implement phase. Tasks parsed from tasks.md become a
+DAG where a task depends on:
+- the closest earlier task writing the same file (its prompt embeds the
+  current file content, so same-file tasks must stay in order)
+- earlier tasks it explicitly references ("Depends on Task 2", "After TASK-003")
+
+Independent tasks run concurrently on a thread pool. Results are committed
+(files saved, completion logged) on the calling thread strictly in task
+order, and a task is only dispatched once all of its dependencies have been
+committed. The files written and the commit log are therefore the same as
+with serial execution, whatever the pool width.
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, List, Set
+
+_TASK_REF_RE = re.compile(r'\b(?:TASK-|Task\s+|T)(\d+(?:\.\d+)?)\b', re.IGNORECASE)
+
+
+def normalize_task_label(label: str) -> str:
+    """
+    Normalize a task number so "001", "1" and "TASK-001" compare equal.
+
+    Args:
+        label: Task number or id
+
+    Returns:
+        Normalized label (e.g. "1", "1.2")
+    """
+    match = _TASK_REF_RE.search(label)
+    number = match.group(1) if match else label.strip()
+    head, _, tail = number.partition('.')
+    head = head.lstrip('0') or '0'
+    return f"{head}.{tail}" if tail else head
+
+
+def extract_task_references(text: str) -> List[str]:
+    """
+    Extract referenced task numbers from a dependency hint.
+
+    Args:
+        text: Text such as "Depends on Task 2 and TASK-004"
+
+    Returns:
+        Normalized task labels in order of appearance
+    """
+    return [normalize_task_label(ref) for ref in _TASK_REF_RE.findall(text)]
+
+
+def build_task_dependencies(tasks: List[Dict[str, Any]]) -> List[Set[int]]:
+    """
+    Compute dependencies (as indices of earlier tasks) for each task.
+
+    Only earlier tasks can be dependencies, so the graph is always acyclic;
+    references to later or unknown tasks are ignored.
+
+    Args:
+        tasks: Task dictionaries from GHSpecAdapter._parse_tasks()
+               (keys: id, file, optional label and depends_on)
+
+    Returns:
+        List with the set of dependency indices for each task
+    """
+    label_index: Dict[str, int] = {}
+    for index, task in enumerate(tasks):
+        for label in (task.get('label'), task.get('id')):
+            if label:
+                label_index.setdefault(normalize_task_label(label), index)
+
+    dependencies: List[Set[int]] = []
+    last_writer: Dict[str, int] = {}
+    for index, task in enumerate(tasks):
+        deps = set()
+
+        file_key = task.get('file', '').strip().lstrip('/')
+        if file_key in last_writer:
+            deps.add(last_writer[file_key])
+        last_writer[file_key] = index
+
+        for ref in task.get('depends_on', []):
+            dep_index = label_index.get(normalize_task_label(ref))
+            if dep_index is not None and dep_index < index:
+                deps.add(dep_index)
+
+        dependencies.append(deps)
+    return dependencies
+
+
+def run_task_graph(
+    tasks: List[Any],
+    dependencies: List[Set[int]],
+    run_fn: Callable[[Any], Any],
+    commit_fn: Callable[[Any, Any], None],
+    max_workers: int = 1
+) -> None:
+    """
+    Run tasks concurrently while committing results in task order.
+
+    run_fn executes on worker threads; commit_fn executes on the calling
+    thread. A task is dispatched once all its dependencies are
+    committed. If run_fn raises, no further tasks are dispatched, running
+    tasks are awaited, every earlier task is committed, and the exception of
+    the earliest failing task is re-raised (fail-fast, deterministic).
+
+    Args:
+        tasks: Items to execute
+        dependencies: Dependency indices per task (see build_task_dependencies)
+        run_fn: Function executing one task, returning its result
+        commit_fn: Function receiving (task, result) in task order
+        max_workers: Maximum number of concurrently running tasks
+
+    Raises:
+        Exception: The exception raised by run_fn for the earliest failing task
+    """
+    max_workers = max(1, max_workers)
+    results: Dict[int, Any] = {}
+    errors: Dict[int, BaseException] = {}
+    next_commit = 0
+    dispatched: Set[int] = set()
+    running: Dict[Future, int] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="task") as executor:
+        while next_commit < len(tasks):
+            # Dispatch ready tasks (all dependencies committed) in task order
+            if not errors:
+                for index in range(next_commit, len(tasks)):
+                    if len(running) >= max_workers:
+                        break
+                    if index in dispatched:
+                        continue
+                    if all(dep < next_commit for dep in dependencies[index]):
+                        dispatched.add(index)
+                        running[executor.submit(run_fn, tasks[index])] = index
+
+            if not running:
+                break
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    errors[index] = e
+
+            # Commit the completed prefix in order
+            while next_commit in results:
+                commit_fn(tasks[next_commit], results.pop(next_commit))
+                next_commit += 1
+
+            if errors and not running:
+                break
+
+    if errors:
+        raise errors[min(errors)]
@@ -4,15 +4,18 @@ Statistical analysis functions for multi-framework comparison.
 Implements non-parametric tests and effect size calculations.
 """
 
-import json
 import math
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Set
 from collections import defaultdict
+import numpy as np
 from src.utils.logger import get_logger
 from src.utils.exceptions import ConfigValidationError, MetricsValidationError
 from src.analysis.types import MetricsDiscoveryResult
 from src.utils.metrics_config import MetricsConfig
+from src.utils.bootstrap import RandomStateLike, global_rng, resolve_rng
+from src.utils.rank_statistics import cliffs_delta_ranked, kruskal_wallis_h, mann_whitney_p_value
+from src.utils.run_metrics_table import RunMetricsTable
 
 logger = get_logger(__name__)
 
@@ -167,37 +170,29 @@ def _discover_metrics_with_data(run_files: List[Path], metrics_config: MetricsCo
         >>> print(f"Measured: {result.metrics_with_data}")
         >>> print(f"Unmeasured: {result.metrics_without_data}")
     """
-    # Collect all metric keys found in run data
-    all_data_metrics: Set[str] = set()
+    # Collect all metric keys found in run data (unreadable files are skipped with a warning)
+    run_table = RunMetricsTable.from_files(run_files)
     
-    for run_file in run_files:
-        try:
-            with open(run_file, 'r', encoding='utf-8') as f:
-                run_data = json.load(f)
-            
-            # Validate presence of aggregate_metrics (fail-fast)
-            if 'aggregate_metrics' not in run_data:
-                raise MetricsValidationError(
-                    f"Missing 'aggregate_metrics' section in run file: {run_file}\n\n"
-                    f"Each metrics.json file must contain an 'aggregate_metrics' section.\n\n"
-                    f"Expected structure:\n"
-                    f"  {{\n"
-                    f"    \"aggregate_metrics\": {{\n"
-                    f"      \"TOK_IN\": <value>,\n"
-                    f"      \"TOK_OUT\": <value>,\n"
-                    f"      ...\n"
-                    f"    }}\n"
-                    f"  }}\n\n"
-                    f"This file may be corrupted or from an incompatible experiment version."
-                )
-            
-            # Extract metrics from aggregate_metrics section
-            aggregate_metrics = run_data['aggregate_metrics']
-            all_data_metrics.update(aggregate_metrics.keys())
-            
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Failed to read run file {run_file}: {e}")
-            continue
+    # Validate presence of aggregate_metrics (fail-fast)
+    missing = np.flatnonzero(~run_table['has_aggregate'])
+    if len(missing):
+        run_file = run_table['source'][missing[0]]
+        raise MetricsValidationError(
+            f"Missing 'aggregate_metrics' section in run file: {run_file}\n\n"
+            f"Each metrics.json file must contain an 'aggregate_metrics' section.\n\n"
+            f"Expected structure:\n"
+            f"  {{\n"
+            f"    \"aggregate_metrics\": {{\n"
+            f"      \"TOK_IN\": <value>,\n"
+            f"      \"TOK_OUT\": <value>,\n"
+            f"      ...\n"
+            f"    }}\n"
+            f"  }}\n\n"
+            f"This file may be corrupted or from an incompatible experiment version."
+        )
+    
+    # Extract metrics from aggregate_metrics sections
+    all_data_metrics: Set[str] = set(run_table.aggregate_keys())
     
     # Get all configured metrics
     config_metrics = set(metrics_config.get_all_metrics().keys())
@@ -314,13 +309,7 @@ def kruskal_wallis_test(groups: Dict[str, List[float]]) -> Dict[str, Any]:
             'n_total': int
         }
     """
-    # Combine all values with group labels
-    all_values = []
-    for group_name, values in groups.items():
-        for value in values:
-            all_values.append((value, group_name))
-    
-    n_total = len(all_values)
+    n_total = sum(len(values) for values in groups.values())
     k = len(groups)
     
     if k < 3:
@@ -334,37 +323,8 @@ def kruskal_wallis_test(groups: Dict[str, List[float]]) -> Dict[str, Any]:
             'error': 'Insufficient groups'
         }
     
-    # Rank all values
-    all_values.sort(key=lambda x: x[0])
-    
-    # Assign ranks (average rank for ties)
-    ranks = {}
-    i = 0
-    while i < n_total:
-        # Find range of tied values
-        j = i
-        while j < n_total and all_values[j][0] == all_values[i][0]:
-            j += 1
-        
-        # Average rank for tied values
-        avg_rank = (i + j + 1) / 2  # +1 because ranks start at 1
-        
-        for idx in range(i, j):
-            value, group = all_values[idx]
-            if group not in ranks:
-                ranks[group] = []
-            ranks[group].append(avg_rank)
-        
-        i = j
-    
-    # Compute H statistic
-    h_stat = 0.0
-    for group_name, group_ranks in ranks.items():
-        n_i = len(group_ranks)
-        r_i = sum(group_ranks) / n_i  # Mean rank for group
-        h_stat += n_i * (r_i - (n_total + 1) / 2) ** 2
-    
-    h_stat = (12 / (n_total * (n_total + 1))) * h_stat
+    # Rank the pooled sample once (average ranks and tie correction)
+    h_stat = float(kruskal_wallis_h(list(groups.values())))
     
     # Approximate p-value using chi-square distribution
     # For large samples, H ~ chi-square(k-1)
@@ -463,22 +423,8 @@ def cliffs_delta(group1: List[float], group2: List[float]) -> float:
     if not group1 or not group2:
         return 0.0
     
-    n1 = len(group1)
-    n2 = len(group2)
-    
-    # Count dominances
-    dominances = 0
-    for x in group1:
-        for y in group2:
-            if x > y:
-                dominances += 1
-            elif x < y:
-                dominances -= 1
-    
-    # Scale to [-1, 1]
-    delta = dominances / (n1 * n2)
-    
-    return delta
+    # Computed from ranks (O(n log n)) rather than comparing every pair
+    return float(cliffs_delta_ranked(group1, group2))
 
 
 def _interpret_kruskal_wallis(result: Dict[str, Any], metric: str) -> str:
@@ -534,7 +480,8 @@ def _interpret_pairwise_comparison(comp: Dict[str, Any], metric: str) -> str:
 
 def bootstrap_aggregate_metrics(
     runs_data: List[Dict[str, float]],
-    n_bootstrap: int = 10000
+    n_bootstrap: int = 10000,
+    random_state: RandomStateLike = None
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute aggregate statistics with bootstrap confidence intervals.
@@ -542,6 +489,8 @@ def bootstrap_aggregate_metrics(
     Args:
         runs_data: List of metric dictionaries from multiple runs
         n_bootstrap: Number of bootstrap resamples
+        random_state: Seed or generator shared by all metrics' CIs (default:
+            NumPy's global random state, so CIs follow set_deterministic_seeds)
         
     Returns:
         Dictionary mapping metric names to statistics:
@@ -562,6 +511,8 @@ def bootstrap_aggregate_metrics(
     if not runs_data:
         return {}
     
+    rng = global_rng() if random_state is None else resolve_rng(random_state)
+    
     # Group values by metric
     metrics_values = defaultdict(list)
     for run in runs_data:
@@ -581,7 +532,7 @@ def bootstrap_aggregate_metrics(
         
         # Bootstrap CI
         from src.analysis.stopping_rule import bootstrap_ci
-        _, ci_lower, ci_upper = bootstrap_ci(values, n_bootstrap)
+        _, ci_lower, ci_upper = bootstrap_ci(values, n_bootstrap, random_state=rng)
         
         results[metric] = {
             'mean': mean,
@@ -2689,7 +2640,8 @@ def _mann_whitney_u_test(group1: List[float], group2: List[float]) -> float:
     """
     Perform Mann-Whitney U test (Wilcoxon rank-sum test).
     
-    Returns approximate p-value using normal approximation.
+    Returns the two-sided p-value (exact for small untied samples, otherwise
+    the tie- and continuity-corrected normal approximation).
     """
     n1 = len(group1)
     n2 = len(group2)
@@ -2697,34 +2649,7 @@ def _mann_whitney_u_test(group1: List[float], group2: List[float]) -> float:
     if n1 == 0 or n2 == 0:
         return 1.0
     
-    # Combine and rank
-    combined = [(x, 1) for x in group1] + [(x, 2) for x in group2]
-    combined.sort(key=lambda x: x[0])
-    
-    # Assign ranks
-    rank_sum_1 = 0
-    for i, (_, group) in enumerate(combined):
-        if group == 1:
-            rank_sum_1 += i + 1
-    
-    # U statistic
-    u1 = rank_sum_1 - n1 * (n1 + 1) / 2
-    u2 = n1 * n2 - u1
-    u = min(u1, u2)
-    
-    # Normal approximation
-    mean_u = n1 * n2 / 2
-    std_u = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
-    
-    if std_u == 0:
-        return 1.0
-    
-    z = (u - mean_u) / std_u
-    
-    # Two-tailed p-value
-    p_value = 2 * (1 - 0.5 * (1 + math.erf(abs(z) / math.sqrt(2))))
-    
-    return p_value
+    return float(mann_whitney_p_value(group1, group2))
 
 
 def _generate_metric_table_from_config(
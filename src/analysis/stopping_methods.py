@@ -0,0 +1,12 @@
+"""
+Names and defaults of the available stopping rules.
+
+Kept free of numerical dependencies so configuration validation can check
+stopping_rule settings without importing NumPy/SciPy (see stopping_rule.py
+for the implementations).
+"""
+
+STOPPING_METHODS = ('sequential', 'bootstrap')
+DEFAULT_STOPPING_METHOD = 'bootstrap'
+ALPHA_SPENDING_FUNCTIONS = ('obrien_fleming', 'pocock')
+SEQUENTIAL_ALPHA = 0.05
@@ -1,11 +1,22 @@
 """
 Stopping rule implementation for multi-framework experiments.
 
-Implements bootstrap confidence intervals to determine convergence.
+Two rules are available:
+- check_convergence(): bootstrap confidence intervals recomputed from the
+  full history after every run
+- SequentialStoppingEngine: running mean/variance (Welford) updated in O(1)
+  per run, an estimate of the runs still needed, and alpha-spending
+  group-sequential tests that stop comparisons which are already conclusive
 """
 
-import random
+import math
 from typing import List, Dict, Any, Tuple, Optional
+
+import numpy as np
+from scipy.stats import norm
+
+from src.analysis.stopping_methods import ALPHA_SPENDING_FUNCTIONS, SEQUENTIAL_ALPHA
+from src.utils.bootstrap import RandomStateLike, bootstrap_distribution, global_rng
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,16 +35,19 @@ DEFAULT_CONVERGENCE_METRICS = ['AUTR', 'TOK_IN', 'T_WALL', 'CRUDe', 'ESR', 'MC']
 
 
 def bootstrap_ci(data: List[float], n_bootstrap: int = BOOTSTRAP_SAMPLES, 
-                 ci_level: float = CI_LEVEL) -> Tuple[float, float, float]:
+                 ci_level: float = CI_LEVEL,
+                 random_state: RandomStateLike = None) -> Tuple[float, float, float]:
     """
     Compute bootstrap confidence interval for the mean.
     
-    Uses percentile method with resampling.
+    Uses percentile method with resampling (vectorized, see src.utils.bootstrap).
     
     Args:
         data: List of observed values
         n_bootstrap: Number of bootstrap resamples (default 10,000)
         ci_level: Confidence level (default 0.95 for 95% CI)
+        random_state: Seed or numpy generator (default: drawn from NumPy's
+            global random state, so results follow set_deterministic_seeds)
         
     Returns:
         Tuple of (mean, lower_bound, upper_bound)
@@ -42,25 +56,18 @@ def bootstrap_ci(data: List[float], n_bootstrap: int = BOOTSTRAP_SAMPLES,
         return 0.0, 0.0, 0.0
         
     n = len(data)
-    bootstrap_means = []
-    
-    # Generate bootstrap samples
-    for _ in range(n_bootstrap):
-        # Resample with replacement
-        sample = random.choices(data, k=n)
-        bootstrap_means.append(sum(sample) / n)
-    
-    # Sort bootstrap means
-    bootstrap_means.sort()
+    if random_state is None:
+        random_state = global_rng()
+    bootstrap_means = np.sort(bootstrap_distribution(data, 'mean', n_bootstrap, random_state))
     
     # Compute percentiles
     alpha = 1 - ci_level
     lower_idx = int(n_bootstrap * (alpha / 2))
-    upper_idx = int(n_bootstrap * (1 - alpha / 2))
+    upper_idx = min(int(n_bootstrap * (1 - alpha / 2)), n_bootstrap - 1)
     
     mean = sum(data) / n
-    lower = bootstrap_means[lower_idx]
-    upper = bootstrap_means[upper_idx]
+    lower = float(bootstrap_means[lower_idx])
+    upper = float(bootstrap_means[upper_idx])
     
     return mean, lower, upper
 
@@ -71,7 +78,8 @@ def check_convergence(
     min_runs: int = MIN_RUNS,
     max_runs: int = MAX_RUNS,
     half_width_threshold: float = HALF_WIDTH_THRESHOLD,
-    convergence_metrics: Optional[List[str]] = None
+    convergence_metrics: Optional[List[str]] = None,
+    random_state: RandomStateLike = None
 ) -> Dict[str, Any]:
     """
     Check if stopping rule is satisfied for a framework.
@@ -90,6 +98,8 @@ def check_convergence(
         convergence_metrics: List of metric keys to check for convergence.
                            If None, uses DEFAULT_CONVERGENCE_METRICS.
                            Recommended: pass metrics from config (stopping_rule.metrics)
+        random_state: Seed or generator for the bootstrap CIs (default:
+            NumPy's global random state, see bootstrap_ci)
         
     Returns:
         Dictionary with convergence status:
@@ -149,7 +159,7 @@ def check_convergence(
             continue
         
         # Compute bootstrap CI
-        mean, lower, upper = bootstrap_ci(values)
+        mean, lower, upper = bootstrap_ci(values, random_state=random_state)
         
         # Compute half-width as percentage of mean
         half_width = (upper - lower) / 2
@@ -222,4 +232,288 @@ def get_convergence_summary(convergence_result: Dict[str, Any]) -> str:
                 f"half-width={details['half_width_pct']*100:.1f}%"
             )
     
+    if convergence_result.get('remaining_runs_estimate') is not None:
+        lines.append(f"Estimated remaining runs: {convergence_result['remaining_runs_estimate']}")
+    
+    comparisons = convergence_result.get('comparisons') or []
+    if comparisons:
+        lines.append("\nComparisons:")
+        for comparison in comparisons:
+            status = "✓" if comparison['conclusive'] else "…"
+            p_value = comparison['p_value']
+            lines.append(
+                f"  {status} vs {comparison['other']} on {comparison['metric']}: "
+                f"p={'n/a' if p_value is None else f'{p_value:.4f}'}, "
+                f"alpha spent={comparison['alpha_spent']:.4f}"
+            )
+    
     return "\n".join(lines)
+
+
+class RunningStats:
+    """Running mean and variance of a metric (Welford's algorithm)."""
+    
+    __slots__ = ('n', 'mean', 'm2')
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, value: float) -> None:
+        """Add one observation in O(1)."""
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1); 0 with fewer than two observations."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self.variance, 0.0))
+
+
+def alpha_spent(information: float, alpha: float, spending: str = 'obrien_fleming') -> float:
+    """
+    Cumulative type I error allowed at an information fraction (Lan-DeMets).
+    
+    Args:
+        information: Fraction of the maximum sample size observed (0-1)
+        alpha: Overall two-sided significance level
+        spending: 'obrien_fleming' (spends little early) or 'pocock' (evenly)
+        
+    Returns:
+        Alpha that may have been spent by this point
+    """
+    t = min(max(information, 0.0), 1.0)
+    if t == 0.0:
+        return 0.0
+    if spending == 'pocock':
+        return alpha * math.log(1 + (math.e - 1) * t)
+    return float(2 * (1 - norm.cdf(norm.ppf(1 - alpha / 2) / math.sqrt(t))))
+
+
+class SequentialStoppingEngine:
+    """
+    Incremental stopping rule across frameworks.
+    
+    After every successful run, record() updates each metric's running
+    statistics in O(1) and re-tests the pairwise framework comparisons the
+    framework takes part in. A framework may stop (after min_runs) when:
+    1. Every metric's normal-approximation CI half-width is within the
+       threshold (same criterion as check_convergence, without resampling)
+    2. Every comparison with the other frameworks is conclusive, so further
+       runs cannot change the answer
+    3. max_runs successful runs are in
+    
+    Comparisons are two-sided Welch z-tests on the running statistics. Each
+    comparison is an independent group-sequential test: at every look, the
+    alpha released by the spending function since the previous look is the
+    nominal level, so the total type I error of a comparison stays below
+    alpha over all looks (information fraction = smaller group's runs /
+    max_runs). Once conclusive, a comparison stays conclusive.
+    """
+    
+    def __init__(
+        self,
+        frameworks: List[str],
+        metrics: List[str],
+        min_runs: int = MIN_RUNS,
+        max_runs: int = MAX_RUNS,
+        confidence_level: float = CI_LEVEL,
+        half_width_threshold: float = HALF_WIDTH_THRESHOLD,
+        alpha: float = SEQUENTIAL_ALPHA,
+        alpha_spending: str = 'obrien_fleming'
+    ):
+        """
+        Initialize the engine.
+        
+        Args:
+            frameworks: Framework names compared with each other
+            metrics: Metric keys of aggregate_metrics to track
+            min_runs: Successful runs required before a framework may stop
+            max_runs: Successful runs after which a framework always stops
+            confidence_level: Confidence level of the precision rule
+            half_width_threshold: Max allowed CI half-width as fraction of mean
+            alpha: Overall significance level of each comparison
+            alpha_spending: Spending function (see ALPHA_SPENDING_FUNCTIONS)
+        
+        Raises:
+            ValueError: If alpha_spending is unknown
+        """
+        if alpha_spending not in ALPHA_SPENDING_FUNCTIONS:
+            raise ValueError(
+                f"alpha_spending must be one of {ALPHA_SPENDING_FUNCTIONS}, got {alpha_spending!r}"
+            )
+        self.frameworks = list(frameworks)
+        self.metrics = list(metrics)
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+        self.half_width_threshold = half_width_threshold
+        self.alpha = alpha
+        self.alpha_spending = alpha_spending
+        self.z = float(norm.ppf(1 - (1 - confidence_level) / 2))
+        
+        self.runs = {fw: 0 for fw in self.frameworks}
+        self.stats = {fw: {metric: RunningStats() for metric in self.metrics} for fw in self.frameworks}
+        self.comparisons = {
+            (a, b, metric): {'alpha_spent': 0.0, 'p_value': None, 'conclusive': False, 'looks': 0}
+            for i, a in enumerate(self.frameworks)
+            for b in self.frameworks[i + 1:]
+            for metric in self.metrics
+        }
+    
+    @classmethod
+    def from_config(cls, frameworks: List[str], stopping_rule: Dict[str, Any]) -> 'SequentialStoppingEngine':
+        """
+        Build an engine from the experiment's stopping_rule section.
+        
+        Args:
+            frameworks: Framework names
+            stopping_rule: Validated stopping_rule configuration
+        """
+        return cls(
+            frameworks,
+            stopping_rule['metrics'],
+            min_runs=stopping_rule['min_runs'],
+            max_runs=stopping_rule['max_runs'],
+            confidence_level=stopping_rule['confidence_level'],
+            half_width_threshold=stopping_rule['max_half_width_pct'] / 100,
+            alpha=stopping_rule.get('alpha', SEQUENTIAL_ALPHA),
+            alpha_spending=stopping_rule.get('alpha_spending', 'obrien_fleming')
+        )
+    
+    def record(self, framework: str, metrics: Dict[str, Any]) -> None:
+        """
+        Add a successful run's aggregate metrics.
+        
+        Args:
+            framework: Framework name
+            metrics: Aggregate metrics of the run
+        """
+        self.runs[framework] += 1
+        for metric, running in self.stats[framework].items():
+            value = metrics.get(metric)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+                running.update(float(value))
+        
+        for (a, b, metric), comparison in self.comparisons.items():
+            if framework in (a, b) and not comparison['conclusive']:
+                self._look(self.stats[a][metric], self.stats[b][metric], comparison)
+    
+    def _look(self, first: RunningStats, second: RunningStats, comparison: Dict[str, Any]) -> None:
+        """Test one comparison if the spending function released new alpha."""
+        if min(first.n, second.n) < max(self.min_runs, 2):
+            return
+        spent = alpha_spent(min(first.n, second.n) / self.max_runs, self.alpha, self.alpha_spending)
+        nominal = spent - comparison['alpha_spent']
+        if nominal <= 0:
+            return
+        comparison['alpha_spent'] = spent
+        comparison['looks'] += 1
+        
+        standard_error = math.sqrt(first.variance / first.n + second.variance / second.n)
+        difference = abs(first.mean - second.mean)
+        if standard_error == 0:
+            p_value = 0.0 if difference > 0 else 1.0
+        else:
+            p_value = float(2 * norm.sf(difference / standard_error))
+        comparison['p_value'] = p_value
+        comparison['conclusive'] = p_value <= nominal
+    
+    def remaining_runs(self, framework: str) -> int:
+        """
+        Estimate the further runs needed to meet the precision rule.
+        
+        Args:
+            framework: Framework name
+            
+        Returns:
+            Runs still needed (bounded by max_runs)
+        """
+        n = self.runs[framework]
+        needed = max(n, self.min_runs)
+        for running in self.stats[framework].values():
+            if running.n < 2 or running.mean <= 0:
+                needed = self.max_runs
+                break
+            target = self.half_width_threshold * running.mean
+            needed = max(needed, math.ceil((self.z * running.std / target) ** 2))
+        return max(0, min(needed, self.max_runs) - n)
+    
+    def check(self, framework: str) -> Dict[str, Any]:
+        """
+        Evaluate the stopping rule for a framework.
+        
+        Args:
+            framework: Framework name
+            
+        Returns:
+            Dictionary in the format of check_convergence(), plus
+            'remaining_runs_estimate' and 'comparisons' (one entry per other
+            framework and metric with 'conclusive', 'p_value', 'alpha_spent')
+        """
+        n_runs = self.runs[framework]
+        result = {
+            'should_stop': False,
+            'runs_completed': n_runs,
+            'convergence_details': {},
+            'remaining_runs_estimate': self.remaining_runs(framework),
+            'comparisons': [
+                {
+                    'other': b if a == framework else a,
+                    'metric': metric,
+                    'conclusive': comparison['conclusive'],
+                    'p_value': comparison['p_value'],
+                    'alpha_spent': comparison['alpha_spent'],
+                }
+                for (a, b, metric), comparison in self.comparisons.items()
+                if framework in (a, b)
+            ],
+        }
+        
+        if n_runs < self.min_runs:
+            result['reason'] = f'Insufficient runs ({n_runs}/{self.min_runs})'
+            return result
+        
+        if n_runs >= self.max_runs:
+            result['should_stop'] = True
+            result['reason'] = f'Maximum runs reached ({n_runs}/{self.max_runs})'
+            return result
+        
+        all_converged = True
+        for metric, running in self.stats[framework].items():
+            if running.n == 0:
+                logger.warning(f"Metric {metric} not found in history",
+                             extra={'metadata': {'framework': framework}})
+                all_converged = False
+                continue
+            half_width = self.z * running.std / math.sqrt(running.n)
+            half_width_pct = half_width / running.mean if running.mean > 0 else float('inf')
+            converged = half_width_pct <= self.half_width_threshold
+            all_converged = all_converged and converged
+            result['convergence_details'][metric] = {
+                'converged': converged,
+                'mean': running.mean,
+                'ci': [running.mean - half_width, running.mean + half_width],
+                'half_width': half_width,
+                'half_width_pct': half_width_pct,
+                'n_samples': running.n
+            }
+        
+        if all_converged:
+            result['should_stop'] = True
+            result['reason'] = f'Convergence achieved for all metrics ({n_runs} runs)'
+        elif result['comparisons'] and all(c['conclusive'] for c in result['comparisons']):
+            result['should_stop'] = True
+            result['reason'] = f'All comparisons conclusive ({n_runs} runs)'
+        else:
+            result['reason'] = (
+                f"Not all metrics converged "
+                f"(~{result['remaining_runs_estimate']} more runs estimated)"
+            )
+        return result
@@ -22,6 +22,7 @@ Example:
 from typing import Dict, List, Any, Callable, Optional
 from pathlib import Path
 
+from src.analysis import visualizations
 from src.analysis.visualizations import (
     radar_chart,
     token_efficiency_chart,
@@ -31,6 +32,14 @@ from src.analysis.visualizations import (
     cache_efficiency_chart,
     api_efficiency_chart,
 )
+from src.utils.figure_cache import (
+    DEFAULT_MAX_BYTES,
+    FIGURE_CACHE_DIRNAME,
+    FIGURE_CACHE_ENABLED,
+    FigureCache,
+    figure_key,
+    source_fingerprint,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -65,6 +74,10 @@ class VisualizationFactory:
         
         self.config = config
         self.visualizations_config = config['visualizations']
+        
+        # Optional 'figure_cache' section: enabled, dir, max_mb
+        self.figure_cache_config = config.get('figure_cache') or {}
+        self.figure_cache: Optional[FigureCache] = None
         logger.info("VisualizationFactory initialized with %d chart definitions",
                    len(self.visualizations_config))
     
@@ -101,6 +114,17 @@ class VisualizationFactory:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
+        # Charts whose data and parameters are unchanged are restored from the cache
+        if self.figure_cache_config.get('enabled', FIGURE_CACHE_ENABLED):
+            cache_dir = self.figure_cache_config.get('dir') or output_path / FIGURE_CACHE_DIRNAME
+            max_mb = self.figure_cache_config.get('max_mb')
+            self.figure_cache = FigureCache(
+                Path(cache_dir),
+                max_bytes=int(max_mb) * 1024 * 1024 if max_mb else DEFAULT_MAX_BYTES
+            )
+        else:
+            self.figure_cache = None
+        
         results = {}
         
         for chart_name, chart_config in self.visualizations_config.items():
@@ -130,6 +154,9 @@ class VisualizationFactory:
                 logger.error("Error generating chart %s: %s", chart_name, e, exc_info=True)
                 results[chart_name] = False
         
+        if self.figure_cache is not None:
+            self.figure_cache.evict()
+        
         # Summary
         total = len(results)
         succeeded = sum(1 for success in results.values() if success)
@@ -185,8 +212,22 @@ class VisualizationFactory:
                 logger.warning("Insufficient data for chart: %s", chart_name)
                 return False
             
+            cache_key = figure_key(
+                chart_name,
+                chart_data,
+                {'function': getattr(chart_func, '__qualname__', repr(chart_func)),
+                 'kwargs': kwargs, 'filename': filename},
+                source_fingerprint(Path(visualizations.__file__))
+            )
+            if self.figure_cache is not None and \
+                    self.figure_cache.restore(cache_key, output_dir) is not None:
+                logger.debug("Reused cached chart: %s", chart_name)
+                return True
+            
             # Generate the chart
             chart_func(chart_data, str(output_file), **kwargs)
+            if self.figure_cache is not None and output_file.exists():
+                self.figure_cache.store(cache_key, [output_file], output_dir)
             return True
             
         except (ValueError, KeyError, TypeError, IOError) as e:
@@ -15,6 +15,8 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
 
+from src.utils.run_metrics_table import RunMetricsTable
+
 
 def _infer_format_from_path(output_path: str) -> str:
     """Infer image format from file extension.
@@ -496,7 +498,8 @@ def aggregate_framework_metrics(
     """
     Aggregate metrics across multiple runs of the same framework.
     
-    Computes mean values for all metrics across runs.
+    Computes mean values of each aggregate metric across the runs that
+    report it.
     
     Args:
         framework_run_dirs: List of paths to run directories for a framework.
@@ -506,23 +509,25 @@ def aggregate_framework_metrics(
     
     Raises:
         ValueError: If framework_run_dirs is empty.
+        FileNotFoundError: If a run has no metrics.json.
     """
     if not framework_run_dirs:
         raise ValueError("framework_run_dirs cannot be empty")
     
-    # Load all runs
-    all_metrics = []
-    for run_dir in framework_run_dirs:
-        metrics = load_metrics_from_run(run_dir)
-        all_metrics.append(metrics)
+    metrics_paths = [Path(run_dir) / "metrics.json" for run_dir in framework_run_dirs]
+    for metrics_path in metrics_paths:
+        if not metrics_path.exists():
+            raise FileNotFoundError(f"Metrics file not found: {metrics_path}")
+    
+    # Load all runs into one columnar table
+    runs = RunMetricsTable.from_files(metrics_paths)
     
     # Compute means
-    metric_names = all_metrics[0].keys()
     aggregated = {}
-    
-    for metric in metric_names:
-        values = [m[metric] for m in all_metrics]
-        aggregated[metric] = np.mean(values)
+    for metric in runs.aggregate_keys():
+        values = runs.aggregate(metric)
+        if not np.isnan(values).all():
+            aggregated[metric] = float(np.nanmean(values))
     
     return aggregated
 
@@ -44,6 +44,7 @@ def main():
         try:
             runner = OrchestratorRunner(framework)
             result = runner.execute_single_run()
+            runner.export_manifest()
             
             if result['status'] == 'success':
                 print(f"\n✓ Run completed successfully")
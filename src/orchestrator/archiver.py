@@ -2,31 +2,247 @@
 Artifact archiving and integrity verification.
 
 Compresses run artifacts and computes checksums.
+
+The archive is written as a single stream: tar -> compressor -> file, with
+the SHA-256 computed on the compressed bytes as they are written, so the
+hash is known without reading the archive back. Compression uses a
+multi-threaded external codec when available (pigz for .tar.gz, zstd for
+.tar.zst) and falls back to the stdlib gzip module otherwise.
+
+Sprint workspaces often carry forward unchanged files from the previous
+sprint. Files whose content was already stored earlier in the archive are
+written as tar hard-link members pointing at the first copy instead of
+being compressed again.
 """
 
-import tarfile
+import gzip
 import hashlib
 import json
+import os
+import shutil
+import subprocess
+import tarfile
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from src.utils.content_store import OBJECTS_DIRNAME
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__, component="orchestrator")
 
+# Compression codec: "auto" (pigz if installed, else gzip), "gzip", "pigz" or "zstd"
+DEFAULT_COMPRESSION = "auto"
+DEFAULT_COMPRESSION_LEVEL = 6
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+PIPE_CHUNK_SIZE = 256 * 1024
+
+# codec -> (archive suffix, command builder)
+EXTERNAL_CODECS = {
+    'pigz': ('.tar.gz', lambda level: ['pigz', '-c', f'-{level}']),
+    'zstd': ('.tar.zst', lambda level: ['zstd', '-c', '-q', '-T0', f'-{level}']),
+}
+
+# codec -> (lowest, highest) compression level ("auto" uses the gzip range)
+COMPRESSION_LEVELS = {
+    'gzip': (0, 9),
+    'pigz': (0, 9),
+    'zstd': (1, 19),
+}
+COMPRESSION_CODECS = ('auto',) + tuple(COMPRESSION_LEVELS)
+
+
+class _HashingWriter:
+    """File wrapper hashing and counting every byte written."""
+
+    def __init__(self, fileobj: BinaryIO):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.fileobj.write(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self.fileobj.flush()
+
+
+def _hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    sha256_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha256_hash.update(block)
+    return sha256_hash.hexdigest()
+
+
+class _ContentIndex:
+    """
+    Finds files whose content was already added to the archive.
+
+    Files are grouped by size first; contents are only hashed when another
+    file of the same size was seen, so unique files are read just once.
+    """
+
+    def __init__(self):
+        self._by_size: Dict[int, List[List[Any]]] = {}
+
+    def find_duplicate(self, path: Path, size: int, arcname: str) -> Optional[str]:
+        """
+        Return the arcname of an earlier identical file, registering path otherwise.
+
+        Args:
+            path: File on disk
+            size: File size in bytes
+            arcname: Name of the file inside the archive
+
+        Returns:
+            Arcname of the identical earlier member, or None
+        """
+        candidates = self._by_size.setdefault(size, [])
+        if candidates:
+            digest = _hash_file(path)
+            for candidate in candidates:
+                if candidate[2] is None:
+                    candidate[2] = _hash_file(candidate[0])
+                if candidate[2] == digest:
+                    return candidate[1]
+            candidates.append([path, arcname, digest])
+        else:
+            candidates.append([path, arcname, None])
+        return None
+
+
+class _GzipCompressor:
+    """Stdlib gzip compressor (single-threaded fallback)."""
+
+    def __init__(self, writer: _HashingWriter, level: int):
+        # mtime=0 keeps the output identical for identical input
+        self._gzip = gzip.GzipFile(fileobj=writer, mode='wb', compresslevel=level, mtime=0)
+
+    def __enter__(self) -> gzip.GzipFile:
+        return self._gzip
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._gzip.close()
+
+
+class _ExternalCompressor:
+    """Multi-threaded compressor process (pigz, zstd) used as a stream filter."""
+
+    def __init__(self, command: List[str], writer: _HashingWriter):
+        self._command = command
+        self._writer = writer
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        self._pump_error: Optional[BaseException] = None
+        self._pump = threading.Thread(target=self._copy_output, daemon=True)
+        self._pump.start()
+
+    def _copy_output(self) -> None:
+        try:
+            for block in iter(lambda: self._process.stdout.read(PIPE_CHUNK_SIZE), b""):
+                self._writer.write(block)
+        except BaseException as e:
+            self._pump_error = e
+
+    def __enter__(self) -> BinaryIO:
+        return self._process.stdin
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self._pump.join()
+        stderr = self._process.stderr.read().decode(errors='replace')
+        returncode = self._process.wait()
+        if exc_type is None:
+            if self._pump_error is not None:
+                raise self._pump_error
+            if returncode != 0:
+                raise RuntimeError(
+                    f"{self._command[0]} exited with code {returncode}: {stderr.strip()[:500]}"
+                )
+
 
 class Archiver:
     """Handles artifact archiving and verification."""
     
-    def __init__(self, run_id: str, run_dir: Path):
+    def __init__(
+        self,
+        run_id: str,
+        run_dir: Path,
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL
+    ):
         """
         Initialize archiver for a run.
         
         Args:
             run_id: Run identifier
             run_dir: Run directory path
+            compression: Codec ("auto", "gzip", "pigz" or "zstd")
+            compression_level: Codec compression level
         """
         self.run_id = run_id
         self.run_dir = run_dir
+        self.compression = compression
+        self.compression_level = compression_level
+        # (path, size, mtime_ns, sha256) of the last archive written
+        self._last_archive: Optional[Tuple[Path, int, int, str]] = None
+        
+    def _resolve_codec(self) -> str:
+        """Pick the codec to use, falling back to stdlib gzip if a tool is missing."""
+        codec = self.compression
+        if codec == 'auto':
+            return 'pigz' if shutil.which('pigz') else 'gzip'
+        if codec in EXTERNAL_CODECS and not shutil.which(codec):
+            logger.warning(f"{codec} not found, falling back to gzip",
+                           extra={'run_id': self.run_id})
+            return 'gzip'
+        if codec != 'gzip' and codec not in EXTERNAL_CODECS:
+            raise ValueError(f"Unsupported archive compression: {codec}")
+        return codec
+        
+    def _add_path(
+        self,
+        tar: tarfile.TarFile,
+        path: Path,
+        arcname: str,
+        index: _ContentIndex,
+        exclude: List[Path],
+        stats: Dict[str, int]
+    ) -> None:
+        """Recursively add a path, storing repeated file contents as hard links."""
+        if path in exclude:
+            return
+        tarinfo = tar.gettarinfo(str(path), arcname)
+        if tarinfo is None:
+            return  # Sockets and other unsupported file types
+        
+        if tarinfo.isreg():
+            duplicate_of = index.find_duplicate(path, tarinfo.size, arcname) if tarinfo.size else None
+            if duplicate_of is not None:
+                tarinfo.type = tarfile.LNKTYPE
+                tarinfo.linkname = duplicate_of
+                tarinfo.size = 0
+                stats['deduplicated_files'] += 1
+                stats['deduplicated_bytes'] += path.stat().st_size
+                tar.addfile(tarinfo)
+            else:
+                with open(path, 'rb') as f:
+                    tar.addfile(tarinfo, f)
+            stats['files'] += 1
+        elif tarinfo.isdir():
+            tar.addfile(tarinfo)
+            for child in sorted(os.listdir(path)):
+                self._add_path(tar, path / child, f"{arcname}/{child}", index, exclude, stats)
+        else:
+            tar.addfile(tarinfo)
         
     def create_archive(
         self,
@@ -37,6 +253,9 @@ class Archiver:
         """
         Create compressed archive of run artifacts.
         
+        The archive is written to a temporary file and renamed into place; its
+        SHA-256 is computed while writing (see compute_hash()).
+        
         Args:
             workspace_dir: Framework workspace directory
             metrics_file: Path to metrics.json
@@ -44,60 +263,98 @@ class Archiver:
             
         Returns:
             Path to created archive
+            
+        Raises:
+            RuntimeError: If the external compressor fails
         """
-        archive_path = self.run_dir / "run.tar.gz"
+        codec = self._resolve_codec()
+        suffix = EXTERNAL_CODECS[codec][0] if codec in EXTERNAL_CODECS else '.tar.gz'
+        archive_path = self.run_dir / f"run{suffix}"
+        partial_path = archive_path.with_name(archive_path.name + ".partial")
         
-        with tarfile.open(archive_path, "w:gz") as tar:
-            # Add workspace
-            if workspace_dir.exists():
-                tar.add(workspace_dir, arcname="workspace")
-                logger.debug("Added workspace to archive",
-                           extra={'run_id': self.run_id})
-            
-            # Add metrics
-            if metrics_file.exists():
-                tar.add(metrics_file, arcname="metrics.json")
-                logger.debug("Added metrics to archive",
-                           extra={'run_id': self.run_id})
-            
-            # Add artifacts directory (generated code from frameworks like ChatDev)
-            artifacts_dir = self.run_dir / "artifacts"
-            if artifacts_dir.exists():
-                tar.add(artifacts_dir, arcname="artifacts")
-                logger.debug("Added artifacts to archive",
-                           extra={'run_id': self.run_id,
-                                 'metadata': {'artifact_count': len(list(artifacts_dir.iterdir()))}})
-            
-            # Add logs
-            for log_name, log_path in logs.items():
-                if log_path.exists():
-                    tar.add(log_path, arcname=log_name)
-                    logger.debug(f"Added {log_name} to archive",
-                               extra={'run_id': self.run_id})
+        # The workspace may be the run directory itself: never archive our own
+        # output, and store sprint files themselves rather than the blob store
+        exclude = [archive_path, partial_path, self.run_dir / OBJECTS_DIRNAME]
+        index = _ContentIndex()
+        stats = {'files': 0, 'deduplicated_files': 0, 'deduplicated_bytes': 0}
+        
+        with open(partial_path, 'wb') as raw:
+            writer = _HashingWriter(raw)
+            try:
+                with self._open_compressor(codec, writer) as stream:
+                    with tarfile.open(fileobj=stream, mode="w|") as tar:
+                        # Add workspace
+                        if workspace_dir.exists():
+                            self._add_path(tar, Path(workspace_dir), "workspace", index, exclude, stats)
+                            logger.debug("Added workspace to archive",
+                                       extra={'run_id': self.run_id})
+                        
+                        # Add metrics
+                        if metrics_file.exists():
+                            self._add_path(tar, Path(metrics_file), "metrics.json", index, exclude, stats)
+                            logger.debug("Added metrics to archive",
+                                       extra={'run_id': self.run_id})
+                        
+                        # Add artifacts directory (generated code from frameworks like ChatDev)
+                        artifacts_dir = self.run_dir / "artifacts"
+                        if artifacts_dir.exists():
+                            self._add_path(tar, artifacts_dir, "artifacts", index, exclude, stats)
+                            logger.debug("Added artifacts to archive",
+                                       extra={'run_id': self.run_id,
+                                             'metadata': {'artifact_count': len(list(artifacts_dir.iterdir()))}})
+                        
+                        # Add logs
+                        for log_name, log_path in logs.items():
+                            if log_path.exists():
+                                self._add_path(tar, Path(log_path), log_name, index, exclude, stats)
+                                logger.debug(f"Added {log_name} to archive",
+                                           extra={'run_id': self.run_id})
+            except BaseException:
+                raw.close()
+                partial_path.unlink(missing_ok=True)
+                raise
+        
+        os.replace(partial_path, archive_path)
+        stat = archive_path.stat()
+        self._last_archive = (archive_path, stat.st_size, stat.st_mtime_ns,
+                              writer.sha256.hexdigest())
                                
         logger.info(f"Archive created: {archive_path}",
-                   extra={'run_id': self.run_id, 'event': 'archive_created'})
+                   extra={'run_id': self.run_id, 'event': 'archive_created',
+                         'metadata': {'codec': codec, 'size_bytes': writer.size, **stats}})
                    
         return archive_path
         
+    def _open_compressor(self, codec: str, writer: _HashingWriter) -> Any:
+        """Open a writable compressed stream feeding writer."""
+        # A zstd level may exceed the gzip range after falling back to gzip
+        level = min(self.compression_level, COMPRESSION_LEVELS[codec][1])
+        if codec in EXTERNAL_CODECS:
+            command = EXTERNAL_CODECS[codec][1](level)
+            return _ExternalCompressor(command, writer)
+        return _GzipCompressor(writer, level)
+        
     def compute_hash(self, archive_path: Path) -> str:
         """
         Compute SHA-256 hash of archive.
         
+        The hash computed while create_archive() wrote the file is reused as
+        long as the file is unchanged; otherwise the file is read.
+        
         Args:
             archive_path: Path to archive file
             
         Returns:
             Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256()
+        hash_value = None
+        if self._last_archive and self._last_archive[0] == archive_path:
+            stat = archive_path.stat()
+            if (stat.st_size, stat.st_mtime_ns) == self._last_archive[1:3]:
+                hash_value = self._last_archive[3]
         
-        with open(archive_path, 'rb') as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-                
-        hash_value = sha256_hash.hexdigest()
+        if hash_value is None:
+            hash_value = _hash_file(archive_path)
         
         logger.info(f"Archive hash computed: {hash_value[:16]}...",
                    extra={'run_id': self.run_id, 'event': 'hash_computed'})
@@ -175,7 +432,8 @@ class Archiver:
         Returns:
             True if hashes match, False otherwise
         """
-        actual_hash = self.compute_hash(archive_path)
+        # Always re-read the file: this is the integrity check
+        actual_hash = _hash_file(archive_path)
         
         if actual_hash == expected_hash:
             logger.info("Archive integrity verified",
@@ -8,6 +8,19 @@ import yaml
 from pathlib import Path
 from typing import Any, Dict
 from src.utils.logger import get_logger
+from src.orchestrator.archiver import (
+    COMPRESSION_CODECS,
+    COMPRESSION_LEVELS,
+    DEFAULT_COMPRESSION,
+    DEFAULT_COMPRESSION_LEVEL
+)
+from src.orchestrator.port_slots import PORT_STRIDE, max_port_slots
+from src.analysis.stopping_methods import (
+    ALPHA_SPENDING_FUNCTIONS,
+    DEFAULT_STOPPING_METHOD,
+    SEQUENTIAL_ALPHA,
+    STOPPING_METHODS
+)
 
 logger = get_logger(__name__, component="orchestrator")
 
@@ -80,6 +93,22 @@ def validate_config(config: Dict[str, Any]) -> None:
     # Validate timeouts
     validate_timeouts(config['timeouts'])
     
+    # Validate optional load probe
+    if 'load_probe' in config:
+        validate_load_probe(config['load_probe'])
+    
+    # Validate optional sprint snapshot toggle (see runner._snapshot_sprint)
+    if not isinstance(config.get('sprint_snapshots', True), bool):
+        raise ConfigValidationError("sprint_snapshots must be a boolean")
+    
+    # Validate optional archive settings
+    if 'archive' in config:
+        validate_archive(config['archive'])
+    
+    # Validate optional concurrent scheduler settings
+    if 'scheduler' in config:
+        validate_scheduler(config['scheduler'], config['frameworks'])
+    
     # Validate paths exist
     validate_paths(config)
     
@@ -116,6 +145,14 @@ def validate_framework_config(name: str, config: Dict[str, Any]) -> None:
         raise ConfigValidationError(
             f"Framework '{name}' ui_port must be a positive integer"
         )
+    
+    # Optional GHSpec tuning (defaults in src/adapters/ghspec_adapter.py)
+    for key in ('task_concurrency', 'excerpt_budget_tokens', 'previous_code_budget_tokens'):
+        if key in config and (not isinstance(config[key], int)
+                              or isinstance(config[key], bool) or config[key] <= 0):
+            raise ConfigValidationError(
+                f"Framework '{name}' {key} must be a positive integer"
+            )
 
 
 def validate_stopping_rule(config: Dict[str, Any]) -> None:
@@ -152,6 +189,21 @@ def validate_stopping_rule(config: Dict[str, Any]) -> None:
     # Validate metrics list
     if not isinstance(config['metrics'], list) or len(config['metrics']) == 0:
         raise ConfigValidationError("metrics must be a non-empty list")
+    
+    # Optional sequential stopping settings
+    if config.get('method', DEFAULT_STOPPING_METHOD) not in STOPPING_METHODS:
+        raise ConfigValidationError(
+            f"method must be one of {list(STOPPING_METHODS)}"
+        )
+    
+    if config.get('alpha_spending', 'obrien_fleming') not in ALPHA_SPENDING_FUNCTIONS:
+        raise ConfigValidationError(
+            f"alpha_spending must be one of {list(ALPHA_SPENDING_FUNCTIONS)}"
+        )
+    
+    alpha = config.get('alpha', SEQUENTIAL_ALPHA)
+    if isinstance(alpha, bool) or not isinstance(alpha, (int, float)) or not (0 < alpha < 1):
+        raise ConfigValidationError("alpha must be a number between 0 and 1")
 
 
 def validate_timeouts(config: Dict[str, Any]) -> None:
@@ -177,6 +229,92 @@ def validate_timeouts(config: Dict[str, Any]) -> None:
             raise ConfigValidationError(
                 f"Timeout '{key}' must be a positive integer"
             )
+    
+    # Optional validation bounds (defaults in src/orchestrator/validator.py)
+    for key in ('validation_request_timeout_seconds', 'validation_deadline_seconds'):
+        if key in config and (not isinstance(config[key], (int, float))
+                              or isinstance(config[key], bool) or config[key] <= 0):
+            raise ConfigValidationError(
+                f"Timeout '{key}' must be a positive number"
+            )
+
+
+def validate_load_probe(config: Dict[str, Any]) -> None:
+    """
+    Validate load probe configuration.
+    
+    Args:
+        config: load_probe configuration dictionary
+        
+    Raises:
+        ConfigValidationError: If validation fails
+    """
+    if not isinstance(config, dict):
+        raise ConfigValidationError("'load_probe' must be a dictionary")
+    
+    if not isinstance(config.get('enabled', False), bool):
+        raise ConfigValidationError("load_probe.enabled must be a boolean")
+    
+    concurrency = config.get('concurrency', 1)
+    if not isinstance(concurrency, int) or isinstance(concurrency, bool) or concurrency <= 0:
+        raise ConfigValidationError("load_probe.concurrency must be a positive integer")
+    
+    duration = config.get('duration_seconds', 1)
+    if not isinstance(duration, (int, float)) or isinstance(duration, bool) or duration <= 0:
+        raise ConfigValidationError("load_probe.duration_seconds must be a positive number")
+
+
+def validate_archive(config: Dict[str, Any]) -> None:
+    """
+    Validate archive configuration.
+    
+    Args:
+        config: archive configuration dictionary
+        
+    Raises:
+        ConfigValidationError: If validation fails
+    """
+    if not isinstance(config, dict):
+        raise ConfigValidationError("'archive' must be a dictionary")
+    
+    codec = config.get('compression', DEFAULT_COMPRESSION)
+    if codec not in COMPRESSION_CODECS:
+        raise ConfigValidationError(
+            f"archive.compression must be one of {list(COMPRESSION_CODECS)}"
+        )
+    
+    low, high = COMPRESSION_LEVELS['gzip' if codec == 'auto' else codec]
+    level = config.get('level', DEFAULT_COMPRESSION_LEVEL)
+    if not isinstance(level, int) or isinstance(level, bool) or not (low <= level <= high):
+        raise ConfigValidationError(
+            f"archive.level must be an integer between {low} and {high} for {codec}"
+        )
+
+
+def validate_scheduler(config: Dict[str, Any], frameworks: Dict[str, Any]) -> None:
+    """
+    Validate scheduler configuration.
+    
+    Args:
+        config: scheduler configuration dictionary
+        frameworks: Frameworks section (bounds max_workers by port slots)
+        
+    Raises:
+        ConfigValidationError: If validation fails
+    """
+    if not isinstance(config, dict):
+        raise ConfigValidationError("'scheduler' must be a dictionary")
+    
+    max_workers = config.get('max_workers', 1)
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers <= 0:
+        raise ConfigValidationError("scheduler.max_workers must be a positive integer")
+    
+    port_slots = max_port_slots(frameworks)
+    if max_workers > port_slots:
+        raise ConfigValidationError(
+            f"scheduler.max_workers must be at most {port_slots} "
+            f"(each worker shifts framework ports by {PORT_STRIDE})"
+        )
 
 
 def validate_paths(config: Dict[str, Any]) -> None:
@@ -3,19 +3,24 @@ Manifest manager for tracking experiment runs.
 
 This module provides a quick-lookup index for all experiment runs
 without needing to scan the entire runs/ directory structure.
+
+Runs are stored in an indexed SQLite database (see ManifestStore) and
+are read from it directly. manifest.json is an export for external tools,
+written by export_manifest() at the end of a sweep rather than on every
+update.
 """
 
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from src.utils.logger import get_logger
 from src.utils.experiment_paths import ExperimentPaths
+from src.orchestrator.manifest_store import ManifestStore, MANIFEST_VERSION
 
 logger = get_logger(__name__, component="orchestrator")
 
-MANIFEST_VERSION = "1.0"
-
 
 def _get_empty_manifest() -> Dict[str, Any]:
     """Create an empty manifest structure."""
@@ -32,6 +37,20 @@ def _get_empty_manifest() -> Dict[str, Any]:
     }
 
 
+def _get_manifest_path(experiment_name: Optional[str] = None) -> Path:
+    """Get the manifest.json path for an experiment (or the standalone layout)."""
+    if experiment_name:
+        exp_paths = ExperimentPaths(experiment_name)
+        return exp_paths.manifest_path
+    # Standalone experiment: use runs/manifest.json
+    return Path("runs/manifest.json")
+
+
+def _manifest_exists(manifest_path: Path) -> bool:
+    """Check whether a manifest (JSON export or database) exists."""
+    return manifest_path.exists() or manifest_path.with_suffix(".db").exists()
+
+
 def get_manifest(experiment_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Load the current runs manifest.
@@ -42,24 +61,18 @@ def get_manifest(experiment_name: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dictionary with manifest data, or empty manifest if not found
     """
-    # Get manifest path
-    if experiment_name:
-        exp_paths = ExperimentPaths(experiment_name)
-        manifest_path = exp_paths.manifest_path
-    else:
-        # Standalone experiment: use runs/manifest.json
-        manifest_path = Path("runs/manifest.json")
+    manifest_path = _get_manifest_path(experiment_name)
     
-    if not manifest_path.exists():
+    if not _manifest_exists(manifest_path):
         logger.info("No manifest found, creating empty one")
         return _get_empty_manifest()
     
     try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-            logger.debug(f"Loaded manifest with {manifest['total_runs']} runs")
-            return manifest
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        with ManifestStore(manifest_path) as store:
+            manifest = store.to_manifest()
+        logger.debug(f"Loaded manifest with {manifest['total_runs']} runs")
+        return manifest
+    except (OSError, sqlite3.Error) as e:
         logger.error(f"Error loading manifest: {e}")
         logger.info("Returning empty manifest")
         return _get_empty_manifest()
@@ -69,6 +82,10 @@ def update_manifest(run_data: Dict[str, Any], experiment_name: Optional[str] = N
     """
     Update the manifest with new run information.
     
+    The run is upserted in the manifest database under its write lock, so
+    concurrent updates from several processes are never lost. manifest.json
+    is not rewritten (see export_manifest).
+    
     Args:
         run_data: Dictionary with run information containing:
             - run_id: Unique identifier
@@ -80,18 +97,7 @@ def update_manifest(run_data: Dict[str, Any], experiment_name: Optional[str] = N
             - total_tokens_out: Output tokens (optional)
         experiment_name: Name of experiment (optional, for backward compatibility)
     """
-    manifest = get_manifest(experiment_name)
-    
-    # Get manifest path
-    if experiment_name:
-        exp_paths = ExperimentPaths(experiment_name)
-        manifest_path = exp_paths.manifest_path
-    else:
-        # Standalone experiment: use runs/manifest.json
-        manifest_path = Path("runs/manifest.json")
-    
-    # Ensure directory exists
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path = _get_manifest_path(experiment_name)
     
     # Extract key fields
     run_id = run_data.get("run_id")
@@ -101,13 +107,6 @@ def update_manifest(run_data: Dict[str, Any], experiment_name: Optional[str] = N
         logger.error("run_id and framework are required in run_data")
         return
     
-    # Check if run already exists
-    existing_idx = None
-    for idx, run in enumerate(manifest["runs"]):
-        if run["run_id"] == run_id:
-            existing_idx = idx
-            break
-    
     # Build run entry
     run_entry = {
         "run_id": run_id,
@@ -120,26 +119,16 @@ def update_manifest(run_data: Dict[str, Any], experiment_name: Optional[str] = N
         "total_tokens_out": run_data.get("total_tokens_out", 0)
     }
     
-    if existing_idx is not None:
-        # Update existing run
-        manifest["runs"][existing_idx] = run_entry
-        logger.info(f"Updated run {run_id} in manifest")
-    else:
-        # Add new run
-        manifest["runs"].append(run_entry)
-        manifest["total_runs"] += 1
-        manifest["frameworks"][framework] = manifest["frameworks"].get(framework, 0) + 1
-        logger.info(f"Added run {run_id} to manifest")
-    
-    # Update timestamp
-    manifest["last_updated"] = datetime.utcnow().isoformat() + "Z"
-    
     # Save manifest
     try:
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        with ManifestStore(manifest_path) as store:
+            added = store.upsert(run_entry)
+        if added:
+            logger.info(f"Added run {run_id} to manifest")
+        else:
+            logger.info(f"Updated run {run_id} in manifest")
         logger.debug(f"Manifest saved to {manifest_path}")
-    except (OSError, IOError) as e:
+    except (OSError, sqlite3.Error) as e:
         logger.error(f"Error saving manifest: {e}")
 
 
@@ -161,26 +150,41 @@ def find_runs(
     Returns:
         List of matching run entries
     """
-    manifest = get_manifest(experiment_name)
-    runs = manifest["runs"]
-    
-    # Apply filters
-    if framework:
-        runs = [r for r in runs if r.get("framework") == framework]
-    
-    if verification_status:
-        runs = [r for r in runs if r.get("verification_status") == verification_status]
+    manifest_path = _get_manifest_path(experiment_name)
+    if not _manifest_exists(manifest_path):
+        return []
     
-    if min_tokens:
-        runs = [
-            r for r in runs 
-            if (r.get("total_tokens_in", 0) + r.get("total_tokens_out", 0)) >= min_tokens
-        ]
+    try:
+        with ManifestStore(manifest_path) as store:
+            runs = store.find(framework=framework,
+                              verification_status=verification_status,
+                              min_tokens=min_tokens)
+    except (OSError, sqlite3.Error) as e:
+        logger.error(f"Error querying manifest: {e}")
+        return []
     
     logger.debug(f"Found {len(runs)} runs matching filters")
     return runs
 
 
+def export_manifest(experiment_name: Optional[str] = None) -> Path:
+    """
+    Rewrite manifest.json from the manifest database.
+    
+    Called once at the end of a sweep (experiment, single-run CLI,
+    reconciliation pass); readers inside the orchestrator query the
+    database instead.
+    
+    Args:
+        experiment_name: Name of experiment (optional, for backward compatibility)
+    
+    Returns:
+        Path of the exported manifest.json
+    """
+    with ManifestStore(_get_manifest_path(experiment_name)) as store:
+        return store.export()
+
+
 def rebuild_manifest(experiment_name: Optional[str] = None) -> None:
     """
     Rebuild the manifest by scanning the runs/ directory.
@@ -252,14 +256,12 @@ def rebuild_manifest(experiment_name: Optional[str] = None) -> None:
             logger.error(f"Error processing {metadata_file}: {e}")
     
     # Save rebuilt manifest
-    manifest["last_updated"] = datetime.utcnow().isoformat() + "Z"
-    
     try:
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        with ManifestStore(manifest_path) as store:
+            store.replace_all(manifest["runs"])
+            store.export()
         logger.info(f"Rebuilt manifest with {manifest['total_runs']} runs")
-    except (OSError, IOError) as e:
+    except (OSError, sqlite3.Error) as e:
         logger.error(f"Error saving rebuilt manifest: {e}")
 
 
@@ -271,8 +273,6 @@ def remove_run(run_id: str, experiment_name: Optional[str] = None) -> None:
         run_id: The run ID to remove
         experiment_name: Name of experiment (optional, for backward compatibility)
     """
-    manifest = get_manifest(experiment_name)
-    
     # Get manifest path
     if experiment_name:
         exp_paths = ExperimentPaths(experiment_name)
@@ -281,20 +281,10 @@ def remove_run(run_id: str, experiment_name: Optional[str] = None) -> None:
         # Backward compatibility: use old path
         manifest_path = Path("runs/runs_manifest.json")
     
-    # Find and remove the run
-    for idx, run in enumerate(manifest["runs"]):
-        if run["run_id"] == run_id:
-            framework = run["framework"]
-            manifest["runs"].pop(idx)
-            manifest["total_runs"] -= 1
-            manifest["frameworks"][framework] = max(0, manifest["frameworks"].get(framework, 1) - 1)
-            manifest["last_updated"] = datetime.utcnow().isoformat() + "Z"
-            
-            # Save
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2)
-            
-            logger.info(f"Removed run {run_id} from manifest")
-            return
+    if _manifest_exists(manifest_path):
+        with ManifestStore(manifest_path) as store:
+            if store.remove(run_id):
+                logger.info(f"Removed run {run_id} from manifest")
+                return
     
     logger.warning(f"Run {run_id} not found in manifest")
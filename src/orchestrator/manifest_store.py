@@ -0,0 +1,351 @@
+"""
+SQLite-backed run manifest store.
+
+The manifest used to be a single JSON document that was loaded, scanned and
+rewritten in full on every update, so concurrent writers could lose
+updates. ManifestStore keeps the runs in an embedded SQLite database
+(manifest.db, next to manifest.json) with indexes on run_id, framework and
+verification_status:
+- Writes run in a BEGIN IMMEDIATE transaction (serialized across processes)
+  and touch only the affected row, so a write costs the same however many
+  runs the manifest holds
+- Lookups and filtered queries use the indexes instead of a full scan;
+  readers query the store, not the JSON file
+- manifest.json is an export, written on demand (export()) or once at the
+  end of a sweep (an experiment, a reconciliation pass, a rebuild)
+
+If manifest.json was changed by something other than the store (hand edits,
+older scripts), it is imported again the next time the store is opened.
+Runs written since the last export are kept when such an edit is imported.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="orchestrator")
+
+MANIFEST_VERSION = "1.0"
+DEFAULT_FRAMEWORKS = ("chatdev", "baes", "ghspec")
+# Seconds a writer waits for another process holding the write lock
+LOCK_TIMEOUT = 30
+
+RUN_FIELDS = (
+    "run_id",
+    "framework",
+    "path",
+    "start_time",
+    "end_time",
+    "verification_status",
+    "total_tokens_in",
+    "total_tokens_out",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    framework TEXT NOT NULL,
+    path TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    verification_status TEXT,
+    total_tokens_in INTEGER NOT NULL DEFAULT 0,
+    total_tokens_out INTEGER NOT NULL DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_framework ON runs(framework);
+CREATE INDEX IF NOT EXISTS idx_runs_verification_status ON runs(verification_status);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _utc_now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+class ManifestStore:
+    """Indexed run manifest with a manifest.json-compatible export."""
+
+    def __init__(self, manifest_path: Path, db_path: Optional[Path] = None):
+        """
+        Open (and create or migrate) the store for a manifest.json location.
+
+        Args:
+            manifest_path: Path of the JSON export (e.g. runs/manifest.json)
+            db_path: SQLite database path (default: manifest_path with a .db suffix)
+        """
+        self.manifest_path = Path(manifest_path)
+        self.db_path = Path(db_path) if db_path else self.manifest_path.with_suffix(".db")
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=LOCK_TIMEOUT,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._import_external_changes()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ManifestStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction holding the database write lock."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _json_signature(self) -> Optional[str]:
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _import_external_changes(self) -> None:
+        """
+        Import manifest.json if it was not written by this store.
+
+        The export replaces the stored runs when the store has no writes
+        since its last export; otherwise the edited runs are merged in, so
+        runs the stale export does not contain are not lost.
+        """
+        signature = self._json_signature()
+        if signature is None or signature == self._get_meta("json_signature"):
+            return
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                runs = json.load(f).get("runs", [])
+        except (OSError, ValueError) as e:
+            logger.error(f"Error importing manifest {self.manifest_path}: {e}")
+            return
+
+        with self._write() as conn:
+            # Re-check under the lock: another process may have imported it
+            if self._json_signature() != self._get_meta("json_signature"):
+                if self._get_meta("unexported_writes"):
+                    logger.warning(f"{self.manifest_path} was edited while the store had "
+                                   f"unexported runs; merging the edited runs")
+                else:
+                    conn.execute("DELETE FROM runs")
+                for run in runs:
+                    if run.get("run_id") and run.get("framework"):
+                        self._upsert(conn, run)
+                self._set_meta(conn, "json_signature", self._json_signature())
+        logger.info(f"Imported {len(runs)} runs from {self.manifest_path}")
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, entry: Dict[str, Any]) -> bool:
+        extra = {k: v for k, v in entry.items() if k not in RUN_FIELDS}
+        values = (
+            entry.get("framework"),
+            entry.get("path"),
+            entry.get("start_time"),
+            entry.get("end_time"),
+            entry.get("verification_status"),
+            entry.get("total_tokens_in") or 0,
+            entry.get("total_tokens_out") or 0,
+            json.dumps(extra) if extra else None,
+        )
+        cursor = conn.execute(
+            "UPDATE runs SET framework = ?, path = ?, start_time = ?, end_time = ?, "
+            "verification_status = ?, total_tokens_in = ?, total_tokens_out = ?, extra = ? "
+            "WHERE run_id = ?",
+            (*values, entry["run_id"])
+        )
+        if cursor.rowcount:
+            return False
+        conn.execute(
+            "INSERT INTO runs (framework, path, start_time, end_time, verification_status, "
+            "total_tokens_in, total_tokens_out, extra, run_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (*values, entry["run_id"])
+        )
+        return True
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        entry = {field: row[field] for field in RUN_FIELDS}
+        if row["extra"]:
+            entry.update(json.loads(row["extra"]))
+        return entry
+
+    def _mark_written(self, conn: sqlite3.Connection) -> None:
+        """Record a write that manifest.json does not reflect yet."""
+        self._set_meta(conn, "last_updated", _utc_now())
+        self._set_meta(conn, "unexported_writes", "1")
+
+    def upsert(self, entry: Dict[str, Any]) -> bool:
+        """
+        Insert or replace a run entry (manifest.json is not rewritten).
+
+        Args:
+            entry: Run entry (must contain run_id and framework)
+
+        Returns:
+            True if the run was added, False if an existing run was updated
+        """
+        with self._write() as conn:
+            inserted = self._upsert(conn, entry)
+            self._mark_written(conn)
+        return inserted
+
+    def remove(self, run_id: str) -> bool:
+        """
+        Remove a run (manifest.json is not rewritten).
+
+        Args:
+            run_id: Run to remove
+
+        Returns:
+            True if the run existed
+        """
+        with self._write() as conn:
+            removed = conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,)).rowcount > 0
+            if removed:
+                self._mark_written(conn)
+        return removed
+
+    def replace_all(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Replace every run (used when rebuilding from the runs/ directory).
+
+        Args:
+            entries: Complete list of run entries
+        """
+        with self._write() as conn:
+            conn.execute("DELETE FROM runs")
+            for entry in entries:
+                self._upsert(conn, entry)
+            self._mark_written(conn)
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a run by id.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Run entry, or None if unknown
+        """
+        row = self._conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def find(
+        self,
+        framework: Optional[str] = None,
+        verification_status: Optional[str] = None,
+        min_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query runs in insertion order using the indexes.
+
+        Args:
+            framework: Filter by framework name
+            verification_status: Filter by verification status
+            min_tokens: Filter by minimum total tokens (in + out)
+
+        Returns:
+            List of matching run entries
+        """
+        clauses = []
+        params: List[Any] = []
+        if framework:
+            clauses.append("framework = ?")
+            params.append(framework)
+        if verification_status:
+            clauses.append("verification_status = ?")
+            params.append(verification_status)
+        if min_tokens:
+            clauses.append("total_tokens_in + total_tokens_out >= ?")
+            params.append(min_tokens)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(f"SELECT * FROM runs{where} ORDER BY seq", params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def _framework_counts(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        counts = {framework: 0 for framework in DEFAULT_FRAMEWORKS}
+        for row in conn.execute("SELECT framework, COUNT(*) AS n FROM runs GROUP BY framework"):
+            counts[row["framework"]] = row["n"]
+        return counts
+
+    def _build_manifest(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        runs = [self._row_to_entry(row)
+                for row in conn.execute("SELECT * FROM runs ORDER BY seq")]
+        return {
+            "version": MANIFEST_VERSION,
+            "last_updated": self._get_meta("last_updated") or _utc_now(),
+            "total_runs": len(runs),
+            "frameworks": self._framework_counts(conn),
+            "runs": runs
+        }
+
+    def to_manifest(self) -> Dict[str, Any]:
+        """
+        Build the manifest.json-compatible document.
+
+        Returns:
+            Dictionary with version, last_updated, total_runs, frameworks and runs
+        """
+        return self._build_manifest(self._conn)
+
+    def _export(self, conn: sqlite3.Connection) -> None:
+        """Atomically rewrite manifest.json (caller holds the write lock)."""
+        manifest = self._build_manifest(conn)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.manifest_path.parent,
+                                        prefix=self.manifest_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._set_meta(conn, "json_signature", self._json_signature())
+        self._set_meta(conn, "unexported_writes", None)
+
+    def export(self) -> Path:
+        """
+        Write manifest.json from the current store contents.
+
+        This is the only place the whole manifest is serialized; call it
+        once after a batch of writes, not after each one.
+
+        Returns:
+            Path of the written manifest.json
+        """
+        with self._write() as conn:
+            self._export(conn)
+        return self.manifest_path
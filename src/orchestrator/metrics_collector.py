@@ -268,6 +268,44 @@ class MetricsCollector:
             'cost_breakdown': cost['COST_BREAKDOWN']
         }
     
+    def apply_call_ledger(self, metrics: Dict[str, Any], ledger_summary: Dict[str, Any]) -> None:
+        """
+        Fill token metrics provisionally from the run's call ledger.
+        
+        Token counts from the Chat Completions responses are known as soon as
+        the run ends; UsageReconciler later overwrites them with Usage API
+        totals, which remain the verification source.
+        
+        Args:
+            metrics: Metrics from get_aggregate_metrics (updated in place)
+            ledger_summary: Result of call_ledger.summarize_ledger
+        """
+        aggregate = metrics['aggregate_metrics']
+        for key in ('TOK_IN', 'TOK_OUT', 'API_CALLS', 'CACHED_TOKENS'):
+            aggregate[key] = ledger_summary[key]
+        
+        tok_in = ledger_summary['TOK_IN']
+        aggregate['AEI'] = aggregate['AUTR'] / math.log(1 + tok_in) if tok_in > 0 else 0.0
+        cost = self.cost_calculator.calculate_cost(
+            tokens_in=tok_in,
+            tokens_out=ledger_summary['TOK_OUT'],
+            cached_tokens=ledger_summary['CACHED_TOKENS']
+        )
+        aggregate['COST_USD'] = cost['total_cost']
+        metrics['provisional_usage'] = {'source': 'call_ledger', **ledger_summary}
+        
+        logger.info(
+            "Token metrics filled provisionally from call ledger",
+            extra={
+                'run_id': self.run_id,
+                'metadata': {
+                    'api_calls': ledger_summary['API_CALLS'],
+                    'tokens_in': tok_in,
+                    'tokens_out': ledger_summary['TOK_OUT']
+                }
+            }
+        )
+    
     def save_metrics(
         self,
         output_path,
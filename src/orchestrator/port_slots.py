@@ -0,0 +1,33 @@
+"""
+Port slots for concurrently executing runs.
+
+Every in-flight run of the scheduler gets a slot whose index times
+PORT_STRIDE is added to the framework's api_port and ui_port. Kept free of
+heavy imports so configuration validation can bound scheduler.max_workers
+without importing the scheduler.
+"""
+
+from typing import Any, Dict
+
+# Port offset applied per worker slot. Framework base ports are spaced 100
+# apart (8100/8200/8300 for APIs, 8600/8700/8800 for UIs), so a stride of
+# 1000 keeps every (framework, slot) pair on a distinct port.
+PORT_STRIDE = 1000
+MAX_PORT = 65535
+
+
+def max_port_slots(frameworks: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Number of worker slots whose shifted ports stay within the valid range.
+
+    Args:
+        frameworks: The config's frameworks section (api_port/ui_port per framework)
+
+    Returns:
+        Maximum usable max_workers (0 if a base port is already out of range)
+    """
+    highest_port = max(
+        max(fw['api_port'], fw['ui_port'])
+        for fw in frameworks.values()
+    )
+    return max(0, (MAX_PORT - highest_port) // PORT_STRIDE + 1)
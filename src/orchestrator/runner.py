@@ -4,17 +4,19 @@ Orchestrator runner for managing single and multi-framework executions.
 Handles timeouts, retries, and full run lifecycle with per-run, per-step logging.
 """
 
-import signal
 import time
 import os
 import json
 import hashlib
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import subprocess
-from src.utils.logger import get_logger, LogContext
+from src.utils.logger import get_logger, LogContext, enable_async_logging, flush_logs
 from src.utils.log_summary import LogSummarizer
+from src.utils.deadline import run_with_deadline, DeadlineExceeded
+from src.utils.content_store import clone_file, snapshot_sprint
 from src.utils.isolation import (
     create_isolated_workspace,
     cleanup_workspace,
@@ -23,14 +25,26 @@ from src.utils.isolation import (
     get_previous_sprint_artifacts
 )
 from src.utils.api_client import OpenAIAPIClient
+from src.utils.call_ledger import CALL_LEDGER_FILENAME, summarize_ledger
 from src.orchestrator.config_loader import load_config, set_deterministic_seeds
 from src.orchestrator.metrics_collector import MetricsCollector
-from src.orchestrator.validator import Validator
-from src.orchestrator.archiver import Archiver
+from src.orchestrator.validator import (
+    Validator,
+    REQUEST_TIMEOUT as VALIDATION_REQUEST_TIMEOUT,
+    VALIDATION_DEADLINE,
+    LOAD_PROBE_CONCURRENCY,
+    LOAD_PROBE_DURATION
+)
+from src.orchestrator.archiver import Archiver, DEFAULT_COMPRESSION, DEFAULT_COMPRESSION_LEVEL
 from src.adapters.baes_adapter import BAeSAdapter
 from src.adapters.chatdev_adapter import ChatDevAdapter
 from src.adapters.ghspec_adapter import GHSpecAdapter
-from src.analysis.stopping_rule import check_convergence, get_convergence_summary
+from src.analysis.stopping_methods import DEFAULT_STOPPING_METHOD
+from src.analysis.stopping_rule import (
+    SequentialStoppingEngine,
+    check_convergence,
+    get_convergence_summary
+)
 from src.config.step_config import get_enabled_steps
 
 logger = get_logger(__name__, component="orchestrator")
@@ -45,6 +59,11 @@ INITIAL_BACKOFF = 5  # seconds
 
 class StepTimeoutError(Exception):
     """Raised when a step execution times out."""
+    
+    def __init__(self, message: str, elapsed_seconds: Optional[float] = None, abandoned: bool = False):
+        super().__init__(message)
+        self.elapsed_seconds = elapsed_seconds
+        self.abandoned = abandoned  # Step still running after cancellation
 
 
 class OrchestratorRunner:
@@ -55,7 +74,8 @@ class OrchestratorRunner:
         framework_name: str,
         config_path: str = "config/experiment.yaml",
         experiment_name: Optional[str] = None,
-        run_id: Optional[str] = None
+        run_id: Optional[str] = None,
+        port_offset: int = 0
     ):
         """
         Initialize orchestrator runner.
@@ -65,6 +85,8 @@ class OrchestratorRunner:
             config_path: Path to experiment configuration
             experiment_name: Name of experiment (optional, for multi-experiment support)
             run_id: Pre-generated run ID (optional, will generate if not provided)
+            port_offset: Offset added to the framework's api_port and ui_port,
+                        used to keep concurrent runs on distinct ports
         """
         self.framework_name = framework_name
         self.config_path = config_path
@@ -77,7 +99,9 @@ class OrchestratorRunner:
         self.workspace_path = None
         self.run_id = run_id  # Use provided run_id or generate later
         self.step_timeout_occurred = False
+        self.step_timeout = STEP_TIMEOUT
         self.hitl_log_path = None
+        self.port_offset = port_offset
         
     def _log_hitl_event(
         self,
@@ -133,17 +157,16 @@ class OrchestratorRunner:
             }
         )
         
-    def _timeout_handler(self, _signum, _frame):
-        """Signal handler for step timeout."""
-        self.step_timeout_occurred = True
-        logger.error("Step timeout occurred",
-                    extra={'run_id': self.run_id, 'event': 'step_timeout'})
-        raise StepTimeoutError("Step execution exceeded timeout")
-        
     def _execute_step_with_timeout(self, step_num: int, command_text: str) -> Dict[str, Any]:
         """
         Execute a step with timeout enforcement.
         
+        The deadline is enforced without SIGALRM, so it works from any thread
+        or worker process. On timeout the adapter is cancelled: its child
+        process groups are terminated (escalating to SIGKILL after the grace
+        period) and its cancel event stops cooperative code (e.g. GHSpec API
+        calls) at the next checkpoint.
+        
         Args:
             step_num: Step number
             command_text: Command to execute
@@ -152,37 +175,40 @@ class OrchestratorRunner:
             Step execution results
             
         Raises:
-            StepTimeoutError: If step exceeds timeout
+            StepTimeoutError: If step exceeds timeout (`abandoned` is True when
+                the step was still running after cancellation)
         """
-        # Set up timeout alarm
-        signal.signal(signal.SIGALRM, self._timeout_handler)
-        signal.alarm(STEP_TIMEOUT)
-        
+        self.adapter.cancel_event.clear()
         try:
-            result = self.adapter.execute_step(step_num, command_text)
-            signal.alarm(0)  # Cancel alarm
-            return result
-        except StepTimeoutError:
-            # Attempt graceful shutdown
-            logger.warning("Attempting graceful shutdown after timeout",
-                          extra={'run_id': self.run_id})
-            try:
-                if self.adapter.process:
-                    self.adapter.process.terminate()
-                    time.sleep(SHUTDOWN_GRACE_PERIOD)
-                    
-                    # Force kill if still running
-                    if self.adapter.process.poll() is None:
-                        logger.warning("Force killing timed out process",
-                                      extra={'run_id': self.run_id})
-                        self.adapter.process.kill()
-            except Exception as e:
-                logger.error("Error during timeout cleanup",
-                           extra={'run_id': self.run_id, 
-                                 'metadata': {'error': str(e)}})
-            raise
-        finally:
-            signal.alarm(0)  # Ensure alarm is cancelled
+            return run_with_deadline(
+                self.adapter.execute_step,
+                self.step_timeout,
+                step_num,
+                command_text,
+                name=f"step-{self.run_id}-{step_num}",
+                on_timeout=self._cancel_timed_out_step,
+                cancel_grace=SHUTDOWN_GRACE_PERIOD
+            )
+        except DeadlineExceeded as e:
+            self.step_timeout_occurred = True
+            logger.error("Step timeout occurred",
+                        extra={'run_id': self.run_id, 'step': step_num,
+                              'event': 'step_timeout',
+                              'metadata': {'timeout': self.step_timeout,
+                                          'elapsed_seconds': round(e.elapsed_seconds, 1),
+                                          'abandoned': e.still_running}})
+            raise StepTimeoutError(
+                f"Step execution exceeded timeout of {self.step_timeout}s "
+                f"(cancelled after {e.elapsed_seconds:.1f}s)",
+                elapsed_seconds=e.elapsed_seconds,
+                abandoned=e.still_running
+            ) from e
+    
+    def _cancel_timed_out_step(self) -> None:
+        """Cancel the adapter's running step (kills its child processes)."""
+        logger.warning("Attempting graceful shutdown after timeout",
+                      extra={'run_id': self.run_id})
+        self.adapter.cancel(SHUTDOWN_GRACE_PERIOD)
             
     def _execute_step_with_retry(self, step_num: int, command_text: str) -> Dict[str, Any]:
         """
@@ -226,6 +252,13 @@ class OrchestratorRunner:
                                    'metadata': {'attempt': attempt + 1, 
                                               'error': str(e)}})
                 
+                # A step that did not stop may still be writing to the
+                # workspace; a second attempt would run on top of it
+                if isinstance(e, StepTimeoutError) and e.abandoned:
+                    logger.error("Not retrying: timed out step is still running",
+                               extra={'run_id': self.run_id, 'step': step_num})
+                    break
+                
                 if attempt == MAX_RETRIES:
                     logger.error("All retries exhausted",
                                extra={'run_id': self.run_id, 'step': step_num})
@@ -298,6 +331,36 @@ class OrchestratorRunner:
         logger.debug(f"Saved sprint validation",
                     extra={'run_id': self.run_id})
     
+    def _snapshot_sprint(self, run_dir: Path, sprint_num: int) -> None:
+        """
+        Snapshot a finished sprint's artifacts into the run's content store.
+        
+        Unchanged files are hard-linked to shared blobs and the tree is
+        recorded in sprint_NNN/tree.json. Files the adapters carried over
+        from the previous sprint keep their blob's size and mtime
+        (IncrementalCopier), so only changed files are read and stored. Failures are logged, not raised.
+        
+        Args:
+            run_dir: Run directory
+            sprint_num: Finished sprint number
+        """
+        if not self.config.get('sprint_snapshots', True):
+            return
+        try:
+            tree = snapshot_sprint(run_dir, sprint_num)
+        except OSError as e:
+            logger.warning(f"Failed to snapshot sprint {sprint_num}: {e}",
+                          extra={'run_id': self.run_id, 'sprint': sprint_num})
+            return
+        if tree:
+            logger.info(f"Snapshotted sprint {sprint_num}",
+                       extra={'run_id': self.run_id, 'sprint': sprint_num,
+                             'event': 'sprint_snapshot',
+                             'metadata': {'files': tree['file_count'],
+                                          'new_blobs': tree['new_blobs'],
+                                          'new_bytes': tree['new_bytes'],
+                                          'total_bytes': tree['total_bytes']}})
+    
     def _generate_run_readme(
         self,
         run_dir: Path,
@@ -397,10 +460,25 @@ cat sprint_001/metadata.json
         """
 
         try:
+            # Adapters log per copied file and per API call: write logs in the
+            # background (flushed on step boundaries); BAES_ASYNC_LOGS=0 opts out
+            if os.environ.get('BAES_ASYNC_LOGS', '1').lower() not in ('0', 'false', 'no'):
+                enable_async_logging()
+            
             # Load configuration
             self.config = load_config(self.config_path)
             framework_config = self.config['frameworks'][self.framework_name]
             
+            # Shift ports when running alongside other runs (scheduler mode)
+            if self.port_offset:
+                framework_config['api_port'] += self.port_offset
+                framework_config['ui_port'] += self.port_offset
+            
+            # Per-step deadline (enforced without SIGALRM, safe in worker threads)
+            self.step_timeout = self.config.get('timeouts', {}).get(
+                'step_timeout_seconds', STEP_TIMEOUT
+            )
+            
             # Set deterministic seeds for reproducibility (T037)
             set_deterministic_seeds(self.config['random_seed'])
             
@@ -430,14 +508,20 @@ cat sprint_001/metadata.json
             
             # Initialize components
             self.metrics_collector = MetricsCollector(self.run_id, model=self.config['model'])
+            timeouts_config = self.config.get('timeouts', {})
             self.validator = Validator(
                 api_base_url=f"http://localhost:{framework_config['api_port']}",
                 ui_base_url=f"http://localhost:{framework_config['ui_port']}",
-                run_id=self.run_id
+                run_id=self.run_id,
+                request_timeout=timeouts_config.get('validation_request_timeout_seconds', VALIDATION_REQUEST_TIMEOUT),
+                validation_deadline=timeouts_config.get('validation_deadline_seconds', VALIDATION_DEADLINE)
             )
+            archive_config = self.config.get('archive', {})
             self.archiver = Archiver(
                 run_id=self.run_id,
-                run_dir=run_dir
+                run_dir=run_dir,
+                compression=archive_config.get('compression', DEFAULT_COMPRESSION),
+                compression_level=archive_config.get('level', DEFAULT_COMPRESSION_LEVEL)
             )
             
             # Initialize framework adapter
@@ -551,23 +635,20 @@ cat sprint_001/metadata.json
                             # Copy context_store.json if it exists
                             prev_context_store = prev_sprint_dir / "database" / "context_store.json"
                             if prev_context_store.exists():
-                                import shutil
-                                shutil.copy2(prev_context_store, self.adapter.database_dir / "context_store.json")
+                                clone_file(prev_context_store, self.adapter.database_dir / "context_store.json")
                                 logger.info(f"Copied context_store.json from sprint {prev_sprint_num}",
                                            extra={'run_id': self.run_id, 'sprint': sprint_num})
                             
                             # Copy SQLite database if it exists
                             prev_db = prev_sprint_dir / "managed_system" / "app" / "database" / "baes_system.db"
                             if prev_db.exists():
-                                import shutil
                                 # Copy to managed_system/app/database/ (where BAES generates/modifies it)
                                 (self.adapter.managed_system_dir / "app" / "database").mkdir(parents=True, exist_ok=True)
-                                shutil.copy2(prev_db, self.adapter.managed_system_dir / "app" / "database" / "baes_system.db")
+                                clone_file(prev_db, self.adapter.managed_system_dir / "app" / "database" / "baes_system.db")
                                 logger.info(f"Copied baes_system.db from sprint {prev_sprint_num}",
                                            extra={'run_id': self.run_id, 'sprint': sprint_num})
                         
                         # Update environment variables for the new sprint workspace
-                        import os
                         os.environ['BAE_CONTEXT_STORE_PATH'] = str(self.adapter.database_dir / "context_store.json")
                         os.environ['MANAGED_SYSTEM_PATH'] = str(self.adapter.managed_system_dir)
                     elif self.framework_name == 'chatdev':
@@ -577,6 +658,10 @@ cat sprint_001/metadata.json
                         # Recreate the directory structure for the new sprint workspace
                         self.adapter._setup_workspace_structure()
                     
+                    # Previous sprint is finished (and its state seeded above): snapshot it
+                    if sprint_num > 1:
+                        self._snapshot_sprint(run_dir, sprint_num - 1)
+                    
                     # Execute step with timeout and retry (use original step ID)
                     result = self._execute_step_with_retry(step_config.id, command_text)
                     retries = result.get('retry_count', 0)
@@ -772,8 +857,25 @@ cat sprint_001/metadata.json
                 zdi=zdi
             )
             
+            # Optional load probe against the generated API (LOAD_* metrics
+            # must be declared in the experiment's metrics section)
+            load_probe_config = self.config.get('load_probe', {})
+            if load_probe_config.get('enabled', False):
+                timestamp = dt.now().strftime("%H:%M:%S")
+                print(f"        ⋯ Load probe | {timestamp}", flush=True)
+                metrics['aggregate_metrics'].update(self.validator.run_load_probe(
+                    concurrency=load_probe_config.get('concurrency', LOAD_PROBE_CONCURRENCY),
+                    duration_seconds=load_probe_config.get('duration_seconds', LOAD_PROBE_DURATION)
+                ))
+            
+            # Provisional token metrics from the per-call ledger (adapters that
+            # call the API directly); the Usage API stays the verification source
+            ledger_summary = summarize_ledger(Path(run_dir) / CALL_LEDGER_FILENAME)
+            if ledger_summary:
+                self.metrics_collector.apply_call_ledger(metrics, ledger_summary)
+            
             # LAZY EVALUATION: Skip Usage API verification during execution
-            # Token metrics are 0 initially and will be backfilled by reconciliation script
+            # Token metrics are 0 (or provisional) initially and will be backfilled by reconciliation script
             # Set verification_status to 'pending' to indicate reconciliation is needed
             logger.info("Skipping Usage API verification (lazy evaluation - reconciliation required)",
                        extra={'run_id': self.run_id, 'event': 'lazy_evaluation'})
@@ -783,6 +885,9 @@ cat sprint_001/metadata.json
             }
             metrics['verification_status'] = 'pending'
             
+            # Per-endpoint latency percentiles observed during validation
+            metrics['validation_latency'] = self.validator.latency_metrics()
+            
             # Save metrics
             metrics_file = Path(run_dir) / "metrics.json"
             with open(metrics_file, 'w', encoding='utf-8') as f:
@@ -820,6 +925,13 @@ cat sprint_001/metadata.json
             timestamp = dt.now().strftime("%H:%M:%S")
             print(f"        ⋯ Archiving | {timestamp}", flush=True)
             
+            # Archive and summary read the log files: drain the async writer
+            flush_logs()
+            
+            # Final sprint was still served during validation: snapshot it now
+            if last_successful_sprint > 0:
+                self._snapshot_sprint(run_dir, last_successful_sprint)
+            
             logs_dir = Path(run_dir) / "logs"
             self.archiver.save_commit_info(framework_config['commit_hash'])
             archive_path = self.archiver.create_archive(
@@ -848,7 +960,7 @@ cat sprint_001/metadata.json
             
             summary_config = {
                 'model': self.config.get('model'),
-                'step_timeout': STEP_TIMEOUT,
+                'step_timeout': self.step_timeout,
                 'max_retries': MAX_RETRIES,
                 'random_seed': self.config.get('random_seed')
             }
@@ -889,13 +1001,15 @@ cat sprint_001/metadata.json
                 'archive_path': archive_path
             }
             
-        except StepTimeoutError:
+        except StepTimeoutError as e:
             logger.error("Run failed due to timeout",
-                        extra={'run_id': self.run_id, 'event': 'run_timeout'})
+                        extra={'run_id': self.run_id, 'event': 'run_timeout',
+                              'metadata': {'elapsed_seconds': e.elapsed_seconds}})
             return {
                 'status': 'timeout_failure',
                 'run_id': self.run_id,
-                'error': 'Step execution timeout'
+                'error': 'Step execution timeout',
+                'elapsed_seconds': e.elapsed_seconds
             }
             
         except Exception as e:
@@ -921,20 +1035,55 @@ cat sprint_001/metadata.json
                     logger.warning("Error during adapter shutdown",
                                  extra={'run_id': self.run_id,
                                        'metadata': {'error': str(e)}})
+            
+            if self.validator:
+                self.validator.close()
+            
+            # Pool workers exit without running atexit handlers
+            flush_logs()
+    
+    def export_manifest(self) -> None:
+        """
+        Write manifest.json from the manifest database for external tools.
+        
+        Runs are only upserted into the database while executing, so entry
+        points call this once after their last run (execute_multi_framework
+        does so itself). Failures are logged, not raised.
+        """
+        from src.orchestrator.manifest_manager import export_manifest
+        try:
+            export_manifest(self.experiment_name)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to export manifest: {e}")
     
     def execute_multi_framework(
         self,
-        frameworks: Optional[List[str]] = None
+        frameworks: Optional[List[str]] = None,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Execute experiments across multiple frameworks with stopping rule.
         
-        Runs each framework until convergence is achieved (5-25 runs per framework).
-        Uses bootstrap confidence intervals to determine convergence.
+        Runs each framework until the stopping rule is satisfied (between
+        stopping_rule.min_runs and stopping_rule.max_runs runs per framework).
+        With stopping_rule.method "bootstrap" (default), a framework stops
+        once the bootstrap confidence intervals of its metrics are narrow
+        enough (check_convergence). With "sequential", a
+        SequentialStoppingEngine tracks running statistics and also stops a
+        framework once all of its comparisons with the other frameworks are
+        conclusive.
+        
+        With max_workers > 1, runs are executed concurrently by RunScheduler
+        (frameworks and runs within a framework share a bounded worker pool,
+        each run in its own process with its own run directory, ports and
+        log context). Otherwise runs are executed serially, one run per
+        framework in turn.
         
         Args:
             frameworks: List of framework names to execute. 
                        If None, executes all frameworks from config.
+            max_workers: Maximum number of concurrent runs. If None, uses
+                        scheduler.max_workers from config (default: 1).
         
         Returns:
             Dictionary with results for all frameworks:
@@ -965,91 +1114,163 @@ cat sprint_001/metadata.json
         logger.info("Starting multi-framework experiment",
                    extra={'metadata': {'frameworks': frameworks}})
         
+        if max_workers is None:
+            max_workers = self.config.get('scheduler', {}).get('max_workers', 1)
+        
+        stopping_rule = self.config['stopping_rule']
+        min_runs = stopping_rule['min_runs']
+        max_runs = stopping_rule['max_runs']
+        stopping_engine = None
+        if stopping_rule.get('method', DEFAULT_STOPPING_METHOD) == 'sequential':
+            stopping_engine = SequentialStoppingEngine.from_config(frameworks, stopping_rule)
+        
         all_results = {}
         total_runs = 0
         successful_runs = 0
         failed_runs = 0
         
-        for framework in frameworks:
-            logger.info(f"Starting experiments for framework: {framework}",
-                       extra={'metadata': {'framework': framework}})
+        if max_workers > 1:
+            from src.orchestrator.scheduler import RunScheduler
+            from src.analysis.report_generator import bootstrap_aggregate_metrics
             
-            framework_runs = []
-            framework_metrics = []
-            run_count = 0
+            scheduler = RunScheduler(
+                config=self.config,
+                config_path=self.config_path,
+                max_workers=max_workers,
+                experiment_name=self.experiment_name,
+                max_runs=max_runs,
+                min_runs=min_runs,
+                stopping_engine=stopping_engine,
+                stopping_rule=stopping_rule
+            )
+            scheduler_state = scheduler.run(frameworks)
             
-            # Execute runs until stopping rule satisfied
-            # TODO: #2 review MAX_RUNS and MIN_RUNS rules
-            while run_count < 25:  # MAX_RUNS
-                run_count += 1
-                total_runs += 1
+            for framework in frameworks:
+                fw_state = scheduler_state[framework]
+                framework_metrics = fw_state['metrics']
+                run_count = fw_state['run_count']
                 
-                logger.info(f"Executing run {run_count} for {framework}",
-                           extra={'metadata': {'framework': framework, 'run': run_count}})
+                total_runs += run_count
+                successful_runs += len(framework_metrics)
+                failed_runs += run_count - len(framework_metrics)
                 
-                # Create new runner for this run
-                runner = OrchestratorRunner(framework, self.config_path)
-                result = runner.execute_single_run()
-                
-                framework_runs.append(result)
-                
-                if result['status'] == 'success':
-                    successful_runs += 1
-                    # Extract aggregate metrics for convergence check
-                    metrics = result['metrics']['aggregate_metrics']
-                    framework_metrics.append(metrics)
-                else:
-                    failed_runs += 1
-                    logger.warning(f"Run {run_count} failed for {framework}",
-                                 extra={'metadata': {
-                                     'framework': framework,
-                                     'error': result.get('error')
-                                 }})
+                all_results[framework] = {
+                    'runs': fw_state['runs'],
+                    'convergence': fw_state['convergence'],
+                    'aggregate_metrics': bootstrap_aggregate_metrics(framework_metrics),
+                    'n_successful': len(framework_metrics),
+                    'n_failed': run_count - len(framework_metrics)
+                }
                 
-                # Check stopping rule (only if we have enough successful runs)
-                if len(framework_metrics) >= 5:  # MIN_RUNS
-                    convergence = check_convergence(
-                        framework_metrics,
-                        framework
-                    )
+                logger.info(f"Completed all runs for {framework}",
+                           extra={'metadata': {
+                               'framework': framework,
+                               'successful': len(framework_metrics),
+                               'failed': run_count - len(framework_metrics)
+                           }})
+        else:
+            from src.analysis.report_generator import bootstrap_aggregate_metrics
+            
+            # Frameworks take turns, one run each, so every stopping-rule look
+            # sees the other frameworks' runs so far (the sequential engine's
+            # comparisons need both sides to accumulate together)
+            framework_states = {
+                framework: {'runs': [], 'metrics': [], 'run_count': 0, 'convergence': None}
+                for framework in frameworks
+            }
+            active_frameworks = list(frameworks)
+            logger.info("Starting serial round-robin runs",
+                       extra={'metadata': {'frameworks': frameworks}})
+            
+            while active_frameworks:
+                for framework in list(active_frameworks):
+                    fw_state = framework_states[framework]
+                    fw_state['run_count'] += 1
+                    run_count = fw_state['run_count']
+                    total_runs += 1
+                    
+                    logger.info(f"Executing run {run_count} for {framework}",
+                               extra={'metadata': {'framework': framework, 'run': run_count}})
                     
-                    logger.info(f"Convergence check for {framework}",
-                               extra={'metadata': {
-                                   'framework': framework,
-                                   'runs': len(framework_metrics),
-                                   'should_stop': convergence['should_stop']
-                               }})
+                    # Create new runner for this run
+                    runner = OrchestratorRunner(framework, self.config_path)
+                    result = runner.execute_single_run()
                     
-                    if convergence['should_stop']:
-                        logger.info(f"Stopping rule satisfied for {framework}",
+                    fw_state['runs'].append(result)
+                    framework_metrics = fw_state['metrics']
+                    
+                    if result['status'] == 'success':
+                        successful_runs += 1
+                        # Extract aggregate metrics for convergence check
+                        metrics = result['metrics']['aggregate_metrics']
+                        framework_metrics.append(metrics)
+                        if stopping_engine is not None:
+                            stopping_engine.record(framework, metrics)
+                    else:
+                        failed_runs += 1
+                        logger.warning(f"Run {run_count} failed for {framework}",
+                                     extra={'metadata': {
+                                         'framework': framework,
+                                         'error': result.get('error')
+                                     }})
+                    
+                    # Check stopping rule (only if we have enough successful runs)
+                    if len(framework_metrics) >= min_runs:
+                        if stopping_engine is not None:
+                            convergence = stopping_engine.check(framework)
+                        else:
+                            convergence = check_convergence(
+                                framework_metrics,
+                                framework,
+                                min_runs=min_runs,
+                                max_runs=max_runs,
+                                half_width_threshold=stopping_rule['max_half_width_pct'] / 100,
+                                convergence_metrics=stopping_rule['metrics']
+                            )
+                        fw_state['convergence'] = convergence
+                        
+                        logger.info(f"Convergence check for {framework}",
                                    extra={'metadata': {
                                        'framework': framework,
                                        'runs': len(framework_metrics),
-                                       'reason': convergence['reason']
+                                       'should_stop': convergence['should_stop']
                                    }})
                         
-                        print(f"\n{framework.upper()} Convergence:")
-                        print(get_convergence_summary(convergence))
-                        break
-            
-            # Compute aggregate statistics for this framework
-            from src.analysis.report_generator import bootstrap_aggregate_metrics
-            aggregate_stats = bootstrap_aggregate_metrics(framework_metrics)
-            
-            all_results[framework] = {
-                'runs': framework_runs,
-                'convergence': convergence if len(framework_metrics) >= 5 else None,
-                'aggregate_metrics': aggregate_stats,
-                'n_successful': len(framework_metrics),
-                'n_failed': run_count - len(framework_metrics)
-            }
+                        if convergence['should_stop']:
+                            logger.info(f"Stopping rule satisfied for {framework}",
+                                       extra={'metadata': {
+                                           'framework': framework,
+                                           'runs': len(framework_metrics),
+                                           'reason': convergence['reason']
+                                       }})
+                            
+                            print(f"\n{framework.upper()} Convergence:")
+                            print(get_convergence_summary(convergence))
+                            active_frameworks.remove(framework)
+                            continue
+                    
+                    if run_count >= max_runs:
+                        active_frameworks.remove(framework)
             
-            logger.info(f"Completed all runs for {framework}",
-                       extra={'metadata': {
-                           'framework': framework,
-                           'successful': len(framework_metrics),
-                           'failed': run_count - len(framework_metrics)
-                       }})
+            for framework in frameworks:
+                fw_state = framework_states[framework]
+                framework_metrics = fw_state['metrics']
+                run_count = fw_state['run_count']
+                
+                all_results[framework] = {
+                    'runs': fw_state['runs'],
+                    'convergence': fw_state['convergence'],
+                    'aggregate_metrics': bootstrap_aggregate_metrics(framework_metrics),
+                    'n_successful': len(framework_metrics),
+                    'n_failed': run_count - len(framework_metrics)
+                }
+                
+                logger.info(f"Completed all runs for {framework}",
+                           extra={'metadata': {
+                               'framework': framework,
+                               'successful': len(framework_metrics),
+                               'failed': run_count - len(framework_metrics)
+                           }})
         
         # Save multi-framework results
         results_path = Path("runs/multi_framework_results.json")
@@ -1068,6 +1289,10 @@ cat sprint_001/metadata.json
         with open(results_path, 'w', encoding='utf-8') as f:
             json.dump(final_results, f, indent=2)
         
+        # Runs were upserted into the manifest database one by one; write
+        # manifest.json once for the whole experiment
+        self.export_manifest()
+        
         logger.info("Multi-framework experiment completed",
                    extra={'metadata': {
                        'total_runs': total_runs,
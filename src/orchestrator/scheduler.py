@@ -0,0 +1,332 @@
+"""
+Concurrent run scheduler for multi-framework experiments.
+
+Runs frameworks (and independent runs within a framework) in a bounded worker
+pool instead of strictly one after another. Each worker executes a complete
+OrchestratorRunner.execute_single_run() in a fresh process (worker processes
+are never reused), so environment variables, the LogContext singleton and
+the framework adapters stay isolated per run. Every in-flight run is given a dedicated port slot so that servers
+started by concurrent runs never collide.
+
+The per-framework stopping rule is evaluated as results arrive: once a
+framework converges (or reaches its run limit) no further runs are scheduled
+for it, while runs already in flight are allowed to finish and are recorded.
+With a SequentialStoppingEngine, every result also re-evaluates the other
+frameworks, since a new run can make their comparisons conclusive.
+"""
+
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    FIRST_COMPLETED,
+    wait
+)
+from typing import Dict, Any, Optional, List, Callable, Type
+
+from src.utils.logger import get_logger
+from src.orchestrator.port_slots import PORT_STRIDE, max_port_slots
+from src.analysis.stopping_rule import (
+    check_convergence,
+    get_convergence_summary,
+    SequentialStoppingEngine,
+    MIN_RUNS,
+    MAX_RUNS,
+    HALF_WIDTH_THRESHOLD
+)
+
+logger = get_logger(__name__, component="orchestrator")
+
+
+def execute_run_job(
+    framework: str,
+    config_path: str,
+    experiment_name: Optional[str],
+    port_offset: int
+) -> Dict[str, Any]:
+    """
+    Execute a single framework run inside a worker.
+
+    Module-level so it can be pickled and sent to worker processes.
+
+    Args:
+        framework: Framework name (baes, chatdev, ghspec)
+        config_path: Path to experiment configuration
+        experiment_name: Name of experiment (optional)
+        port_offset: Offset added to the framework's api_port and ui_port
+
+    Returns:
+        Run result dictionary from OrchestratorRunner.execute_single_run()
+    """
+    # Imported here to avoid a circular import with runner.py
+    from src.orchestrator.runner import OrchestratorRunner
+
+    runner = OrchestratorRunner(
+        framework,
+        config_path,
+        experiment_name=experiment_name,
+        port_offset=port_offset
+    )
+    return runner.execute_single_run()
+
+
+class RunScheduler:
+    """Schedules framework runs concurrently in a bounded worker pool."""
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        config_path: str,
+        max_workers: int,
+        experiment_name: Optional[str] = None,
+        max_runs: int = MAX_RUNS,
+        min_runs: int = MIN_RUNS,
+        job_fn: Callable[..., Dict[str, Any]] = execute_run_job,
+        executor_cls: Type[Executor] = ProcessPoolExecutor,
+        stopping_engine: Optional[SequentialStoppingEngine] = None,
+        stopping_rule: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize run scheduler.
+
+        Args:
+            config: Loaded experiment configuration
+            config_path: Path to experiment configuration (passed to workers)
+            max_workers: Maximum number of runs executing at the same time
+            experiment_name: Name of experiment (optional)
+            max_runs: Maximum runs per framework
+            min_runs: Successful runs required before checking convergence
+            job_fn: Callable executing one run; receives
+                    (framework, config_path, experiment_name, port_offset)
+            executor_cls: Executor class used for the worker pool
+            stopping_engine: Sequential stopping rule (default: bootstrap
+                             check_convergence per framework)
+            stopping_rule: The config's stopping_rule block; its
+                           max_half_width_pct and metrics parameterize the
+                           bootstrap check exactly as in serial execution
+                           (stopping_rule defaults if None)
+
+        Raises:
+            ValueError: If max_workers is not positive or the port slots
+                        required by max_workers exceed the valid port range
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+        port_slots = max_port_slots(config['frameworks'])
+        if max_workers > port_slots:
+            raise ValueError(
+                f"max_workers={max_workers} exceeds available port range "
+                f"({port_slots} slots with stride {PORT_STRIDE})"
+            )
+
+        self.config = config
+        self.config_path = config_path
+        self.max_workers = max_workers
+        self.experiment_name = experiment_name
+        self.max_runs = max_runs
+        self.min_runs = min_runs
+        self.job_fn = job_fn
+        self.executor_cls = executor_cls
+        self.stopping_engine = stopping_engine
+        stopping_rule = stopping_rule or {}
+        self.half_width_threshold = (
+            stopping_rule['max_half_width_pct'] / 100
+            if 'max_half_width_pct' in stopping_rule else HALF_WIDTH_THRESHOLD
+        )
+        self.convergence_metrics = stopping_rule.get('metrics')
+
+    def run(self, frameworks: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute runs for all frameworks until each one converges.
+
+        Runs are dispatched round-robin across frameworks that still need
+        runs, so all frameworks progress at the same pace.
+
+        Args:
+            frameworks: Framework names to execute
+
+        Returns:
+            Per-framework state dictionary:
+            {
+                'baes': {
+                    'runs': [run results in completion order],
+                    'metrics': [aggregate metrics of successful runs],
+                    'convergence': latest convergence result or None,
+                    'run_count': number of runs executed
+                },
+                ...
+            }
+        """
+        state = {
+            fw: {
+                'runs': [],
+                'metrics': [],
+                'convergence': None,
+                'run_count': 0,
+                'launched': 0,
+                'stopped': False
+            }
+            for fw in frameworks
+        }
+        free_slots = list(range(self.max_workers))
+        in_flight: Dict[Future, tuple] = {}
+        next_index = 0
+
+        logger.info("Starting concurrent run scheduler",
+                   extra={'metadata': {'frameworks': frameworks,
+                                       'max_workers': self.max_workers}})
+
+        with self._create_executor() as executor:
+            while True:
+                # Fill free slots round-robin across frameworks needing runs
+                while free_slots:
+                    framework = None
+                    for i in range(len(frameworks)):
+                        candidate = frameworks[(next_index + i) % len(frameworks)]
+                        fw_state = state[candidate]
+                        if not fw_state['stopped'] and fw_state['launched'] < self.max_runs:
+                            framework = candidate
+                            next_index = (next_index + i + 1) % len(frameworks)
+                            break
+                    if framework is None:
+                        break
+
+                    slot = free_slots.pop(0)
+                    state[framework]['launched'] += 1
+                    logger.info(f"Scheduling run {state[framework]['launched']} for {framework}",
+                               extra={'metadata': {'framework': framework,
+                                                   'run': state[framework]['launched'],
+                                                   'slot': slot}})
+                    future = executor.submit(
+                        self.job_fn,
+                        framework,
+                        self.config_path,
+                        self.experiment_name,
+                        slot * PORT_STRIDE
+                    )
+                    in_flight[future] = (framework, slot)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    framework, slot = in_flight.pop(future)
+                    free_slots.append(slot)
+                    free_slots.sort()
+                    self._record_result(framework, future, state[framework])
+                    if self.stopping_engine is not None:
+                        # Comparisons with this framework may now be conclusive
+                        for other, other_state in state.items():
+                            if other != framework and not other_state['stopped'] \
+                                    and len(other_state['metrics']) >= self.min_runs:
+                                self._apply_convergence(
+                                    other, self.stopping_engine.check(other), other_state
+                                )
+
+        for fw_state in state.values():
+            del fw_state['launched']
+            del fw_state['stopped']
+
+        return state
+
+    def _create_executor(self) -> Executor:
+        """
+        Create the worker pool.
+
+        Process pools get a new worker process per run: a reused worker would
+        carry os.environ changes and LogContext state from one run into the next.
+
+        Returns:
+            Executor with max_workers workers
+        """
+        if issubclass(self.executor_cls, ProcessPoolExecutor):
+            return self.executor_cls(max_workers=self.max_workers, max_tasks_per_child=1)
+        return self.executor_cls(max_workers=self.max_workers)
+
+    def _record_result(
+        self,
+        framework: str,
+        future: Future,
+        fw_state: Dict[str, Any]
+    ) -> None:
+        """
+        Record a finished run and re-evaluate the framework's stopping rule.
+
+        Args:
+            framework: Framework name
+            future: Completed future of the run job
+            fw_state: Mutable scheduler state for the framework
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            # Worker crashed before execute_single_run could report a status
+            result = {'status': 'failed', 'run_id': None, 'error': str(e)}
+
+        fw_state['run_count'] += 1
+        fw_state['runs'].append(result)
+
+        if result['status'] == 'success':
+            fw_state['metrics'].append(result['metrics']['aggregate_metrics'])
+            if self.stopping_engine is not None:
+                self.stopping_engine.record(framework, result['metrics']['aggregate_metrics'])
+        else:
+            logger.warning(f"Run {fw_state['run_count']} failed for {framework}",
+                         extra={'run_id': result.get('run_id'),
+                                'metadata': {
+                                    'framework': framework,
+                                    'error': result.get('error')
+                                }})
+
+        if len(fw_state['metrics']) < self.min_runs:
+            return
+
+        if self.stopping_engine is not None:
+            convergence = self.stopping_engine.check(framework)
+        else:
+            convergence = check_convergence(
+                fw_state['metrics'],
+                framework,
+                min_runs=self.min_runs,
+                max_runs=self.max_runs,
+                half_width_threshold=self.half_width_threshold,
+                convergence_metrics=self.convergence_metrics
+            )
+        self._apply_convergence(framework, convergence, fw_state)
+
+    def _apply_convergence(
+        self,
+        framework: str,
+        convergence: Dict[str, Any],
+        fw_state: Dict[str, Any]
+    ) -> None:
+        """
+        Store a stopping rule result and stop scheduling the framework if satisfied.
+
+        Args:
+            framework: Framework name
+            convergence: Result of the stopping rule
+            fw_state: Mutable scheduler state for the framework
+        """
+        fw_state['convergence'] = convergence
+
+        logger.info(f"Convergence check for {framework}",
+                   extra={'metadata': {
+                       'framework': framework,
+                       'runs': len(fw_state['metrics']),
+                       'should_stop': convergence['should_stop']
+                   }})
+
+        if convergence['should_stop'] and not fw_state['stopped']:
+            fw_state['stopped'] = True
+            logger.info(f"Stopping rule satisfied for {framework}",
+                       extra={'metadata': {
+                           'framework': framework,
+                           'runs': len(fw_state['metrics']),
+                           'reason': convergence['reason']
+                       }})
+
+            print(f"\n{framework.upper()} Convergence:")
+            print(get_convergence_summary(convergence))
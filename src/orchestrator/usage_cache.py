@@ -0,0 +1,197 @@
+"""
+On-disk cache of OpenAI Usage API minute buckets.
+
+The Usage API is queried with bucket_width="1m". Buckets are stored per API
+key id, keyed by the bucket's start minute (Unix timestamp), so that every
+run using the same key can be reconciled from one fetch of the merged time
+range instead of one request per run.
+
+The API reports usage with a 5-60 minute delay, so a bucket is only
+"settled" once it was fetched at least settle_seconds after the minute
+ended. Settled buckets are never fetched again; unsettled ones are
+refetched on later reconciliation passes.
+
+Cache layout (one JSON file per key id):
+    <cache_dir>/usage_<key_id>.json
+    {"buckets": {"<minute>": [tokens_in, tokens_out, api_calls, cached_tokens, fetched_at]}}
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="reconciliation")
+
+BUCKET_SECONDS = 60
+# Key used for unfiltered queries (no api_key_ids parameter)
+ALL_KEYS = "all"
+
+UsageTotals = Tuple[int, int, int, int]
+
+
+def minute_floor(timestamp: float) -> int:
+    """Return the start of the minute bucket containing timestamp."""
+    return int(timestamp) // BUCKET_SECONDS * BUCKET_SECONDS
+
+
+def merge_windows(windows: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge time windows into disjoint minute-aligned ranges.
+
+    Args:
+        windows: (start, end) Unix timestamp pairs
+
+    Returns:
+        Sorted, non-overlapping [start, end) ranges aligned to whole minutes
+    """
+    aligned = sorted(
+        (minute_floor(start), minute_floor(end - 1) + BUCKET_SECONDS)
+        for start, end in windows
+        if end > start
+    )
+    merged: List[Tuple[int, int]] = []
+    for start, end in aligned:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class UsageBucketCache:
+    """Minute-bucket usage cache persisted as one JSON file per API key id."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+        """
+        self.cache_dir = Path(cache_dir)
+        self._buckets: Dict[str, Dict[int, List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key_id: str) -> Path:
+        safe_key = re.sub(r'[^A-Za-z0-9_.-]', '_', key_id)
+        return self.cache_dir / f"usage_{safe_key}.json"
+
+    def _load(self, key_id: str) -> Dict[int, List[float]]:
+        if key_id not in self._buckets:
+            buckets: Dict[int, List[float]] = {}
+            path = self._path(key_id)
+            if path.exists():
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    buckets = {int(minute): entry for minute, entry in data.get('buckets', {}).items()}
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable usage cache {path}: {e}")
+            self._buckets[key_id] = buckets
+        return self._buckets[key_id]
+
+    def _save(self, key_id: str) -> None:
+        """Write a key's buckets atomically (temp file + rename)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key_id)
+        data = {'buckets': {str(minute): entry for minute, entry in sorted(self._buckets[key_id].items())}}
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def stale_ranges(
+        self,
+        key_id: str,
+        windows: Iterable[Tuple[int, int]],
+        fresh_since: float,
+        settle_seconds: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Compute the ranges that still have to be fetched.
+
+        A minute needs fetching if it was never fetched, or if it was not
+        settled and was fetched before fresh_since.
+
+        Args:
+            key_id: API key id (or ALL_KEYS)
+            windows: (start, end) windows to cover
+            fresh_since: Unsettled buckets fetched at or after this time are reused
+            settle_seconds: Delay after a minute ends before its bucket is final
+
+        Returns:
+            Sorted, contiguous [start, end) ranges of minutes to fetch
+        """
+        with self._lock:
+            buckets = self._load(key_id)
+            ranges: List[Tuple[int, int]] = []
+            for start, end in merge_windows(windows):
+                for minute in range(start, end, BUCKET_SECONDS):
+                    entry = buckets.get(minute)
+                    if entry is not None:
+                        fetched_at = entry[4]
+                        settled = fetched_at - (minute + BUCKET_SECONDS) >= settle_seconds
+                        if settled or fetched_at >= fresh_since:
+                            continue
+                    if ranges and ranges[-1][1] == minute:
+                        ranges[-1] = (ranges[-1][0], minute + BUCKET_SECONDS)
+                    else:
+                        ranges.append((minute, minute + BUCKET_SECONDS))
+            return ranges
+
+    def store(
+        self,
+        key_id: str,
+        start: int,
+        end: int,
+        totals: Dict[int, UsageTotals],
+        fetched_at: float
+    ) -> None:
+        """
+        Record a fetched range; minutes without a bucket are stored as zero usage.
+
+        Args:
+            key_id: API key id (or ALL_KEYS)
+            start: Range start (minute-aligned)
+            end: Range end (exclusive, minute-aligned)
+            totals: Per-minute (tokens_in, tokens_out, api_calls, cached_tokens)
+            fetched_at: Unix time the range was fetched
+        """
+        with self._lock:
+            buckets = self._load(key_id)
+            for minute in range(start, end, BUCKET_SECONDS):
+                buckets[minute] = [*totals.get(minute, (0, 0, 0, 0)), fetched_at]
+            self._save(key_id)
+
+    def totals(self, key_id: str, start: int, end: int) -> UsageTotals:
+        """
+        Sum cached usage for all buckets overlapping [start, end).
+
+        Args:
+            key_id: API key id (or ALL_KEYS)
+            start: Window start (Unix timestamp)
+            end: Window end (Unix timestamp)
+
+        Returns:
+            Tuple of (input_tokens, output_tokens, api_calls, cached_tokens)
+        """
+        sums = [0, 0, 0, 0]
+        with self._lock:
+            buckets = self._load(key_id)
+            for range_start, range_end in merge_windows([(start, end)]):
+                for minute in range(range_start, range_end, BUCKET_SECONDS):
+                    entry = buckets.get(minute)
+                    if entry:
+                        for i in range(4):
+                            sums[i] += int(entry[i])
+        return sums[0], sums[1], sums[2], sums[3]
@@ -11,13 +11,17 @@ import json
 import math
 import time
 import os
+import sqlite3
 import subprocess
-import requests
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from src.utils.logger import get_logger
+from src.utils.run_metrics_table import RunMetricsTable, load_run_metrics_table
+from src.utils.openai_client import get_openai_client, OpenAIClientError
 from src.orchestrator.manifest_manager import find_runs
+from src.orchestrator.usage_cache import ALL_KEYS, UsageBucketCache, minute_floor
 
 logger = get_logger(__name__, component="reconciliation")
 
@@ -32,6 +36,48 @@ DEFAULT_VERIFICATION_INTERVAL_MIN = int(os.getenv('RECONCILIATION_VERIFICATION_I
 # Default: 2 (double-check verification)
 DEFAULT_MIN_STABLE_VERIFICATIONS = int(os.getenv('RECONCILIATION_MIN_STABLE_VERIFICATIONS', '2'))
 
+# Minutes after which a Usage API bucket is considered final and is never refetched
+# Default: 60 (upper bound of the typical OpenAI Usage API delay)
+DEFAULT_USAGE_SETTLE_MIN = int(os.getenv('RECONCILIATION_USAGE_SETTLE_MIN', '60'))
+
+# Query window extension on each side of a run (FR-013)
+BUFFER_SECONDS = 300  # 5 minutes
+
+# Usage bucket cache location, relative to runs_dir
+USAGE_CACHE_DIRNAME = ".usage_cache"
+
+
+def _extract_tokens(result: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    """
+    Extract token counts from one Usage API result.
+    
+    The Usage API (Oct 2025) returns input_tokens/output_tokens, but we fall
+    back to legacy field names to remain compatible with earlier API responses.
+    
+    Args:
+        result: Entry of a bucket's "results" list
+        
+    Returns:
+        Tuple of (input_tokens, output_tokens, api_calls, cached_tokens)
+    """
+    input_fields = (
+        "input_tokens",
+        "n_context_tokens_total",
+        "n_input_tokens_total",
+        "n_context_tokens",
+    )
+    output_fields = (
+        "output_tokens",
+        "n_generated_tokens_total",
+        "n_output_tokens_total",
+        "n_generated_tokens",
+    )
+    tokens_in = next((int(result.get(field, 0) or 0) for field in input_fields if field in result), 0)
+    tokens_out = next((int(result.get(field, 0) or 0) for field in output_fields if field in result), 0)
+    num_requests = int(result.get("num_model_requests", 0) or 0)
+    cached_tokens = int(result.get("input_cached_tokens", 0) or 0)
+    return tokens_in, tokens_out, num_requests, cached_tokens
+
 
 class UsageReconciler:
     """
@@ -49,6 +95,141 @@ class UsageReconciler:
             runs_dir: Root directory containing framework run directories
         """
         self.runs_dir = runs_dir
+        self.usage_cache = UsageBucketCache(runs_dir / USAGE_CACHE_DIRNAME)
+        self._sweep_started_at: Optional[float] = None
+    
+    def _resolve_api_key_id(self, framework: Optional[str]) -> Optional[str]:
+        """
+        Get the framework-specific API key ID used to filter Usage API results.
+        
+        Args:
+            framework: Framework name (baes, chatdev, ghspec), or None for no filtering
+            
+        Returns:
+            API key ID, or None when no framework is given (legacy, unfiltered)
+            
+        Raises:
+            KeyError: If framework specified but OPENAI_API_KEY_{FRAMEWORK}_ID not found
+        """
+        # This prevents cross-contamination when multiple frameworks run simultaneously (FR-010)
+        if not framework:
+            return None
+        framework_upper = framework.upper()
+        api_key_id = os.getenv(f'OPENAI_API_KEY_{framework_upper}_ID')
+        if not api_key_id:
+            raise KeyError(
+                f"OPENAI_API_KEY_{framework_upper}_ID environment variable required for "
+                f"Usage API filtering. Find your API key ID in OpenAI Dashboard > Usage > API Keys."
+            )
+        return api_key_id
+    
+    def _fetch_usage_buckets(
+        self,
+        api_key: str,
+        api_key_id: Optional[str],
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Dict[int, Tuple[int, int, int, int]]:
+        """
+        Fetch minute buckets for a time range, following pagination.
+        
+        Args:
+            api_key: Key with api.usage.read permission
+            api_key_id: API key ID to filter by (None = all keys)
+            start_timestamp: Range start (Unix timestamp)
+            end_timestamp: Range end (Unix timestamp)
+            
+        Returns:
+            Mapping of bucket start minute to
+            (input_tokens, output_tokens, api_calls, cached_tokens)
+            
+        Raises:
+            OpenAIClientError: If a request fails
+        """
+        # Convert to integer timestamps (seconds only, no microseconds)
+        # OpenAI Usage API requires integer Unix timestamps
+        params: Dict[str, Any] = {
+            "start_time": int(start_timestamp),
+            "end_time": int(end_timestamp),
+            "bucket_width": "1m",  # Changed from "1d" - minute-level granularity (FR-005)
+            "limit": 1440  # 24 hours of minute buckets (max for 1m bucket_width)
+        }
+        
+        # Add API key filtering if framework specified (FR-010)
+        if api_key_id:
+            params["api_key_ids"] = [api_key_id]
+        
+        buckets: Dict[int, Tuple[int, int, int, int]] = {}
+        pages = 0
+        while True:
+            usage_data = get_openai_client().request(
+                "GET",
+                "/organization/usage/completions",
+                api_key,
+                params=params,
+                timeout=30
+            )
+            pages += 1
+            
+            for bucket in usage_data.get("data", []):
+                minute = minute_floor(bucket.get("start_time", start_timestamp))
+                totals = list(buckets.get(minute, (0, 0, 0, 0)))
+                for result in bucket.get("results", []):
+                    for i, value in enumerate(_extract_tokens(result)):
+                        totals[i] += value
+                buckets[minute] = (totals[0], totals[1], totals[2], totals[3])
+            
+            next_page = usage_data.get("next_page")
+            if not usage_data.get("has_more") or not next_page:
+                break
+            params["page"] = next_page
+        
+        logger.debug(
+            f"Fetched {len(buckets)} usage buckets in {pages} page(s)",
+            extra={'metadata': {
+                'api_key_id': api_key_id,
+                'start_time': start_timestamp,
+                'end_time': end_timestamp,
+                'pages': pages
+            }}
+        )
+        return buckets
+    
+    def _ensure_usage_cached(
+        self,
+        api_key: str,
+        api_key_id: Optional[str],
+        windows: List[Tuple[int, int]]
+    ) -> int:
+        """
+        Fetch every minute of the given windows that is missing or unsettled.
+        
+        Windows are merged first, so overlapping runs on the same key cost one
+        request (plus pagination) per contiguous stale range.
+        
+        Args:
+            api_key: Key with api.usage.read permission
+            api_key_id: API key ID to filter by (None = all keys)
+            windows: (start, end) Unix timestamp pairs
+            
+        Returns:
+            Number of ranges fetched
+            
+        Raises:
+            OpenAIClientError: If a request fails
+        """
+        cache_key = api_key_id or ALL_KEYS
+        # Inside a reconcile_all_pending() sweep, buckets fetched during the
+        # sweep are reused; otherwise every unsettled bucket is refetched
+        fresh_since = self._sweep_started_at or time.time()
+        settle_seconds = int(os.getenv('RECONCILIATION_USAGE_SETTLE_MIN', '60')) * 60
+        
+        ranges = self.usage_cache.stale_ranges(cache_key, windows, fresh_since, settle_seconds)
+        for range_start, range_end in ranges:
+            fetched_at = time.time()
+            buckets = self._fetch_usage_buckets(api_key, api_key_id, range_start, range_end)
+            self.usage_cache.store(cache_key, range_start, range_end, buckets, fetched_at)
+        return len(ranges)
     
     def _fetch_usage_from_openai(
         self,
@@ -70,6 +251,9 @@ class UsageReconciler:
         Uses OPENAI_API_KEY_USAGE_TRACKING (which has api.usage.read permission) to query the Usage API.
         Attribution to specific frameworks is achieved through api_key_ids filtering.
         
+        Buckets are read through the on-disk usage cache: only minutes that are
+        not cached or not yet settled are requested from the API.
+        
         Args:
             start_timestamp: Unix timestamp for start of window
             end_timestamp: Unix timestamp for end of window
@@ -83,7 +267,7 @@ class UsageReconciler:
             
         Note:
             - bucket_width="1m" provides minute-level granularity (finest available)
-            - limit=1440 allows up to 24 hours of minute buckets per query
+            - limit=1440 per page, larger ranges follow next_page
             - Tokens are attributed by completion time (not request time)
             - api_key_ids parameter filters to framework-specific usage
         """
@@ -95,91 +279,157 @@ class UsageReconciler:
             logger.warning("OPENAI_API_KEY_USAGE_TRACKING not found in environment")
             return 0, 0, 0, 0
         
-        # Get framework-specific API key ID for filtering (FR-010)
-        # This prevents cross-contamination when multiple frameworks run simultaneously
-        if framework:
-            framework_upper = framework.upper()
-            api_key_id = os.getenv(f'OPENAI_API_KEY_{framework_upper}_ID')
-            if not api_key_id:
-                raise KeyError(
-                    f"OPENAI_API_KEY_{framework_upper}_ID environment variable required for "
-                    f"Usage API filtering. Find your API key ID in OpenAI Dashboard > Usage > API Keys."
-                )
-        else:
-            # Legacy path (no framework specified) - no filtering
-            api_key_id = None
+        api_key_id = self._resolve_api_key_id(framework)
         
-        url = "https://api.openai.com/v1/organization/usage/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        # Convert to integer timestamps (seconds only, no microseconds)
-        # OpenAI Usage API requires integer Unix timestamps
-        params = {
-            "start_time": int(start_timestamp),
-            "end_time": int(end_timestamp),
-            "bucket_width": "1m",  # Changed from "1d" - minute-level granularity (FR-005)
-            "limit": 1440  # 24 hours of minute buckets (max for 1m bucket_width)
-        }
+        try:
+            self._ensure_usage_cached(api_key, api_key_id, [(start_timestamp, end_timestamp)])
+        except OpenAIClientError as e:
+            # Check for permission errors
+            if e.status_code == 401 and "api.usage.read" in (e.response_text or ""):
+                logger.error("API key lacks 'api.usage.read' scope")
+            else:
+                logger.error(f"Failed to fetch usage from OpenAI API: {e}")
+            return 0, 0, 0, 0
+        except Exception as e:
+            logger.error(f"Failed to fetch usage from OpenAI API: {e}")
+            return 0, 0, 0, 0
         
-        # Add API key filtering if framework specified (FR-010)
-        if api_key_id:
-            params["api_key_ids"] = [api_key_id]
+        return self.usage_cache.totals(api_key_id or ALL_KEYS, start_timestamp, end_timestamp)
+    
+    def _prefetch_usage(self, run_windows: List[Tuple[str, Tuple[int, int]]]) -> None:
+        """
+        Fetch usage buckets for many runs with one merged query per API key ID.
         
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+        Failures are logged and ignored; reconcile_run() then retries the
+        affected windows individually.
+        
+        Args:
+            run_windows: (framework, (query_start, query_end)) per run
+        """
+        api_key = os.getenv('OPENAI_API_KEY_USAGE_TRACKING')
+        if not api_key or not run_windows:
+            return
+        
+        windows_by_key: Dict[Optional[str], List[Tuple[int, int]]] = {}
+        for framework_name, window in run_windows:
+            try:
+                api_key_id = self._resolve_api_key_id(framework_name)
+            except KeyError:
+                continue  # Reported per run by reconcile_run()
+            windows_by_key.setdefault(api_key_id, []).append(window)
+        
+        for api_key_id, windows in windows_by_key.items():
+            try:
+                fetched = self._ensure_usage_cached(api_key, api_key_id, windows)
+            except Exception as e:
+                logger.warning(f"Batched usage fetch failed for key {api_key_id}: {e}")
+                continue
+            logger.info(
+                f"Usage buckets cached for {len(windows)} runs ({fetched} ranges fetched)",
+                extra={'metadata': {'api_key_id': api_key_id, 'runs': len(windows),
+                                    'ranges_fetched': fetched}}
+            )
+    
+    def _get_run_window(self, metrics: Dict[str, Any], framework: str, run_id: str) -> Tuple[int, int]:
+        """
+        Get a run's Usage API query window (run duration plus buffer).
+        
+        Uses the exact first/last call times of the run's call ledger when the
+        run has one, otherwise the step (or run) timestamps.
+        
+        Args:
+            metrics: Parsed metrics.json
+            framework: Framework name
+            run_id: Run identifier
             
-            # Check for permission errors
-            if response.status_code == 401:
-                error_data = response.json()
-                if "api.usage.read" in error_data.get("error", {}).get("message", ""):
-                    logger.error("API key lacks 'api.usage.read' scope")
-                    return 0, 0, 0, 0
-            
-            response.raise_for_status()
-            usage_data = response.json()
-            
-            # Aggregate tokens from all buckets. The Usage API (Oct 2025) returns
-            # input_tokens/output_tokens, but we fall back to legacy field names
-            # to remain compatible with earlier API responses.
-            def _extract_tokens(result: Dict[str, Any]) -> tuple[int, int, int, int]:
-                input_fields = (
-                    "input_tokens",
-                    "n_context_tokens_total",
-                    "n_input_tokens_total",
-                    "n_context_tokens",
-                )
-                output_fields = (
-                    "output_tokens",
-                    "n_generated_tokens_total",
-                    "n_output_tokens_total",
-                    "n_generated_tokens",
-                )
-                tokens_in = next((int(result.get(field, 0) or 0) for field in input_fields if field in result), 0)
-                tokens_out = next((int(result.get(field, 0) or 0) for field in output_fields if field in result), 0)
-                num_requests = int(result.get("num_model_requests", 0) or 0)
-                cached_tokens = int(result.get("input_cached_tokens", 0) or 0)
-                return tokens_in, tokens_out, num_requests, cached_tokens
-
-            total_input_tokens = 0
-            total_output_tokens = 0
-            total_api_calls = 0
-            total_cached_tokens = 0
+        Returns:
+            (query_start, query_end) Unix timestamps
             
-            for bucket in usage_data.get("data", []):
-                for result in bucket.get("results", []):
-                    tokens_in, tokens_out, api_calls, cached_tokens = _extract_tokens(result)
-                    total_input_tokens += tokens_in
-                    total_output_tokens += tokens_out
-                    total_api_calls += api_calls
-                    total_cached_tokens += cached_tokens
+        Raises:
+            ValueError: If the run time window cannot be determined
+        """
+        start_timestamp = None
+        end_timestamp = None
+        
+        # Exact window of the run's LLM calls (provisional usage from the call ledger)
+        provisional = metrics.get('provisional_usage') or {}
+        if provisional.get('first_call_at') and provisional.get('last_call_at'):
+            start_timestamp = math.floor(provisional['first_call_at'])
+            end_timestamp = math.ceil(provisional['last_call_at'])
+        
+        # Try to get from steps (use earliest start and latest end)
+        elif metrics.get('steps'):
+            timestamps = [
+                (step.get('start_timestamp'), step.get('end_timestamp'))
+                for step in metrics['steps']
+                if step.get('start_timestamp') and step.get('end_timestamp')
+            ]
+            if timestamps:
+                start_timestamp = min(t[0] for t in timestamps)
+                end_timestamp = max(t[1] for t in timestamps)
+        
+        return self._query_window(
+            start_timestamp, end_timestamp,
+            metrics.get('start_timestamp'), metrics.get('end_timestamp'),
+            framework, run_id
+        )
+    
+    def _query_window(
+        self,
+        start_timestamp: Optional[int],
+        end_timestamp: Optional[int],
+        start_ts_str: Optional[str],
+        end_ts_str: Optional[str],
+        framework: str,
+        run_id: str
+    ) -> Tuple[int, int]:
+        """
+        Build the query window from step timestamps or the run's ISO timestamps.
+        
+        Args:
+            start_timestamp: Earliest step start (Unix seconds), if known
+            end_timestamp: Latest step end (Unix seconds), if known
+            start_ts_str: Run start_timestamp (ISO 8601) fallback
+            end_ts_str: Run end_timestamp (ISO 8601) fallback
+            framework: Framework name
+            run_id: Run identifier
             
-            return total_input_tokens, total_output_tokens, total_api_calls, total_cached_tokens
+        Returns:
+            (query_start, query_end) Unix timestamps
             
-        except Exception as e:
-            logger.error(f"Failed to fetch usage from OpenAI API: {e}")
-            return 0, 0, 0, 0
+        Raises:
+            ValueError: If the run time window cannot be determined
+        """
+        # Fallback to aggregate metrics timestamps
+        if not start_timestamp:
+            if start_ts_str and end_ts_str:
+                from dateutil import parser
+                start_timestamp = int(parser.parse(start_ts_str).timestamp())
+                end_timestamp = int(parser.parse(end_ts_str).timestamp())
+        
+        if not start_timestamp or not end_timestamp:
+            raise ValueError(f"Cannot determine run time window for {framework}/{run_id}")
+        
+        # Extend query window on each end (FR-013)
+        # This accounts for OpenAI Usage API's async processing delay
+        return start_timestamp - BUFFER_SECONDS, end_timestamp + BUFFER_SECONDS
+    
+    def _step_windows(self, runs: RunMetricsTable) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Earliest step start and latest step end of every run in the table.
+        
+        Only steps with both timestamps set count (as in _get_run_window).
+        
+        Returns:
+            (starts, ends) per run; 0 where no step has both timestamps
+        """
+        step_starts = np.nan_to_num(runs.step('start_timestamp'))
+        step_ends = np.nan_to_num(runs.step('end_timestamp'))
+        complete = (step_starts != 0) & (step_ends != 0)
+        starts = runs.step_reduce('start_timestamp', np.minimum, np.inf, where=complete)
+        ends = runs.step_reduce('end_timestamp', np.maximum, -np.inf, where=complete)
+        found = np.isfinite(starts)
+        return np.where(found, starts, 0).astype(np.int64), np.where(found, ends, 0).astype(np.int64)
     
     def reconcile_run(
         self,
@@ -236,38 +486,8 @@ class UsageReconciler:
         # Changed from per-step reconciliation to per-run reconciliation
         # This eliminates the 36-50% zero-token error caused by bucket misalignment
         
-        # Get run time window from metrics
-        start_timestamp = None
-        end_timestamp = None
-        
-        # Try to get from steps (use earliest start and latest end)
-        if metrics.get('steps'):
-            timestamps = [
-                (step.get('start_timestamp'), step.get('end_timestamp'))
-                for step in metrics['steps']
-                if step.get('start_timestamp') and step.get('end_timestamp')
-            ]
-            if timestamps:
-                start_timestamp = min(t[0] for t in timestamps)
-                end_timestamp = max(t[1] for t in timestamps)
-        
-        # Fallback to aggregate metrics timestamps
-        if not start_timestamp:
-            start_ts_str = metrics.get('start_timestamp')
-            end_ts_str = metrics.get('end_timestamp')
-            if start_ts_str and end_ts_str:
-                from dateutil import parser
-                start_timestamp = int(parser.parse(start_ts_str).timestamp())
-                end_timestamp = int(parser.parse(end_ts_str).timestamp())
-        
-        if not start_timestamp or not end_timestamp:
-            raise ValueError(f"Cannot determine run time window for {framework}/{run_id}")
-        
-        # Extend query window by 5 minutes on each end (FR-013)
-        # This accounts for OpenAI Usage API's async processing delay
-        BUFFER_SECONDS = 300  # 5 minutes
-        query_start = start_timestamp - BUFFER_SECONDS
-        query_end = end_timestamp + BUFFER_SECONDS
+        # Get run time window from metrics (extended by BUFFER_SECONDS)
+        query_start, query_end = self._get_run_window(metrics, framework, run_id)
         
         # Query Usage API once for entire run
         tokens_in, tokens_out, api_calls, cached_tokens = self._fetch_usage_from_openai(
@@ -290,6 +510,15 @@ class UsageReconciler:
             }
         }
         
+        # Usage API minus call ledger counts (provisional metrics check)
+        provisional = metrics.get('provisional_usage')
+        if provisional:
+            current_attempt['call_ledger_delta'] = {
+                'tokens_in': tokens_in - provisional.get('TOK_IN', 0),
+                'tokens_out': tokens_out - provisional.get('TOK_OUT', 0),
+                'api_calls': api_calls - provisional.get('API_CALLS', 0)
+            }
+        
         # 3. Check verification status against previous attempts
         verification_result = self._check_verification_status(
             metrics, 
@@ -546,6 +775,11 @@ class UsageReconciler:
         """
         Find and reconcile all runs with missing token data.
         
+        Usage buckets are fetched once per API key ID for the merged time
+        windows of all pending runs; each run's totals are then sliced from
+        the on-disk bucket cache. Minutes that have settled are never
+        refetched on later passes.
+        
         Args:
             framework: Specific framework to reconcile (None = all frameworks)
             min_age_minutes: Only reconcile runs older than this (wait for Usage API delay).
@@ -575,29 +809,23 @@ class UsageReconciler:
             }
         )
         
-        # Get all runs from manifest (standalone experiment)
-        manifest_path = Path("runs/manifest.json")
-        if not manifest_path.exists():
-            logger.warning("No manifest found")
-            return results
-        
-        try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
-            all_runs = manifest.get("runs", [])
-            
-            # Apply framework filter if specified
-            if framework:
-                all_runs = [r for r in all_runs if r.get("framework") == framework]
-        except Exception as e:
-            logger.error(f"Failed to load manifest: {e}")
-            return results
+        # Get all runs from the manifest database (standalone experiment)
+        all_runs = find_runs(framework=framework)
         
         if not all_runs:
             logger.warning("No runs found in manifest")
             return results
         
-        # Process each run
+        # Statuses and step timestamps of all runs (only changed files are re-parsed)
+        run_table = load_run_metrics_table(self.runs_dir)
+        table_rows = run_table.row_index()
+        step_starts, step_ends = self._step_windows(run_table)
+        start_timestamps = run_table.top_str('start_timestamp')
+        end_timestamps = run_table.top_str('end_timestamp')
+        
+        # Collect runs needing reconciliation and their query windows
+        pending_runs: List[Tuple[str, str, str]] = []
+        run_windows: List[Tuple[str, Tuple[int, int]]] = []
         for run_entry in all_runs:
             run_id = run_entry['run_id']
             framework_name = run_entry['framework']
@@ -640,22 +868,25 @@ class UsageReconciler:
             
             # Check if already reconciled or has token data
             try:
-                with open(metrics_file, 'r', encoding='utf-8') as f:
-                    metrics = json.load(f)
+                row = table_rows.get((framework_name, run_id))
+                if row is None:
+                    raise ValueError(f"Unreadable metrics file: {metrics_file}")
                 
                 # Skip if already verified (not just reconciled)
-                reconciliation = metrics.get('usage_api_reconciliation', {})
-                verification_status = reconciliation.get('verification_status', 'pending')
+                verification_status = str(run_table['reconciliation_status'][row]) or 'pending'
                 
                 if verification_status == 'verified':
                     logger.debug(f"Already verified: {framework_name}/{run_id}")
                     continue
                 
                 # This run needs reconciliation/verification!
-                logger.info(f"Reconciling: {framework_name}/{run_id} (status: {verification_status})")
-                
-                report = self.reconcile_run(run_id, framework_name)
-                results.append(report)
+                window = self._query_window(
+                    int(step_starts[row]), int(step_ends[row]),
+                    start_timestamps[row] or None, end_timestamps[row] or None,
+                    framework_name, run_id
+                )
+                pending_runs.append((run_id, framework_name, verification_status))
+                run_windows.append((framework_name, window))
                 
             except Exception as e:
                 logger.error(
@@ -673,6 +904,43 @@ class UsageReconciler:
                     'error': str(e)
                 })
         
+        # Fetch usage for all pending runs at once (one merged query per API key),
+        # then slice each run's totals from the bucket cache
+        self._sweep_started_at = current_time
+        try:
+            self._prefetch_usage(run_windows)
+            
+            for run_id, framework_name, verification_status in pending_runs:
+                logger.info(f"Reconciling: {framework_name}/{run_id} (status: {verification_status})")
+                try:
+                    report = self.reconcile_run(run_id, framework_name)
+                    results.append(report)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to reconcile {framework_name}/{run_id}: {e}",
+                        extra={
+                            'framework': framework_name,
+                            'run_id': run_id,
+                            'metadata': {'error': str(e)}
+                        }
+                    )
+                    results.append({
+                        'run_id': run_id,
+                        'framework': framework_name,
+                        'status': 'error',
+                        'error': str(e)
+                    })
+        finally:
+            self._sweep_started_at = None
+        
+        # Refresh manifest.json once for the whole pass
+        if results:
+            from src.orchestrator.manifest_manager import export_manifest
+            try:
+                export_manifest()
+            except (OSError, sqlite3.Error) as e:
+                logger.error(f"Failed to export manifest: {e}")
+        
         logger.info(
             f"Reconciliation scan complete: {len(results)} runs processed",
             extra={'metadata': {'runs_reconciled': len(results)}}
@@ -710,6 +978,10 @@ class UsageReconciler:
             logger.error("Failed to query manifest: %s", e)
             return pending
         
+        run_table = load_run_metrics_table(self.runs_dir)
+        table_rows = run_table.row_index()
+        end_timestamps = run_table.top_str('end_timestamp')
+        
         for run_entry in all_runs:
             run_id = run_entry['run_id']
             framework_name = run_entry['framework']
@@ -722,40 +994,36 @@ class UsageReconciler:
                 logger.warning("Metrics file not found for run %s: %s", run_id, metrics_file)
                 continue
             
-            file_mtime = metrics_file.stat().st_mtime
+            row = table_rows.get((framework_name, run_id))
+            if row is None:
+                logger.warning(f"Error checking {framework_name}/{run_id}: unreadable metrics file")
+                continue
+            
+            file_mtime = run_table['mtime_ns'][row] / 1e9
             
             # Skip if too recent
             if file_mtime > min_cutoff:
                 continue
             
-            try:
-                with open(metrics_file, 'r', encoding='utf-8') as f:
-                    metrics = json.load(f)
-                
-                # Check verification status
-                reconciliation = metrics.get('usage_api_reconciliation', {})
-                verification_status = reconciliation.get('verification_status', 'pending')
-                
-                # Skip if already verified
-                if verification_status == 'verified':
-                    continue
-                
-                age_minutes = (current_time - file_mtime) / 60
-                attempts = reconciliation.get('attempts', [])
-                
-                pending.append({
-                    'run_id': run_id,
-                    'framework': framework_name,
-                    'age_minutes': age_minutes,
-                    'metrics_file': str(metrics_file),
-                    'end_timestamp': metrics.get('end_timestamp'),
-                    'verification_status': verification_status,
-                    'attempts': len(attempts),
-                    'message': reconciliation.get('verification_message', 'Not yet reconciled')
-                })
-                    
-            except Exception as e:
-                logger.warning(f"Error checking {framework_name}/{run_id}: {e}")
+            # Check verification status
+            verification_status = str(run_table['reconciliation_status'][row]) or 'pending'
+            
+            # Skip if already verified
+            if verification_status == 'verified':
+                continue
+            
+            age_minutes = (current_time - file_mtime) / 60
+            
+            pending.append({
+                'run_id': run_id,
+                'framework': framework_name,
+                'age_minutes': age_minutes,
+                'metrics_file': str(metrics_file),
+                'end_timestamp': str(end_timestamps[row]) or None,
+                'verification_status': verification_status,
+                'attempts': int(run_table['reconciliation_attempts'][row]),
+                'message': str(run_table['reconciliation_message'][row]) or 'Not yet reconciled'
+            })
         
         return pending
     
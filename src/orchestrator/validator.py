@@ -2,21 +2,124 @@
 Validation and testing for generated applications.
 
 Provides API, UI, and downtime validation capabilities.
+
+All requests go through one pooled requests.Session (keep-alive connections
+shared by the CRUD chains, UI checks and the downtime monitor). The CRUD
+chain of each entity (create → read → update → delete) runs concurrently
+with the other entities, every request is bounded by a per-request timeout
+and the whole validation by an overall deadline, so validation takes about
+as long as the slowest entity chain. Per-endpoint latencies are recorded
+and summarized by latency_metrics().
+
+run_load_probe() measures how fast the generated API is: concurrent workers
+repeat create → read → delete cycles against the CRUD endpoints for a fixed
+duration and report latency percentiles, throughput and error rate as the
+LOAD_* metrics (declared in the experiment's metrics section).
 """
 
+import math
 import requests
 import time
 import threading
-from typing import Dict, List, Tuple, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, List, Tuple, Optional
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__, component="validator")
 
+REQUEST_TIMEOUT = 10  # seconds per HTTP request
+VALIDATION_DEADLINE = 60  # seconds for a whole validation pass
+HEALTH_CHECK_TIMEOUT = 5  # seconds per health check request
+SESSION_POOL_SIZE = 16
+
+# Load probe defaults (overridable via the load_probe config section)
+LOAD_PROBE_CONCURRENCY = 8
+LOAD_PROBE_DURATION = 10  # seconds
+LOAD_PROBE_METRICS = ('LOAD_P50_MS', 'LOAD_P95_MS', 'LOAD_P99_MS', 'LOAD_RPS', 'LOAD_ERROR_RATE')
+
+CRUD_ENTITIES = ['students', 'courses', 'teachers']
+CRUD_TEST_DATA = {
+    'students': {'name': 'Test Student', 'email': 'test@example.com',
+                 'enrollment_date': '2025-01-01'},
+    'courses': {'code': 'CS101', 'title': 'Intro to CS', 'credits': 3},
+    'teachers': {'name': 'Dr. Smith', 'email': 'smith@example.com',
+                 'department': 'Computer Science'}
+}
+
+
+def load_probe_payload(entity: str) -> Dict[str, Any]:
+    """
+    Create payload for one load probe request.
+    
+    Copies CRUD_TEST_DATA[entity] with fresh values for the fields that are
+    typically unique (emails, course codes), so concurrent creates do not
+    collide on unique constraints.
+    
+    Args:
+        entity: Entity collection name (e.g. "students")
+        
+    Returns:
+        Request body
+    """
+    token = uuid.uuid4().hex[:8]
+    payload = dict(CRUD_TEST_DATA[entity])
+    if 'email' in payload:
+        payload['email'] = f"load-{token}@example.com"
+    if 'code' in payload:
+        payload['code'] = f"LP{token}"
+    return payload
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list.
+    
+    Args:
+        sorted_values: Non-empty, ascending values
+        q: Percentile in [0, 100]
+        
+    Returns:
+        Smallest value with at least q% of the values at or below it
+    """
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples.
+    
+    Args:
+        latencies_ms: Latencies in milliseconds
+        
+    Returns:
+        Dictionary with count, p50_ms, p95_ms, p99_ms and max_ms (empty if no samples)
+    """
+    if not latencies_ms:
+        return {}
+    ordered = sorted(latencies_ms)
+    return {
+        'count': len(ordered),
+        'p50_ms': round(percentile(ordered, 50), 3),
+        'p95_ms': round(percentile(ordered, 95), 3),
+        'p99_ms': round(percentile(ordered, 99), 3),
+        'max_ms': round(ordered[-1], 3),
+    }
+
 
 class Validator:
     """Validates generated application functionality."""
     
-    def __init__(self, api_base_url: str, ui_base_url: str, run_id: str):
+    def __init__(
+        self,
+        api_base_url: str,
+        ui_base_url: str,
+        run_id: str,
+        request_timeout: float = REQUEST_TIMEOUT,
+        validation_deadline: float = VALIDATION_DEADLINE
+    ):
         """
         Initialize validator.
         
@@ -24,110 +127,181 @@ class Validator:
             api_base_url: Base URL for API (e.g., http://localhost:8000)
             ui_base_url: Base URL for UI (e.g., http://localhost:3000)
             run_id: Run identifier for logging
+            request_timeout: Timeout per HTTP request in seconds
+            validation_deadline: Upper bound for one validation pass
+                                 (CRUD or UI) in seconds
         """
         self.api_base_url = api_base_url.rstrip('/')
         self.ui_base_url = ui_base_url.rstrip('/')
         self.run_id = run_id
+        self.request_timeout = request_timeout
+        self.validation_deadline = validation_deadline
         self.downtime_count = 0
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
         
-    def test_crud_endpoints(self) -> Tuple[int, float]:
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=SESSION_POOL_SIZE, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        self._latency_lock = threading.Lock()
+        self.endpoint_latencies: Dict[str, List[float]] = {}
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+    
+    def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        deadline: Optional[float] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> requests.Response:
         """
-        Test CRUD operations for Student, Course, Teacher entities.
+        Send a request on the pooled session and record its latency.
+        
+        Args:
+            method: HTTP method
+            url: Full URL
+            endpoint: Endpoint label for latency metrics (e.g. "GET /students/{id}")
+            deadline: time.monotonic() value after which no request is sent;
+                      the timeout is shortened to the time remaining
+            timeout: Per-request timeout (defaults to request_timeout)
+            **kwargs: Passed to requests.Session.request
+            
+        Returns:
+            HTTP response
+            
+        Raises:
+            TimeoutError: If the deadline has already passed
+            requests.RequestException: On connection errors and timeouts
+        """
+        timeout = timeout or self.request_timeout
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("validation deadline exceeded")
+            timeout = min(timeout, remaining)
         
+        started = time.perf_counter()
+        response = self.session.request(method, url, timeout=timeout, **kwargs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._latency_lock:
+            self.endpoint_latencies.setdefault(endpoint, []).append(elapsed_ms)
+        return response
+    
+    def _run_concurrently(self, tasks: List[Callable[[], int]]) -> int:
+        """Run independent checks in parallel and sum their success counts."""
+        if not tasks:
+            return 0
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="validator") as pool:
+            return sum(future.result() for future in [pool.submit(task) for task in tasks])
+    
+    def _crud_chain(self, entity: str, deadline: float) -> int:
+        """
+        Create, read, update and delete one entity.
+        
+        Args:
+            entity: Collection name (e.g. 'students')
+            deadline: time.monotonic() deadline for the chain
+            
         Returns:
-            Tuple of (crude_score, esr) where:
-                crude_score: 0-12 (4 ops × 3 entities)
-                esr: Endpoint success rate 0-1
+            Number of successful operations (0-4)
         """
         successful_ops = 0
-        total_ops = 12  # 4 CRUD operations × 3 entities
+        entity_id = None
         
-        entities = ['students', 'courses', 'teachers']
-        test_data = {
-            'students': {'name': 'Test Student', 'email': 'test@example.com', 
-                        'enrollment_date': '2025-01-01'},
-            'courses': {'code': 'CS101', 'title': 'Intro to CS', 'credits': 3},
-            'teachers': {'name': 'Dr. Smith', 'email': 'smith@example.com', 
-                        'department': 'Computer Science'}
-        }
-        
-        created_ids: Dict[str, Optional[int]] = {}
+        # CREATE (POST)
+        try:
+            response = self._request(
+                'POST', f"{self.api_base_url}/{entity}", f"POST /{entity}",
+                deadline, json=CRUD_TEST_DATA[entity]
+            )
+            if response.status_code in [200, 201]:
+                successful_ops += 1
+                entity_id = response.json().get('id')
+                logger.debug(f"POST /{entity} succeeded",
+                           extra={'run_id': self.run_id})
+        except Exception as e:
+            logger.warning(f"POST /{entity} failed: {e}",
+                         extra={'run_id': self.run_id})
         
-        for entity in entities:
-            # CREATE (POST)
+        # READ (GET)
+        try:
+            if entity_id:
+                response = self._request(
+                    'GET', f"{self.api_base_url}/{entity}/{entity_id}",
+                    f"GET /{entity}/{{id}}", deadline
+                )
+            else:
+                response = self._request(
+                    'GET', f"{self.api_base_url}/{entity}", f"GET /{entity}", deadline
+                )
+                
+            if response.status_code == 200:
+                successful_ops += 1
+                logger.debug(f"GET /{entity} succeeded",
+                           extra={'run_id': self.run_id})
+        except Exception as e:
+            logger.warning(f"GET /{entity} failed: {e}",
+                         extra={'run_id': self.run_id})
+            
+        # UPDATE (PATCH)
+        if entity_id:
             try:
-                response = requests.post(
-                    f"{self.api_base_url}/{entity}",
-                    json=test_data[entity],
-                    timeout=10
+                update_data = {'name': 'Updated Name'} if entity != 'courses' else {'title': 'Updated Title'}
+                response = self._request(
+                    'PATCH', f"{self.api_base_url}/{entity}/{entity_id}",
+                    f"PATCH /{entity}/{{id}}", deadline, json=update_data
                 )
-                if response.status_code in [200, 201]:
+                if response.status_code == 200:
                     successful_ops += 1
-                    created_ids[entity] = response.json().get('id')
-                    logger.debug(f"POST /{entity} succeeded", 
+                    logger.debug(f"PATCH /{entity}/{entity_id} succeeded",
                                extra={'run_id': self.run_id})
             except Exception as e:
-                logger.warning(f"POST /{entity} failed: {e}",
+                logger.warning(f"PATCH /{entity}/{entity_id} failed: {e}",
                              extra={'run_id': self.run_id})
-                created_ids[entity] = None
                 
-        for entity in entities:
-            entity_id = created_ids.get(entity)
-            
-            # READ (GET)
+        # DELETE
+        if entity_id:
             try:
-                if entity_id:
-                    response = requests.get(
-                        f"{self.api_base_url}/{entity}/{entity_id}",
-                        timeout=10
-                    )
-                else:
-                    response = requests.get(
-                        f"{self.api_base_url}/{entity}",
-                        timeout=10
-                    )
-                    
-                if response.status_code == 200:
+                response = self._request(
+                    'DELETE', f"{self.api_base_url}/{entity}/{entity_id}",
+                    f"DELETE /{entity}/{{id}}", deadline
+                )
+                if response.status_code in [200, 204]:
                     successful_ops += 1
-                    logger.debug(f"GET /{entity} succeeded",
+                    logger.debug(f"DELETE /{entity}/{entity_id} succeeded",
                                extra={'run_id': self.run_id})
             except Exception as e:
-                logger.warning(f"GET /{entity} failed: {e}",
+                logger.warning(f"DELETE /{entity}/{entity_id} failed: {e}",
                              extra={'run_id': self.run_id})
-                
-            # UPDATE (PATCH)
-            if entity_id:
-                try:
-                    update_data = {'name': 'Updated Name'} if entity != 'courses' else {'title': 'Updated Title'}
-                    response = requests.patch(
-                        f"{self.api_base_url}/{entity}/{entity_id}",
-                        json=update_data,
-                        timeout=10
-                    )
-                    if response.status_code == 200:
-                        successful_ops += 1
-                        logger.debug(f"PATCH /{entity}/{entity_id} succeeded",
-                                   extra={'run_id': self.run_id})
-                except Exception as e:
-                    logger.warning(f"PATCH /{entity}/{entity_id} failed: {e}",
-                                 extra={'run_id': self.run_id})
-                    
-            # DELETE
-            if entity_id:
-                try:
-                    response = requests.delete(
-                        f"{self.api_base_url}/{entity}/{entity_id}",
-                        timeout=10
-                    )
-                    if response.status_code in [200, 204]:
-                        successful_ops += 1
-                        logger.debug(f"DELETE /{entity}/{entity_id} succeeded",
-                                   extra={'run_id': self.run_id})
-                except Exception as e:
-                    logger.warning(f"DELETE /{entity}/{entity_id} failed: {e}",
-                                 extra={'run_id': self.run_id})
+        
+        return successful_ops
+        
+    def test_crud_endpoints(self) -> Tuple[int, float]:
+        """
+        Test CRUD operations for Student, Course, Teacher entities.
+        
+        The per-entity chains run concurrently; requests not sent before
+        the validation deadline count as failed.
+        
+        Returns:
+            Tuple of (crude_score, esr) where:
+                crude_score: 0-12 (4 ops × 3 entities)
+                esr: Endpoint success rate 0-1
+        """
+        total_ops = 4 * len(CRUD_ENTITIES)  # 4 CRUD operations × 3 entities
+        deadline = time.monotonic() + self.validation_deadline
+        
+        successful_ops = self._run_concurrently([
+            lambda entity=entity: self._crud_chain(entity, deadline)
+            for entity in CRUD_ENTITIES
+        ])
                     
         crude_score = successful_ops
         esr = successful_ops / total_ops if total_ops > 0 else 0.0
@@ -138,6 +312,121 @@ class Validator:
                    }})
         
         return crude_score, esr
+    
+    def run_load_probe(
+        self,
+        concurrency: int = LOAD_PROBE_CONCURRENCY,
+        duration_seconds: float = LOAD_PROBE_DURATION
+    ) -> Dict[str, float]:
+        """
+        Fire concurrent CRUD traffic at the API for a fixed duration.
+        
+        Each worker cycles through the entities, creating a record, reading
+        it back and deleting it (listing the collection instead when the
+        create fails), so the probe leaves no data behind. Every create sends
+        fresh values for the entity's unique fields, so concurrent creates
+        are not rejected as duplicates. A request counts as an error if it
+        raises or returns HTTP >= 400.
+        
+        Latency and throughput only count successful requests: a dead or
+        failing API must not score as fast.
+        
+        Args:
+            concurrency: Number of concurrent workers
+            duration_seconds: Probe duration
+            
+        Returns:
+            Dictionary with LOAD_P50_MS, LOAD_P95_MS, LOAD_P99_MS (latency of
+            successful requests in milliseconds), LOAD_RPS (successful
+            requests per second) and LOAD_ERROR_RATE (0-1). Latency and
+            throughput are left out when no request succeeded, and all
+            metrics when no request was sent.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        timeout = min(self.request_timeout, duration_seconds)
+        
+        def worker(offset: int) -> Tuple[List[float], int, int]:
+            latencies: List[float] = []  # Successful requests only
+            errors = 0
+            requests_sent = 0
+            
+            def call(method: str, url: str, **kwargs) -> Optional[requests.Response]:
+                nonlocal errors, requests_sent
+                started = time.perf_counter()
+                try:
+                    response = session.request(method, url, timeout=timeout, **kwargs)
+                except Exception:
+                    response = None
+                requests_sent += 1
+                if response is None or response.status_code >= 400:
+                    errors += 1
+                else:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                return response
+            
+            cycle = offset
+            while time.monotonic() < end_time:
+                entity = CRUD_ENTITIES[cycle % len(CRUD_ENTITIES)]
+                cycle += 1
+                created = call('POST', f"{self.api_base_url}/{entity}", json=load_probe_payload(entity))
+                entity_id = None
+                if created is not None and created.status_code in [200, 201]:
+                    try:
+                        entity_id = created.json().get('id')
+                    except (ValueError, AttributeError):
+                        entity_id = None
+                if entity_id:
+                    call('GET', f"{self.api_base_url}/{entity}/{entity_id}")
+                    call('DELETE', f"{self.api_base_url}/{entity}/{entity_id}")
+                else:
+                    call('GET', f"{self.api_base_url}/{entity}")
+            return latencies, errors, requests_sent
+        
+        logger.info(f"Starting load probe: {concurrency} workers for {duration_seconds}s",
+                   extra={'run_id': self.run_id, 'event': 'load_probe_start'})
+        started = time.monotonic()
+        end_time = started + duration_seconds
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load-probe") as pool:
+                results = list(pool.map(worker, range(concurrency)))
+        finally:
+            session.close()
+        elapsed = time.monotonic() - started
+        
+        latencies = sorted(latency for worker_latencies, _, _ in results for latency in worker_latencies)
+        errors = sum(worker_errors for _, worker_errors, _ in results)
+        total = sum(sent for _, _, sent in results)
+        metrics = {}
+        if latencies:
+            metrics.update({
+                'LOAD_P50_MS': round(percentile(latencies, 50), 3),
+                'LOAD_P95_MS': round(percentile(latencies, 95), 3),
+                'LOAD_P99_MS': round(percentile(latencies, 99), 3),
+                'LOAD_RPS': round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+            })
+        if total:
+            metrics['LOAD_ERROR_RATE'] = round(errors / total, 6)
+        
+        logger.info(f"Load probe complete: {total} requests, {len(latencies)} succeeded, "
+                   f"{metrics.get('LOAD_RPS')} req/s, p95 {metrics.get('LOAD_P95_MS')} ms, "
+                   f"error rate {metrics.get('LOAD_ERROR_RATE')}",
+                   extra={'run_id': self.run_id, 'event': 'load_probe_complete',
+                         'metadata': metrics})
+        return metrics
+    
+    def latency_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency percentiles per endpoint recorded so far.
+        
+        Returns:
+            Mapping of endpoint label (e.g. "POST /students") to latency_summary()
+        """
+        with self._latency_lock:
+            samples = {endpoint: list(values) for endpoint, values in self.endpoint_latencies.items()}
+        return {endpoint: latency_summary(values) for endpoint, values in sorted(samples.items())}
         
     def test_relational_endpoints(self) -> int:
         """
@@ -150,7 +439,7 @@ class Validator:
         
         # Test enrollment endpoints
         try:
-            response = requests.get(f"{self.api_base_url}/enrollments", timeout=10)
+            response = self._request('GET', f"{self.api_base_url}/enrollments", "GET /enrollments")
             if response.status_code == 200:
                 successful += 1
         except Exception:
@@ -166,18 +455,23 @@ class Validator:
             Number of accessible pages
         """
         pages = ['/', '/students', '/courses', '/teachers', '/enrollments']
-        accessible_count = 0
+        deadline = time.monotonic() + self.validation_deadline
         
-        for page in pages:
+        def check_page(page: str) -> int:
             try:
-                response = requests.get(f"{self.ui_base_url}{page}", timeout=10)
+                response = self._request('GET', f"{self.ui_base_url}{page}", f"UI {page}", deadline)
                 if response.status_code == 200 and len(response.text) > 0:
-                    accessible_count += 1
                     logger.debug(f"UI page {page} accessible",
                                extra={'run_id': self.run_id})
+                    return 1
             except Exception as e:
                 logger.warning(f"UI page {page} not accessible: {e}",
                              extra={'run_id': self.run_id})
+            return 0
+        
+        accessible_count = self._run_concurrently([
+            lambda page=page: check_page(page) for page in pages
+        ])
                              
         logger.info(f"UI validation complete: {accessible_count}/{len(pages)} pages accessible",
                    extra={'run_id': self.run_id})
@@ -192,8 +486,8 @@ class Validator:
             True if both return HTTP 200, False otherwise
         """
         try:
-            api_response = requests.get(f"{self.api_base_url}/", timeout=5)
-            ui_response = requests.get(f"{self.ui_base_url}/", timeout=5)
+            api_response = self.session.get(f"{self.api_base_url}/", timeout=HEALTH_CHECK_TIMEOUT)
+            ui_response = self.session.get(f"{self.ui_base_url}/", timeout=HEALTH_CHECK_TIMEOUT)
             return api_response.status_code == 200 and ui_response.status_code == 200
         except Exception:
             return False
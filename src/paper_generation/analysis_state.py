@@ -0,0 +1,127 @@
+"""
+Saved per-metric statistical findings for incremental re-analysis.
+
+StatisticalAnalyzer.analyze_experiment() recomputes distributions, assumption
+checks, tests, effect sizes and power for every metric. When an experiment is
+re-analyzed after every few runs, most metrics' samples are unchanged, so the
+analyzer stores each metric's findings next to a fingerprint of every
+framework's sample of that metric. On the next analysis only metrics whose
+samples (or the analysis settings) changed are recomputed; the rest are
+merged from the saved state.
+
+The state is a pickle of the findings dataclasses (which hold NumPy arrays and
+enums), written atomically. It is a local cache produced by this process;
+a missing, corrupt or outdated file simply means a full analysis.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = ".statistical_state.pkl"
+# Bump to invalidate saved findings (e.g. when the findings dataclasses change)
+STATE_FORMAT_VERSION = 1
+
+
+def sample_fingerprints(metric_data: Dict[str, List[float]]) -> Dict[str, str]:
+    """
+    Fingerprint every framework's sample of one metric.
+
+    Args:
+        metric_data: Framework name → sample values (in run order)
+
+    Returns:
+        Framework name → SHA-256 hex digest of the float64 values
+    """
+    return {
+        framework: hashlib.sha256(np.asarray(values, dtype='<f8').tobytes()).hexdigest()
+        for framework, values in metric_data.items()
+    }
+
+
+class AnalysisState:
+    """Per-metric findings keyed by sample fingerprints and analysis settings."""
+
+    def __init__(self, path: Path, settings: str):
+        """
+        Initialize and load saved findings.
+
+        Args:
+            path: State file
+            settings: Fingerprint of everything besides the samples that
+                determines findings (alpha, seed, config, library and code
+                versions); saved findings with other settings are discarded
+        """
+        self.path = Path(path)
+        self.settings = settings
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Ignoring unreadable analysis state %s: %s", self.path, e)
+            return
+        if (isinstance(state, dict) and state.get('version') == STATE_FORMAT_VERSION
+                and state.get('settings') == self.settings):
+            self.metrics = state.get('metrics', {})
+        else:
+            logger.info("Analysis settings changed; recomputing all metrics")
+
+    def get(self, metric_name: str, fingerprints: Dict[str, str]) -> Optional[Any]:
+        """
+        Saved findings of a metric, if its samples are unchanged.
+
+        Args:
+            metric_name: Metric name
+            fingerprints: Current sample fingerprints (see sample_fingerprints)
+
+        Returns:
+            Saved findings, or None if the metric must be recomputed
+        """
+        entry = self.metrics.get(metric_name)
+        if entry is None or entry['fingerprints'] != fingerprints:
+            return None
+        return entry['findings']
+
+    def put(self, metric_name: str, fingerprints: Dict[str, str], findings: Any) -> None:
+        """Record a metric's findings (saved by save())."""
+        self.metrics[metric_name] = {'fingerprints': fingerprints, 'findings': findings}
+
+    def save(self, metric_names: List[str]) -> None:
+        """
+        Write the state, keeping only the given metrics.
+
+        Args:
+            metric_names: Metrics of the current analysis (others are dropped)
+        """
+        state = {
+            'version': STATE_FORMAT_VERSION,
+            'settings': self.settings,
+            'metrics': {name: self.metrics[name] for name in metric_names if name in self.metrics},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.stem}.")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not save analysis state %s: %s", self.path, e)
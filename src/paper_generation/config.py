@@ -21,6 +21,9 @@ class StatisticalConfig:
         normality_sample_size_threshold: Minimum samples for Shapiro-Wilk test (default: 3)
         bootstrap_iterations: Number of bootstrap iterations for CI estimation (default: 10000)
         bootstrap_confidence_level: Confidence level for bootstrap CIs (default: 0.95)
+        power_simulations: Maximum simulated experiments for non-parametric power (default: 10000)
+        power_mc_tolerance: Stop power simulation once its 95% Monte Carlo half-width
+            is at most this (default: 0.005)
         min_group_size: Minimum group size for valid comparisons (default: 2)
     """
     
@@ -36,6 +39,10 @@ class StatisticalConfig:
     bootstrap_iterations: int = 10000
     bootstrap_confidence_level: float = 0.95
     
+    # Power simulation parameters
+    power_simulations: int = 10000
+    power_mc_tolerance: float = 0.005
+    
     # Sample size requirements
     min_group_size: int = 2
     
@@ -53,5 +60,9 @@ class StatisticalConfig:
             raise ValueError(
                 f"bootstrap_confidence_level must be between 0 and 1, got {self.bootstrap_confidence_level}"
             )
+        if self.power_simulations < 1000:
+            raise ValueError(f"power_simulations should be at least 1000, got {self.power_simulations}")
+        if not 0 < self.power_mc_tolerance < 1:
+            raise ValueError(f"power_mc_tolerance must be between 0 and 1, got {self.power_mc_tolerance}")
         if self.min_group_size < 2:
             raise ValueError(f"min_group_size must be at least 2, got {self.min_group_size}")
@@ -11,10 +11,13 @@ import statistics
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
+import numpy as np
 import yaml
 
+from .analysis_state import STATE_FILENAME
 from .exceptions import ExperimentDataError
 from src.utils.cost_calculator import CostCalculator
+from src.utils.run_metrics_table import RunMetricsTable, as_json_number, load_run_metrics_table
 from src.utils.statistical_helpers import format_pvalue
 from .statistical_analyzer import StatisticalAnalyzer
 from .statistical_visualizations import StatisticalVisualizationGenerator
@@ -22,6 +25,17 @@ from .educational_content import EducationalContentGenerator
 
 logger = logging.getLogger(__name__)
 
+# Reported per-run metric → source metric (see ExperimentAnalyzer._metric_values)
+RUN_METRICS = {
+    "execution_time": "duration_total",
+    "total_cost_usd": "cost_total",
+    "api_calls": "api_calls_total",
+    "tokens_in": "tokens_in",
+    "tokens_out": "tokens_out",
+    "tokens_total": "tokens_total",
+    "cached_tokens": "cached_tokens",
+}
+
 
 class ExperimentAnalyzer:
     """
@@ -31,16 +45,28 @@ class ExperimentAnalyzer:
     Writes to: output_dir/metrics.json, output_dir/statistical_report.md
     """
     
-    def __init__(self, experiment_dir: Path, output_dir: Path):
+    def __init__(
+        self,
+        experiment_dir: Path,
+        output_dir: Path,
+        incremental: bool = True,
+        analysis_workers: Optional[int] = None
+    ):
         """
         Initialize analyzer.
         
         Args:
             experiment_dir: Root experiment directory with runs/
             output_dir: Where to write analysis results
+            incremental: Reuse saved statistical findings of metrics whose
+                samples did not change since the last analysis
+            analysis_workers: Worker processes for per-metric statistical
+                analysis (None: one per CPU, capped)
         """
         self.experiment_dir = experiment_dir
         self.output_dir = output_dir
+        self.incremental = incremental
+        self.analysis_workers = analysis_workers
         self.runs_dir = experiment_dir / "runs"
         
         if not self.runs_dir.exists():
@@ -118,6 +144,9 @@ class ExperimentAnalyzer:
         logger.info("Found %d frameworks: %s", len(framework_dirs), 
                    [d.name for d in framework_dirs])
         
+        # Parse run files once (only new or changed ones since the last analysis)
+        self.run_table = load_run_metrics_table(self.runs_dir)
+        
         # Aggregate metrics for each framework
         frameworks_data = {}
         for framework_dir in framework_dirs:
@@ -136,12 +165,17 @@ class ExperimentAnalyzer:
         logger.info("Performing comprehensive statistical analysis...")
         
         # Initialize statistical analyzers
-        statistical_analyzer = StatisticalAnalyzer(alpha=0.05, random_seed=42)
+        statistical_analyzer = StatisticalAnalyzer(
+            alpha=0.05, random_seed=42, analysis_workers=self.analysis_workers
+        )
         viz_generator = StatisticalVisualizationGenerator(output_dir=str(self.output_dir))
         educational_generator = EducationalContentGenerator(reading_level=8)
         
         # Perform statistical analysis
-        statistical_findings = statistical_analyzer.analyze_experiment(frameworks_data)
+        state_path = self.output_dir / STATE_FILENAME if self.incremental else None
+        statistical_findings = statistical_analyzer.analyze_experiment(
+            frameworks_data, state_path=state_path
+        )
         
         # Feature 013: Display warning summary if warnings exist
         if statistical_findings.warnings:
@@ -197,137 +231,89 @@ class ExperimentAnalyzer:
         """Aggregate metrics across all runs for a framework."""
         logger.debug("Analyzing framework: %s", framework_dir.name)
         
-        # Find all run directories (UUIDs)
-        run_dirs = [d for d in framework_dir.iterdir() if d.is_dir()]
-        logger.debug("Found %d run directories for %s", len(run_dirs), framework_dir.name)
-        
-        # Collect metrics from all runs with their run_ids
-        all_runs = []
-        run_data = []  # Individual run data for statistical analysis
-        skipped_unverified = 0
-        
-        for run_dir in run_dirs:
-            metrics = self._load_run_metrics(run_dir)
-            if metrics:
-                # Check verification status - only include verified runs
-                if self._is_run_verified(metrics):
-                    all_runs.append(metrics)
-                    # Extract individual run data
-                    run_data.append({
-                        "run_id": run_dir.name,
-                        "execution_time": self._extract_metric_value(metrics, "duration_total"),
-                        "total_cost_usd": self._extract_metric_value(metrics, "cost_total"),
-                        "api_calls": self._extract_metric_value(metrics, "api_calls_total"),
-                        "tokens_in": self._extract_metric_value(metrics, "tokens_in"),
-                        "tokens_out": self._extract_metric_value(metrics, "tokens_out"),
-                        "tokens_total": self._extract_metric_value(metrics, "tokens_total"),
-                        "cached_tokens": self._extract_metric_value(metrics, "cached_tokens"),
-                    })
-                else:
-                    skipped_unverified += 1
-                    logger.debug("Skipped unverified run: %s", run_dir.name)
+        runs = self.run_table.for_framework(framework_dir.name)
+        logger.debug("Found %d runs for %s", len(runs), framework_dir.name)
+        
+        # Only include runs verified through usage API reconciliation
+        # (usage_api_reconciliation.verification_status == "verified")
+        verified = runs['reconciliation_status'] == "verified"
+        skipped_unverified = int((~verified).sum())
+        runs = runs.where(verified)
         
-        if not all_runs:
+        if not len(runs):
             logger.warning("No valid metrics found for %s", framework_dir.name)
             return {}
         
         if skipped_unverified > 0:
             logger.info("Loaded %d verified runs for %s (skipped %d unverified)", 
-                       len(all_runs), framework_dir.name, skipped_unverified)
+                       len(runs), framework_dir.name, skipped_unverified)
         else:
-            logger.info("Loaded %d verified runs for %s", len(all_runs), framework_dir.name)
+            logger.info("Loaded %d verified runs for %s", len(runs), framework_dir.name)
+        
+        columns = {
+            reported: [
+                float(value) if source == "cost_total" else as_json_number(value)
+                for value in self._metric_values(runs, source)
+            ]
+            for reported, source in RUN_METRICS.items()
+        }
+        
+        # Individual run data for statistical analysis
+        run_data = [
+            {"run_id": run_id, **{reported: values[i] for reported, values in columns.items()}}
+            for i, run_id in enumerate(runs['run_id'].tolist())
+        ]
         
         # Aggregate statistics
         aggregated = {
-            "num_runs": len(all_runs),
-            "runs": run_data,  # Individual run data for statistical analysis
-            "execution_time": self._aggregate_metric(all_runs, "duration_total"),
-            "total_cost_usd": self._aggregate_metric(all_runs, "cost_total"),
-            "api_calls": self._aggregate_metric(all_runs, "api_calls_total"),
-            "tokens_in": self._aggregate_metric(all_runs, "tokens_in"),
-            "tokens_out": self._aggregate_metric(all_runs, "tokens_out"),
-            "tokens_total": self._aggregate_metric(all_runs, "tokens_total"),
-            "cached_tokens": self._aggregate_metric(all_runs, "cached_tokens"),
+            "num_runs": len(runs),
+            "runs": run_data,
+            **{reported: self._aggregate_metric(values) for reported, values in columns.items()},
         }
         
         return aggregated
     
-    def _load_run_metrics(self, run_dir: Path) -> Dict[str, Any]:
-        """Load metrics from a single run directory."""
-        metrics_file = run_dir / "metrics.json"
-        if not metrics_file.exists():
-            logger.debug("Metrics file not found: %s", metrics_file)
-            return None
-        
-        try:
-            with open(metrics_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning("Failed to load %s: %s", metrics_file, str(e))
-            return None
-    
-    def _is_run_verified(self, metrics: Dict[str, Any]) -> bool:
+    def _metric_values(self, runs: RunMetricsTable, metric_name: str) -> np.ndarray:
         """
-        Check if a run has been verified through usage API reconciliation.
+        Extract a metric for every run in the table.
         
-        A run is considered verified if:
-        - usage_api_reconciliation.verification_status == "verified"
-        
-        Args:
-            metrics: Run metrics dictionary
-            
-        Returns:
-            True if run is verified, False otherwise
+        A top-level field of the same name wins; otherwise duration_total is
+        the sum of step durations and the API/token metrics (including cost)
+        are derived from aggregate_metrics. Runs without a source yield 0.
         """
-        if "usage_api_reconciliation" not in metrics:
-            return False
-        
-        reconciliation = metrics["usage_api_reconciliation"]
-        verification_status = reconciliation.get("verification_status", "")
-        
-        return verification_status == "verified"
-    
-    def _extract_metric_value(self, metrics: Dict[str, Any], metric_name: str) -> float:
-        """Extract a single metric value from run data."""
-        value = None
-        
-        # Try to find the metric in the run data
-        if metric_name in metrics:
-            value = metrics[metric_name]
-        # Compute from steps for duration
-        elif metric_name == "duration_total" and "steps" in metrics:
-            value = sum(step.get("duration_seconds", 0) for step in metrics["steps"])
-        # Get from aggregate_metrics (primary source for API/token data)
-        elif "aggregate_metrics" in metrics:
-            agg = metrics["aggregate_metrics"]
-            if metric_name == "cost_total":
-                # Calculate cost dynamically from token data using experiment's pricing
-                tokens_in = agg.get("TOK_IN", 0)
-                tokens_out = agg.get("TOK_OUT", 0)
-                cached_tokens = agg.get("CACHED_TOKENS", 0)
-                model = metrics.get("model", self.default_model)
-                
-                if tokens_in > 0 or tokens_out > 0:
-                    value = self._calculate_cost(
-                        model=model,
-                        tokens_in=tokens_in,
-                        tokens_out=tokens_out,
-                        cached_tokens=cached_tokens
-                    )
-                else:
-                    value = 0.0
-            elif metric_name == "api_calls_total":
-                value = agg.get("API_CALLS", 0)
-            elif metric_name == "tokens_in":
-                value = agg.get("TOK_IN", 0)
-            elif metric_name == "tokens_out":
-                value = agg.get("TOK_OUT", 0)
-            elif metric_name == "tokens_total":
-                value = agg.get("TOK_IN", 0) + agg.get("TOK_OUT", 0)
-            elif metric_name == "cached_tokens":
-                value = agg.get("CACHED_TOKENS", 0)
-        
-        return value if value is not None else 0
+        top_level = runs.top(metric_name)
+        has_aggregate = runs['has_aggregate']
+        
+        if metric_name == "duration_total":
+            derived = np.where(runs['has_steps'], runs.step_sum("duration_seconds"), 0.0)
+        elif metric_name == "cost_total":
+            # Calculate cost dynamically from token data using experiment's pricing
+            tokens_in = runs.aggregate("TOK_IN", 0.0)
+            tokens_out = runs.aggregate("TOK_OUT", 0.0)
+            cached_tokens = runs.aggregate("CACHED_TOKENS", 0.0)
+            models = runs['model']
+            derived = np.array([
+                self._calculate_cost(
+                    model=models[i] or self.default_model,
+                    tokens_in=int(tokens_in[i]),
+                    tokens_out=int(tokens_out[i]),
+                    cached_tokens=int(cached_tokens[i])
+                ) if has_aggregate[i] and (tokens_in[i] > 0 or tokens_out[i] > 0) else 0.0
+                for i in range(len(runs))
+            ], dtype=np.float64)
+        else:
+            tokens_in = runs.aggregate("TOK_IN", 0.0)
+            tokens_out = runs.aggregate("TOK_OUT", 0.0)
+            from_aggregate = {
+                "api_calls_total": runs.aggregate("API_CALLS", 0.0),
+                "tokens_in": tokens_in,
+                "tokens_out": tokens_out,
+                "tokens_total": tokens_in + tokens_out,
+                "cached_tokens": runs.aggregate("CACHED_TOKENS", 0.0),
+            }.get(metric_name, np.zeros(len(runs)))
+            derived = np.where(has_aggregate, from_aggregate, 0.0)
+        
+        return np.where(np.isnan(top_level), derived, top_level)
     
     def _calculate_cost(
         self,
@@ -370,17 +356,10 @@ class ExperimentAnalyzer:
                 return 0.0
     
     
-    def _aggregate_metric(self, runs: List[Dict], metric_name: str) -> Dict[str, float]:
-        """Calculate statistics for a specific metric across runs."""
-        values = []
-        
-        for run in runs:
-            # Use _extract_metric_value for consistency
-            value = self._extract_metric_value(run, metric_name)
-            values.append(value)
-        
+    def _aggregate_metric(self, values: List[float]) -> Dict[str, float]:
+        """Calculate statistics for a metric's per-run values."""
         if not values:
-            logger.debug("No values found for metric: %s", metric_name)
+            logger.debug("No values found for metric")
             return {"mean": 0, "std": 0, "min": 0, "max": 0, "count": 0}
         
         return {
@@ -21,6 +21,9 @@ except ImportError:
     plt = None
     np = None
 
+from src.utils.figure_cache import (
+    FIGURE_CACHE_DIRNAME, FIGURE_CACHE_ENABLED, FigureCache, figure_key, source_fingerprint
+)
 from .models import Figure, PaperConfig, SectionContext
 from .exceptions import FigureExportError
 
@@ -66,6 +69,11 @@ class FigureExporter:
         self.figures_dir = self.output_dir / "figures"
         self.figures_dir.mkdir(exist_ok=True)
         
+        # Figures whose inputs are unchanged are restored instead of redrawn
+        self.figure_cache = (
+            FigureCache(self.output_dir / FIGURE_CACHE_DIRNAME) if FIGURE_CACHE_ENABLED else None
+        )
+        
         logger.info(f"FigureExporter initialized with output_dir={self.output_dir}")
     
     def export_figures(self, context: SectionContext) -> List[Figure]:
@@ -128,6 +136,9 @@ class FigureExporter:
                 if sig_fig:
                     figures.append(sig_fig)
             
+            if self.figure_cache is not None:
+                self.figure_cache.evict()
+            
             logger.info(f"Successfully exported {len(figures)} figures")
             return figures
             
@@ -172,6 +183,18 @@ class FigureExporter:
                 means.append(metric_data.get('mean', 0))
                 stds.append(metric_data.get('std', 0))
             
+            base_filename = f"{metric_name}_comparison"
+            pdf_path = self.figures_dir / f"{base_filename}.pdf"
+            png_path = self.figures_dir / f"{base_filename}.png"
+            caption = f"Comparison of {self._format_metric_label(metric_name)} across {len(frameworks)} frameworks. Error bars represent standard deviation."
+            
+            cache_key = self._figure_key(
+                'comparison_chart',
+                {'metric': metric_name, 'frameworks': frameworks, 'means': means, 'stds': stds}
+            )
+            if self._restore_cached_figure(cache_key):
+                return Figure(pdf_path=pdf_path, png_path=png_path, caption=caption)
+            
             # Create figure
             fig, ax = plt.subplots(figsize=(10, 6))
             
@@ -188,10 +211,6 @@ class FigureExporter:
             plt.tight_layout()
             
             # Export to PDF and PNG
-            base_filename = f"{metric_name}_comparison"
-            pdf_path = self.figures_dir / f"{base_filename}.pdf"
-            png_path = self.figures_dir / f"{base_filename}.png"
-            
             fig.savefig(pdf_path, format='pdf', dpi=300, bbox_inches='tight')
             fig.savefig(png_path, format='png', dpi=300, bbox_inches='tight')
             
@@ -204,7 +223,7 @@ class FigureExporter:
             if pdf_size_mb > 10 or png_size_mb > 10:
                 logger.warning(f"Figure file sizes large: PDF={pdf_size_mb:.1f}MB, PNG={png_size_mb:.1f}MB")
             
-            caption = f"Comparison of {self._format_metric_label(metric_name)} across {len(frameworks)} frameworks. Error bars represent standard deviation."
+            self._cache_figure(cache_key, [pdf_path, png_path])
             
             return Figure(
                 pdf_path=pdf_path,
@@ -234,6 +253,16 @@ class FigureExporter:
             Figure object or None if insufficient data
         """
         try:
+            base_filename = "statistical_significance"
+            pdf_path = self.figures_dir / f"{base_filename}.pdf"
+            png_path = self.figures_dir / f"{base_filename}.png"
+            caption = "Statistical significance analysis across frameworks showing distributions and p-values."
+            
+            # The placeholder does not depend on the data
+            cache_key = self._figure_key('statistical_significance', None)
+            if self._restore_cached_figure(cache_key):
+                return Figure(pdf_path=pdf_path, png_path=png_path, caption=caption)
+            
             # Create box plot for first metric to show distributions
             # (In a real implementation, would be more sophisticated)
             
@@ -251,16 +280,12 @@ class FigureExporter:
             plt.tight_layout()
             
             # Export
-            base_filename = "statistical_significance"
-            pdf_path = self.figures_dir / f"{base_filename}.pdf"
-            png_path = self.figures_dir / f"{base_filename}.png"
-            
             fig.savefig(pdf_path, format='pdf', dpi=300, bbox_inches='tight')
             fig.savefig(png_path, format='png', dpi=300, bbox_inches='tight')
             
             plt.close(fig)
             
-            caption = "Statistical significance analysis across frameworks showing distributions and p-values."
+            self._cache_figure(cache_key, [pdf_path, png_path])
             
             return Figure(
                 pdf_path=pdf_path,
@@ -272,6 +297,21 @@ class FigureExporter:
             logger.error(f"Failed to create statistical plot: {e}")
             return None
     
+    def _figure_key(self, kind: str, inputs: Any) -> str:
+        """Cache key of a figure drawn by this module from the given inputs."""
+        return figure_key(kind, inputs, {'dpi': 300}, source_fingerprint(Path(__file__)))
+    
+    def _restore_cached_figure(self, cache_key: str) -> bool:
+        """Restore a figure's PDF and PNG from the cache; False on a miss."""
+        if self.figure_cache is None:
+            return False
+        return self.figure_cache.restore(cache_key, self.figures_dir) is not None
+    
+    def _cache_figure(self, cache_key: str, paths: List[Path]) -> None:
+        """Add freshly exported files to the cache."""
+        if self.figure_cache is not None and all(path.exists() for path in paths):
+            self.figure_cache.store(cache_key, paths, self.figures_dir)
+    
     def _format_metric_label(self, metric_name: str) -> str:
         """Convert metric_name to human-readable label."""
         # Convert snake_case to Title Case
@@ -0,0 +1,198 @@
+"""
+Figure rendering scheduler for StatisticalVisualizationGenerator.
+
+Each figure is described by a picklable RenderJob (generator method name and
+arguments). Jobs are rendered in a process pool whose workers each build
+their own StatisticalVisualizationGenerator with the Agg backend and the
+same output directory and style, so figures never share matplotlib state.
+Results are returned in job order, so callers see the same Visualization
+list regardless of which worker finished first.
+
+With a single worker (or a single job) figures are rendered in-process.
+
+When the generator has a figure cache, a job whose inputs, parameters,
+style and plotting code are unchanged is restored from the cache instead of
+being drawn again (see src/utils/figure_cache.py).
+"""
+
+import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.figure_cache import figure_key, source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on worker processes when the caller does not choose
+MAX_DEFAULT_RENDER_WORKERS = 8
+
+# Generator built by each worker process (see _init_worker)
+_worker_generator = None
+
+
+@dataclass
+class RenderJob:
+    """
+    One figure to render.
+
+    Attributes:
+        method: Name of the StatisticalVisualizationGenerator method to call
+        args: Positional arguments (must be picklable)
+        kwargs: Keyword arguments (must be picklable)
+        description: Human-readable label used in log and warning messages
+        required: If True, a failure is raised to the caller; otherwise it is
+                  reported with warnings.warn and the job yields None
+    """
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
+    required: bool = False
+
+
+def default_render_workers(n_jobs: int) -> int:
+    """Number of worker processes to use for n_jobs figures."""
+    return max(1, min(n_jobs, os.cpu_count() or 1, MAX_DEFAULT_RENDER_WORKERS))
+
+
+def _init_worker(output_dir: str, style: str, cache_dir: Optional[str]) -> None:
+    """Build the per-process generator (Agg backend, publication styling)."""
+    global _worker_generator
+    import matplotlib
+    matplotlib.use('Agg')
+    from .statistical_visualizations import StatisticalVisualizationGenerator
+    _worker_generator = StatisticalVisualizationGenerator(
+        output_dir, style, render_workers=1,
+        cache_dir=cache_dir, use_cache=cache_dir is not None
+    )
+
+
+def _visualization_to_meta(viz: Any, fig_dir: Path) -> Dict[str, Any]:
+    return {
+        'viz_type': viz.viz_type.value,
+        'metric_name': viz.metric_name,
+        'file_path': Path(viz.file_path).relative_to(fig_dir).as_posix(),
+        'format': viz.format,
+        'title': viz.title,
+        'caption': viz.caption,
+        'groups': viz.groups,
+    }
+
+
+def _visualization_from_meta(meta: Dict[str, Any], fig_dir: Path) -> Any:
+    from .statistical_analyzer import Visualization, VisualizationType
+    return Visualization(
+        viz_type=VisualizationType(meta['viz_type']),
+        metric_name=meta['metric_name'],
+        file_path=fig_dir / meta['file_path'],
+        format=meta['format'],
+        title=meta['title'],
+        caption=meta['caption'],
+        groups=meta['groups'],
+    )
+
+
+def _execute(generator: Any, job: RenderJob) -> Any:
+    """Render one job, going through the generator's figure cache if it has one."""
+    cache = getattr(generator, 'figure_cache', None)
+    if cache is None:
+        return getattr(generator, job.method)(*job.args, **job.kwargs)
+
+    from . import statistical_visualizations
+    key = figure_key(job.method, [job.args, job.kwargs], {'style': generator.style},
+                     source_fingerprint(Path(statistical_visualizations.__file__)))
+    meta = cache.restore(key, generator.fig_dir)
+    if meta:
+        return _visualization_from_meta(meta, generator.fig_dir)
+
+    viz = getattr(generator, job.method)(*job.args, **job.kwargs)
+    try:
+        cache.store(key, [viz.file_path], generator.fig_dir,
+                    _visualization_to_meta(viz, generator.fig_dir))
+    except ValueError:
+        # Figure written outside fig_dir: not cacheable
+        pass
+    return viz
+
+
+def _render_in_worker(job: RenderJob) -> Any:
+    return _execute(_worker_generator, job)
+
+
+def _render_one(generator: Any, job: RenderJob) -> Tuple[bool, Any]:
+    try:
+        return True, _execute(generator, job)
+    except Exception as e:
+        return False, e
+
+
+def _render_parallel(generator: Any, jobs: List[RenderJob], workers: int) -> List[Tuple[bool, Any]]:
+    logger.info(f"Rendering {len(jobs)} figures with {workers} worker processes")
+    outcomes = []
+    cache = getattr(generator, 'figure_cache', None)
+    cache_dir = str(cache.cache_dir) if cache is not None else None
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(generator.output_dir), generator.style, cache_dir)) as pool:
+        futures = [pool.submit(_render_in_worker, job) for job in jobs]
+        for future in futures:
+            try:
+                outcomes.append((True, future.result()))
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                outcomes.append((False, e))
+    return outcomes
+
+
+def render_jobs(
+    generator: Any,
+    jobs: List[RenderJob],
+    max_workers: Optional[int] = None
+) -> List[Optional[Any]]:
+    """
+    Render figures, in parallel when more than one worker is available.
+
+    Args:
+        generator: StatisticalVisualizationGenerator whose output_dir and
+                   style the workers replicate (used directly when serial)
+        jobs: Figures to render
+        max_workers: Worker processes (None: one per CPU, capped)
+
+    Returns:
+        One entry per job, in job order: the Visualization, or None if a
+        non-required job failed
+
+    Raises:
+        Exception: The first failure (in job order) of a required job
+    """
+    workers = max_workers or default_render_workers(len(jobs))
+    workers = min(workers, len(jobs))
+
+    outcomes: Optional[List[Tuple[bool, Any]]] = None
+    if workers > 1:
+        try:
+            outcomes = _render_parallel(generator, jobs, workers)
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Figure worker pool failed ({e}); rendering in-process")
+    if outcomes is None:
+        outcomes = [_render_one(generator, job) for job in jobs]
+
+    cache = getattr(generator, 'figure_cache', None)
+    if cache is not None:
+        cache.evict()
+
+    results: List[Optional[Any]] = []
+    for job, (succeeded, value) in zip(jobs, outcomes):
+        if succeeded:
+            results.append(value)
+        elif job.required:
+            raise value
+        else:
+            warnings.warn(f"Failed to generate {job.description or job.method}: {value}")
+            results.append(None)
+    return results
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from .exceptions import ConfigValidationError
+from .prose_cache import PROSE_CACHE_MODES
 
 
 @dataclass
@@ -36,6 +37,11 @@ class PaperConfig:
     skip_latex: bool = False      # Generate Markdown only (skip Pandoc)
     figures_only: bool = False    # Regenerate just figures, no paper
     
+    # Prose generation throughput
+    prose_cache: str = "readwrite"    # "off" | "readwrite" | "replay" (offline, cache only)
+    prose_cache_dir: Path | None = None  # Defaults to output_dir/.prose_cache
+    section_workers: int = 4      # Sections generated concurrently (1 = sequential)
+    
     def __post_init__(self):
         """Validate configuration. Fail-fast on invalid values."""
         # Validate paths exist
@@ -61,8 +67,21 @@ class PaperConfig:
                 field="prose_level"
             )
         
-        # Validate API key (only if not figures_only mode)
-        if not self.figures_only:
+        # Validate prose cache mode
+        if self.prose_cache not in PROSE_CACHE_MODES:
+            raise ConfigValidationError(
+                f"Invalid prose_cache: {self.prose_cache}. Must be one of {list(PROSE_CACHE_MODES)}",
+                field="prose_cache"
+            )
+        
+        if self.section_workers < 1:
+            raise ConfigValidationError(
+                f"section_workers must be >= 1, got {self.section_workers}",
+                field="section_workers"
+            )
+        
+        # Validate API key (only if not figures_only mode; replay never calls the API)
+        if not self.figures_only and self.prose_cache != "replay":
             if self.openai_api_key is None:
                 self.openai_api_key = os.getenv("OPENAI_API_KEY")
                 if not self.openai_api_key:
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from .models import PaperConfig, PaperResult, PaperStructure, SectionContext
 from .exceptions import (
@@ -633,34 +634,46 @@ class PaperGenerator:
             # Only specified sections get full prose
             selected_sections = set(self.config.sections)
         
-        for section_name, generator in self.section_generators.items():
-            logger.info("Generating section: %s", section_name)
+        # Sections are independent API calls: dispatch them concurrently
+        # (bounded by config.section_workers) and collect in paper order
+        selected = [name for name in self.section_generators if name in selected_sections]
+        workers = min(self.config.section_workers, len(selected)) or 1
+        if selected:
+            logger.info("Generating %d sections with %d workers", len(selected), workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="section") as pool:
+            futures = {
+                name: pool.submit(self.section_generators[name].generate, context)
+                for name in selected
+            }
             
-            if section_name in selected_sections:
-                # Generate full AI prose
-                try:
-                    prose = generator.generate(context)
-                    
-                    # T037-T039: Enhance sections with statistical content
-                    if section_name == 'methodology':
-                        prose = self._enhance_methodology_section(prose)
-                    elif section_name == 'results':
-                        prose = self._enhance_results_section(prose)
-                    elif section_name == 'discussion':
-                        prose = self._enhance_discussion_section(prose)
-                    
-                    sections[section_name] = prose
-                    logger.info("  ✓ %s: %d words (full prose)", section_name, len(prose.split()))
-                except Exception as e:
-                    import traceback
-                    logger.error("  ✗ %s: %s", section_name, str(e))
-                    logger.debug("Full traceback: %s", traceback.format_exc())
-                    sections[section_name] = f"<!-- ERROR generating {section_name}: {str(e)} -->"
-            else:
-                # Generate brief outline only
-                outline = self._generate_section_outline(section_name, context)
-                sections[section_name] = outline
-                logger.info("  ✓ %s: %d words (outline only)", section_name, len(outline.split()))
+            for section_name in self.section_generators:
+                logger.info("Generating section: %s", section_name)
+                
+                if section_name in futures:
+                    # Full AI prose
+                    try:
+                        prose = futures[section_name].result()
+                        
+                        # T037-T039: Enhance sections with statistical content
+                        if section_name == 'methodology':
+                            prose = self._enhance_methodology_section(prose)
+                        elif section_name == 'results':
+                            prose = self._enhance_results_section(prose)
+                        elif section_name == 'discussion':
+                            prose = self._enhance_discussion_section(prose)
+                        
+                        sections[section_name] = prose
+                        logger.info("  ✓ %s: %d words (full prose)", section_name, len(prose.split()))
+                    except Exception as e:
+                        import traceback
+                        logger.error("  ✗ %s: %s", section_name, str(e))
+                        logger.debug("Full traceback: %s", traceback.format_exc())
+                        sections[section_name] = f"<!-- ERROR generating {section_name}: {str(e)} -->"
+                else:
+                    # Generate brief outline only
+                    outline = self._generate_section_outline(section_name, context)
+                    sections[section_name] = outline
+                    logger.info("  ✓ %s: %d words (outline only)", section_name, len(outline.split()))
         
         return sections
     
@@ -0,0 +1,133 @@
+"""
+Persistent prompt-hash → response cache for ProseEngine.
+
+A response is keyed by a SHA-256 over everything sent to the chat completion
+endpoint that determines its output: the model, temperature, max_tokens and
+the full message list. Re-generating a paper after a template tweak therefore
+only calls the API for the sections whose prompt actually changed.
+
+Layout (one JSON file per response, written atomically):
+    <cache_dir>/<key[:2]>/<key>.json
+
+Modes (PaperConfig.prose_cache):
+    "off"       never read or write the cache
+    "readwrite" serve hits from the cache, call the API and store on a miss
+    "replay"    fully offline: serve hits, fail on a miss (for tests and
+                reproducible rebuilds; no API key is required)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+PROSE_CACHE_DIRNAME = ".prose_cache"
+PROSE_CACHE_MODES = ("off", "readwrite", "replay")
+# Bump to invalidate every cached response (e.g. when the key format changes)
+CACHE_FORMAT_VERSION = 1
+
+
+def prompt_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    messages: List[Dict[str, str]]
+) -> str:
+    """
+    Compute the cache key of a chat completion request.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Completion token limit
+        messages: Chat messages (role/content dicts)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        {
+            'format': CACHE_FORMAT_VERSION,
+            'model': model,
+            'temperature': float(temperature),
+            'max_tokens': max_tokens,
+            'messages': messages,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ProseCache:
+    """On-disk store of chat completion responses keyed by prompt hash."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (created on first store)
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Prompt key (see prompt_key)
+
+        Returns:
+            Stored entry with 'content' and 'total_tokens', or None on a miss
+        """
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or 'content' not in entry:
+            return None
+        return entry
+
+    def put(self, key: str, content: str, total_tokens: int, model: str,
+            temperature: float) -> None:
+        """
+        Store a response (last writer wins; the value is identical per key).
+
+        Args:
+            key: Prompt key (see prompt_key)
+            content: Generated text as returned by the API
+            total_tokens: Tokens the original API call consumed
+            model: Model name (informational)
+            temperature: Sampling temperature (informational)
+        """
+        entry_path = self._entry_path(key)
+        entry = {
+            'content': content,
+            'total_tokens': total_tokens,
+            'model': model,
+            'temperature': temperature,
+        }
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, prefix=f".{key[:8]}.")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not cache prose response %s: %s", key[:12], e)
@@ -4,18 +4,23 @@ ProseEngine: AI-powered prose generation for scientific papers.
 Handles OpenAI API calls with structured prompts, exponential backoff retry,
 token usage tracking, and word count validation (≥800 words per section).
 
-Uses requests library for direct API calls (no openai package dependency).
+Uses the shared pooled OpenAI client (src.utils.openai_client) for API calls
+(no openai package dependency).
+
+Responses are cached on disk by prompt hash (see prose_cache.py), and the
+engine is safe to share between threads generating sections concurrently.
 """
 
 import os
-import time
-import json
+import threading
 from typing import Optional
 import logging
-import requests
+
+from src.utils.openai_client import get_openai_client, OpenAIClientError
 
 from .models import PaperConfig, SectionContext
 from .exceptions import ProseGenerationError
+from .prose_cache import PROSE_CACHE_DIRNAME, ProseCache, prompt_key
 
 
 logger = logging.getLogger(__name__)
@@ -25,12 +30,12 @@ class ProseEngine:
     """
     Generate AI-powered prose for scientific paper sections.
     
-    Uses OpenAI API (default: gpt-3.5-turbo) via requests library to generate 
+    Uses OpenAI API (default: gpt-3.5-turbo) via the shared OpenAI client to generate 
     comprehensive prose based on experiment data and section context. 
     Includes retry logic, token tracking, and quality validation.
     """
     
-    OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+    MAX_TOKENS = 2000  # Allow sufficient tokens for ≥800 words
     
     def __init__(self, config: PaperConfig):
         """
@@ -40,22 +45,30 @@ class ProseEngine:
             config: PaperConfig with model, temperature, prose_level settings
             
         Raises:
-            ConfigValidationError: If API key not found
+            ConfigValidationError: If API key not found (not needed in replay mode)
         """
         self.config = config
         self.total_tokens_used = 0
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+        
+        self.cache_mode = config.prose_cache
+        self.cache: Optional[ProseCache] = None
+        if self.cache_mode != "off":
+            cache_dir = config.prose_cache_dir or config.output_dir / PROSE_CACHE_DIRNAME
+            self.cache = ProseCache(cache_dir)
         
         # Set OpenAI API key from config or environment
         self.api_key = config.openai_api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
+        if not self.api_key and self.cache_mode != "replay":
             from .exceptions import ConfigValidationError
             raise ConfigValidationError(
                 field="openai_api_key",
                 message="OpenAI API key not found. Set OPENAI_API_KEY environment variable or pass via config.openai_api_key"
             )
         
-        logger.info("ProseEngine initialized with model=%s, prose_level=%s", 
-                   config.model, config.prose_level)
+        logger.info("ProseEngine initialized with model=%s, prose_level=%s, prose_cache=%s",
+                   config.model, config.prose_level, self.cache_mode)
     
     def generate_prose(
         self,
@@ -79,90 +92,79 @@ class ProseEngine:
         """
         prompt = self._build_prompt(context)
         
-        # Retry loop with exponential backoff
-        last_exception = None
-        for attempt in range(max_retries):
-            try:
-                logger.info("Generating prose for section '%s' (attempt %d/%d)",
-                           context.section_name, attempt + 1, max_retries)
-                
-                # Prepare API request
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                
-                payload = {
-                    "model": self.config.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an expert scientific writer specializing in software engineering research papers."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": self.config.temperature,
-                    "max_tokens": 2000  # Allow sufficient tokens for ≥800 words
-                }
-                
-                # Make API call
-                response = requests.post(
-                    self.OPENAI_API_URL,
-                    headers=headers,
-                    json=payload,
-                    timeout=60  # 60 second timeout
-                )
-                
-                # Check for HTTP errors
-                response.raise_for_status()
-                
-                # Parse response
-                response_data = response.json()
-                
-                # Extract prose and track tokens
-                prose = response_data['choices'][0]['message']['content']
-                tokens_used = response_data['usage']['total_tokens']
-                self.total_tokens_used += tokens_used
-                
-                logger.info("Generated %d words using %d tokens",
-                           len(prose.split()), tokens_used)
-                
-                # Validate word count
-                word_count = len(prose.split())
-                if word_count < 800:
-                    logger.warning("Prose only %d words, expected ≥800. Retrying with adjusted prompt.",
-                                 word_count)
-                    # Could adjust prompt here, but for now just return what we got
-                    # (validation will happen at caller level)
-                
-                # Add AI-generated marker
-                prose_with_marker = self._add_ai_marker(prose)
-                
-                return prose_with_marker
-                
-            except (requests.RequestException, KeyError, json.JSONDecodeError) as e:
-                last_exception = e
-                logger.warning("API call failed (attempt %d/%d): %s",
-                             attempt + 1, max_retries, str(e))
-                
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    delay = retry_delay * (2 ** attempt)
-                    logger.info("Retrying in %.1f seconds...", delay)
-                    time.sleep(delay)
-                else:
-                    # Final attempt failed
-                    raise ProseGenerationError(
-                        message=f"OpenAI API call failed after {max_retries} attempts: {str(last_exception)}"
-                    ) from e
+        logger.info("Generating prose for section '%s'", context.section_name)
+        
+        messages = [
+            {
+                "role": "system",
+                "content": "You are an expert scientific writer specializing in software engineering research papers."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        
+        key = prompt_key(self.config.model, self.config.temperature, self.MAX_TOKENS, messages)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            logger.info("Reusing cached prose for section '%s' (prompt %s)",
+                       context.section_name, key[:12])
+            return self._add_ai_marker(cached['content'])
+        
+        if self.cache_mode == "replay":
+            raise ProseGenerationError(
+                message=(f"No cached prose for section '{context.section_name}' "
+                         f"(prompt {key[:12]}) and prose_cache='replay' forbids API calls")
+            )
+        
+        # Retries with exponential backoff (and rate-limit headers) are
+        # handled by the shared client
+        try:
+            response_data = get_openai_client().chat_completion(
+                self.api_key,
+                messages,
+                model=self.config.model,
+                temperature=self.config.temperature,
+                timeout=60,
+                max_tokens=self.MAX_TOKENS,
+                max_retries=max(max_retries - 1, 0),
+                initial_backoff=retry_delay
+            )
+        except OpenAIClientError as e:
+            logger.warning("API call failed after %d attempts: %s", max_retries, str(e))
+            raise ProseGenerationError(
+                message=f"OpenAI API call failed after {max_retries} attempts: {str(e)}"
+            ) from e
+        
+        try:
+            # Extract prose and track tokens
+            prose = response_data['choices'][0]['message']['content']
+            tokens_used = response_data['usage']['total_tokens']
+        except (KeyError, IndexError, TypeError) as e:
+            raise ProseGenerationError(
+                message=f"Unexpected OpenAI API response format: {str(e)}"
+            ) from e
+        
+        with self._lock:
+            self.total_tokens_used += tokens_used
+        
+        if self.cache is not None:
+            self.cache.put(key, prose, tokens_used, self.config.model, self.config.temperature)
+        
+        logger.info("Generated %d words using %d tokens",
+                   len(prose.split()), tokens_used)
+        
+        # Validate word count
+        word_count = len(prose.split())
+        if word_count < 800:
+            logger.warning("Prose only %d words, expected ≥800.", word_count)
+            # Validation happens at caller level
         
-        # Should not reach here, but just in case
-        raise ProseGenerationError(
-            message=f"Prose generation failed after {max_retries} attempts"
-        )
+        # Add AI-generated marker
+        return self._add_ai_marker(prose)
     
     def _build_prompt(self, context: SectionContext) -> str:
         """
@@ -14,21 +14,56 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from pathlib import Path
+import hashlib
+import inspect
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 
 import numpy as np
 from scipy import stats
 from statsmodels.stats.power import TTestIndPower
 
+from src.utils.bootstrap import bootstrap_two_sample_distribution, percentile_interval
+from src.utils.figure_cache import source_fingerprint
+from src.utils.power_simulation import simulate_power
+from src.utils.rank_statistics import mann_whitney_p_value
 from src.utils.statistical_helpers import (
     bootstrap_ci, cohens_d, cliffs_delta, interpret_effect_size, format_pvalue
 )
+from .analysis_state import AnalysisState, sample_fingerprints
 from .exceptions import StatisticalAnalysisError
 from .config import StatisticalConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker processes when the caller does not choose
+MAX_DEFAULT_ANALYSIS_WORKERS = 8
+
+# Analyzer copied into each worker process (see _init_worker)
+_worker_analyzer = None
+
+
+def metric_seed(random_seed: int, metric_name: str) -> int:
+    """
+    Derive a metric's seed from the analysis seed and the metric name.
+    
+    The name is hashed with SHA-256 (Python's hash() is salted per process),
+    so the seed is stable across runs and worker processes, and metrics with
+    identical samples still get independent resampling streams.
+    
+    Args:
+        random_seed: Analysis seed
+        metric_name: Metric name
+    
+    Returns:
+        32-bit seed for np.random.RandomState
+    """
+    name_hash = int.from_bytes(hashlib.sha256(metric_name.encode('utf-8')).digest()[:8], 'little')
+    return int(np.random.SeedSequence([random_seed, name_hash]).generate_state(1)[0])
+
 
 class TestType(Enum):
     """Statistical test types."""
@@ -527,6 +562,28 @@ class StatisticalFindings:
         }
 
 
+@dataclass
+class MetricAnalysis:
+    """
+    Findings of a single metric (the unit saved for incremental analysis).
+    
+    Attributes:
+        metric_name: Metric name
+        distributions/assumption_checks/statistical_tests/effect_sizes/
+        power_analyses: The metric's share of StatisticalFindings
+        warnings: Analysis warnings raised for the metric
+        complete: False if the analysis stopped on an error
+    """
+    metric_name: str
+    distributions: List[MetricDistribution] = field(default_factory=list)
+    assumption_checks: List[AssumptionCheck] = field(default_factory=list)
+    statistical_tests: List[StatisticalTest] = field(default_factory=list)
+    effect_sizes: List[EffectSize] = field(default_factory=list)
+    power_analyses: List[PowerAnalysis] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    complete: bool = True
+
+
 class StatisticalAnalyzer:
     """
     Comprehensive statistical analyzer for experiment results.
@@ -552,7 +609,8 @@ class StatisticalAnalyzer:
         self,
         alpha: float = 0.05,
         random_seed: int = 42,
-        config: Optional[StatisticalConfig] = None
+        config: Optional[StatisticalConfig] = None,
+        analysis_workers: Optional[int] = 1
     ):
         """
         Initialize statistical analyzer.
@@ -561,9 +619,12 @@ class StatisticalAnalyzer:
             alpha: Significance level for hypothesis tests (default: 0.05)
             random_seed: Random seed for reproducibility (default: 42)
             config: Statistical configuration (default: StatisticalConfig())
+            analysis_workers: Worker processes analyzing metrics in parallel
+                (default: 1, in-process; None: one per CPU, capped)
         """
         self.alpha = alpha
         self.random_seed = random_seed
+        self.analysis_workers = analysis_workers
         self.rng = np.random.RandomState(random_seed)
         self.config = config if config is not None else StatisticalConfig()
         logger.info(
@@ -623,7 +684,8 @@ class StatisticalAnalyzer:
     def analyze_experiment(
         self,
         frameworks_data: Dict[str, Any],
-        metrics_to_analyze: Optional[List[str]] = None
+        metrics_to_analyze: Optional[List[str]] = None,
+        state_path: Optional[Path] = None
     ) -> StatisticalFindings:
         """
         Perform complete statistical analysis on experiment data.
@@ -632,6 +694,9 @@ class StatisticalAnalyzer:
             frameworks_data: Experiment data from ExperimentAnalyzer
                 Format: {framework_name: {metric_name: {mean, std, ...}, runs: [...]}}
             metrics_to_analyze: List of metrics to analyze (None = all available)
+            state_path: Incremental mode: file with the findings of the previous
+                analysis. Metrics whose samples are unchanged are merged from it
+                instead of being recomputed; the file is then updated.
         
         Returns:
             StatisticalFindings with complete analysis results
@@ -654,19 +719,7 @@ class StatisticalAnalyzer:
         
         logger.info(f"Analyzing {len(metrics_to_analyze)} metrics: {metrics_to_analyze}")
         
-        # Feature 013: Create early findings object for warning collection
-        findings_for_warnings = StatisticalFindings(
-            experiment_name=self._infer_experiment_name(frameworks_data),
-            timestamp=datetime.now().isoformat(),
-            metrics_analyzed=[],  # Will be populated later
-            distributions=[],
-            assumption_checks=[],
-            statistical_tests=[],
-            effect_sizes=[],
-            power_analyses=[],
-            visualizations=[],
-            metadata={}
-        )
+        state = AnalysisState(state_path, self._settings_fingerprint()) if state_path else None
         
         # Initialize result containers
         distributions = []
@@ -674,11 +727,13 @@ class StatisticalAnalyzer:
         statistical_tests = []
         effect_sizes = []
         power_analyses = []
+        warnings = []
+        reused = 0
         
-        # Analyze each metric
+        # Collect each metric's samples; unchanged metrics come from saved state
+        analyses: Dict[str, MetricAnalysis] = {}
+        pending: List[Tuple[str, Dict[str, List[float]], Optional[Dict[str, str]]]] = []
         for metric_name in metrics_to_analyze:
-            logger.debug(f"Analyzing metric: {metric_name}")
-            
             try:
                 # Extract metric data for all frameworks
                 metric_data = self._extract_metric_data(frameworks_data, metric_name)
@@ -687,75 +742,46 @@ class StatisticalAnalyzer:
                     logger.warning(f"No data found for metric: {metric_name}")
                     continue
                 
-                # T006: Analyze distributions
-                metric_distributions = self._analyze_distributions(metric_name, metric_data)
-                distributions.extend(metric_distributions)
-                
-                # T007: Check normality assumptions
-                normality_checks = self._check_normality(
-                    metric_name, metric_data, findings=findings_for_warnings
-                )
-                assumption_checks.extend(normality_checks)
-                
-                # T008: Check variance homogeneity (if multiple groups)
-                if len(metric_data) >= 2:
-                    variance_check = self._check_variance_homogeneity(
-                        metric_name, metric_data, findings=findings_for_warnings
-                    )
-                    if variance_check:
-                        assumption_checks.append(variance_check)
-                
-                # T009: Select and perform appropriate statistical tests
-                if len(metric_data) >= 2:
-                    test_results = self._perform_statistical_tests(
-                        metric_name, metric_data, metric_distributions
-                    )
-                    
-                    # T044-T046: Apply multiple comparison correction to p-values
-                    if len(test_results) > 0:
-                        # Extract p-values and comparison labels
-                        pvalues = [test.p_value for test in test_results]
-                        comparison_labels = [
-                            "_vs_".join(test.groups) for test in test_results
-                        ]
-                        
-                        # Apply correction (T041-T043)
-                        correction = self._apply_multiple_comparison_correction(
-                            pvalues=pvalues,
-                            comparison_labels=comparison_labels,
-                            metric_name=metric_name,
-                            alpha=self.alpha,
-                            method="holm"  # FR-022
-                        )
-                        
-                        # T045: Populate test fields with raw, adjusted p-values and correction method
-                        for i, test in enumerate(test_results):
-                            test.pvalue_raw = correction.raw_pvalues[i]
-                            test.pvalue_adjusted = correction.adjusted_pvalues[i]
-                            test.correction_method = correction.correction_method
-                            
-                            # T046: Update significance decision using adjusted p-value (FR-023, FR-024)
-                            test.is_significant = correction.reject_decisions[i]
-                    
-                    statistical_tests.extend(test_results)
-                    
-                    # T010, T036: Calculate effect sizes with test alignment
-                    effects = self._calculate_effect_sizes(
-                        metric_name, metric_data, metric_distributions, test_results,
-                        findings=findings_for_warnings
-                    )
-                    effect_sizes.extend(effects)
-                    
-                    # T011: Perform power analysis
-                    power_results = self._perform_power_analysis(
-                        metric_name, metric_data, metric_distributions
-                    )
-                    power_analyses.extend(power_results)
-                
+                fingerprints = sample_fingerprints(metric_data) if state else None
             except Exception as e:
+                # A bad run value skips this metric only (analysis errors are
+                # handled the same way per metric in _analyze_metric)
                 logger.error(f"Error analyzing metric {metric_name}: {e}", exc_info=True)
-                # Continue with other metrics
                 continue
+            
+            analysis = state.get(metric_name, fingerprints) if state else None
+            if analysis is not None:
+                logger.debug(f"Reusing saved findings for unchanged metric: {metric_name}")
+                analyses[metric_name] = analysis
+                reused += 1
+            else:
+                pending.append((metric_name, metric_data, fingerprints))
+        
+        # Analyze the remaining metrics (in parallel when workers are available)
+        computed = self._analyze_metrics([(name, data) for name, data, _ in pending])
+        for (metric_name, _, fingerprints), analysis in zip(pending, computed):
+            analyses[metric_name] = analysis
+            if state and analysis.complete:
+                state.put(metric_name, fingerprints, analysis)
+        
+        # Merge in metric order, so findings match a serial analysis
+        for metric_name in metrics_to_analyze:
+            analysis = analyses.get(metric_name)
+            if analysis is None:
+                continue
+            distributions.extend(analysis.distributions)
+            assumption_checks.extend(analysis.assumption_checks)
+            statistical_tests.extend(analysis.statistical_tests)
+            effect_sizes.extend(analysis.effect_sizes)
+            power_analyses.extend(analysis.power_analyses)
+            warnings.extend(analysis.warnings)
+        
+        if state:
+            state.save(metrics_to_analyze)
+            logger.info(
+                f"Incremental analysis: {reused} metrics reused, "
+                f"{len(metrics_to_analyze) - reused} recomputed"
+            )
         
         # T031: Prepare reproducibility metadata
         import scipy
@@ -784,7 +810,7 @@ class StatisticalAnalyzer:
             power_analyses=power_analyses,
             visualizations=[],  # Will be populated by visualization generator
             metadata=metadata,
-            warnings=findings_for_warnings.warnings  # Feature 013: Copy collected warnings
+            warnings=warnings  # Feature 013: Copy collected warnings
         )
         
         # T032: Generate methodology text
@@ -798,6 +824,168 @@ class StatisticalAnalyzer:
         
         return findings
     
+    def _analyze_metrics(
+        self,
+        metrics: List[Tuple[str, Dict[str, List[float]]]]
+    ) -> List[MetricAnalysis]:
+        """
+        Run the per-metric pipeline for several metrics.
+        
+        Metrics are independent and each is reseeded from random_seed and its
+        name (see metric_seed), so they can be analyzed in worker processes;
+        results are returned in input order and are identical to analyzing the
+        metrics one after another.
+        Falls back to in-process analysis if the worker pool cannot run.
+        
+        Args:
+            metrics: (metric name, framework name → sample values) pairs
+        
+        Returns:
+            One MetricAnalysis per metric, in input order
+        """
+        workers = self.analysis_workers or default_analysis_workers(len(metrics))
+        workers = min(workers, len(metrics))
+        
+        if workers > 1:
+            logger.info(f"Analyzing {len(metrics)} metrics with {workers} worker processes")
+            try:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self,)) as pool:
+                    futures = [pool.submit(_analyze_in_worker, name, data) for name, data in metrics]
+                    return [future.result() for future in futures]
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Analysis worker pool failed ({e}); analyzing in-process")
+        
+        return [self._analyze_metric(name, data) for name, data in metrics]
+    
+    def _analyze_metric(self, metric_name: str, metric_data: Dict[str, List[float]]) -> MetricAnalysis:
+        """
+        Run the full analysis pipeline for one metric.
+        
+        Errors are logged and end the pipeline early; the partial results are
+        returned with complete=False (and are never saved for reuse).
+        
+        Args:
+            metric_name: Metric name
+            metric_data: Framework name → sample values
+        
+        Returns:
+            MetricAnalysis with the metric's findings and warnings
+        """
+        logger.debug(f"Analyzing metric: {metric_name}")
+        
+        # Reseed per metric so a metric's results depend only on its own samples
+        # (saved findings of unchanged metrics stay identical to a full re-analysis)
+        self.rng = np.random.RandomState(metric_seed(self.random_seed, metric_name))
+        
+        analysis = MetricAnalysis(metric_name=metric_name)
+        
+        # Feature 013: Create findings object for warning collection
+        findings_for_warnings = StatisticalFindings(
+            experiment_name=metric_name,
+            timestamp=datetime.now().isoformat(),
+            metrics_analyzed=[],
+            distributions=[],
+            assumption_checks=[],
+            statistical_tests=[],
+            effect_sizes=[],
+            power_analyses=[],
+            visualizations=[],
+            metadata={},
+            warnings=analysis.warnings
+        )
+        
+        try:
+            # T006: Analyze distributions
+            metric_distributions = self._analyze_distributions(metric_name, metric_data)
+            analysis.distributions.extend(metric_distributions)
+            
+            # T007: Check normality assumptions
+            normality_checks = self._check_normality(
+                metric_name, metric_data, findings=findings_for_warnings
+            )
+            analysis.assumption_checks.extend(normality_checks)
+            
+            # T008: Check variance homogeneity (if multiple groups)
+            if len(metric_data) >= 2:
+                variance_check = self._check_variance_homogeneity(
+                    metric_name, metric_data, findings=findings_for_warnings
+                )
+                if variance_check:
+                    analysis.assumption_checks.append(variance_check)
+            
+            # T009: Select and perform appropriate statistical tests
+            if len(metric_data) >= 2:
+                test_results = self._perform_statistical_tests(
+                    metric_name, metric_data, metric_distributions
+                )
+                
+                # T044-T046: Apply multiple comparison correction to p-values
+                if len(test_results) > 0:
+                    # Extract p-values and comparison labels
+                    pvalues = [test.p_value for test in test_results]
+                    comparison_labels = [
+                        "_vs_".join(test.groups) for test in test_results
+                    ]
+                    
+                    # Apply correction (T041-T043)
+                    correction = self._apply_multiple_comparison_correction(
+                        pvalues=pvalues,
+                        comparison_labels=comparison_labels,
+                        metric_name=metric_name,
+                        alpha=self.alpha,
+                        method="holm"  # FR-022
+                    )
+                    
+                    # T045: Populate test fields with raw, adjusted p-values and correction method
+                    for i, test in enumerate(test_results):
+                        test.pvalue_raw = correction.raw_pvalues[i]
+                        test.pvalue_adjusted = correction.adjusted_pvalues[i]
+                        test.correction_method = correction.correction_method
+                        
+                        # T046: Update significance decision using adjusted p-value (FR-023, FR-024)
+                        test.is_significant = correction.reject_decisions[i]
+                
+                analysis.statistical_tests.extend(test_results)
+                
+                # T010, T036: Calculate effect sizes with test alignment
+                effects = self._calculate_effect_sizes(
+                    metric_name, metric_data, metric_distributions, test_results,
+                    findings=findings_for_warnings
+                )
+                analysis.effect_sizes.extend(effects)
+                
+                # T011: Perform power analysis
+                power_results = self._perform_power_analysis(
+                    metric_name, metric_data, metric_distributions
+                )
+                analysis.power_analyses.extend(power_results)
+            
+        except Exception as e:
+            logger.error(f"Error analyzing metric {metric_name}: {e}", exc_info=True)
+            # Continue with other metrics
+            analysis.complete = False
+        
+        return analysis
+    
+    def _settings_fingerprint(self) -> str:
+        """Fingerprint of everything besides the samples that determines findings."""
+        import scipy
+        import statsmodels
+        
+        analysis_code = source_fingerprint(
+            Path(__file__),
+            Path(inspect.getfile(bootstrap_two_sample_distribution)),
+            Path(inspect.getfile(bootstrap_ci)),
+            Path(inspect.getfile(simulate_power)),
+            Path(inspect.getfile(mann_whitney_p_value)),
+        )
+        settings = repr((
+            self.alpha, self.random_seed, sorted(vars(self.config).items()),
+            np.__version__, scipy.__version__, statsmodels.__version__, analysis_code
+        ))
+        return hashlib.sha256(settings.encode('utf-8')).hexdigest()
+    
     def _get_available_metrics(self, frameworks_data: Dict[str, Any]) -> List[str]:
         """Extract list of available metrics from framework data."""
         metrics = set()
@@ -1706,6 +1894,9 @@ class StatisticalAnalyzer:
             warning_message=warning_message
         )
     
+    # Effect size functions with a vectorized bootstrap kernel
+    _VECTORIZED_EFFECT_SIZES = {cohens_d: 'cohens_d', cliffs_delta: 'cliffs_delta'}
+    
     # T010-T015: Bootstrap confidence interval with independent group resampling
     def _bootstrap_confidence_interval(
         self,
@@ -1760,32 +1951,25 @@ class StatisticalAnalyzer:
         rng = np.random.RandomState(random_seed) if random_seed is not None else self.rng
         
         # Bootstrap resampling - INDEPENDENT GROUP RESAMPLING (FR-001)
-        bootstrap_stats = []
-        n1, n2 = len(group1_values), len(group2_values)
-        
-        for _ in range(n_iterations):
-            try:
-                # FR-001: Resample each group INDEPENDENTLY (preserves group structure)
-                g1_sample = rng.choice(group1_values, size=n1, replace=True)
-                g2_sample = rng.choice(group2_values, size=n2, replace=True)
-                
-                # Compute effect size on resampled groups
-                effect = effect_size_func(g1_sample.tolist(), g2_sample.tolist())
-                bootstrap_stats.append(effect)
-            except Exception:
-                # FR-004: Handle bootstrap failures gracefully
-                continue
+        # Known effect sizes are evaluated on all resamples at once; other
+        # callables are applied per resample (failures become NaN, FR-004)
+        statistic = self._VECTORIZED_EFFECT_SIZES.get(effect_size_func, effect_size_func)
+        try:
+            bootstrap_stats = bootstrap_two_sample_distribution(
+                group1_values, group2_values, statistic, n_iterations, rng
+            )
+        except Exception as e:
+            raise StatisticalAnalysisError(f"Bootstrap failed: {e}")
         
         # FR-004: Check if bootstrap failed
-        if len(bootstrap_stats) < n_iterations * 0.9:  # Allow 10% failure rate
+        n_succeeded = int(np.count_nonzero(np.isfinite(bootstrap_stats)))
+        if n_succeeded < n_iterations * 0.9:  # Allow 10% failure rate
             raise StatisticalAnalysisError(
-                f"Bootstrap failed: only {len(bootstrap_stats)}/{n_iterations} iterations succeeded"
+                f"Bootstrap failed: only {n_succeeded}/{n_iterations} iterations succeeded"
             )
         
         # Compute percentile-based CI
-        alpha = 1 - confidence_level
-        ci_lower = float(np.percentile(bootstrap_stats, (alpha / 2) * 100))
-        ci_upper = float(np.percentile(bootstrap_stats, (1 - alpha / 2) * 100))
+        ci_lower, ci_upper = percentile_interval(bootstrap_stats, confidence_level)
         
         # FR-002: Validate that CI contains point estimate
         from ..utils.statistical_helpers import validate_ci
@@ -2225,44 +2409,39 @@ class StatisticalAnalyzer:
         group1: List[float],
         group2: List[float],
         effect_size: float,
-        n_simulations: int = 1000
+        n_simulations: Optional[int] = None
     ) -> float:
         """
         Simulate statistical power for non-parametric tests.
         
-        Uses permutation test approach to estimate power conservatively.
+        Resamples both groups with replacement and counts Mann-Whitney U
+        rejections, testing a batch of simulated experiments per ranked pass
+        (see src.utils.power_simulation). Stops early once the Monte Carlo
+        error is within config.power_mc_tolerance.
         
         Args:
             group1: First group data
             group2: Second group data
             effect_size: Expected effect size (Cohen's d)
-            n_simulations: Number of simulation iterations
+            n_simulations: Maximum simulation iterations
+                (default: config.power_simulations)
         
         Returns:
             Estimated statistical power
         """
-        n1, n2 = len(group1), len(group2)
-        significant_count = 0
-        
-        # Simulate under alternative hypothesis (effect exists)
-        for _ in range(n_simulations):
-            # Resample with replacement
-            sim_group1 = self.rng.choice(group1, size=n1, replace=True)
-            sim_group2 = self.rng.choice(group2, size=n2, replace=True)
-            
-            # Perform Mann-Whitney U test
-            try:
-                _, p_value = stats.mannwhitneyu(
-                    sim_group1, sim_group2, alternative='two-sided'
-                )
-                if p_value < self.alpha:
-                    significant_count += 1
-            except:
-                # Handle edge cases
-                continue
-        
-        power = significant_count / n_simulations
-        return float(power)
+        estimate = simulate_power(
+            group1, group2,
+            test='mann_whitney',
+            alpha=self.alpha,
+            n_simulations=n_simulations or self.config.power_simulations,
+            random_state=self.rng,
+            tolerance=self.config.power_mc_tolerance
+        )
+        logger.debug(
+            f"Simulated power {estimate.power:.3f} ± {estimate.mc_half_width:.3f} "
+            f"from {estimate.n_simulations} simulations"
+        )
+        return float(estimate.power)
     
     # T013: Standalone power analysis method (can be called independently)
     def perform_power_analysis(
@@ -2488,3 +2667,16 @@ class StatisticalAnalyzer:
         return "".join(sections)
 
 
+def default_analysis_workers(n_metrics: int) -> int:
+    """Number of worker processes to use for n_metrics metrics."""
+    return max(1, min(n_metrics, os.cpu_count() or 1, MAX_DEFAULT_ANALYSIS_WORKERS))
+
+
+def _init_worker(analyzer: StatisticalAnalyzer) -> None:
+    """Keep the per-process copy of the parent's analyzer (same settings)."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_in_worker(metric_name: str, metric_data: Dict[str, List[float]]) -> MetricAnalysis:
+    return _worker_analyzer._analyze_metric(metric_name, metric_data)
@@ -24,7 +24,9 @@ import seaborn as sns
 import numpy as np
 from scipy import stats
 
+from src.utils.figure_cache import FIGURE_CACHE_DIRNAME, FIGURE_CACHE_ENABLED, FigureCache
 from src.utils.statistical_helpers import format_pvalue
+from .figure_scheduler import RenderJob, render_jobs
 from .statistical_analyzer import (
     MetricDistribution,
     EffectSize,
@@ -52,18 +54,36 @@ class StatisticalVisualizationGenerator:
         output_dir: Base directory for visualization output
         style: Matplotlib/seaborn style (default: seaborn colorblind palette)
         fig_dir: Full path to figures/statistical/ subdirectory
+        render_workers: Worker processes for batch generation (None: auto)
+        figure_cache: Cache of rendered figures used by batch generation (or None)
     """
     
-    def __init__(self, output_dir: str, style: str = "seaborn-v0_8-colorblind"):
+    def __init__(
+        self,
+        output_dir: str,
+        style: str = "seaborn-v0_8-colorblind",
+        render_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = FIGURE_CACHE_ENABLED
+    ):
         """
         Initialize visualization generator.
         
         Args:
             output_dir: Base output directory (e.g., 'tmp/test_paper2/')
             style: Matplotlib style preset
+            render_workers: Worker processes used by generate_all_visualizations
+                and generate_all_enhanced_plots (None: one per CPU, 1: in-process)
+            cache_dir: Figure cache directory (default: output_dir/.figure_cache)
+            use_cache: Reuse cached figures whose inputs are unchanged
         """
         self.output_dir = Path(output_dir)
         self.style = style
+        self.render_workers = render_workers
+        self.figure_cache = (
+            FigureCache(Path(cache_dir) if cache_dir else self.output_dir / FIGURE_CACHE_DIRNAME)
+            if use_cache else None
+        )
         self.fig_dir = self.output_dir / "figures" / "statistical"
         
         # Create output directory
@@ -695,53 +715,44 @@ class StatisticalVisualizationGenerator:
                 if framework:
                     metrics_data[check.metric_name]['normality_checks'][framework] = check
         
-        # Generate visualizations for each metric
+        # Plan one independent render job per figure, then render them together
+        jobs = []
+        job_metrics = []
         for metric_name, data in metrics_data.items():
-            visualizations = []
-            
             distributions = data['distributions']
             effect_sizes = data['effect_sizes']
             normality_checks = data['normality_checks']
             
-            # Box plot (if we have distributions)
+            # Box and violin plots (if we have distributions)
             if distributions:
-                try:
-                    viz = self.generate_box_plot(metric_name, distributions)
-                    visualizations.append(viz)
-                except Exception as e:
-                    warnings.warn(f"Failed to generate box plot for {metric_name}: {e}")
-            
-            # Violin plot (if we have distributions)
-            if distributions:
-                try:
-                    viz = self.generate_violin_plot(metric_name, distributions)
-                    visualizations.append(viz)
-                except Exception as e:
-                    warnings.warn(f"Failed to generate violin plot for {metric_name}: {e}")
+                jobs.append(RenderJob('generate_box_plot', (metric_name, distributions),
+                                      description=f"box plot for {metric_name}"))
+                jobs.append(RenderJob('generate_violin_plot', (metric_name, distributions),
+                                      description=f"violin plot for {metric_name}"))
+                job_metrics.extend([metric_name, metric_name])
             
             # Forest plot (if we have effect sizes)
             if effect_sizes:
-                try:
-                    viz = self.generate_forest_plot(metric_name, effect_sizes)
-                    visualizations.append(viz)
-                except Exception as e:
-                    warnings.warn(f"Failed to generate forest plot for {metric_name}: {e}")
+                jobs.append(RenderJob('generate_forest_plot', (metric_name, effect_sizes),
+                                      description=f"forest plot for {metric_name}"))
+                job_metrics.append(metric_name)
             
             # Q-Q plots (one per framework, if we have normality checks)
             for dist in distributions:
                 framework = dist.group_name
                 if framework in normality_checks:
-                    try:
-                        viz = self.generate_qq_plot(
-                            metric_name,
-                            dist,
-                            normality_checks[framework]
-                        )
-                        visualizations.append(viz)
-                    except Exception as e:
-                        warnings.warn(f"Failed to generate Q-Q plot for {metric_name} ({framework}): {e}")
-            
-            all_visualizations[metric_name] = visualizations
+                    jobs.append(RenderJob(
+                        'generate_qq_plot',
+                        (metric_name, dist, normality_checks[framework]),
+                        description=f"Q-Q plot for {metric_name} ({framework})"
+                    ))
+                    job_metrics.append(metric_name)
+        
+        for metric_name in metrics_data:
+            all_visualizations[metric_name] = []
+        for metric_name, viz in zip(job_metrics, render_jobs(self, jobs, self.render_workers)):
+            if viz is not None:
+                all_visualizations[metric_name].append(viz)
         
         return all_visualizations
     
@@ -2313,7 +2324,9 @@ class StatisticalVisualizationGenerator:
         if not hasattr(statistical_findings, 'effect_sizes'):
             raise AttributeError("statistical_findings must have 'effect_sizes' attribute")
         
-        visualizations = []
+        # Each plot becomes an independent render job; jobs are rendered
+        # together (in parallel) once all of them have been planned
+        jobs = []
         
         # STEP 1: Transform flat lists into nested dictionaries for easier access
         # Build metric_distributions: Dict[metric_name, Dict[framework, MetricDistribution]]
@@ -2357,9 +2370,8 @@ class StatisticalVisualizationGenerator:
             # convert accordingly to avoid treating the metric string as an
             # iterable (which previously caused single-character metric handling).
             metric_map = {metric: list(effect_sizes.values())}
-            viz = self.generate_effect_size_panel(metric_map)
-            visualizations.append(viz)
-            logger.info(f"✓ Generated effect size panel for {metric}")
+            jobs.append(RenderJob('generate_effect_size_panel', (metric_map,),
+                                  description=f"effect size panel for {metric}", required=True))
         
         # T102: US2 - Efficiency Plot (REQUIRED if time+cost metrics exist)
         logger.info("Generating efficiency plot...")
@@ -2372,14 +2384,12 @@ class StatisticalVisualizationGenerator:
             time_metric = list(time_dists.keys())[0]
             cost_metric = list(cost_dists.keys())[0]
             
-            viz = self.generate_efficiency_plot(
+            jobs.append(RenderJob('generate_efficiency_plot', kwargs=dict(
                 time_distributions=time_dists[time_metric],  # Dict[framework, MetricDistribution]
                 cost_distributions=cost_dists[cost_metric],  # Dict[framework, MetricDistribution]
                 time_metric=time_metric,
                 cost_metric=cost_metric
-            )
-            visualizations.append(viz)
-            logger.info(f"✓ Generated efficiency plot ({time_metric} vs {cost_metric})")
+            ), description=f"efficiency plot ({time_metric} vs {cost_metric})", required=True))
         else:
             # This is an EXPECTED edge case - not all experiments track time/cost
             logger.warning(f"⚠ Skipping efficiency plot - missing required metrics (time: {bool(time_dists)}, cost: {bool(cost_dists)})")
@@ -2400,15 +2410,13 @@ class StatisticalVisualizationGenerator:
                            if 'cached' in k.lower() and 'token' in k.lower()}
             cached_metric = list(cached_dists.keys())[0] if cached_dists else None
             
-            viz = self.generate_regression_plot(
+            jobs.append(RenderJob('generate_regression_plot', kwargs=dict(
                 x_distributions=token_dists[token_metric],  # Dict[framework, MetricDistribution]
                 y_distributions=cost_dists[cost_metric],    # Dict[framework, MetricDistribution]
                 x_metric=token_metric,
                 y_metric=cost_metric,
                 cached_tokens=cached_dists.get(cached_metric) if cached_metric else None
-            )
-            visualizations.append(viz)
-            logger.info(f"✓ Generated regression plot ({token_metric} vs {cost_metric})")
+            ), description=f"regression plot ({token_metric} vs {cost_metric})", required=True))
         else:
             # EXPECTED edge case - not all experiments have token/cost data
             logger.warning(f"⚠ Skipping regression plot - missing required metrics (tokens: {bool(token_dists)}, cost: {bool(cost_dists)})")
@@ -2438,17 +2446,14 @@ class StatisticalVisualizationGenerator:
                                     p_value = test.p_value
                                     break
                             
-                            viz = self.generate_overlap_plot(
-                                dist_a,
-                                dist_b,
-                                metric,
-                                es,
-                                p_value,
-                                plot_type="density"
-                            )
-                            visualizations.append(viz)
+                            jobs.append(RenderJob(
+                                'generate_overlap_plot',
+                                (dist_a, dist_b, metric, es, p_value),
+                                {'plot_type': "density"},
+                                description=f"overlap plot for {metric} ({group_a} vs {group_b}, δ={es.value:.3f})",
+                                required=True
+                            ))
                             overlap_count += 1
-                            logger.info(f"✓ Generated overlap plot for {metric} ({group_a} vs {group_b}, δ={es.value:.3f})")
         
         if overlap_count == 0:
             logger.info("ℹ No small effect sizes detected - overlap plots not needed")
@@ -2464,13 +2469,12 @@ class StatisticalVisualizationGenerator:
             cost_metric_name = list(cost_dists_full.keys())[0]
             quality_metric_key = list(quality_dists.keys())[0]
             
-            viz = self.generate_normalized_cost_plot(
-                cost_dists_full[cost_metric_name],
-                quality_dists[quality_metric_key],
-                quality_metric_key
-            )
-            visualizations.append(viz)
-            logger.info(f"✓ Generated normalized cost plot (cost per {quality_metric_key})")
+            jobs.append(RenderJob(
+                'generate_normalized_cost_plot',
+                (cost_dists_full[cost_metric_name], quality_dists[quality_metric_key], quality_metric_key),
+                description=f"normalized cost plot (cost per {quality_metric_key})",
+                required=True
+            ))
         else:
             # EXPECTED edge case - quality metrics are optional
             logger.warning(f"⚠ Skipping normalized cost plot - missing quality metric '{quality_metric}' (cost: {bool(cost_dists_full)})")
@@ -2511,9 +2515,11 @@ class StatisticalVisualizationGenerator:
                     ))
         
         if rank_data and len(frameworks) >= 2:
-            viz = self.generate_rank_plot(rank_data, list(frameworks))
-            visualizations.append(viz)
-            logger.info(f"✓ Generated rank plot for {len(frameworks)} frameworks across {len(metric_distributions)} metrics")
+            jobs.append(RenderJob(
+                'generate_rank_plot', (rank_data, list(frameworks)),
+                description=f"rank plot for {len(frameworks)} frameworks across {len(metric_distributions)} metrics",
+                required=True
+            ))
         else:
             # This should NEVER happen if we have distributions - FAIL FAST
             raise ValueError(f"Insufficient data for rank plot: {len(frameworks)} frameworks, {len(rank_data)} rank entries")
@@ -2537,9 +2543,11 @@ class StatisticalVisualizationGenerator:
                     ))
         
         if stability_metrics:
-            viz = self.generate_stability_plot(stability_metrics, cv_threshold)
-            visualizations.append(viz)
-            logger.info(f"✓ Generated stability plot ({len(stability_metrics)} measurements)")
+            jobs.append(RenderJob(
+                'generate_stability_plot', (stability_metrics, cv_threshold),
+                description=f"stability plot ({len(stability_metrics)} measurements)",
+                required=True
+            ))
         else:
             # This should NEVER happen - FAIL FAST
             raise ValueError("No stability metrics could be computed from distributions")
@@ -2579,20 +2587,18 @@ class StatisticalVisualizationGenerator:
                                 iqr_factor=iqr_distance
                             ))
                         
-                        viz = self.generate_outlier_run_plot(
-                            outlier_info,
-                            framework,
-                            metric_name,
-                            values
-                        )
-                        visualizations.append(viz)
+                        jobs.append(RenderJob(
+                            'generate_outlier_run_plot',
+                            (outlier_info, framework, metric_name, values),
+                            description=f"outlier plot for {metric_name} / {framework}",
+                            required=True
+                        ))
                         outlier_plot_count += 1
-                        logger.info(f"✓ Generated outlier plot for {metric_name} / {framework}")
         
         if outlier_plot_count == 0:
             logger.info("ℹ No outliers detected - outlier run plots not needed")
         else:
-            logger.info(f"✓ Generated {outlier_plot_count} outlier run plots")
+            logger.info(f"Planned {outlier_plot_count} outlier run plots")
         
         # T109: US9 - Radar Chart (OPTIONAL - multi-metric overview)
         logger.info("Generating radar chart...")
@@ -2622,19 +2628,22 @@ class StatisticalVisualizationGenerator:
             # Limit to 6-8 metrics for readability
             radar_metrics = radar_metrics[:8]
             
-            try:
-                viz = self.generate_radar_chart(
-                    metric_distributions,
-                    metrics=radar_metrics,
-                    title="Multi-Metric Framework Comparison"
-                )
-                visualizations.append(viz)
-                logger.info(f"✓ Generated radar chart with {len(radar_metrics)} metrics")
-            except Exception as e:
-                logger.warning(f"⚠ Skipping radar chart - error: {e}")
+            # Optional: a failure is reported as a warning and skipped
+            jobs.append(RenderJob(
+                'generate_radar_chart', (metric_distributions,),
+                {'metrics': radar_metrics, 'title': "Multi-Metric Framework Comparison"},
+                description=f"radar chart with {len(radar_metrics)} metrics"
+            ))
         else:
             logger.info(f"ℹ Skipping radar chart - need at least 3 common metrics, found {len(radar_metrics)}")
         
+        # Render all planned plots; results keep the planning order
+        visualizations = []
+        for job, viz in zip(jobs, render_jobs(self, jobs, self.render_workers)):
+            if viz is not None:
+                visualizations.append(viz)
+                logger.info(f"✓ Generated {job.description}")
+        
         logger.info(f"Batch generation complete: {len(visualizations)} plots generated")
         return visualizations
 
@@ -0,0 +1,240 @@
+"""
+Vectorized NumPy bootstrap engine.
+
+Shared by the stopping rule, the report generator, the statistical helpers
+and the paper StatisticalAnalyzer. Instead of resampling in a Python loop,
+resample indices are drawn as (chunk, n) integer matrices and the statistic
+is evaluated on all rows at once. Chunks keep the resample matrices within a
+bounded number of elements, whatever the number of resamples.
+
+Random state can be an int seed, a numpy Generator, a legacy RandomState
+(as held by StatisticalAnalyzer) or None (fresh entropy). Callers without a
+seed of their own use global_rng(), which follows NumPy's global seed (set by
+set_deterministic_seeds).
+"""
+
+from typing import Callable, Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.utils.rank_statistics import cliffs_delta_ranked
+
+# Upper bound on array elements materialized per chunk (~32 MB of float64)
+DEFAULT_MAX_CHUNK_ELEMENTS = 4_000_000
+
+RandomStateLike = Union[None, int, np.random.Generator, np.random.RandomState]
+Statistic = Union[str, Callable]
+
+
+def resolve_rng(random_state: RandomStateLike) -> Union[np.random.Generator, np.random.RandomState]:
+    """
+    Normalize a seed or generator.
+
+    Args:
+        random_state: Seed, Generator, RandomState or None
+
+    Returns:
+        A Generator or RandomState to draw from
+    """
+    if isinstance(random_state, (np.random.Generator, np.random.RandomState)):
+        return random_state
+    return np.random.default_rng(random_state)
+
+
+def global_rng() -> np.random.Generator:
+    """
+    Generator seeded from NumPy's global random state.
+
+    Reproducible whenever the global state is seeded (np.random.seed, as
+    done by set_deterministic_seeds); each call advances the global state.
+
+    Returns:
+        A new Generator
+    """
+    return np.random.default_rng(np.random.randint(0, 2**32 - 1, dtype=np.int64))
+
+
+def _draw(rng: Union[np.random.Generator, np.random.RandomState], n: int, rows: int) -> np.ndarray:
+    """Draw a (rows, n) matrix of resample indices."""
+    if isinstance(rng, np.random.RandomState):
+        return rng.randint(0, n, size=(rows, n))
+    return rng.integers(0, n, size=(rows, n))
+
+
+def _chunk_rows(n_resamples: int, row_elements: int, max_chunk_elements: int) -> Iterator[int]:
+    """Yield chunk sizes (rows) covering n_resamples."""
+    rows = max(1, max_chunk_elements // max(1, row_elements))
+    remaining = n_resamples
+    while remaining > 0:
+        size = min(rows, remaining)
+        yield size
+        remaining -= size
+
+
+def _row_statistic(statistic: Statistic) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Turn a statistic into a function mapping a (rows, n) matrix to (rows,).
+
+    Accepts "mean", "median", NumPy reductions supporting axis=, or any
+    function of a 1-D sample (evaluated row by row as a fallback).
+    """
+    if isinstance(statistic, str):
+        reductions = {'mean': np.mean, 'median': np.median, 'std': np.std}
+        if statistic not in reductions:
+            raise ValueError(f"Unknown bootstrap statistic: {statistic}")
+        statistic = reductions[statistic]
+
+    def apply(samples: np.ndarray) -> np.ndarray:
+        try:
+            result = np.asarray(statistic(samples, axis=1), dtype=float)
+            if result.shape == (samples.shape[0],):
+                return result
+        except TypeError:
+            pass
+        return np.array([statistic(row) for row in samples], dtype=float)
+
+    return apply
+
+
+def bootstrap_distribution(
+    data: Sequence[float],
+    statistic: Statistic = 'mean',
+    n_resamples: int = 10000,
+    random_state: RandomStateLike = None,
+    max_chunk_elements: int = DEFAULT_MAX_CHUNK_ELEMENTS
+) -> np.ndarray:
+    """
+    Bootstrap distribution of a one-sample statistic.
+
+    Args:
+        data: Observed values
+        statistic: "mean", "median", "std" or a callable (see _row_statistic)
+        n_resamples: Number of bootstrap resamples
+        random_state: Seed or generator for reproducibility
+        max_chunk_elements: Memory bound for each resample chunk
+
+    Returns:
+        Array of n_resamples statistic values
+
+    Raises:
+        ValueError: If data is empty
+    """
+    values = np.asarray(data, dtype=float)
+    n = len(values)
+    if n == 0:
+        raise ValueError("Cannot bootstrap empty data")
+
+    rng = resolve_rng(random_state)
+    compute = _row_statistic(statistic)
+    parts = [
+        compute(values[_draw(rng, n, rows)])
+        for rows in _chunk_rows(n_resamples, n, max_chunk_elements)
+    ]
+    return np.concatenate(parts)
+
+
+def cohens_d_rows(group1: np.ndarray, group2: np.ndarray) -> np.ndarray:
+    """
+    Cohen's d (pooled SD) for each row pair of two resample matrices.
+
+    Matches statistical_helpers.cohens_d, including 0.0 for zero pooled SD.
+    """
+    n1, n2 = group1.shape[1], group2.shape[1]
+    var1 = np.var(group1, axis=1, ddof=1)
+    var2 = np.var(group2, axis=1, ddof=1)
+    pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+    diff = group1.mean(axis=1) - group2.mean(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(pooled_std == 0, 0.0, diff / pooled_std)
+
+
+def cliffs_delta_rows(group1: np.ndarray, group2: np.ndarray) -> np.ndarray:
+    """
+    Cliff's delta for each row pair of two resample matrices.
+
+    Matches statistical_helpers.cliffs_delta (ties count as neither).
+    """
+    return cliffs_delta_ranked(group1, group2)
+
+
+_TWO_SAMPLE_STATISTICS = {
+    'cohens_d': (cohens_d_rows, lambda n1, n2: n1 + n2),
+    'cliffs_delta': (cliffs_delta_rows, lambda n1, n2: n1 + n2),
+    'mean_difference': (lambda g1, g2: g1.mean(axis=1) - g2.mean(axis=1), lambda n1, n2: n1 + n2),
+}
+
+
+def bootstrap_two_sample_distribution(
+    group1: Sequence[float],
+    group2: Sequence[float],
+    statistic: Statistic = 'cohens_d',
+    n_resamples: int = 10000,
+    random_state: RandomStateLike = None,
+    max_chunk_elements: int = DEFAULT_MAX_CHUNK_ELEMENTS
+) -> np.ndarray:
+    """
+    Bootstrap distribution of a two-sample statistic with independent resampling.
+
+    Each group is resampled independently (preserving group structure).
+
+    Args:
+        group1: First group's values
+        group2: Second group's values
+        statistic: "cohens_d", "cliffs_delta", "mean_difference", or a
+                   callable f(sample1, sample2) evaluated row by row
+        n_resamples: Number of bootstrap resamples
+        random_state: Seed or generator for reproducibility
+        max_chunk_elements: Memory bound for each chunk
+
+    Returns:
+        Array of statistic values (NaN where a callable raised)
+
+    Raises:
+        ValueError: If a group is empty or the statistic name is unknown
+    """
+    x = np.asarray(group1, dtype=float)
+    y = np.asarray(group2, dtype=float)
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Cannot bootstrap empty groups")
+
+    if isinstance(statistic, str):
+        if statistic not in _TWO_SAMPLE_STATISTICS:
+            raise ValueError(f"Unknown bootstrap statistic: {statistic}")
+        compute, row_cost = _TWO_SAMPLE_STATISTICS[statistic]
+        row_elements = row_cost(n1, n2)
+    else:
+        func = statistic
+
+        def compute(g1: np.ndarray, g2: np.ndarray) -> np.ndarray:
+            out = np.empty(g1.shape[0])
+            for i in range(g1.shape[0]):
+                try:
+                    out[i] = func(g1[i], g2[i])
+                except Exception:
+                    out[i] = np.nan
+            return out
+
+        row_elements = n1 + n2
+
+    rng = resolve_rng(random_state)
+    parts = []
+    for rows in _chunk_rows(n_resamples, row_elements, max_chunk_elements):
+        parts.append(compute(x[_draw(rng, n1, rows)], y[_draw(rng, n2, rows)]))
+    return np.concatenate(parts)
+
+
+def percentile_interval(distribution: np.ndarray, confidence_level: float = 0.95) -> Tuple[float, float]:
+    """
+    Percentile-method confidence interval (linear interpolation, NaNs ignored).
+
+    Args:
+        distribution: Bootstrap statistic values
+        confidence_level: Confidence level (e.g. 0.95)
+
+    Returns:
+        Tuple of (lower, upper)
+    """
+    alpha = 1 - confidence_level
+    lower, upper = np.nanpercentile(distribution, [(alpha / 2) * 100, (1 - alpha / 2) * 100])
+    return float(lower), float(upper)
@@ -0,0 +1,176 @@
+"""
+Per-run ledger of LLM calls and their token usage.
+
+Every Chat Completions response carries a `usage` block with the exact
+prompt, completion and cached token counts of that call. Adapters that call
+the API directly (BaseAdapter.call_openai_chat_completion) append one JSON
+line per call to llm_calls.jsonl in the run directory, so a run's token
+totals, latency and throughput are known as soon as it finishes. Calls are
+tagged with the adapter's phase, so prompt cache hit ratios can be reported
+per phase.
+
+The ledger is provisional: the OpenAI Usage API (see UsageReconciler)
+remains the verification source for token metrics. The reconciler uses the
+ledger's first and last call times as the run's query window.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="metrics")
+
+CALL_LEDGER_FILENAME = "llm_calls.jsonl"
+
+# Serializes appends from concurrent adapter threads (e.g. parallel GHSpec tasks)
+_append_lock = threading.Lock()
+
+
+def usage_from_response(response: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Token counts of one Chat Completions response.
+
+    Args:
+        response: Full response dictionary
+
+    Returns:
+        Dict with prompt_tokens, completion_tokens, cached_tokens (0 when absent)
+    """
+    usage = response.get('usage') or {}
+    details = usage.get('prompt_tokens_details') or {}
+    return {
+        'prompt_tokens': int(usage.get('prompt_tokens') or 0),
+        'completion_tokens': int(usage.get('completion_tokens') or 0),
+        'cached_tokens': int(details.get('cached_tokens') or 0),
+    }
+
+
+def record_call(
+    run_dir: Path,
+    response: Dict[str, Any],
+    model: str,
+    started_at: float,
+    ended_at: float,
+    **context: Any
+) -> Dict[str, Any]:
+    """
+    Append one call to the run's ledger.
+
+    Args:
+        run_dir: Run directory holding the ledger
+        response: Full Chat Completions response
+        model: Requested model (the response's model is recorded when present)
+        started_at: Unix time (seconds) the request was sent
+        ended_at: Unix time (seconds) the response was received
+        **context: Extra fields to record (e.g. step, sprint)
+
+    Returns:
+        The ledger entry
+    """
+    entry = {
+        'request_id': response.get('id'),
+        'model': response.get('model') or model,
+        'started_at': started_at,
+        'ended_at': ended_at,
+        'latency_seconds': round(ended_at - started_at, 6),
+        **usage_from_response(response),
+        **context,
+    }
+    path = Path(run_dir) / CALL_LEDGER_FILENAME
+    line = json.dumps(entry) + "\n"
+    try:
+        with _append_lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line)
+    except OSError as e:
+        # The ledger is provisional; never fail the call over it
+        logger.warning(f"Could not append to call ledger {path}: {e}")
+    return entry
+
+
+def read_ledger(path: Path) -> List[Dict[str, Any]]:
+    """
+    Read ledger entries, skipping unparseable lines (e.g. a torn last write).
+
+    Args:
+        path: Ledger file
+
+    Returns:
+        Entries in call order (empty if the file does not exist)
+    """
+    entries = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed call ledger line in {path}")
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def cache_hit_ratios(entries: List[Dict[str, Any]], key: str = 'phase') -> Dict[str, Dict[str, Any]]:
+    """
+    Cached share of prompt tokens per group of calls.
+
+    Args:
+        entries: Ledger entries
+        key: Entry field to group by (entries without it are skipped)
+
+    Returns:
+        Group → {calls, prompt_tokens, cached_tokens, cache_hit_ratio}
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for entry in entries:
+        if entry.get(key) is None:
+            continue
+        group = groups.setdefault(str(entry[key]), {'calls': 0, 'prompt_tokens': 0, 'cached_tokens': 0})
+        group['calls'] += 1
+        group['prompt_tokens'] += entry.get('prompt_tokens', 0)
+        group['cached_tokens'] += entry.get('cached_tokens', 0)
+    for group in groups.values():
+        prompt_tokens = group['prompt_tokens']
+        group['cache_hit_ratio'] = group['cached_tokens'] / prompt_tokens if prompt_tokens else 0.0
+    return groups
+
+
+def summarize_ledger(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Run-level totals of a ledger.
+
+    Args:
+        path: Ledger file
+
+    Returns:
+        Dict with TOK_IN, TOK_OUT, API_CALLS, CACHED_TOKENS, first_call_at,
+        last_call_at, latency totals, throughput, models and cache hit
+        ratios (overall and per phase); None if the ledger is missing or empty
+    """
+    entries = read_ledger(path)
+    if not entries:
+        return None
+
+    tok_in = sum(e.get('prompt_tokens', 0) for e in entries)
+    cached = sum(e.get('cached_tokens', 0) for e in entries)
+    tok_out = sum(e.get('completion_tokens', 0) for e in entries)
+    latencies = [e.get('latency_seconds', 0.0) for e in entries]
+    total_latency = sum(latencies)
+    return {
+        'TOK_IN': tok_in,
+        'TOK_OUT': tok_out,
+        'API_CALLS': len(entries),
+        'CACHED_TOKENS': cached,
+        'first_call_at': min(e['started_at'] for e in entries),
+        'last_call_at': max(e['ended_at'] for e in entries),
+        'total_latency_seconds': round(total_latency, 6),
+        'max_latency_seconds': max(latencies),
+        'output_tokens_per_second': tok_out / total_latency if total_latency > 0 else 0.0,
+        'models': sorted({e.get('model') for e in entries if e.get('model')}),
+        'cache_hit_ratio': cached / tok_in if tok_in else 0.0,
+        'phases': cache_hit_ratios(entries, 'phase'),
+    }
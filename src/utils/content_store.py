@@ -0,0 +1,407 @@
+"""
+Content-addressed snapshots of sprint workspaces.
+
+Each run keeps an object store (run_dir/.objects/<aa>/<sha256>) holding one
+read-only blob per distinct file content. Once a sprint has finished, its
+generated_artifacts tree is snapshotted into the store: every file is
+replaced by a hard link to its blob and the tree is recorded in
+sprint_NNN/tree.json. Files carried over unchanged from earlier sprints
+therefore share a single copy on disk, so disk usage grows with the amount
+of change rather than with the number of files.
+
+The next sprint is built from the store as well: adapters copy the
+framework's output into the sprint through IncrementalCopier, which clones
+files that are unchanged since the previous sprint's tree from their blobs
+(stamped so the later snapshot does not re-read them) and copies only the
+changed ones from the framework's output.
+
+Blobs are immutable: a new blob is always written as a private copy (never
+a hard link to the live file, which a still-running process might keep
+writing to), and only finished sprint trees are linked to blobs. Workspaces
+that will be modified again (e.g. the BAeS context store and database
+seeded into the next sprint) are created with clone_file(), which uses a
+copy-on-write reflink where the filesystem supports it and a regular copy
+otherwise.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.isolation import sprint_dir
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="orchestrator")
+
+OBJECTS_DIRNAME = ".objects"
+TREE_MANIFEST_NAME = "tree.json"
+TREE_MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# ioctl request number of FICLONE (Linux reflink)
+_FICLONE = 0x40049409
+_reflink_unsupported = False
+
+
+def _try_reflink(src: Path, dst: Path) -> bool:
+    """Clone src into dst (must not exist) with FICLONE; False if unsupported."""
+    global _reflink_unsupported
+    if _reflink_unsupported:
+        return False
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX
+        _reflink_unsupported = True
+        return False
+
+    with open(src, 'rb') as fsrc:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(fd, _FICLONE, fsrc.fileno())
+        except OSError as e:
+            os.close(fd)
+            os.unlink(dst)
+            if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS):
+                _reflink_unsupported = True
+            return False
+        os.close(fd)
+    shutil.copystat(src, dst)
+    return True
+
+
+def clone_file(src: Path, dst: Path) -> Path:
+    """
+    Copy a file, using a copy-on-write reflink when the filesystem allows it.
+
+    Drop-in replacement for shutil.copy2 (also usable as copytree's
+    copy_function). The destination is always an independent, writable file.
+
+    Args:
+        src: Source file
+        dst: Destination file or directory
+
+    Returns:
+        Destination path
+    """
+    src = Path(src)
+    dst = Path(dst)
+    if dst.is_dir():
+        dst = dst / src.name
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    if not _try_reflink(src, dst):
+        shutil.copy2(src, dst)
+    # Sources may be read-only blobs; copies must be writable
+    mode = stat.S_IMODE(dst.stat().st_mode)
+    if not mode & stat.S_IWUSR:
+        os.chmod(dst, mode | stat.S_IWUSR)
+    return dst
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    sha256_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            sha256_hash.update(block)
+    return sha256_hash.hexdigest()
+
+
+def load_tree_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a sprint tree manifest.
+
+    Args:
+        path: Path to tree.json
+
+    Returns:
+        Manifest dictionary, or None if missing or unreadable
+    """
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable tree manifest {path}: {e}")
+        return None
+
+
+class ContentStore:
+    """Per-run object store mapping SHA-256 digests to immutable blobs."""
+
+    def __init__(self, run_dir: Path):
+        """
+        Initialize the store for a run.
+
+        Args:
+            run_dir: Run directory (the store lives in run_dir/.objects)
+        """
+        self.run_dir = Path(run_dir)
+        self.root = self.run_dir / OBJECTS_DIRNAME
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob for a digest."""
+        return self.root / digest[:2] / digest
+
+    def has(self, digest: str) -> bool:
+        """Whether a blob exists for a digest."""
+        return self.blob_path(digest).exists()
+
+    def put(self, path: Path, digest: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Store a file's content (no-op if an identical blob exists).
+
+        Args:
+            path: File to store
+            digest: Known SHA-256 of the file (computed if None)
+
+        Returns:
+            Dict with 'digest' and 'new' (True if a blob was written)
+        """
+        digest = digest or hash_file(path)
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return {'digest': digest, 'new': False}
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob.with_name(f"{digest}.{os.getpid()}.tmp")
+        clone_file(path, tmp_path)
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(tmp_path).st_mode) & 0o555)
+        os.replace(tmp_path, blob)
+        return {'digest': digest, 'new': True}
+
+    def link(self, digest: str, path: Path) -> bool:
+        """
+        Atomically replace (or create) path as a hard link to a blob.
+
+        Args:
+            digest: SHA-256 of an existing blob
+            path: File to replace
+
+        Returns:
+            False if the link could not be created (cross-device or link
+            limit reached); path is left untouched in that case
+        """
+        blob = self.blob_path(digest)
+        if path.exists() and os.path.samefile(path, blob):
+            return True
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.lnk")
+        try:
+            os.link(blob, tmp_path)
+        except OSError:
+            return False
+        os.replace(tmp_path, path)
+        return True
+
+    def _link_to_blob(self, path: Path, digest: str) -> None:
+        """Replace path with a hard link to its blob (keep the private copy on failure)."""
+        self.link(digest, path)
+
+    def snapshot(
+        self,
+        tree_dir: Path,
+        manifest_path: Path,
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Snapshot a finished tree into the store and write its manifest.
+
+        Regular files are stored and replaced by hard links to their blobs.
+        Digests of files whose size and mtime match the previous manifest
+        entry for the same path are reused without re-reading the file.
+
+        Args:
+            tree_dir: Directory to snapshot (must no longer be written to)
+            manifest_path: Where to write the tree manifest (tree.json)
+            previous: Previous sprint's tree manifest (optional)
+
+        Returns:
+            The tree manifest
+        """
+        previous_files = (previous or {}).get('files', {})
+        files: Dict[str, Dict[str, Any]] = {}
+        new_blobs = 0
+        new_bytes = 0
+        total_bytes = 0
+
+        for dirpath, dirnames, filenames in os.walk(tree_dir):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = Path(dirpath) / name
+                st = path.lstat()
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                rel_path = path.relative_to(tree_dir).as_posix()
+
+                prev = previous_files.get(rel_path)
+                digest = None
+                if prev and prev['size'] == st.st_size and prev['mtime_ns'] == st.st_mtime_ns \
+                        and self.has(prev['sha256']):
+                    digest = prev['sha256']
+
+                # The file's own mode: once linked, path reports the read-only blob's
+                mode = stat.S_IMODE(st.st_mode)
+                result = self.put(path, digest)
+                if result['new']:
+                    new_blobs += 1
+                    new_bytes += st.st_size
+                self._link_to_blob(path, result['digest'])
+
+                st = path.stat()
+                files[rel_path] = {
+                    'sha256': result['digest'],
+                    'size': st.st_size,
+                    'mode': mode,
+                    'mtime_ns': st.st_mtime_ns
+                }
+                total_bytes += st.st_size
+
+        manifest = {
+            'version': TREE_MANIFEST_VERSION,
+            'root': os.path.relpath(tree_dir, manifest_path.parent),
+            'file_count': len(files),
+            'total_bytes': total_bytes,
+            'new_blobs': new_blobs,
+            'new_bytes': new_bytes,
+            'files': files
+        }
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+    def materialize(self, manifest: Dict[str, Any], rel_path: str, dest: Path) -> bool:
+        """
+        Create a private, writable copy of one file of a snapshotted tree.
+
+        The copy gets the file's recorded mode (plus owner write permission).
+
+        Args:
+            manifest: Tree manifest containing rel_path
+            rel_path: Path relative to the tree root
+            dest: Destination file
+
+        Returns:
+            True if the file was found in the manifest and copied
+        """
+        entry = manifest.get('files', {}).get(rel_path)
+        if not entry or not self.has(entry['sha256']):
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        clone_file(self.blob_path(entry['sha256']), dest)
+        if 'mode' in entry:
+            os.chmod(dest, entry['mode'] | stat.S_IWUSR)
+        return True
+
+
+class IncrementalCopier:
+    """
+    Copies files into a sprint's generated_artifacts, reusing unchanged blobs.
+
+    A file whose content matches the previous sprint's tree entry for the
+    same path is cloned from the existing blob (a reflink where supported)
+    and keeps the blob's mtime, so the later snapshot recognises it without
+    hashing it again. As in ContentStore.snapshot, a size and mtime match is
+    trusted without reading the file; otherwise the source is hashed and
+    compared.
+
+    The sprint is still live (the generated app is validated and may write
+    to its own files), so files are never hard-linked to blobs here: every
+    destination is an independent, writable file created with clone_file().
+    Linking happens only when the finished sprint is snapshotted.
+    """
+
+    def __init__(self, run_dir: Optional[Path], sprint_num: int):
+        """
+        Initialize the copier for a sprint.
+
+        Args:
+            run_dir: Run directory (None disables blob reuse)
+            sprint_num: Sprint being built
+        """
+        self.reused = 0
+        self.copied = 0
+        self.store = None
+        self.previous_files: Dict[str, Dict[str, Any]] = {}
+        if run_dir is None or sprint_num <= 1:
+            return
+        previous = load_tree_manifest(sprint_dir(run_dir, sprint_num - 1) / TREE_MANIFEST_NAME)
+        if previous:
+            self.store = ContentStore(run_dir)
+            self.previous_files = previous.get('files', {})
+            self.artifacts_dir = (sprint_dir(run_dir, sprint_num) / "generated_artifacts").absolute()
+
+    def _unchanged_digest(self, src: Path, dst: Path) -> Optional[str]:
+        """Digest of the previous tree's blob if src has the same content."""
+        try:
+            rel_path = dst.absolute().relative_to(self.artifacts_dir).as_posix()
+        except ValueError:
+            return None
+        entry = self.previous_files.get(rel_path)
+        if not entry or not self.store.has(entry['sha256']):
+            return None
+        st = src.stat()
+        if st.st_size != entry['size']:
+            return None
+        if st.st_mtime_ns == entry['mtime_ns'] or hash_file(src) == entry['sha256']:
+            return entry['sha256']
+        return None
+
+    def copy(self, src, dst) -> Path:
+        """
+        Copy one file (signature compatible with shutil.copytree's copy_function).
+
+        Args:
+            src: Source file
+            dst: Destination file or directory
+
+        Returns:
+            Destination path
+        """
+        src = Path(src)
+        dst = Path(dst)
+        if dst.is_dir():
+            dst = dst / src.name
+        if self.store is not None:
+            digest = self._unchanged_digest(src, dst)
+            if digest:
+                self.reused += 1
+                # Blobs are shared by equal contents: keep the source's own mode
+                clone_file(self.store.blob_path(digest), dst)
+                os.chmod(dst, stat.S_IMODE(src.stat().st_mode) | stat.S_IWUSR)
+                return dst
+        self.copied += 1
+        return clone_file(src, dst)
+
+
+def snapshot_sprint(run_dir: Path, sprint_num: int) -> Optional[Dict[str, Any]]:
+    """
+    Snapshot a finished sprint's generated_artifacts into the run's store.
+
+    Writes sprint_NNN/tree.json and links the sprint's files to shared blobs.
+
+    Args:
+        run_dir: Run directory
+        sprint_num: Finished sprint number
+
+    Returns:
+        Tree manifest, or None if the sprint has no artifacts directory
+    """
+    artifacts_dir = sprint_dir(run_dir, sprint_num) / "generated_artifacts"
+    if not artifacts_dir.is_dir():
+        return None
+
+    previous = None
+    if sprint_num > 1:
+        previous = load_tree_manifest(sprint_dir(run_dir, sprint_num - 1) / TREE_MANIFEST_NAME)
+
+    store = ContentStore(run_dir)
+    return store.snapshot(artifacts_dir,
+                          sprint_dir(run_dir, sprint_num) / TREE_MANIFEST_NAME,
+                          previous)
@@ -0,0 +1,161 @@
+"""
+Deadline enforcement that works from any thread or worker process.
+
+Replaces signal.alarm/SIGALRM based timeouts, which only work on the main
+thread of a single process. The guarded call runs on a daemon thread while
+the caller waits on it with a deadline, so several steps can be supervised
+concurrently (threads of one orchestrator, or separate worker processes).
+
+A thread cannot be interrupted, so on timeout the caller cancels the work
+(on_timeout): child processes are killed and cooperative code checks a
+cancel event (raising StepCancelled). DeadlineExceeded.still_running tells
+whether the call unwound within the grace period; while it has not, the
+abandoned call may still write to its workspace and must not be retried.
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="orchestrator")
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a guarded call does not finish before its deadline."""
+
+    def __init__(self, message: str, elapsed_seconds: float, still_running: bool = False):
+        super().__init__(message)
+        self.elapsed_seconds = elapsed_seconds
+        self.still_running = still_running
+
+
+class StepCancelled(Exception):
+    """Raised inside cancelled work when it notices its cancel event."""
+
+
+def run_with_deadline(
+    func: Callable[..., Any],
+    timeout: float,
+    *args: Any,
+    name: Optional[str] = None,
+    on_timeout: Optional[Callable[[], None]] = None,
+    cancel_grace: float = 0.0,
+    **kwargs: Any
+) -> Any:
+    """
+    Run func(*args, **kwargs) and wait at most `timeout` seconds for it.
+
+    The call runs on a daemon thread. On timeout the thread cannot be
+    interrupted: on_timeout is called to cancel the underlying work (e.g.
+    kill its child processes, set a cancel event), then the thread is given
+    `cancel_grace` seconds to unwind.
+
+    Args:
+        func: Callable to execute
+        timeout: Deadline in seconds
+        *args: Positional arguments for func
+        name: Optional thread name (for debugging)
+        on_timeout: Cancels func's work when the deadline expires
+        cancel_grace: Seconds to wait for func to unwind after on_timeout
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+
+    Raises:
+        DeadlineExceeded: If func is still running when the deadline expires
+        Exception: Any exception raised by func is re-raised unchanged
+    """
+    outcome = {}
+
+    def _target():
+        try:
+            outcome['result'] = func(*args, **kwargs)
+        except BaseException as e:  # Propagated to the caller below
+            outcome['error'] = e
+
+    start = time.monotonic()
+    worker = threading.Thread(target=_target, name=name, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    elapsed = time.monotonic() - start
+
+    if worker.is_alive():
+        if on_timeout is not None:
+            try:
+                on_timeout()
+            except Exception as e:
+                logger.error("Error cancelling timed out call",
+                            extra={'metadata': {'thread': worker.name, 'error': str(e)}})
+            worker.join(cancel_grace)
+        still_running = worker.is_alive()
+        if still_running:
+            logger.error("Timed out call did not stop after cancellation",
+                        extra={'metadata': {'thread': worker.name, 'cancel_grace': cancel_grace}})
+        raise DeadlineExceeded(
+            f"Execution exceeded timeout of {timeout}s (cancelled after {elapsed:.1f}s)",
+            elapsed_seconds=elapsed,
+            still_running=still_running
+        )
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('result')
+
+
+def terminate_process_tree(
+    process: Optional[subprocess.Popen],
+    grace_period: float,
+    run_id: Optional[str] = None
+) -> None:
+    """
+    Terminate a process and its process group, escalating to SIGKILL.
+
+    Sends SIGTERM, waits up to `grace_period` seconds, then sends SIGKILL.
+    The whole process group is signalled when the process leads its own
+    group (started with start_new_session=True); the orchestrator's own
+    group is never signalled.
+
+    Args:
+        process: Process to terminate (no-op if None or already exited)
+        grace_period: Seconds to wait between SIGTERM and SIGKILL
+        run_id: Run identifier for logging
+    """
+    if process is None or process.poll() is not None:
+        return
+
+    try:
+        pgid = os.getpgid(process.pid)
+    except ProcessLookupError:
+        return
+    signal_group = pgid != os.getpgrp()
+
+    def _send(sig):
+        try:
+            if signal_group:
+                os.killpg(pgid, sig)
+            else:
+                process.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+    _send(signal.SIGTERM)
+    try:
+        process.wait(timeout=grace_period)
+    except subprocess.TimeoutExpired:
+        logger.warning("Force killing timed out process",
+                      extra={'run_id': run_id,
+                            'metadata': {'pid': process.pid,
+                                        'process_group': signal_group}})
+        _send(signal.SIGKILL)
+        process.wait()
+        return
+
+    # Leader exited; make sure no children of the group survive it
+    if signal_group:
+        _send(signal.SIGKILL)
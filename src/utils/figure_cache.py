@@ -0,0 +1,249 @@
+"""
+Content-addressed cache of rendered figures.
+
+A figure's cache key is a SHA-256 over everything that determines its pixels:
+the plot kind, its input data and parameters (canonically serialized, so
+dict order and list/array containers do not matter), the active matplotlib
+rcParams (style), the matplotlib/NumPy/seaborn versions and a fingerprint of
+the plotting code. Re-running an analysis after adding one run therefore
+only redraws the figures whose inputs changed; every other figure is copied
+back from the cache.
+
+Layout (one directory per entry, written atomically):
+    <cache_dir>/<key[:2]>/<key>/entry.json   # file list + caller metadata
+    <cache_dir>/<key[:2]>/<key>/<files...>
+
+The cache is bounded by size: evict() removes least recently used entries
+(entry.json mtime is refreshed on every hit) until it fits max_bytes.
+"""
+
+import dataclasses
+import enum
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="analysis")
+
+FIGURE_CACHE_DIRNAME = ".figure_cache"
+ENTRY_MANIFEST = "entry.json"
+# Bump to invalidate every cached figure (e.g. when the key format changes)
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = int(os.getenv("FIGURE_CACHE_MAX_MB", "256")) * 1024 * 1024
+FIGURE_CACHE_ENABLED = os.getenv("FIGURE_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+
+_source_fingerprints: Dict[str, str] = {}
+
+
+def _update(hasher: "hashlib._Hash", value: Any) -> None:
+    """Feed a canonical, type-tagged serialization of value into hasher."""
+    if value is None or isinstance(value, bool):
+        hasher.update(f"c:{value!r};".encode())
+    elif isinstance(value, enum.Enum):
+        hasher.update(f"e:{type(value).__name__}.{value.name};".encode())
+    elif isinstance(value, int):
+        hasher.update(f"i:{value};".encode())
+    elif isinstance(value, float):
+        hasher.update(b"f:" + struct.pack("<d", value))
+    elif isinstance(value, str):
+        encoded = value.encode()
+        hasher.update(f"s:{len(encoded)}:".encode() + encoded)
+    elif isinstance(value, bytes):
+        hasher.update(f"b:{len(value)}:".encode() + value)
+    elif isinstance(value, Path):
+        _update(hasher, str(value))
+    elif hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        # NumPy arrays and scalars
+        import numpy as np
+        array = np.ascontiguousarray(value)
+        if array.dtype == object:
+            _update(hasher, array.tolist())
+        else:
+            hasher.update(f"a:{array.dtype.str}:{array.shape};".encode())
+            hasher.update(array.tobytes())
+    elif isinstance(value, dict):
+        hasher.update(f"d:{len(value)}:".encode())
+        for key in sorted(value, key=repr):
+            _update(hasher, key)
+            _update(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"l:{len(value)}:".encode())
+        for item in value:
+            _update(hasher, item)
+    elif isinstance(value, (set, frozenset)):
+        _update(hasher, sorted(value, key=repr))
+    elif dataclasses.is_dataclass(value):
+        hasher.update(f"o:{type(value).__qualname__}:".encode())
+        for f in dataclasses.fields(value):
+            _update(hasher, f.name)
+            _update(hasher, getattr(value, f.name))
+    else:
+        # Unknown objects: repr (may contain an address, i.e. never hit)
+        _update(hasher, f"{type(value).__qualname__}:{value!r}")
+
+
+def source_fingerprint(*paths: Path) -> str:
+    """
+    Fingerprint of plotting source files (cached per process).
+
+    Args:
+        paths: Source files whose changes must invalidate cached figures
+
+    Returns:
+        SHA-256 hex digest over the files' contents
+    """
+    hasher = hashlib.sha256()
+    for path in paths:
+        path_key = str(Path(path).resolve())
+        if path_key not in _source_fingerprints:
+            try:
+                _source_fingerprints[path_key] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            except OSError:
+                _source_fingerprints[path_key] = "missing"
+        hasher.update(_source_fingerprints[path_key].encode())
+    return hasher.hexdigest()
+
+
+def _environment() -> Dict[str, Any]:
+    """Library versions and active rcParams that influence rendering."""
+    env: Dict[str, Any] = {'format': CACHE_FORMAT_VERSION}
+    for name in ("matplotlib", "numpy", "seaborn"):
+        module = sys.modules.get(name)
+        if module is not None:
+            env[name] = getattr(module, "__version__", "unknown")
+    if "matplotlib" in sys.modules:
+        import matplotlib
+        env['rcParams'] = repr(sorted(matplotlib.rcParams.items()))
+    return env
+
+
+def figure_key(kind: str, inputs: Any, params: Optional[Dict[str, Any]] = None,
+               code_fingerprint: str = "") -> str:
+    """
+    Compute the cache key of a figure.
+
+    Args:
+        kind: Plot kind (e.g. generator method or chart name)
+        inputs: Input data (dicts, lists, NumPy arrays, dataclasses, ...)
+        params: Plot parameters (labels, thresholds, style, ...)
+        code_fingerprint: Fingerprint of the plotting code (see source_fingerprint)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    hasher = hashlib.sha256()
+    _update(hasher, [kind, inputs, params or {}, code_fingerprint, _environment()])
+    return hasher.hexdigest()
+
+
+class FigureCache:
+    """Size-bounded, content-addressed on-disk store of rendered figure files."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Cache directory (created on first store)
+            max_bytes: Size bound enforced by evict()
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def restore(self, key: str, dest_dir: Path) -> Optional[Dict[str, Any]]:
+        """
+        Copy a cached figure's files into dest_dir.
+
+        Args:
+            key: Figure key
+            dest_dir: Directory the files were originally rendered into
+
+        Returns:
+            Metadata stored with the entry, or None on a miss
+        """
+        entry_dir = self._entry_dir(key)
+        manifest_path = entry_dir / ENTRY_MANIFEST
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            for rel_path in entry['files']:
+                dest = Path(dest_dir) / rel_path
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(entry_dir / rel_path, dest)
+            os.utime(manifest_path)  # LRU: mark as recently used
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry.get('meta', {})
+
+    def store(self, key: str, files: Iterable[Path], base_dir: Path,
+              meta: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add rendered files to the cache (no-op if the key is already cached).
+
+        Args:
+            key: Figure key
+            files: Rendered files (inside base_dir)
+            base_dir: Directory the files are relative to
+            meta: JSON-serializable metadata returned by restore()
+        """
+        entry_dir = self._entry_dir(key)
+        if (entry_dir / ENTRY_MANIFEST).exists():
+            return
+
+        entry_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent, prefix=f".{key[:8]}."))
+        try:
+            rel_paths: List[str] = []
+            for path in files:
+                rel_path = Path(path).relative_to(base_dir).as_posix()
+                (tmp_dir / rel_path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, tmp_dir / rel_path)
+                rel_paths.append(rel_path)
+            with open(tmp_dir / ENTRY_MANIFEST, 'w', encoding='utf-8') as f:
+                json.dump({'files': rel_paths, 'meta': meta or {}}, f)
+            os.rename(tmp_dir, entry_dir)
+        except OSError as e:
+            # Another process stored the same key first, or the disk is full
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not (entry_dir / ENTRY_MANIFEST).exists():
+                logger.warning(f"Could not cache figure {key[:12]}: {e}")
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        total = 0
+        for manifest_path in self.cache_dir.glob(f"*/*/{ENTRY_MANIFEST}"):
+            entry_dir = manifest_path.parent
+            try:
+                size = sum(p.stat().st_size for p in entry_dir.rglob("*") if p.is_file())
+                entries.append((manifest_path.stat().st_mtime, size, entry_dir))
+            except OSError:
+                continue
+            total += size
+
+        removed = 0
+        for _, size, entry_dir in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Evicted {removed} cached figures from {self.cache_dir}")
+        return removed
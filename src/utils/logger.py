@@ -3,15 +3,33 @@ Structured JSON logging for BAEs experiment framework.
 
 Provides consistent logging format across all modules with metadata support.
 Implements per-run, per-step logging with component separation.
+
+File logging is synchronous by default. enable_async_logging() (or
+BAES_ASYNC_LOGS=1) switches to a non-blocking mode: records are routed to
+their file on the caller's thread and handed to a bounded queue; a
+background writer formats and batch-writes them, keeping an LRU of open file
+handles per log file (run, sprint, component). The queue is flushed on step
+boundaries (LogContext changes), by flush_logs() and at interpreter exit.
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
+import sys
 import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, List, Optional
+
+# Records buffered before callers block (backpressure, nothing is dropped)
+ASYNC_LOG_QUEUE_SIZE = 10_000
+# Records written per batch by the background writer
+ASYNC_LOG_BATCH_SIZE = 512
+# Log files kept open at once by the background writer (LRU)
+MAX_OPEN_LOG_FILES = 32
 
 
 class LogContext:
@@ -55,6 +73,7 @@ class LogContext:
             framework: Framework name
             logs_dir: Base logs directory (runs/<framework>/<run_id>/logs)
         """
+        flush_logs()
         self.run_id = run_id
         self.framework = framework
         self.logs_dir = logs_dir
@@ -72,6 +91,7 @@ class LogContext:
         Args:
             step_num: Step number (1-indexed)
         """
+        flush_logs()
         self.current_step = step_num
         
         if self.logs_dir:
@@ -80,6 +100,7 @@ class LogContext:
     
     def clear_step_context(self) -> None:
         """Clear current step (for run-level logging)."""
+        flush_logs()
         self.current_step = None
         
     def get_log_file(self, component: str) -> Optional[Path]:
@@ -142,6 +163,12 @@ class DynamicFileHandler(logging.Handler):
             # No context set - skip file logging
             return
         
+        writer = _async_writer
+        if writer is not None:
+            # Route now (context may change), format and write in the background
+            writer.submit(log_file, _prepare_record(record), self.formatter)
+            return
+        
         # Check if we need to switch files
         if log_file != self.current_file:
             # Close current handler if exists
@@ -179,7 +206,8 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_entry: Dict[str, Any] = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            # Record creation time, so deferred (async) formatting keeps it exact
+            'timestamp': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
             'level': record.levelname,
             'module': record.module,
             'message': record.getMessage()
@@ -200,6 +228,207 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry)
 
 
+def _prepare_record(record: logging.LogRecord) -> logging.LogRecord:
+    """Merge message arguments so the record no longer references caller objects."""
+    if record.args:
+        record.msg = record.getMessage()
+        record.args = None
+    return record
+
+
+class AsyncLogWriter:
+    """
+    Background writer for DynamicFileHandler records.
+    
+    Callers only enqueue (path, record, formatter) tuples; the writer thread
+    drains the queue in batches, formats the records and appends them to
+    their files, keeping at most max_open_files handles open (LRU).
+    """
+    
+    _STOP = object()
+    
+    def __init__(
+        self,
+        queue_size: int = ASYNC_LOG_QUEUE_SIZE,
+        batch_size: int = ASYNC_LOG_BATCH_SIZE,
+        max_open_files: int = MAX_OPEN_LOG_FILES
+    ):
+        """
+        Initialize the writer (the thread starts on first use).
+        
+        Args:
+            queue_size: Records buffered before callers block
+            batch_size: Records written per batch
+            max_open_files: Open file handles kept by the writer
+        """
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_open_files = max_open_files
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._handles: "OrderedDict[Path, IO[str]]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _ensure_started(self) -> None:
+        """Start the writer thread (again in a forked child, whose copy has none)."""
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # Inherited handles and queued records belong to the parent
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            self._handles = OrderedDict()
+            self._thread = threading.Thread(target=self._run, name="async-log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+    
+    def submit(self, path: Path, record: logging.LogRecord, formatter: logging.Formatter) -> None:
+        """
+        Enqueue a record for path (blocks only while the queue is full).
+        
+        Args:
+            path: Log file the record belongs to
+            record: Log record (message arguments already merged)
+            formatter: Formatter producing the line
+        """
+        self._ensure_started()
+        self._queue.put((path, record, formatter))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every record submitted so far is written.
+        
+        Args:
+            timeout: Seconds to wait (None: no limit)
+            
+        Returns:
+            True if the writer caught up within the timeout
+        """
+        if self._pid != os.getpid():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush pending records, stop the thread and close all files."""
+        if self._pid != os.getpid():
+            return
+        self._queue.put(self._STOP)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._pid = None
+    
+    def _run(self) -> None:
+        """Writer loop: drain a batch, write it, signal flush waiters."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines: "OrderedDict[Path, List[str]]" = OrderedDict()
+            waiters: List[threading.Event] = []
+            for item in batch:
+                if item is self._STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    path, record, formatter = item
+                    try:
+                        lines.setdefault(path, []).append(formatter.format(record))
+                    except Exception as e:
+                        sys.stderr.write(f"Failed to format log record for {path}: {e}\n")
+            
+            self._write(lines)
+            for done in waiters:
+                done.set()
+        
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+    
+    def _write(self, lines: "OrderedDict[Path, List[str]]") -> None:
+        """Append each file's lines with one write and flush per file."""
+        for path, file_lines in lines.items():
+            try:
+                handle = self._handle(path)
+                handle.write("\n".join(file_lines) + "\n")
+                handle.flush()
+            except OSError as e:
+                sys.stderr.write(f"Failed to write {len(file_lines)} log records to {path}: {e}\n")
+                stale = self._handles.pop(path, None)
+                if stale is not None:
+                    stale.close()
+    
+    def _handle(self, path: Path) -> IO[str]:
+        """Open (or reuse) the append handle for path, closing the least recently used."""
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(path, 'a', encoding='utf-8')
+        self._handles[path] = handle
+        while len(self._handles) > self.max_open_files:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+        return handle
+
+
+_async_writer: Optional[AsyncLogWriter] = None
+_async_lock = threading.Lock()
+
+
+def enable_async_logging(
+    queue_size: int = ASYNC_LOG_QUEUE_SIZE,
+    batch_size: int = ASYNC_LOG_BATCH_SIZE,
+    max_open_files: int = MAX_OPEN_LOG_FILES
+) -> None:
+    """
+    Switch file logging to the background writer (no-op if already enabled).
+    
+    Args:
+        queue_size: Records buffered before callers block
+        batch_size: Records written per batch
+        max_open_files: Open file handles kept by the writer
+    """
+    global _async_writer
+    with _async_lock:
+        if _async_writer is None:
+            _async_writer = AsyncLogWriter(queue_size, batch_size, max_open_files)
+
+
+def disable_async_logging() -> None:
+    """Flush and stop the background writer; file logging becomes synchronous."""
+    global _async_writer
+    with _async_lock:
+        writer, _async_writer = _async_writer, None
+    if writer is not None:
+        writer.close()
+
+
+def flush_logs(timeout: Optional[float] = None) -> None:
+    """
+    Block until all queued log records are on disk (no-op in synchronous mode).
+    
+    Args:
+        timeout: Seconds to wait (None: no limit)
+    """
+    writer = _async_writer
+    if writer is not None:
+        writer.flush(timeout)
+
+
+atexit.register(disable_async_logging)
+
+
 def get_logger(name: str, component: str = "run") -> logging.Logger:
     """
     Get a configured logger instance with JSON formatting.
@@ -217,6 +446,9 @@ def get_logger(name: str, component: str = "run") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    if _async_writer is None and os.environ.get('BAES_ASYNC_LOGS', '').lower() in ('1', 'true', 'yes'):
+        enable_async_logging()
+    
     # Create unique logger name including component to avoid conflicts
     logger_name = f"{name}.{component}"
     logger = logging.getLogger(logger_name)
@@ -0,0 +1,350 @@
+"""
+Shared, connection-pooled OpenAI HTTP client.
+
+One client instance (see get_openai_client()) is shared by the adapters, the
+ProseEngine and the UsageReconciler so that:
+- TLS connections are kept alive and reused (requests.Session + urllib3 pool)
+- Retry/backoff is handled the same way everywhere (connection errors,
+  timeouts, HTTP 408/409/429/5xx)
+- Rate-limit headers are respected (Retry-After, retry-after-ms,
+  x-ratelimit-reset-requests/tokens), including pausing further requests
+  for a key once its remaining quota reaches zero
+- Concurrency is bounded per API key
+
+Blocking methods are safe to call from multiple threads; the ``a``-prefixed
+coroutines run them on the default executor for use with asyncio.gather().
+
+The base URL can be overridden with the OPENAI_API_BASE_URL environment
+variable (e.g. to point every caller at a local mock server).
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# API configuration
+OPENAI_API_BASE = "https://api.openai.com/v1"
+MAX_RETRIES = 3
+INITIAL_BACKOFF = 1  # seconds
+BACKOFF_MULTIPLIER = 2
+MAX_BACKOFF = 60  # seconds
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+DEFAULT_MAX_CONCURRENCY_PER_KEY = 8
+DEFAULT_POOL_SIZE = 32
+
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class OpenAIClientError(RuntimeError):
+    """Raised when an OpenAI API request fails (after retries, if retryable)."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_text: Optional[str] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_text = response_text
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse an OpenAI rate-limit reset duration ("20ms", "1s", "6m0s", "1h2m3.5s").
+
+    Args:
+        value: Duration string from an x-ratelimit-reset-* header
+
+    Returns:
+        Duration in seconds, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    parts = _DURATION_RE.findall(value.strip())
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Extract the server-requested wait time from response headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+
+    Returns:
+        Seconds to wait, or None if the headers do not specify a delay
+    """
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    resets = [
+        parse_duration(headers.get(name, ''))
+        for name in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')
+    ]
+    resets = [r for r in resets if r is not None]
+    return max(resets) if resets else None
+
+
+class OpenAIHTTPClient:
+    """Thread-safe OpenAI REST client with pooling, retries and per-key limits."""
+
+    def __init__(
+        self,
+        base_url: str = OPENAI_API_BASE,
+        max_retries: int = MAX_RETRIES,
+        initial_backoff: float = INITIAL_BACKOFF,
+        backoff_multiplier: float = BACKOFF_MULTIPLIER,
+        max_backoff: float = MAX_BACKOFF,
+        max_concurrency_per_key: int = DEFAULT_MAX_CONCURRENCY_PER_KEY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: API base URL (without trailing slash)
+            max_retries: Retries after the first attempt for retryable failures
+            initial_backoff: First backoff delay in seconds
+            backoff_multiplier: Backoff growth factor per retry
+            max_backoff: Upper bound for any single wait
+            max_concurrency_per_key: Maximum in-flight requests per API key
+            pool_size: Maximum pooled connections per host
+            sleep: Sleep function (injectable for tests)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.max_backoff = max_backoff
+        self.max_concurrency_per_key = max_concurrency_per_key
+        self._sleep = sleep
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._lock = threading.Lock()
+        self._key_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._key_not_before: Dict[str, float] = {}
+
+    def _semaphore_for(self, api_key: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._key_semaphores.get(api_key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrency_per_key)
+                self._key_semaphores[api_key] = semaphore
+            return semaphore
+
+    def _wait_for_quota(self, api_key: str) -> None:
+        """Block until a key that exhausted its rate limit may send again."""
+        with self._lock:
+            not_before = self._key_not_before.get(api_key, 0.0)
+        delay = not_before - time.monotonic()
+        if delay > 0:
+            self._sleep(min(delay, self.max_backoff))
+
+    def _record_rate_limit(self, api_key: str, headers: Mapping[str, str]) -> None:
+        """Pause the key until its window resets once remaining quota hits zero."""
+        exhausted = any(
+            headers.get(name) == '0'
+            for name in ('x-ratelimit-remaining-requests', 'x-ratelimit-remaining-tokens')
+        )
+        if not exhausted:
+            return
+        reset = parse_retry_after(headers)
+        if reset:
+            with self._lock:
+                self._key_not_before[api_key] = time.monotonic() + reset
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        api_key: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 60,
+        max_retries: Optional[int] = None,
+        initial_backoff: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request and return the decoded JSON body.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the base URL (e.g. "/chat/completions")
+            api_key: Bearer token used for the request (and its concurrency limit)
+            json: JSON body
+            params: Query parameters
+            timeout: Per-attempt timeout in seconds
+            max_retries: Override of the client's retry count
+            initial_backoff: Override of the client's first backoff delay
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            OpenAIClientError: On non-retryable errors or when retries are exhausted
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+        retries = self.max_retries if max_retries is None else max_retries
+        backoff = self.initial_backoff if initial_backoff is None else initial_backoff
+        semaphore = self._semaphore_for(api_key)
+
+        for attempt in range(retries + 1):
+            wait = None
+            self._wait_for_quota(api_key)
+            try:
+                with semaphore:
+                    response = self.session.request(
+                        method, url, headers=headers, json=json,
+                        params=params, timeout=timeout
+                    )
+            except requests.RequestException as e:
+                error = OpenAIClientError(f"OpenAI API request failed: {e}")
+            else:
+                self._record_rate_limit(api_key, response.headers)
+                if response.status_code < 400:
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        raise OpenAIClientError(
+                            f"Invalid JSON in OpenAI API response: {e}",
+                            status_code=response.status_code,
+                            response_text=response.text[:500]
+                        ) from e
+
+                error = OpenAIClientError(
+                    f"OpenAI API returned HTTP {response.status_code}: {response.text[:200]}",
+                    status_code=response.status_code,
+                    response_text=response.text
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+                wait = parse_retry_after(response.headers)
+
+            if attempt == retries:
+                raise error
+
+            delay = min(max(wait or 0.0, backoff), self.max_backoff)
+            logger.info("Retrying OpenAI API request",
+                       extra={'metadata': {'path': path, 'attempt': attempt + 1,
+                                           'delay': delay, 'error': str(error)}})
+            self._sleep(delay)
+            backoff *= self.backoff_multiplier
+
+        raise OpenAIClientError("OpenAI API request failed")  # pragma: no cover
+
+    def chat_completion(
+        self,
+        api_key: str,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: Optional[float] = None,
+        timeout: float = 120,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Call the Chat Completions endpoint.
+
+        Args:
+            api_key: OpenAI API key
+            messages: Chat messages
+            model: Model name
+            temperature: Sampling temperature (omitted if None, so the API default applies)
+            timeout: Per-attempt timeout in seconds
+            **kwargs: Extra payload fields (e.g. max_tokens) or request()
+                      options (max_retries, initial_backoff)
+
+        Returns:
+            Full response dictionary (choices, usage, ...)
+        """
+        request_options = {
+            name: kwargs.pop(name)
+            for name in ('max_retries', 'initial_backoff')
+            if name in kwargs
+        }
+        payload = {"model": model, "messages": messages, **kwargs}
+        if temperature is not None:
+            payload["temperature"] = temperature
+        return self.request("POST", "/chat/completions", api_key, json=payload,
+                            timeout=timeout, **request_options)
+
+    async def arequest(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Async variant of request()."""
+        return await asyncio.to_thread(self.request, *args, **kwargs)
+
+    async def achat_completion(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Async variant of chat_completion()."""
+        return await asyncio.to_thread(self.chat_completion, *args, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+
+_shared_client: Optional[OpenAIHTTPClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAIHTTPClient:
+    """
+    Return the process-wide shared client, creating it on first use.
+
+    Returns:
+        Shared OpenAIHTTPClient
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = OpenAIHTTPClient(
+                base_url=os.getenv('OPENAI_API_BASE_URL', OPENAI_API_BASE)
+            )
+        return _shared_client
+
+
+def reset_openai_client() -> None:
+    """Close and drop the shared client (e.g. after changing OPENAI_API_BASE_URL)."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+        _shared_client = None
@@ -0,0 +1,431 @@
+"""
+Columnar table of all run metrics in an experiment.
+
+Every analysis entry point used to walk runs/<framework>/<run_id>/ and
+json.load each metrics.json on its own. load_run_metrics_table() parses each
+file once into NumPy columns and keeps them in a sidecar
+(runs/.run_metrics.npz). On later loads only files whose size or mtime
+changed (new runs, reconciled runs) are parsed again; the rest of the table
+comes from the sidecar.
+
+Columns (one row per run):
+    framework, run_id, source, model            str
+    verification_status                         str  top-level field ('' if missing)
+    reconciliation_status                       str  usage_api_reconciliation.verification_status
+    reconciliation_message                      str  usage_api_reconciliation.verification_message
+    reconciliation_attempts                     int  len(usage_api_reconciliation.attempts)
+    has_aggregate, has_steps                    bool
+    aggregate.<KEY>                             float (NaN if missing or non-numeric)
+    aggregate_present.<KEY>                     bool  key present in aggregate_metrics
+    top.<key> / top_str.<key>                   float / str  other top-level scalars
+    mtime_ns, size                              int  signature of the source file
+
+Step rows (one row per entry of "steps"):
+    run                                         int  row of the run
+    step.<field>                                float (NaN if missing)
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__, component="analysis")
+
+RUN_METRICS_TABLE_FILENAME = ".run_metrics.npz"
+# Bump to force a rebuild of existing sidecars (e.g. when columns change)
+TABLE_FORMAT_VERSION = 1
+
+_STRING_COLUMNS = ('framework', 'run_id', 'source', 'model', 'verification_status',
+                   'reconciliation_status', 'reconciliation_message')
+_INT_COLUMNS = ('reconciliation_attempts', 'mtime_ns', 'size')
+_BOOL_COLUMNS = ('has_aggregate', 'has_steps')
+_SKIPPED_TOP_LEVEL = frozenset({'aggregate_metrics', 'steps', 'usage_api_reconciliation',
+                                'model', 'verification_status'})
+
+Row = Tuple[Dict[str, Any], List[Dict[str, float]]]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def as_json_number(value: float) -> Any:
+    """Table value back to a JSON-style number (int when integral, like the source data)."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _parse_metrics_file(path: Path) -> Optional[Row]:
+    """
+    Parse one metrics.json into a run row and its step rows.
+
+    Returns:
+        (run row, step rows), or None if the file cannot be read
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            metrics = json.load(f)
+        stat = path.stat()
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to read run file {path}: {e}")
+        return None
+    if not isinstance(metrics, dict):
+        logger.warning(f"Failed to read run file {path}: not a JSON object")
+        return None
+
+    reconciliation = metrics.get('usage_api_reconciliation')
+    if not isinstance(reconciliation, dict):
+        reconciliation = {}
+    aggregate = metrics.get('aggregate_metrics')
+    steps = metrics.get('steps')
+
+    row: Dict[str, Any] = {
+        'framework': path.parent.parent.name,
+        'run_id': path.parent.name,
+        'source': str(path),
+        'model': str(metrics.get('model') or ''),
+        'verification_status': str(metrics.get('verification_status') or ''),
+        'reconciliation_status': str(reconciliation.get('verification_status') or ''),
+        'reconciliation_message': str(reconciliation.get('verification_message') or ''),
+        'reconciliation_attempts': len(reconciliation.get('attempts') or []),
+        'has_aggregate': 'aggregate_metrics' in metrics,
+        'has_steps': isinstance(steps, list),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+    }
+    if isinstance(aggregate, dict):
+        for key, value in aggregate.items():
+            row[f'aggregate_present.{key}'] = True
+            row[f'aggregate.{key}'] = float(value) if _is_number(value) else np.nan
+    for key, value in metrics.items():
+        if key in _SKIPPED_TOP_LEVEL:
+            continue
+        if _is_number(value):
+            row[f'top.{key}'] = float(value)
+        elif isinstance(value, str):
+            row[f'top_str.{key}'] = value
+
+    step_rows: List[Dict[str, float]] = []
+    for step in steps if isinstance(steps, list) else []:
+        if isinstance(step, dict):
+            step_rows.append({f'step.{field}': float(value)
+                              for field, value in step.items() if _is_number(value)})
+    return row, step_rows
+
+
+def _default_for(name: str) -> Any:
+    if name in _STRING_COLUMNS or name.startswith('top_str.'):
+        return ''
+    if name in _INT_COLUMNS:
+        return 0
+    if name in _BOOL_COLUMNS or name.startswith('aggregate_present.'):
+        return False
+    return np.nan
+
+
+def _column(name: str, values: Sequence[Any]) -> np.ndarray:
+    if name in _STRING_COLUMNS or name.startswith('top_str.'):
+        return np.array(values, dtype=str) if len(values) else np.array([], dtype='<U1')
+    if name in _INT_COLUMNS or name == 'run':
+        return np.array(values, dtype=np.int64)
+    if name in _BOOL_COLUMNS or name.startswith('aggregate_present.'):
+        return np.array(values, dtype=bool)
+    return np.array(values, dtype=np.float64)
+
+
+class RunMetricsTable:
+    """Run-level and step-level metric columns of an experiment."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], steps: Dict[str, np.ndarray]):
+        """
+        Initialize from column arrays (see module docstring for the layout).
+
+        Args:
+            columns: Run-level columns of equal length
+            steps: Step-level columns of equal length, including 'run'
+        """
+        self.columns = columns
+        self.steps = steps
+        self.steps.setdefault('run', np.array([], dtype=np.int64))
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Row]) -> 'RunMetricsTable':
+        """Build a table from parsed (run row, step rows) pairs."""
+        names = set(_STRING_COLUMNS) | set(_INT_COLUMNS) | set(_BOOL_COLUMNS)
+        step_names = set()
+        for row, step_rows in rows:
+            names.update(row)
+            for step_row in step_rows:
+                step_names.update(step_row)
+
+        columns = {
+            name: _column(name, [row.get(name, _default_for(name)) for row, _ in rows])
+            for name in sorted(names)
+        }
+        run_index = [i for i, (_, step_rows) in enumerate(rows) for _ in step_rows]
+        all_steps = [step_row for _, step_rows in rows for step_row in step_rows]
+        steps = {'run': _column('run', run_index)}
+        for name in sorted(step_names):
+            steps[name] = _column(name, [step_row.get(name, np.nan) for step_row in all_steps])
+        return cls(columns, steps)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[Path]) -> 'RunMetricsTable':
+        """
+        Parse metrics.json files (runs/<framework>/<run_id>/metrics.json).
+
+        Unreadable files are logged and left out.
+        """
+        rows = [row for row in (_parse_metrics_file(Path(path)) for path in paths) if row is not None]
+        return cls.from_rows(rows)
+
+    @classmethod
+    def concat(cls, tables: Sequence['RunMetricsTable']) -> 'RunMetricsTable':
+        """Stack tables (columns missing from a table take their default)."""
+        names = sorted(set().union(*(table.columns for table in tables)))
+        step_names = sorted(set().union(*(table.steps for table in tables)))
+        columns = {}
+        for name in names:
+            parts = [table.columns[name] if name in table.columns
+                     else _column(name, [_default_for(name)] * len(table)) for table in tables]
+            columns[name] = np.concatenate(parts) if parts else _column(name, [])
+        steps = {}
+        offset = 0
+        run_parts = []
+        for table in tables:
+            run_parts.append(table.steps['run'] + offset)
+            offset += len(table)
+        steps['run'] = np.concatenate(run_parts) if run_parts else _column('run', [])
+        for name in step_names:
+            if name == 'run':
+                continue
+            parts = [table.steps[name] if name in table.steps
+                     else np.full(len(table.steps['run']), np.nan) for table in tables]
+            steps[name] = np.concatenate(parts)
+        return cls(columns, steps)
+
+    def take(self, indices: Sequence[int]) -> 'RunMetricsTable':
+        """Rows at indices (in that order), with their steps."""
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = {name: values[indices] for name, values in self.columns.items()}
+        new_position = np.full(len(self), -1, dtype=np.int64)
+        new_position[indices] = np.arange(len(indices))
+        step_mask = new_position[self.steps['run']] >= 0 if len(self) else np.zeros(0, dtype=bool)
+        steps = {name: values[step_mask] for name, values in self.steps.items()}
+        steps['run'] = new_position[steps['run']]
+        order = np.argsort(steps['run'], kind='stable')
+        return RunMetricsTable(columns, {name: values[order] for name, values in steps.items()})
+
+    def where(self, mask: np.ndarray) -> 'RunMetricsTable':
+        """Rows where mask is True."""
+        return self.take(np.flatnonzero(mask))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the table to an .npz file (atomically)."""
+        path = Path(path)
+        arrays = {'meta.version': np.array(TABLE_FORMAT_VERSION)}
+        arrays.update({f'runs/{name}': values for name, values in self.columns.items()})
+        arrays.update({f'steps/{name}': values for name, values in self.steps.items()})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".npz")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['RunMetricsTable']:
+        """Read a table written by save(); None if missing, corrupt or outdated."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data['meta.version']) != TABLE_FORMAT_VERSION:
+                    return None
+                columns = {key[len('runs/'):]: data[key] for key in data.files if key.startswith('runs/')}
+                steps = {key[len('steps/'):]: data[key] for key in data.files if key.startswith('steps/')}
+        except (OSError, ValueError, KeyError) as e:
+            if Path(path).exists():
+                logger.warning(f"Ignoring unreadable run metrics table {path}: {e}")
+            return None
+        return cls(columns, steps)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.columns['run_id'])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def frameworks(self) -> List[str]:
+        """Framework names with at least one run, sorted."""
+        return sorted(set(self.columns['framework'].tolist()))
+
+    def for_framework(self, framework: str) -> 'RunMetricsTable':
+        """Runs of one framework."""
+        return self.where(self.columns['framework'] == framework)
+
+    def row_index(self) -> Dict[Tuple[str, str], int]:
+        """(framework, run_id) → row."""
+        return {key: row for row, key in enumerate(zip(self.columns['framework'].tolist(),
+                                                       self.columns['run_id'].tolist()))}
+
+    def aggregate_keys(self) -> List[str]:
+        """Keys present in at least one run's aggregate_metrics."""
+        return sorted(name[len('aggregate_present.'):] for name, values in self.columns.items()
+                      if name.startswith('aggregate_present.') and values.any())
+
+    def aggregate(self, key: str, default: float = np.nan) -> np.ndarray:
+        """aggregate_metrics[key] per run (default where missing or non-numeric)."""
+        values = self.columns.get(f'aggregate.{key}')
+        if values is None:
+            return np.full(len(self), default, dtype=np.float64)
+        return np.where(np.isnan(values), default, values)
+
+    def aggregate_row(self, row: int) -> Dict[str, Any]:
+        """aggregate_metrics of one run as a dict of numbers (None for non-numeric values)."""
+        result = {}
+        for key in self.aggregate_keys():
+            if self.columns[f'aggregate_present.{key}'][row]:
+                value = self.columns[f'aggregate.{key}'][row]
+                result[key] = None if np.isnan(value) else as_json_number(value)
+        return result
+
+    def top(self, key: str) -> np.ndarray:
+        """Numeric top-level field per run (NaN where missing)."""
+        values = self.columns.get(f'top.{key}')
+        return values if values is not None else np.full(len(self), np.nan)
+
+    def top_str(self, key: str) -> np.ndarray:
+        """String top-level field per run ('' where missing)."""
+        values = self.columns.get(f'top_str.{key}')
+        return values if values is not None else np.full(len(self), '', dtype='<U1')
+
+    def step_slice(self, row: int) -> slice:
+        """Step rows of a run (steps are stored grouped by run, in row order)."""
+        runs = self.steps['run']
+        return slice(int(np.searchsorted(runs, row, side='left')),
+                     int(np.searchsorted(runs, row, side='right')))
+
+    def step(self, field: str) -> np.ndarray:
+        """Step-level field (NaN where missing), aligned with steps['run']."""
+        values = self.steps.get(f'step.{field}')
+        return values if values is not None else np.full(len(self.steps['run']), np.nan)
+
+    def step_sum(self, field: str) -> np.ndarray:
+        """
+        Sum of a step field per run (missing fields count as 0).
+
+        Returns:
+            Per-run sums; NaN for runs without a "steps" list
+        """
+        values = np.nan_to_num(self.step(field), nan=0.0)
+        sums = np.bincount(self.steps['run'], weights=values, minlength=len(self)).astype(np.float64)
+        return np.where(self.columns['has_steps'], sums, np.nan)
+
+    def step_reduce(self, field: str, reducer: np.ufunc, initial: float,
+                    where: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Reduce a step field per run with a ufunc (e.g. np.minimum), ignoring NaN.
+
+        Args:
+            field: Step field name
+            reducer: Binary ufunc applied with reducer.at
+            initial: Value for runs without any (selected) step value
+            where: Optional step mask selecting the steps to include
+
+        Returns:
+            Per-run results
+        """
+        result = np.full(len(self), initial, dtype=np.float64)
+        values = self.step(field)
+        valid = ~np.isnan(values)
+        if where is not None:
+            valid &= where
+        reducer.at(result, self.steps['run'][valid], values[valid])
+        return result
+
+
+def _scan_metrics_files(runs_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """metrics.json path → (mtime_ns, size) for runs/<framework>/<run_id>/metrics.json."""
+    found: Dict[str, Tuple[int, int]] = {}
+    try:
+        framework_entries = list(os.scandir(runs_dir))
+    except OSError:
+        return found
+    for framework_entry in framework_entries:
+        if framework_entry.name.startswith('.') or not framework_entry.is_dir():
+            continue
+        try:
+            run_entries = list(os.scandir(framework_entry.path))
+        except OSError:
+            continue
+        for run_entry in run_entries:
+            if not run_entry.is_dir():
+                continue
+            path = os.path.join(run_entry.path, "metrics.json")
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            found[str(Path(path))] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+def load_run_metrics_table(runs_dir: Path, persist: bool = True) -> RunMetricsTable:
+    """
+    Load the run metrics table of an experiment, parsing only changed files.
+
+    Args:
+        runs_dir: Experiment runs directory (runs/<framework>/<run_id>/)
+        persist: Read and update the runs/.run_metrics.npz sidecar
+
+    Returns:
+        Table with one row per readable metrics.json, ordered by source path
+    """
+    runs_dir = Path(runs_dir)
+    sidecar = runs_dir / RUN_METRICS_TABLE_FILENAME
+    current = _scan_metrics_files(runs_dir)
+
+    cached = RunMetricsTable.load(sidecar) if persist else None
+    reuse: Dict[str, int] = {}
+    if cached is not None:
+        for row, (source, mtime_ns, size) in enumerate(zip(
+                cached['source'].tolist(), cached['mtime_ns'].tolist(), cached['size'].tolist())):
+            if current.get(source) == (mtime_ns, size):
+                reuse[source] = row
+
+    changed = sorted(source for source in current if source not in reuse)
+    parsed = RunMetricsTable.from_files(Path(source) for source in changed)
+    parts = [parsed]
+    if reuse:
+        parts.insert(0, cached.take(list(reuse.values())))
+    table = RunMetricsTable.concat(parts)
+    table = table.take(np.argsort(table['source'], kind='stable'))
+
+    stale = cached is not None and len(cached) != len(reuse)
+    if persist and (changed or stale or cached is None):
+        try:
+            table.save(sidecar)
+        except OSError as e:
+            logger.warning(f"Could not write run metrics table {sidecar}: {e}")
+    logger.info(f"Run metrics table: {len(table)} runs ({len(changed)} parsed, {len(reuse)} reused)")
+    return table
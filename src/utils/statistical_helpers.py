@@ -9,6 +9,9 @@ from typing import Tuple, List
 import numpy as np
 from scipy import stats
 
+from src.utils.bootstrap import bootstrap_distribution, percentile_interval
+from src.utils.rank_statistics import cliffs_delta_ranked
+
 
 def bootstrap_ci(
     data: List[float],
@@ -43,21 +46,11 @@ def bootstrap_ci(
     # Calculate observed statistic
     observed = statistic_fn(data)
     
-    # Generate bootstrap samples
-    rng = np.random.RandomState(random_seed)
-    bootstrap_stats = []
-    
-    for _ in range(n_iterations):
-        sample = rng.choice(data, size=len(data), replace=True)
-        bootstrap_stats.append(statistic_fn(sample))
-    
-    # Calculate percentile-based CI
-    alpha = 1 - confidence_level
-    lower_percentile = (alpha / 2) * 100
-    upper_percentile = (1 - alpha / 2) * 100
-    
-    lower_bound = np.percentile(bootstrap_stats, lower_percentile)
-    upper_bound = np.percentile(bootstrap_stats, upper_percentile)
+    # Resample all iterations at once (vectorized for NumPy reductions)
+    bootstrap_stats = bootstrap_distribution(
+        data, statistic_fn, n_iterations, np.random.RandomState(random_seed)
+    )
+    lower_bound, upper_bound = percentile_interval(bootstrap_stats, confidence_level)
     
     return observed, lower_bound, upper_bound
 
@@ -133,25 +126,8 @@ def cliffs_delta(group1: List[float], group2: List[float]) -> float:
     if len(group1) == 0 or len(group2) == 0:
         raise ValueError("Cannot calculate Cliff's Delta for empty groups")
     
-    # Count comparisons
-    greater = 0
-    less = 0
-    
-    for x in group1:
-        for y in group2:
-            if x > y:
-                greater += 1
-            elif x < y:
-                less += 1
-            # Ties don't contribute
-    
-    total = len(group1) * len(group2)
-    
-    # Avoid division by zero
-    if total == 0:
-        return 0.0
-    
-    return (greater - less) / total
+    # Equivalent to counting dominances over all pairs, computed from ranks
+    return float(cliffs_delta_ranked(group1, group2))
 
 
 def interpret_effect_size(effect_size: float, measure: str = "cohens_d") -> str:
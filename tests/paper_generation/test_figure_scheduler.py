@@ -0,0 +1,91 @@
+"""
+Unit tests for the figure rendering scheduler.
+
+Validates job ordering, failure handling and that parallel rendering
+produces the same Visualization objects as in-process rendering.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.paper_generation.figure_scheduler import RenderJob, render_jobs
+from src.paper_generation.statistical_analyzer import MetricDistribution
+from src.paper_generation.statistical_visualizations import StatisticalVisualizationGenerator
+
+
+class FakeGenerator:
+    """Stands in for StatisticalVisualizationGenerator in serial mode."""
+
+    def plot(self, name):
+        if name.startswith("bad"):
+            raise RuntimeError(f"cannot draw {name}")
+        return f"viz:{name}"
+
+
+def _distribution(metric, group, values):
+    values = np.asarray(values, dtype=float)
+    q1, q3 = np.percentile(values, [25, 75])
+    return MetricDistribution(
+        metric_name=metric, group_name=group, values=values, n_samples=len(values),
+        mean=float(values.mean()), median=float(np.median(values)),
+        std_dev=float(values.std(ddof=1)), min_value=float(values.min()),
+        max_value=float(values.max()), q1=float(q1), q3=float(q3),
+        median_ci_lower=float(values.min()), median_ci_upper=float(values.max()),
+        is_normal=True, has_zero_variance=False
+    )
+
+
+class TestRenderJobs:
+    """Test scheduling semantics."""
+
+    def test_results_in_job_order(self):
+        jobs = [RenderJob('plot', (name,)) for name in ("a", "b", "c")]
+        assert render_jobs(FakeGenerator(), jobs, max_workers=1) == ["viz:a", "viz:b", "viz:c"]
+
+    def test_optional_failure_warns_and_yields_none(self):
+        jobs = [RenderJob('plot', ("a",)), RenderJob('plot', ("bad",), description="bad plot")]
+        with pytest.warns(UserWarning, match="Failed to generate bad plot"):
+            assert render_jobs(FakeGenerator(), jobs, max_workers=1) == ["viz:a", None]
+
+    def test_required_failure_raises(self):
+        jobs = [RenderJob('plot', ("bad1",), required=True), RenderJob('plot', ("ok",))]
+        with pytest.raises(RuntimeError, match="cannot draw bad1"):
+            render_jobs(FakeGenerator(), jobs, max_workers=1)
+
+
+@pytest.mark.slow
+def test_parallel_matches_serial(tmp_path):
+    rng = np.random.default_rng(3)
+    distributions = {
+        metric: [_distribution(metric, group, rng.normal(10 + i, 2, size=8))
+                 for i, group in enumerate(("baes", "chatdev", "ghspec"))]
+        for metric in ("tokens_in", "tokens_out", "api_calls")
+    }
+    jobs = [RenderJob('generate_violin_plot', (metric, dists))
+            for metric, dists in distributions.items()]
+
+    serial = render_jobs(StatisticalVisualizationGenerator(str(tmp_path / "serial")), jobs, max_workers=1)
+    parallel = render_jobs(StatisticalVisualizationGenerator(str(tmp_path / "parallel")), jobs, max_workers=2)
+
+    assert [(v.viz_type, v.metric_name, v.file_path.name, v.caption) for v in parallel] == \
+        [(v.viz_type, v.metric_name, v.file_path.name, v.caption) for v in serial]
+    assert all(v.file_path.exists() and v.file_path.parent.parent.parent.name == "parallel"
+               for v in parallel)
+
+
+def test_unchanged_figure_restored_from_cache(tmp_path):
+    distributions = [_distribution("tokens_in", group, values)
+                     for group, values in (("baes", [1, 2, 3, 5]), ("ghspec", [2, 4, 4, 7]))]
+    jobs = [RenderJob('generate_violin_plot', ("tokens_in", distributions))]
+    generator = StatisticalVisualizationGenerator(str(tmp_path), use_cache=True)
+
+    first, = render_jobs(generator, jobs, max_workers=1)
+    first.file_path.unlink()
+    with patch.object(StatisticalVisualizationGenerator, 'generate_violin_plot') as draw:
+        second, = render_jobs(generator, jobs, max_workers=1)
+
+    draw.assert_not_called()
+    assert second == first
+    assert second.file_path.exists()
@@ -0,0 +1,127 @@
+"""
+Unit tests for incremental and parallel statistical analysis (per-metric findings).
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.paper_generation.statistical_analyzer import StatisticalAnalyzer, metric_seed
+
+
+def _frameworks_data(seed=0, shift_tokens=0.0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i, framework in enumerate(("baes", "chatdev", "ghspec")):
+        tokens = rng.normal(1000 + 200 * i + shift_tokens, 80, size=8)
+        times = rng.normal(60 + 5 * i, 6, size=8)
+        data[framework] = {
+            'num_runs': 8,
+            'runs': [{'run_id': f"{framework}-{k}", 'tokens_in': float(t), 'execution_time': float(s)}
+                     for k, (t, s) in enumerate(zip(tokens, times))],
+            'tokens_in': {'mean': float(tokens.mean())},
+            'execution_time': {'mean': float(times.mean())},
+        }
+    return data
+
+
+def _summary(findings):
+    """Comparable view of findings (dataclasses hold NumPy arrays)."""
+    return (
+        [(d.metric_name, d.group_name, d.mean, d.median_ci_lower, d.median_ci_upper)
+         for d in findings.distributions],
+        [(t.metric_name, tuple(t.groups), t.p_value, t.pvalue_adjusted) for t in findings.statistical_tests],
+        [(e.metric_name, e.group1, e.group2, e.value, e.ci_lower, e.ci_upper) for e in findings.effect_sizes],
+        [(p.metric_name, p.statistical_power, p.recommended_n_per_group) for p in findings.power_analyses],
+        findings.warnings,
+    )
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return tmp_path / "analysis" / ".statistical_state.pkl"
+
+
+def test_unchanged_metrics_are_reused(state_path):
+    StatisticalAnalyzer().analyze_experiment(_frameworks_data(), state_path=state_path)
+    assert state_path.exists()
+
+    changed = _frameworks_data(shift_tokens=150.0)
+    analyzer = StatisticalAnalyzer()
+    with patch.object(analyzer, '_analyze_metric', wraps=analyzer._analyze_metric) as analyze:
+        incremental = analyzer.analyze_experiment(changed, state_path=state_path)
+
+    assert [call.args[0] for call in analyze.call_args_list] == ['tokens_in']
+    full = StatisticalAnalyzer().analyze_experiment(changed)
+    assert _summary(incremental) == _summary(full)
+    assert incremental.metrics_analyzed == full.metrics_analyzed
+
+
+def test_settings_change_recomputes_everything(state_path):
+    StatisticalAnalyzer().analyze_experiment(_frameworks_data(), state_path=state_path)
+
+    analyzer = StatisticalAnalyzer(alpha=0.01)
+    with patch.object(analyzer, '_analyze_metric', wraps=analyzer._analyze_metric) as analyze:
+        analyzer.analyze_experiment(_frameworks_data(), state_path=state_path)
+    assert analyze.call_count == 2
+
+
+def test_metric_results_do_not_depend_on_other_metrics():
+    data = _frameworks_data()
+    both = StatisticalAnalyzer().analyze_experiment(data)
+    alone = StatisticalAnalyzer().analyze_experiment(data, metrics_to_analyze=['tokens_in'])
+
+    tokens_only = tuple(
+        [row for row in part if row[0] == 'tokens_in'] for part in _summary(both)[:4]
+    )
+    assert tokens_only == _summary(alone)[:4]
+
+
+def test_parallel_analysis_matches_serial():
+    data = _frameworks_data()
+    serial = StatisticalAnalyzer().analyze_experiment(data)
+    parallel = StatisticalAnalyzer(analysis_workers=2).analyze_experiment(data)
+
+    assert _summary(parallel) == _summary(serial)
+    assert parallel.metrics_analyzed == serial.metrics_analyzed
+    assert parallel.methodology_text == serial.methodology_text
+
+
+def test_parallel_analysis_falls_back_in_process():
+    analyzer = StatisticalAnalyzer(analysis_workers=2)
+    with patch('src.paper_generation.statistical_analyzer.ProcessPoolExecutor', side_effect=OSError("no fork")):
+        findings = analyzer.analyze_experiment(_frameworks_data())
+    assert _summary(findings) == _summary(StatisticalAnalyzer().analyze_experiment(_frameworks_data()))
+
+
+def test_metrics_get_independent_seeds():
+    assert metric_seed(42, 'tokens_in') == metric_seed(42, 'tokens_in')
+    assert metric_seed(42, 'tokens_in') != metric_seed(42, 'execution_time')
+    assert metric_seed(42, 'tokens_in') != metric_seed(7, 'tokens_in')
+
+    # Identical samples under two metric names are resampled differently
+    data = _frameworks_data()
+    for framework_data in data.values():
+        for run in framework_data['runs']:
+            run['execution_time'] = run['tokens_in']
+        framework_data['execution_time'] = framework_data['tokens_in']
+    findings = StatisticalAnalyzer().analyze_experiment(data)
+
+    cis = {}
+    for e in findings.effect_sizes:
+        cis.setdefault(e.metric_name, []).append((e.value, e.ci_lower, e.ci_upper))
+    assert [ci[0] for ci in cis['tokens_in']] == [ci[0] for ci in cis['execution_time']]
+    assert cis['tokens_in'] != cis['execution_time']
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bad_run_value_skips_only_its_metric(workers):
+    data = _frameworks_data()
+    data['chatdev']['runs'][3]['execution_time'] = "n/a"
+
+    findings = StatisticalAnalyzer(analysis_workers=workers).analyze_experiment(data)
+
+    assert {d.metric_name for d in findings.distributions} == {'tokens_in'}
+    clean = StatisticalAnalyzer().analyze_experiment(data, metrics_to_analyze=['tokens_in'])
+    assert _summary(findings)[:4] == _summary(clean)[:4]
@@ -0,0 +1,175 @@
+"""
+Unit tests for the prose response cache and concurrent section generation.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.paper_generation.exceptions import ConfigValidationError, ProseGenerationError
+from src.paper_generation.models import PaperConfig, SectionContext
+from src.paper_generation.paper_generator import PaperGenerator
+from src.paper_generation.prose_cache import ProseCache, prompt_key
+from src.paper_generation.prose_engine import ProseEngine
+
+
+MESSAGES = [{"role": "user", "content": "Write the abstract"}]
+
+
+@pytest.fixture
+def experiment_dir(tmp_path):
+    exp_dir = tmp_path / "experiment"
+    (exp_dir / "runs").mkdir(parents=True)
+    return exp_dir
+
+
+def _config(experiment_dir, tmp_path, **overrides):
+    settings = dict(experiment_dir=experiment_dir, output_dir=tmp_path / "output",
+                    openai_api_key="test-key", model="gpt-test", temperature=0.3)
+    settings.update(overrides)
+    return PaperConfig(**settings)
+
+
+def _context(section_name="abstract", findings=("Framework A is faster",)):
+    return SectionContext(
+        section_name=section_name,
+        experiment_summary="Comparison of three frameworks",
+        frameworks=["A", "B", "C"],
+        task_description="Build a web application",
+        metrics={},
+        statistical_results={},
+        key_findings=list(findings),
+        num_runs=10,
+    )
+
+
+def _response(text, tokens=100):
+    return {'choices': [{'message': {'content': text}}], 'usage': {'total_tokens': tokens}}
+
+
+class TestPromptKey:
+    """Test what the cache key depends on."""
+
+    def test_key_is_stable(self):
+        assert prompt_key("m", 0.3, 2000, MESSAGES) == prompt_key("m", 0.3, 2000, list(MESSAGES))
+
+    def test_key_changes_with_model_temperature_and_prompt(self):
+        base = prompt_key("m", 0.3, 2000, MESSAGES)
+        assert base != prompt_key("m2", 0.3, 2000, MESSAGES)
+        assert base != prompt_key("m", 0.7, 2000, MESSAGES)
+        assert base != prompt_key("m", 0.3, 1000, MESSAGES)
+        assert base != prompt_key("m", 0.3, 2000, [{"role": "user", "content": "Write the intro"}])
+
+    def test_round_trip(self, tmp_path):
+        cache = ProseCache(tmp_path / "cache")
+        key = prompt_key("m", 0.3, 2000, MESSAGES)
+        assert cache.get(key) is None
+        cache.put(key, "Generated text", 120, "m", 0.3)
+        assert cache.get(key)['content'] == "Generated text"
+        assert cache.get(key)['total_tokens'] == 120
+
+
+class TestProseEngineCache:
+    """Test that unchanged prompts are served from the cache."""
+
+    def test_unchanged_prompt_calls_api_once(self, experiment_dir, tmp_path):
+        client = Mock()
+        client.chat_completion.return_value = _response("Abstract prose")
+        engine = ProseEngine(_config(experiment_dir, tmp_path))
+
+        with patch('src.paper_generation.prose_engine.get_openai_client', return_value=client):
+            first = engine.generate_prose(_context())
+            second = engine.generate_prose(_context())
+            engine.generate_prose(_context(findings=["Framework B is cheaper"]))
+
+        assert first == second
+        assert "Abstract prose" in first
+        assert client.chat_completion.call_count == 2
+        assert engine.cache_hits == 1
+        assert engine.total_tokens_used == 200
+
+    def test_cache_persists_across_engines(self, experiment_dir, tmp_path):
+        client = Mock()
+        client.chat_completion.return_value = _response("Abstract prose")
+        with patch('src.paper_generation.prose_engine.get_openai_client', return_value=client):
+            ProseEngine(_config(experiment_dir, tmp_path)).generate_prose(_context())
+            ProseEngine(_config(experiment_dir, tmp_path)).generate_prose(_context())
+        assert client.chat_completion.call_count == 1
+
+    def test_off_mode_always_calls_api(self, experiment_dir, tmp_path):
+        client = Mock()
+        client.chat_completion.return_value = _response("Abstract prose")
+        engine = ProseEngine(_config(experiment_dir, tmp_path, prose_cache="off"))
+        with patch('src.paper_generation.prose_engine.get_openai_client', return_value=client):
+            engine.generate_prose(_context())
+            engine.generate_prose(_context())
+        assert client.chat_completion.call_count == 2
+        assert not (tmp_path / "output" / ".prose_cache").exists()
+
+
+class TestReplayMode:
+    """Test fully offline generation from the cache."""
+
+    def test_replay_serves_cached_prose_without_api_key(self, experiment_dir, tmp_path):
+        client = Mock()
+        client.chat_completion.return_value = _response("Abstract prose")
+        with patch('src.paper_generation.prose_engine.get_openai_client', return_value=client):
+            recorded = ProseEngine(_config(experiment_dir, tmp_path)).generate_prose(_context())
+
+        with patch.dict('os.environ', {}, clear=True), \
+                patch('src.paper_generation.prose_engine.get_openai_client') as offline:
+            engine = ProseEngine(_config(experiment_dir, tmp_path, openai_api_key=None,
+                                         prose_cache="replay"))
+            assert engine.generate_prose(_context()) == recorded
+            with pytest.raises(ProseGenerationError, match="replay"):
+                engine.generate_prose(_context(section_name="conclusion"))
+        offline.assert_not_called()
+
+    def test_invalid_mode_rejected(self, experiment_dir, tmp_path):
+        with pytest.raises(ConfigValidationError):
+            _config(experiment_dir, tmp_path, prose_cache="sometimes")
+
+
+class TestConcurrentSections:
+    """Test that sections are generated concurrently and assembled in order."""
+
+    def test_sections_overlap_and_keep_order(self, experiment_dir, tmp_path):
+        generator = PaperGenerator.__new__(PaperGenerator)
+        generator.config = _config(experiment_dir, tmp_path, section_workers=3,
+                                   sections=["abstract", "introduction", "conclusion"])
+        generator._generate_section_outline = lambda name, context: f"outline {name}"
+
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def section(name, delay, fail=False):
+            def generate(context):
+                with lock:
+                    running.append(name)
+                    peak.append(len(running))
+                time.sleep(delay)
+                with lock:
+                    running.remove(name)
+                if fail:
+                    raise ProseGenerationError("API down")
+                return f"prose {name}"
+            return Mock(generate=generate)
+
+        generator.section_generators = {
+            'abstract': section('abstract', 0.2),
+            'introduction': section('introduction', 0.1, fail=True),
+            'methodology': section('methodology', 0.0),
+            'conclusion': section('conclusion', 0.0),
+        }
+
+        sections = generator._generate_all_sections(_context())
+
+        assert list(sections) == ['abstract', 'introduction', 'methodology', 'conclusion']
+        assert sections['abstract'] == "prose abstract"
+        assert sections['introduction'].startswith("<!-- ERROR generating introduction")
+        assert sections['methodology'] == "outline methodology"
+        assert sections['conclusion'] == "prose conclusion"
+        assert max(peak) > 1
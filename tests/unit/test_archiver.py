@@ -9,6 +9,9 @@ import tempfile
 import shutil
 import json
 import tarfile
+import hashlib
+import io
+import subprocess
 from pathlib import Path
 from src.orchestrator.archiver import Archiver
 
@@ -522,6 +525,96 @@ class TestArchiveIntegration:
         assert metadata['archive_size_bytes'] > 0
 
 
+
+class TestStreamingArchive:
+    """Test streaming hash, codec selection and sprint de-duplication."""
+    
+    def _sprint_run(self, run_dir):
+        """Create a run directory where sprint 2 carries forward sprint 1's files."""
+        for sprint in (1, 2):
+            artifacts = run_dir / f"sprint_{sprint:03d}" / "generated_artifacts"
+            artifacts.mkdir(parents=True)
+            (artifacts / "models.py").write_text("class Student: pass\n" * 200)
+            (artifacts / "main.py").write_text(f"# sprint {sprint}\n")
+        metrics = run_dir / "metrics.json"
+        metrics.write_text("{}")
+        return metrics
+    
+    def test_streamed_hash_matches_file(self, archiver, sample_workspace, sample_metrics, sample_logs):
+        """The hash computed while writing equals a fresh read of the file."""
+        archive_path = archiver.create_archive(sample_workspace, sample_metrics, sample_logs)
+        
+        expected = hashlib.sha256(archive_path.read_bytes()).hexdigest()
+        assert archiver.compute_hash(archive_path) == expected
+        assert not archive_path.with_name("run.tar.gz.partial").exists()
+    
+    def test_unchanged_sprint_files_stored_once(self, temp_run_dir):
+        """Identical files in later sprints become hard-link members."""
+        archiver = Archiver("dedup_run", temp_run_dir, compression="gzip")
+        metrics = self._sprint_run(temp_run_dir)
+        
+        # Workspace is the run directory itself (sprint architecture)
+        archive_path = archiver.create_archive(temp_run_dir, metrics, {})
+        
+        with tarfile.open(archive_path, 'r:gz') as tar:
+            members = {m.name: m for m in tar.getmembers()}
+            assert not any(name.endswith("run.tar.gz") for name in members)
+            
+            second = members["workspace/sprint_002/generated_artifacts/models.py"]
+            assert second.islnk()
+            assert second.linkname == "workspace/sprint_001/generated_artifacts/models.py"
+            assert members["workspace/sprint_002/generated_artifacts/main.py"].isreg()
+            
+            extract_dir = temp_run_dir.parent / f"{temp_run_dir.name}_extract"
+            tar.extractall(extract_dir, filter="data")
+        
+        restored = extract_dir / "workspace/sprint_002/generated_artifacts/models.py"
+        assert restored.read_text() == "class Student: pass\n" * 200
+        shutil.rmtree(extract_dir)
+    
+    def test_missing_codec_falls_back_to_gzip(self, temp_run_dir, sample_workspace, sample_metrics, monkeypatch):
+        """A configured but unavailable codec falls back to stdlib gzip."""
+        monkeypatch.setattr("src.orchestrator.archiver.shutil.which", lambda name: None)
+        # A zstd-only level is clamped to the gzip range
+        archiver = Archiver("fallback_run", temp_run_dir, compression="zstd", compression_level=19)
+        
+        archive_path = archiver.create_archive(sample_workspace, sample_metrics, {})
+        
+        assert archive_path.name == "run.tar.gz"
+        assert tarfile.is_tarfile(archive_path)
+    
+    @pytest.mark.skipif(shutil.which("zstd") is None, reason="zstd not installed")
+    def test_zstd_codec(self, temp_run_dir, sample_workspace, sample_metrics):
+        """zstd produces a run.tar.zst that decompresses to the same members."""
+        archiver = Archiver("zstd_run", temp_run_dir, compression="zstd", compression_level=3)
+        
+        archive_path = archiver.create_archive(sample_workspace, sample_metrics, {})
+        
+        assert archive_path.name == "run.tar.zst"
+        assert archiver.verify_archive(archive_path, archiver.compute_hash(archive_path))
+        tar_bytes = subprocess.run(["zstd", "-d", "-c", str(archive_path)],
+                                   capture_output=True, check=True).stdout
+        with tarfile.open(fileobj=io.BytesIO(tar_bytes)) as tar:
+            assert "workspace/subdir/file3.txt" in tar.getnames()
+    
+    def test_invalid_codec_rejected(self, temp_run_dir, sample_workspace, sample_metrics):
+        """Unknown codecs raise ValueError."""
+        archiver = Archiver("bad_codec", temp_run_dir, compression="lzma")
+        with pytest.raises(ValueError):
+            archiver.create_archive(sample_workspace, sample_metrics, {})
+    
+    def test_config_validates_compression(self):
+        """Unknown codecs and out-of-range levels are rejected at config load."""
+        from src.orchestrator.config_loader import ConfigValidationError, validate_archive
+        
+        validate_archive({})
+        validate_archive({'compression': 'zstd', 'level': 19})
+        validate_archive({'compression': 'auto', 'level': 9})
+        for bad in ({'compression': 'lzma'}, {'level': 10}, {'compression': 'zstd', 'level': 0},
+                    {'level': '6'}, {'level': True}):
+            with pytest.raises(ConfigValidationError):
+                validate_archive(bad)
+
 if __name__ == "__main__":
     """
     Run archiver unit tests.
@@ -0,0 +1,215 @@
+"""
+Unit tests for the persistent BAEs kernel worker.
+
+Runs the real baes_kernel_wrapper.py in --serve mode against a fake
+`baes` package, so no BAEs installation is required.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.baes_adapter import BAeSAdapter
+from src.adapters.baes_kernel_worker import (
+    WRAPPER_SCRIPT,
+    BAeSKernelWorker,
+    KernelWorkerError,
+    KernelWorkerTimeout
+)
+
+
+FAKE_KERNEL = '''
+import os
+import sys
+import time
+
+INSTANCES = []
+
+
+class EnhancedRuntimeKernel:
+    def __init__(self, context_store_path):
+        self.context_store_path = context_store_path
+        self.calls = 0
+        self._managed_system_manager = self
+        INSTANCES.append(self)
+
+    def stop_servers(self):
+        open(self.context_store_path + ".stopped", "w").close()
+
+    def process_natural_language_request(self, request, start_servers=False):
+        self.calls += 1
+        print("noise that must not corrupt the protocol")
+        if request == "crash":
+            os._exit(3)
+        if request == "hang":
+            time.sleep(60)
+        if request == "fail":
+            raise ValueError("entity not supported")
+        return {
+            "request": request,
+            "start_servers": start_servers,
+            "calls": self.calls,
+            "kernels": len(INSTANCES),
+            "env": os.environ.get("MANAGED_SYSTEM_PATH"),
+        }
+'''
+
+
+@pytest.fixture
+def framework_dir(tmp_path):
+    """Create a fake BAEs framework with a stub kernel."""
+    core = tmp_path / "framework" / "baes" / "core"
+    core.mkdir(parents=True)
+    (tmp_path / "framework" / "baes" / "__init__.py").write_text("")
+    (core / "__init__.py").write_text("")
+    (core / "enhanced_runtime_kernel.py").write_text(textwrap.dedent(FAKE_KERNEL))
+    return tmp_path / "framework"
+
+
+@pytest.fixture
+def worker(framework_dir):
+    """Start a kernel worker using the current interpreter."""
+    worker = BAeSKernelWorker(Path(sys.executable), framework_dir, "test-run")
+    worker.start(timeout=30)
+    yield worker
+    worker.stop(grace_period=2)
+
+
+def test_kernel_stays_warm_between_requests(worker, tmp_path):
+    """Requests on the same context store reuse one kernel instance."""
+    store = str(tmp_path / "context_store.json")
+
+    first = worker.execute("add student", store, True, timeout=30)
+    second = worker.execute("add course", store, False, timeout=30)
+
+    assert first['success'] is True
+    assert first['result']['start_servers'] is True
+    assert second['result']['calls'] == 2
+    assert second['result']['kernels'] == 1
+
+
+def test_new_context_store_gets_new_kernel(worker, tmp_path):
+    """A different context store path (new sprint) replaces the kernel."""
+    worker.execute("a", str(tmp_path / "s1.json"), False, timeout=30)
+    result = worker.execute("b", str(tmp_path / "s2.json"), False, timeout=30)
+
+    assert result['result']['calls'] == 1
+    assert result['result']['kernels'] == 2
+    # The previous sprint's kernel was evicted and its servers stopped
+    assert (tmp_path / "s1.json.stopped").exists()
+    assert not (tmp_path / "s2.json.stopped").exists()
+    assert worker.request({'op': 'ping'}, timeout=5)['result']['kernels'] == 1
+
+
+def test_environment_forwarded(worker, tmp_path, monkeypatch):
+    """Sprint paths set after the worker started reach the kernel."""
+    monkeypatch.setenv("MANAGED_SYSTEM_PATH", "/sprint_002/managed_system")
+    result = worker.execute("x", str(tmp_path / "c.json"), False, timeout=30)
+    assert result['result']['env'] == "/sprint_002/managed_system"
+
+
+def test_kernel_exception_reported(worker, tmp_path):
+    """Kernel errors are returned as failed results, worker stays usable."""
+    result = worker.execute("fail", str(tmp_path / "c.json"), False, timeout=30)
+
+    assert result['success'] is False
+    assert result['error_type'] == 'ValueError'
+    assert worker.ping()
+
+
+def test_crash_raises_worker_error(worker, tmp_path):
+    """A dying worker surfaces as KernelWorkerError."""
+    with pytest.raises(KernelWorkerError):
+        worker.execute("crash", str(tmp_path / "c.json"), False, timeout=30)
+    assert not worker.ping()
+
+
+def test_timeout_raises(worker, tmp_path):
+    """A hung request surfaces as KernelWorkerTimeout."""
+    with pytest.raises(KernelWorkerTimeout):
+        worker.execute("hang", str(tmp_path / "c.json"), False, timeout=0.5)
+
+
+def _adapter(framework_dir, tmp_path, python_path=Path(sys.executable)):
+    adapter = BAeSAdapter({'api_port': 8100, 'ui_port': 8600}, "test-run",
+                          str(tmp_path / "workspace"))
+    adapter.framework_dir = framework_dir
+    adapter.python_path = python_path
+    adapter.database_dir = tmp_path
+    return adapter
+
+
+def test_adapter_falls_back_to_cli_when_worker_cannot_start(framework_dir, tmp_path):
+    """The adapter runs a request through the CLI if no worker could take it."""
+    adapter = _adapter(framework_dir, tmp_path, python_path=tmp_path / "missing-python")
+
+    cli_result = {'success': True, 'result': 'from cli'}
+    with patch.object(BAeSAdapter, '_execute_cli_request',
+                      return_value=cli_result) as cli:
+        assert adapter._execute_kernel_request("add student") == cli_result
+    cli.assert_called_once_with("add student", False)
+
+
+def test_adapter_does_not_replay_request_after_crash(framework_dir, tmp_path):
+    """A worker dying mid-request fails the request instead of replaying it."""
+    adapter = _adapter(framework_dir, tmp_path)
+
+    with patch.object(BAeSAdapter, '_execute_cli_request') as cli:
+        result = adapter._execute_kernel_request("crash")
+        assert result['success'] is False
+        assert "crashed during the request" in result['error']
+
+        result = adapter._execute_kernel_request("add student")
+        assert result == {'success': True, 'result': result['result']}
+        assert result['result']['request'] == "add student"
+    cli.assert_not_called()
+
+    assert adapter.process is adapter.kernel_worker.process
+    adapter.kernel_worker.stop(grace_period=2)
+
+
+def test_responses_match_one_shot_shape(worker, framework_dir, tmp_path):
+    """Warm and one-shot (CLI wrapper) paths return the same response shape."""
+    store = str(tmp_path / "c.json")
+    completed = subprocess.run([sys.executable, str(WRAPPER_SCRIPT), str(framework_dir), store, "fail", "false"],
+                               capture_output=True, text=True, timeout=30)
+    one_shot = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert one_shot['error_type'] == 'ValueError'
+    assert worker.execute("fail", store, False, timeout=30) == one_shot
+    ping = worker.request({'op': 'ping'}, timeout=5)
+    assert set(ping) == {'success', 'result'}
+    assert set(ping['result']) == {'pid', 'kernels'}
+
+
+def test_kernels_evicted_when_run_finishes(framework_dir, tmp_path):
+    """Stopping the adapter evicts warm kernels and stops their servers."""
+    adapter = _adapter(framework_dir, tmp_path)
+    adapter._execute_kernel_request("add student")
+    worker = adapter.kernel_worker
+    assert worker.request({'op': 'ping'}, timeout=5)['result']['kernels'] == 1
+    assert worker.evict(str(tmp_path / "other.json")) == 0
+
+    with patch.object(BAeSAdapter, '_ensure_servers_stopped'), \
+            patch.object(BAeSAdapter, '_archive_managed_system'):
+        adapter.stop()
+
+    assert (tmp_path / "context_store.json.stopped").exists()
+    assert adapter.kernel_worker is None
+    assert not worker.is_alive()
+
+
+def test_adapter_cli_only_when_disabled(tmp_path):
+    """persistent_kernel: false always uses the CLI path."""
+    adapter = BAeSAdapter({'persistent_kernel': False}, "test-run",
+                          str(tmp_path / "workspace"))
+    with patch.object(BAeSAdapter, '_execute_cli_request',
+                      return_value={'success': True}) as cli:
+        adapter._execute_kernel_request("req", start_servers=True)
+    cli.assert_called_once_with("req", True)
+    assert adapter.kernel_worker is None
@@ -0,0 +1,104 @@
+"""
+Unit tests for the vectorized bootstrap engine.
+"""
+
+import numpy as np
+import pytest
+
+from src.analysis.report_generator import bootstrap_aggregate_metrics
+from src.analysis.stopping_rule import bootstrap_ci as stopping_bootstrap_ci
+from src.utils.bootstrap import (
+    bootstrap_distribution,
+    bootstrap_two_sample_distribution,
+    cliffs_delta_rows,
+    cohens_d_rows,
+    percentile_interval
+)
+from src.utils.statistical_helpers import bootstrap_ci, cliffs_delta, cohens_d
+
+
+DATA = [12.0, 15.5, 9.8, 14.2, 11.1, 13.7, 10.4, 16.0]
+
+
+class TestBootstrapDistribution:
+    """Test one-sample resampling."""
+
+    def test_matches_loop_with_same_indices(self):
+        dist = bootstrap_distribution(DATA, 'median', 500, random_state=np.random.RandomState(7))
+        rng = np.random.RandomState(7)
+        indices = rng.randint(0, len(DATA), size=(500, len(DATA)))
+        expected = [np.median(np.asarray(DATA)[row]) for row in indices]
+        np.testing.assert_allclose(dist, expected)
+
+    def test_chunking_does_not_change_result(self):
+        whole = bootstrap_distribution(DATA, 'mean', 1000, random_state=np.random.RandomState(3))
+        chunked = bootstrap_distribution(DATA, 'mean', 1000, random_state=np.random.RandomState(3),
+                                         max_chunk_elements=50)
+        np.testing.assert_allclose(whole, chunked)
+
+    def test_arbitrary_callable_falls_back_to_rows(self):
+        dist = bootstrap_distribution(DATA, lambda sample: max(sample) - min(sample), 200,
+                                      random_state=1)
+        assert dist.shape == (200,)
+        assert (dist >= 0).all()
+
+    def test_empty_data_rejected(self):
+        with pytest.raises(ValueError):
+            bootstrap_distribution([], 'mean', 10)
+
+
+class TestTwoSampleKernels:
+    """Test vectorized effect sizes against the scalar helpers."""
+
+    def test_rows_match_scalar_effect_sizes(self):
+        rng = np.random.default_rng(0)
+        g1 = rng.normal(10, 2, size=(20, 6))
+        g2 = rng.normal(11, 2, size=(20, 5))
+        g2[0] = g1[0, :5]  # ties
+        g1[1] = g2[1, 0]   # zero variance in group 1
+        g2[1] = g2[1, 0]
+        for i in range(20):
+            assert cohens_d_rows(g1, g2)[i] == pytest.approx(cohens_d(list(g1[i]), list(g2[i])))
+            assert cliffs_delta_rows(g1, g2)[i] == pytest.approx(cliffs_delta(list(g1[i]), list(g2[i])))
+
+    def test_callable_failures_become_nan(self):
+        def flaky(a, b):
+            if a[0] > 14:
+                raise ValueError("boom")
+            return float(np.mean(a) - np.mean(b))
+
+        dist = bootstrap_two_sample_distribution(DATA, DATA, flaky, 300, random_state=2)
+        assert np.isnan(dist).any()
+        assert np.isfinite(dist).any()
+
+    def test_unknown_statistic_rejected(self):
+        with pytest.raises(ValueError):
+            bootstrap_two_sample_distribution(DATA, DATA, 'hedges_g', 10)
+
+
+class TestCallers:
+    """Test that existing bootstrap entry points keep their contracts."""
+
+    def test_helpers_bootstrap_ci_is_reproducible(self):
+        first = bootstrap_ci(DATA, random_seed=42)
+        assert first == bootstrap_ci(DATA, random_seed=42)
+        median, lower, upper = first
+        assert median == np.median(DATA)
+        assert lower <= median <= upper
+
+    def test_stopping_rule_ci_contains_mean(self):
+        mean, lower, upper = stopping_bootstrap_ci(DATA, random_state=5)
+        assert mean == pytest.approx(np.mean(DATA))
+        assert lower < mean < upper
+        assert stopping_bootstrap_ci([]) == (0.0, 0.0, 0.0)
+
+    def test_percentile_interval_ignores_nan(self):
+        lower, upper = percentile_interval(np.array([np.nan, *range(101)]), 0.9)
+        assert (lower, upper) == pytest.approx((5.0, 95.0))
+
+    def test_unseeded_callers_follow_global_seed(self):
+        np.random.seed(7)
+        first = (stopping_bootstrap_ci(DATA), bootstrap_aggregate_metrics([{'x': v} for v in DATA]))
+        np.random.seed(7)
+        assert (stopping_bootstrap_ci(DATA), bootstrap_aggregate_metrics([{'x': v} for v in DATA])) == first
+        assert stopping_bootstrap_ci(DATA) != first[0]
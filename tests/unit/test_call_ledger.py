@@ -0,0 +1,107 @@
+"""
+Unit tests for the per-run LLM call ledger and provisional token metrics.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.adapters.base_adapter import BaseAdapter
+from src.orchestrator.metrics_collector import MetricsCollector
+from src.orchestrator.usage_reconciler import BUFFER_SECONDS, UsageReconciler
+from src.utils.call_ledger import (
+    CALL_LEDGER_FILENAME,
+    read_ledger,
+    record_call,
+    summarize_ledger,
+    usage_from_response,
+)
+
+
+def _response(prompt, completion, cached=0):
+    return {
+        'id': 'chatcmpl-1',
+        'model': 'gpt-4o-mini-2024-07-18',
+        'choices': [{'message': {'content': 'ok'}}],
+        'usage': {'prompt_tokens': prompt, 'completion_tokens': completion,
+                  'prompt_tokens_details': {'cached_tokens': cached}},
+    }
+
+
+class _Adapter(BaseAdapter):
+    def start(self): pass
+    def execute_step(self, step_num, command_text): return {}
+    def health_check(self): return True
+    def handle_hitl(self, query): return ""
+    def stop(self): pass
+    def validate_run_artifacts(self): return True, ""
+
+
+def test_usage_from_response_defaults_missing_fields():
+    assert usage_from_response(_response(100, 20, 64)) == \
+        {'prompt_tokens': 100, 'completion_tokens': 20, 'cached_tokens': 64}
+    assert usage_from_response({'usage': {'prompt_tokens': 5}}) == \
+        {'prompt_tokens': 5, 'completion_tokens': 0, 'cached_tokens': 0}
+
+
+def test_summary_totals_calls(tmp_path):
+    record_call(tmp_path, _response(100, 20, 64), 'gpt-4o-mini', 1000.0, 1002.0, step=1)
+    record_call(tmp_path, _response(300, 60), 'gpt-4o-mini', 1005.0, 1006.0, step=2)
+    with open(tmp_path / CALL_LEDGER_FILENAME, 'a') as f:
+        f.write('{"torn": ')
+
+    assert [e['step'] for e in read_ledger(tmp_path / CALL_LEDGER_FILENAME)] == [1, 2]
+    summary = summarize_ledger(tmp_path / CALL_LEDGER_FILENAME)
+    assert summary['TOK_IN'] == 400
+    assert summary['TOK_OUT'] == 80
+    assert summary['API_CALLS'] == 2
+    assert summary['CACHED_TOKENS'] == 64
+    assert (summary['first_call_at'], summary['last_call_at']) == (1000.0, 1006.0)
+    assert summary['output_tokens_per_second'] == pytest.approx(80 / 3)
+    assert summary['models'] == ['gpt-4o-mini-2024-07-18']
+    assert summarize_ledger(tmp_path / "missing.jsonl") is None
+
+
+def test_adapter_call_is_recorded(tmp_path, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY_TEST', 'sk-test')
+    adapter = _Adapter({'api_key_env': 'OPENAI_API_KEY_TEST'}, 'run-1', str(tmp_path),
+                       sprint_num=2, run_dir=tmp_path)
+    adapter.current_step = 3
+    client = MagicMock()
+    client.chat_completion.return_value = _response(120, 30, 100)
+
+    with patch('src.adapters.base_adapter.get_openai_client', return_value=client):
+        assert adapter.call_openai_chat_completion("system", "user") == 'ok'
+    # T063 fail-fast: the shared client must not retry adapter calls
+    assert client.chat_completion.call_args.kwargs['max_retries'] == 0
+
+    [entry] = read_ledger(tmp_path / CALL_LEDGER_FILENAME)
+    assert (entry['prompt_tokens'], entry['cached_tokens'], entry['step'], entry['sprint']) == (120, 100, 3, 2)
+    assert entry['ended_at'] >= entry['started_at']
+
+
+def test_provisional_metrics_and_reconciler_window(tmp_path):
+    cost = {'total_cost': 0.0, 'uncached_input_cost': 0.0, 'cached_input_cost': 0.0,
+            'output_cost': 0.0, 'cache_savings': 0.0, 'model': 'gpt-4o-mini'}
+    with patch('src.orchestrator.metrics_collector.CostCalculator') as calculator, \
+         patch('src.orchestrator.metrics_collector.get_metrics_config'):
+        calculator.return_value.calculate_cost.side_effect = \
+            lambda tokens_in, tokens_out, cached_tokens: {**cost, 'total_cost': (tokens_in + 4 * tokens_out) / 1e6}
+        collector = MetricsCollector('run-1')
+    collector.record_step(1, 90.0, 1700000000, 1700000090)
+    metrics = collector.get_aggregate_metrics(crude_score=12, esr=1.0, mc=1.0, zdi=0)
+    summary = {'TOK_IN': 1000, 'TOK_OUT': 200, 'API_CALLS': 4, 'CACHED_TOKENS': 0,
+               'first_call_at': 1700000000.4, 'last_call_at': 1700000090.2}
+    collector.apply_call_ledger(metrics, summary)
+
+    assert metrics['aggregate_metrics']['TOK_IN'] == 1000
+    assert metrics['aggregate_metrics']['COST_USD'] == pytest.approx(0.0018)
+    assert metrics['aggregate_metrics']['AEI'] > 0
+    assert metrics['provisional_usage']['source'] == 'call_ledger'
+    json.dumps(metrics)
+
+    # The ledger's exact call times take precedence over the (wider) step window
+    metrics['steps'] = [{'start_timestamp': 1699999000, 'end_timestamp': 1700001000}]
+    window = UsageReconciler(runs_dir=tmp_path)._get_run_window(metrics, 'ghspec', 'run-1')
+    assert window == (1700000000 - BUFFER_SECONDS, 1700000091 + BUFFER_SECONDS)
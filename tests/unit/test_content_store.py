@@ -0,0 +1,159 @@
+"""
+Unit tests for content-addressed sprint workspace snapshots.
+"""
+
+import json
+import os
+import tarfile
+
+import pytest
+
+from src.orchestrator.archiver import Archiver
+from src.utils.content_store import (
+    OBJECTS_DIRNAME,
+    ContentStore,
+    IncrementalCopier,
+    clone_file,
+    hash_file,
+    snapshot_sprint
+)
+from src.utils.isolation import create_sprint_workspace
+
+
+def _write_sprint(run_dir, sprint_num, files):
+    _, artifacts = create_sprint_workspace(run_dir, sprint_num)
+    for rel_path, content in files.items():
+        path = artifacts / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return artifacts
+
+
+def test_unchanged_files_share_one_blob(tmp_path):
+    sprint1 = _write_sprint(tmp_path, 1, {"app/models.py": "models v1", "README.md": "readme"})
+    tree1 = snapshot_sprint(tmp_path, 1)
+
+    # Sprint 2 carries models.py forward unchanged and edits README.md
+    sprint2 = _write_sprint(tmp_path, 2, {"README.md": "readme v2"})
+    (sprint2 / "app").mkdir()
+    clone_file(sprint1 / "app/models.py", sprint2 / "app/models.py")
+    tree2 = snapshot_sprint(tmp_path, 2)
+
+    assert tree1['new_blobs'] == 2
+    assert tree2['new_blobs'] == 1
+    assert tree2['new_bytes'] == len("readme v2")
+    assert os.path.samefile(sprint1 / "app/models.py", sprint2 / "app/models.py")
+    assert not os.path.samefile(sprint1 / "README.md", sprint2 / "README.md")
+
+    manifest = json.loads((tmp_path / "sprint_002" / "tree.json").read_text())
+    assert manifest['files']['app/models.py']['sha256'] == hash_file(sprint1 / "app/models.py")
+    assert manifest['root'] == "generated_artifacts"
+
+
+def test_clone_of_blob_is_private_and_writable(tmp_path):
+    sprint1 = _write_sprint(tmp_path, 1, {"database/context_store.json": "{}"})
+    tree = snapshot_sprint(tmp_path, 1)
+
+    store = ContentStore(tmp_path)
+    seeded = tmp_path / "sprint_002" / "generated_artifacts" / "database" / "context_store.json"
+    assert store.materialize(tree, "database/context_store.json", seeded)
+
+    seeded.write_text('{"entities": ["Student"]}')
+    assert (sprint1 / "database/context_store.json").read_text() == "{}"
+    digest = tree['files']['database/context_store.json']['sha256']
+    assert hash_file(store.blob_path(digest)) == digest
+
+
+def test_tree_records_file_mode(tmp_path):
+    sprint1 = _write_sprint(tmp_path, 1, {"run.sh": "#!/bin/sh\n", "app.py": "pass\n"})
+    os.chmod(sprint1 / "run.sh", 0o755)
+    os.chmod(sprint1 / "app.py", 0o644)
+    tree = snapshot_sprint(tmp_path, 1)
+
+    assert tree['files']['run.sh']['mode'] == 0o755
+    assert tree['files']['app.py']['mode'] == 0o644
+    restored = tmp_path / "restored.sh"
+    assert ContentStore(tmp_path).materialize(tree, "run.sh", restored)
+    assert os.stat(restored).st_mode & 0o777 == 0o755
+
+
+def test_late_writer_cannot_corrupt_blob(tmp_path):
+    sprint1 = _write_sprint(tmp_path, 1, {"app.db": "original"})
+    handle = open(sprint1 / "app.db", "a")
+    tree = snapshot_sprint(tmp_path, 1)
+
+    # A process that still has the old file open keeps writing to it
+    handle.write(" + late write")
+    handle.close()
+
+    digest = tree['files']['app.db']['sha256']
+    assert (ContentStore(tmp_path).blob_path(digest)).read_text() == "original"
+
+
+def test_archive_skips_object_store(tmp_path):
+    _write_sprint(tmp_path, 1, {"main.py": "print('hi')"})
+    snapshot_sprint(tmp_path, 1)
+    metrics = tmp_path / "metrics.json"
+    metrics.write_text("{}")
+
+    archive_path = Archiver("run", tmp_path).create_archive(tmp_path, metrics, {})
+
+    with tarfile.open(archive_path, "r:gz") as tar:
+        names = tar.getnames()
+    assert "workspace/sprint_001/generated_artifacts/main.py" in names
+    assert "workspace/sprint_001/tree.json" in names
+    assert not any(OBJECTS_DIRNAME in name for name in names)
+
+
+def test_next_sprint_copies_only_changed_files(tmp_path):
+    output = tmp_path / "framework_output"
+    output.mkdir()
+    (output / "models.py").write_text("models v1")
+    (output / "api.py").write_text("api v1")
+    (output / "touched.py").write_text("same content")
+
+    first = IncrementalCopier(tmp_path, 1)
+    _, sprint1 = create_sprint_workspace(tmp_path, 1)
+    for src in output.iterdir():
+        first.copy(src, sprint1)
+    assert (first.copied, first.reused) == (3, 0)
+    snapshot_sprint(tmp_path, 1)
+
+    (output / "api.py").write_text("api v2")
+    os.utime(output / "touched.py", ns=(1, 1))
+    copier = IncrementalCopier(tmp_path, 2)
+    _, sprint2 = create_sprint_workspace(tmp_path, 2)
+    for src in output.iterdir():
+        copier.copy(src, sprint2 / src.name)
+
+    assert (copier.copied, copier.reused) == (1, 2)
+    assert (sprint2 / "models.py").read_text() == "models v1"
+    assert (sprint2 / "api.py").read_text() == "api v2"
+
+    # The live workspace never shares an inode with blobs or earlier sprints
+    assert not os.path.samefile(sprint1 / "models.py", sprint2 / "models.py")
+    assert os.stat(sprint2 / "models.py").st_nlink == 1
+    assert os.access(sprint2 / "models.py", os.W_OK)
+    (sprint2 / "models.py").write_text("written in place")
+    assert (sprint1 / "models.py").read_text() == "models v1"
+    assert hash_file(sprint1 / "models.py") == hash_file(output / "models.py")
+
+    assert snapshot_sprint(tmp_path, 2)['new_blobs'] == 2
+
+
+def test_config_rejects_non_boolean_snapshot_toggle(tmp_path):
+    from src.orchestrator.config_loader import ConfigValidationError, validate_config
+
+    (tmp_path / "hitl.txt").write_text("")
+    config = {
+        'random_seed': 42, 'prompts_dir': str(tmp_path), 'hitl_path': str(tmp_path / "hitl.txt"),
+        'frameworks': {'baes': {'repo_url': 'x', 'commit_hash': 'y', 'api_port': 8100,
+                                'ui_port': 8600, 'api_key_env': 'KEY'}},
+        'stopping_rule': {'min_runs': 5, 'max_runs': 50, 'confidence_level': 0.95,
+                          'max_half_width_pct': 10, 'metrics': ['TOK_IN']},
+        'timeouts': {'step_timeout_seconds': 600, 'health_check_interval_seconds': 5,
+                     'api_retry_attempts': 3},
+    }
+    validate_config(dict(config, sprint_snapshots=False))
+    with pytest.raises(ConfigValidationError, match="sprint_snapshots"):
+        validate_config(dict(config, sprint_snapshots="no"))
@@ -0,0 +1,106 @@
+"""
+Unit tests for token-budgeted context packing of GHSpec prompts.
+"""
+
+from src.adapters.context_packer import (
+    ContextChunk,
+    ContextIndex,
+    code_chunks,
+    estimate_tokens,
+    markdown_chunks,
+)
+from src.adapters.ghspec_adapter import GHSpecAdapter
+
+SPEC = """# Feature
+
+## Students
+Student entity with name, email and enrollment date.
+
+## Courses
+Course entity with title and credits.
+
+## Authentication
+Login with email and password; tokens expire after one hour.
+"""
+
+
+def _adapter(tmp_path, **config):
+    return GHSpecAdapter({'api_key_env': 'OPENAI_API_KEY_GHSPEC', **config}, 'test-run', str(tmp_path),
+                         sprint_num=2, run_dir=tmp_path)
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_markdown_chunks_split_at_headers():
+    chunks = markdown_chunks(SPEC, "spec.md")
+    assert [c.text.split('\n')[0] for c in chunks] == ["# Feature", "## Students", "## Courses", "## Authentication"]
+    assert [c.position for c in chunks] == [0, 1, 2, 3]
+
+
+class TestPack:
+    """Test ranking and greedy packing."""
+
+    def test_most_relevant_chunks_in_document_order(self):
+        index = ContextIndex(markdown_chunks(SPEC, "spec.md"))
+        packed = index.pack("models/student.py student enrollment email", budget_tokens=500)
+        assert [c.text.split('\n')[0] for c in packed] == ["## Students", "## Authentication"]
+        assert index.pack("unrelated words", budget_tokens=500) == []
+
+    def test_budget_skips_chunks_that_do_not_fit(self):
+        chunks = [ContextChunk("a.md", "alpha " * 40, 0), ContextChunk("b.md", "alpha beta", 1),
+                  ContextChunk("c.md", "alpha " * 8, 2)]
+        packed = ContextIndex(chunks).pack("alpha beta", budget_tokens=20)
+        assert [c.source for c in packed] == ["b.md", "c.md"]
+        assert sum(c.tokens for c in packed) <= 20
+
+    def test_oversized_best_chunk_is_truncated(self):
+        packed = ContextIndex([ContextChunk("a.md", "student " * 200)]).pack("student", budget_tokens=50)
+        assert len(packed) == 1
+        assert packed[0].tokens <= 50
+        assert packed[0].text.endswith("[... excerpt truncated ...]")
+
+    def test_target_file_is_boosted(self, tmp_path):
+        (tmp_path / "models").mkdir()
+        (tmp_path / "models" / "course.py").write_text("class Course:\n    student_ids = []\n", encoding='utf-8')
+        (tmp_path / "models" / "student.py").write_text("class Student:\n    pass\n", encoding='utf-8')
+        index = ContextIndex(code_chunks(tmp_path, ["models", "api"], [".py"]))
+        scores = index.score("student ids", target_file="models/student.py")
+        assert scores[1] > scores[0]
+        assert index.chunks[1].text.startswith("File: models/student.py (lines 1-2)\n```")
+
+
+def test_excerpts_are_packed_and_indexed_once(tmp_path):
+    adapter = _adapter(tmp_path, excerpt_budget_tokens=25)
+    task = {'file': 'models/course.py', 'description': 'Course model', 'goal': 'credits and title'}
+
+    excerpt = adapter._extract_relevant_section(SPEC, task, "spec.md")
+    assert excerpt.startswith("## Courses") and "Students" not in excerpt
+    assert estimate_tokens(excerpt) <= 25
+    adapter._extract_relevant_section(SPEC, task, "spec.md")
+    assert len(adapter._context_indexes) == 1
+    assert "Authentication" in adapter._extract_spec_excerpt(SPEC, "api/auth.py", "password token expired")
+    assert adapter._extract_spec_excerpt(SPEC, "x.py", "zzz") == "Refer to general specification requirements"
+
+
+def test_previous_sprint_code_stays_within_budget(tmp_path):
+    adapter = _adapter(tmp_path, previous_code_budget_tokens=200)
+    previous = tmp_path / "sprint_001" / "generated_artifacts"
+    (previous / "models").mkdir(parents=True)
+    for n in range(50):
+        (previous / "models" / f"entity{n}.py").write_text(f"class Entity{n}:\n" + "    field = 1\n" * 20,
+                                                          encoding='utf-8')
+    (previous / "models" / "invoice.py").write_text("class Invoice:\n    total = 0\n", encoding='utf-8')
+
+    context = adapter._get_previous_sprint_context()
+    assert estimate_tokens(context['code_files']) <= 200
+    assert context['code_summary'].endswith("- ... and 11 more files")
+    assert adapter._get_previous_sprint_context() is context
+
+    tasks = [{'file': 'api/invoices.py', 'description': 'Invoice endpoints using Invoice model'}]
+    incremental = adapter._incremental_task_context(tasks)
+    assert "File: models/invoice.py" in incremental
+    assert estimate_tokens(adapter._pack_previous_code("Invoice entity0 entity1 entity2")) <= 200
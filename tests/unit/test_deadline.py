@@ -0,0 +1,151 @@
+"""
+Unit tests for thread/process-safe deadline enforcement.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from src.adapters.base_adapter import BaseAdapter
+from src.orchestrator.runner import OrchestratorRunner, StepTimeoutError
+from src.utils.deadline import (
+    DeadlineExceeded,
+    StepCancelled,
+    run_with_deadline,
+    terminate_process_tree
+)
+
+
+def test_returns_result_before_deadline():
+    """Fast calls return their value unchanged."""
+    assert run_with_deadline(lambda a, b: a + b, 5, 2, b=3) == 5
+
+
+def test_propagates_exceptions():
+    """Exceptions from the guarded call reach the caller."""
+    def fail():
+        raise ValueError("bad step")
+
+    with pytest.raises(ValueError, match="bad step"):
+        run_with_deadline(fail, 5)
+
+
+def test_raises_with_elapsed_time():
+    """A hung call is abandoned at the deadline with the elapsed time."""
+    release = threading.Event()
+
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        run_with_deadline(release.wait, 0.2, 10)
+    release.set()
+
+    assert 0.2 <= exc_info.value.elapsed_seconds < 5
+
+
+def test_works_off_main_thread():
+    """Deadlines are enforced from worker threads (SIGALRM could not)."""
+    errors = []
+
+    def worker():
+        try:
+            run_with_deadline(time.sleep, 0.1, 5)
+        except DeadlineExceeded as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+
+
+def test_terminate_process_group():
+    """SIGTERM is sent to the process group of a session leader."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(60)"],
+        start_new_session=True
+    )
+    terminate_process_tree(process, grace_period=5)
+    assert process.poll() is not None
+
+
+def test_escalates_to_kill():
+    """Processes ignoring SIGTERM are killed after the grace period."""
+    process = subprocess.Popen(
+        [sys.executable, "-c",
+         "import signal, time, sys\n"
+         "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+         "print('ready', flush=True)\n"
+         "time.sleep(60)"],
+        stdout=subprocess.PIPE,
+        start_new_session=True
+    )
+    process.stdout.readline()
+
+    start = time.monotonic()
+    terminate_process_tree(process, grace_period=0.5)
+
+    assert process.returncode == -9
+    assert time.monotonic() - start < 10
+    process.stdout.close()
+
+
+def test_terminate_ignores_missing_process():
+    """None and already-exited processes are a no-op."""
+    terminate_process_tree(None, grace_period=1)
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    terminate_process_tree(process, grace_period=1)
+
+
+def test_cancels_on_timeout_and_reports_abandoned_calls():
+    """on_timeout runs at the deadline; still_running tells whether the call unwound."""
+    cancel = threading.Event()
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        run_with_deadline(cancel.wait, 0.1, 10, on_timeout=cancel.set, cancel_grace=5)
+    assert not exc_info.value.still_running
+
+    release = threading.Event()
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        run_with_deadline(release.wait, 0.1, 10, on_timeout=lambda: None, cancel_grace=0.1)
+    assert exc_info.value.still_running
+    release.set()
+
+
+class _Adapter(BaseAdapter):
+    def start(self): pass
+    def execute_step(self, step_num, command_text):
+        return self.run_child_process([sys.executable, "-c", "import time; time.sleep(60)"])
+    def health_check(self): return True
+    def handle_hitl(self, query): return ""
+    def stop(self): pass
+    def validate_run_artifacts(self): return True, ""
+
+
+def test_timed_out_step_is_killed_and_not_retried(tmp_path, monkeypatch):
+    """Child processes of a timed-out step are killed; abandoned steps are never retried."""
+    adapter = _Adapter({}, 'run-1', str(tmp_path))
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        run_with_deadline(adapter.execute_step, 0.5, 1, "cmd",
+                          on_timeout=lambda: adapter.cancel(grace_period=5), cancel_grace=10)
+    assert not exc_info.value.still_running
+    assert not adapter._child_processes
+    with pytest.raises(StepCancelled):
+        adapter.raise_if_cancelled()
+
+    runner = OrchestratorRunner.__new__(OrchestratorRunner)
+    runner.run_id, runner.adapter = 'run-1', adapter
+    attempts = []
+
+    def abandoned(step_num, command_text):
+        attempts.append(step_num)
+        raise StepTimeoutError("timed out", elapsed_seconds=1.0, abandoned=True)
+
+    monkeypatch.setattr(runner, '_execute_step_with_timeout', abandoned)
+    with pytest.raises(StepTimeoutError):
+        runner._execute_step_with_retry(1, "cmd")
+    assert attempts == [1]
@@ -0,0 +1,105 @@
+"""
+Unit tests for the content-hash figure cache.
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+
+from src.analysis.visualization_factory import VisualizationFactory
+from src.utils.figure_cache import FigureCache, figure_key
+
+
+class TestFigureKey:
+    """Test canonical hashing of figure inputs."""
+
+    def test_key_ignores_dict_order_and_container_type(self):
+        a = figure_key('box', {'baes': [1.0, 2.0], 'ghspec': [3.0]}, {'title': 'T'})
+        b = figure_key('box', {'ghspec': (3.0,), 'baes': [1.0, 2.0]}, {'title': 'T'})
+        assert a == b
+
+    def test_key_changes_with_data_params_and_code(self):
+        base = figure_key('box', {'baes': np.array([1.0, 2.0])}, {'title': 'T'}, "code-v1")
+        assert base == figure_key('box', {'baes': np.array([1.0, 2.0])}, {'title': 'T'}, "code-v1")
+        assert base != figure_key('box', {'baes': np.array([1.0, 2.5])}, {'title': 'T'}, "code-v1")
+        assert base != figure_key('box', {'baes': np.array([1.0, 2.0])}, {'title': 'U'}, "code-v1")
+        assert base != figure_key('box', {'baes': np.array([1.0, 2.0])}, {'title': 'T'}, "code-v2")
+        assert base != figure_key('violin', {'baes': np.array([1.0, 2.0])}, {'title': 'T'}, "code-v1")
+
+    def test_key_changes_with_style(self):
+        import matplotlib
+        before = figure_key('box', [1.0])
+        with matplotlib.rc_context({'font.size': 23}):
+            assert figure_key('box', [1.0]) != before
+
+
+class TestFigureCache:
+    """Test storing, restoring and evicting rendered figures."""
+
+    def test_round_trip(self, tmp_path):
+        cache = FigureCache(tmp_path / "cache")
+        out = tmp_path / "out"
+        (out / "sub").mkdir(parents=True)
+        (out / "sub" / "plot.svg").write_text("<svg/>")
+
+        assert cache.restore("ab" * 32, out) is None
+        cache.store("ab" * 32, [out / "sub" / "plot.svg"], out, {'caption': "c"})
+
+        target = tmp_path / "elsewhere"
+        assert cache.restore("ab" * 32, target) == {'caption': "c"}
+        assert (target / "sub" / "plot.svg").read_text() == "<svg/>"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = FigureCache(tmp_path / "cache", max_bytes=2500)
+        src = tmp_path / "src"
+        src.mkdir()
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            path = src / f"fig{i}.png"
+            path.write_bytes(b"x" * 1000)
+            cache.store(key, [path], src)
+            manifest = cache.cache_dir / key[:2] / key / "entry.json"
+            os.utime(manifest, (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so the second one becomes least recently used
+        assert cache.restore(keys[0], tmp_path / "restored") is not None
+
+        assert cache.evict() == 1
+        assert cache.restore(keys[1], tmp_path / "restored") is None
+        assert cache.restore(keys[0], tmp_path / "restored") is not None
+        assert cache.restore(keys[2], tmp_path / "restored") is not None
+
+
+class TestVisualizationFactoryCache:
+    """Test that unchanged charts are not redrawn."""
+
+    def test_unchanged_chart_is_restored(self, tmp_path):
+        config = {'visualizations': {'radar_chart': {
+            'enabled': True, 'metrics': ['TOK_IN'], 'filename': 'radar.svg'}}}
+        data = {'baes': {'TOK_IN': 100.0}, 'ghspec': {'TOK_IN': 120.0}}
+
+        def draw(chart_data, output_file, **kwargs):
+            with open(output_file, 'w') as f:
+                f.write(repr(chart_data))
+
+        calls = []
+
+        def chart(*args, **kwargs):
+            calls.append(1)
+            draw(*args, **kwargs)
+
+        output_dir = str(tmp_path / "analysis")
+        with patch.dict(VisualizationFactory.CHART_REGISTRY, {'radar_chart': chart}):
+            factory = VisualizationFactory(config)
+            assert factory.generate_all({}, aggregated_data=data, output_dir=output_dir) == {'radar_chart': True}
+            (tmp_path / "analysis" / "radar.svg").unlink()
+
+            # Unchanged data: restored from the cache without drawing
+            assert factory.generate_all({}, aggregated_data=data, output_dir=output_dir) == {'radar_chart': True}
+            assert len(calls) == 1
+            assert (tmp_path / "analysis" / "radar.svg").exists()
+
+            data['ghspec'] = {'TOK_IN': 130.0}
+            factory.generate_all({}, aggregated_data=data, output_dir=output_dir)
+            assert len(calls) == 2
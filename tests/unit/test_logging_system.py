@@ -5,7 +5,17 @@ Unit tests for the per-run, per-step logging system.
 import json
 import tempfile
 from pathlib import Path
-from src.utils.logger import LogContext, get_logger
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.logger import (
+    LogContext,
+    disable_async_logging,
+    enable_async_logging,
+    flush_logs,
+    get_logger,
+)
 
 
 class TestLogContext:
@@ -244,3 +254,72 @@ class TestLoggerFallback:
         
         # Should work but not create any files
         # (logs go to console only)
+
+
+class TestAsyncLogging:
+    """Tests for the queue-based background writer."""
+    
+    def teardown_method(self):
+        disable_async_logging()
+    
+    def test_records_written_on_step_boundary(self):
+        """Test that queued records reach their step file when the step changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs_dir = Path(tmpdir) / "logs"
+            context = LogContext.get_instance()
+            context.set_run_context(run_id="async-run", framework="baes", logs_dir=logs_dir)
+            enable_async_logging()
+            
+            logger = get_logger("test.async", component="adapter")
+            context.set_step_context(1)
+            for i in range(100):
+                logger.debug("Copied artifact: file_%d.py", i, extra={'step': 1})
+            context.set_step_context(2)
+            logger.info("Step 2 message")
+            context.clear_step_context()
+            
+            step1_lines = (logs_dir / "step_001" / "adapter.log").read_text().splitlines()
+            assert [json.loads(line)['message'] for line in step1_lines] == \
+                [f"Copied artifact: file_{i}.py" for i in range(100)]
+            assert "Step 2 message" in (logs_dir / "step_002" / "adapter.log").read_text()
+    
+    def test_lru_closes_handles_without_losing_records(self):
+        """Test that evicted file handles are reopened in append mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logs_dir = Path(tmpdir) / "logs"
+            context = LogContext.get_instance()
+            context.set_run_context(run_id="async-run", framework="baes", logs_dir=logs_dir)
+            context.set_step_context(1)
+            enable_async_logging(max_open_files=1)
+            
+            loggers = [get_logger("test.lru", component=component)
+                       for component in ("adapter", "metrics", "validator")]
+            for round_num in range(3):
+                for logger in loggers:
+                    logger.info(f"round {round_num}")
+            flush_logs()
+            
+            for component in ("adapter", "metrics", "validator"):
+                content = (logs_dir / "step_001" / f"{component}.log").read_text()
+                assert [json.loads(line)['message'] for line in content.splitlines()] == \
+                    ["round 0", "round 1", "round 2"]
+            context.clear_step_context()
+    
+    @pytest.mark.parametrize("setting,enabled", [(None, True), ("0", False)])
+    def test_single_run_switches_async_logging(self, monkeypatch, setting, enabled):
+        """Test that execute_single_run honours BAES_ASYNC_LOGS before loading config."""
+        from src.orchestrator.runner import OrchestratorRunner
+        
+        if setting is None:
+            monkeypatch.delenv("BAES_ASYNC_LOGS", raising=False)
+        else:
+            monkeypatch.setenv("BAES_ASYNC_LOGS", setting)
+        
+        with patch('src.orchestrator.runner.enable_async_logging') as enable, \
+                patch('src.orchestrator.runner.load_config',
+                      side_effect=RuntimeError("config unavailable")):
+            result = OrchestratorRunner('baes', 'missing.yaml').execute_single_run()
+        
+        assert enable.called is enabled
+        assert result['status'] == 'failed'
+        assert result['error'] == "config unavailable"
@@ -0,0 +1,120 @@
+"""
+Unit tests for the SQLite-backed manifest store and manifest_manager API.
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.orchestrator.manifest_manager import export_manifest, find_runs, get_manifest, update_manifest
+from src.orchestrator.manifest_store import ManifestStore
+
+
+def _entry(run_id, framework="baes", status="pending", tokens=0):
+    return {"run_id": run_id, "framework": framework, "path": f"{framework}/{run_id}",
+            "start_time": "2025-10-01T00:00:00Z", "end_time": None,
+            "verification_status": status, "total_tokens_in": tokens, "total_tokens_out": 0}
+
+
+def _update_many(cwd, framework, count):
+    os.chdir(cwd)
+    for i in range(count):
+        update_manifest({"run_id": f"{framework}-{i}", "framework": framework,
+                         "start_time": "2025-10-01T00:00:00Z"})
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ManifestStore(tmp_path / "runs" / "manifest.json")
+    yield store
+    store.close()
+
+
+def test_upsert_and_export_are_json_compatible(store):
+    assert store.upsert(_entry("r1")) is True
+    assert store.upsert(_entry("r2", framework="ghspec")) is True
+    assert store.upsert(_entry("r1", status="verified", tokens=100)) is False
+
+    # Writes do not rewrite manifest.json; it is exported on demand
+    assert not store.manifest_path.exists()
+    store.export()
+    manifest = json.loads(store.manifest_path.read_text())
+    assert manifest["total_runs"] == 2
+    assert manifest["frameworks"] == {"chatdev": 0, "baes": 1, "ghspec": 1}
+    assert [r["run_id"] for r in manifest["runs"]] == ["r1", "r2"]
+    assert manifest["runs"][0]["verification_status"] == "verified"
+    assert manifest["runs"][0]["total_tokens_in"] == 100
+
+
+def test_indexed_queries(store):
+    store.upsert(_entry("a", "baes", "verified", tokens=500))
+    store.upsert(_entry("b", "baes", "pending", tokens=50))
+    store.upsert(_entry("c", "chatdev", "verified", tokens=900))
+
+    assert [r["run_id"] for r in store.find(framework="baes")] == ["a", "b"]
+    assert [r["run_id"] for r in store.find(verification_status="verified")] == ["a", "c"]
+    assert [r["run_id"] for r in store.find(min_tokens=100)] == ["a", "c"]
+    assert store.get("b")["framework"] == "baes"
+    assert store.get("missing") is None
+
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE verification_status = ?", ("x",)
+    ).fetchall()
+    assert "idx_runs_verification_status" in str([tuple(row) for row in plan])
+
+
+def test_external_json_edits_are_imported(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"runs": [
+        {**_entry("legacy"), "note": "kept"}
+    ]}))
+
+    with ManifestStore(manifest_path) as store:
+        assert store.get("legacy")["note"] == "kept"
+        store.upsert(_entry("new"))
+        store.export()
+
+    # Hand edit after the store's last export
+    manifest = json.loads(manifest_path.read_text())
+    manifest["runs"][0]["verification_status"] = "verified"
+    manifest_path.write_text(json.dumps(manifest, indent=4))
+
+    with ManifestStore(manifest_path) as store:
+        assert store.get("legacy")["verification_status"] == "verified"
+        assert store.get("new") is not None
+
+
+def test_concurrent_writers_do_not_lose_updates(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ctx = multiprocessing.get_context("spawn")
+    processes = [ctx.Process(target=_update_many, args=(str(tmp_path), fw, 15))
+                 for fw in ("baes", "chatdev", "ghspec")]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    manifest = get_manifest()
+    assert manifest["total_runs"] == 45
+    assert len(find_runs(framework="chatdev")) == 15
+    export_manifest()
+    assert json.loads((tmp_path / "runs" / "manifest.json").read_text())["total_runs"] == 45
+
+
+def test_editing_a_stale_export_keeps_unexported_runs(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    with ManifestStore(manifest_path) as store:
+        store.upsert(_entry("old"))
+        store.export()
+        store.upsert(_entry("unexported"))
+
+    manifest = json.loads(manifest_path.read_text())
+    manifest["runs"][0]["verification_status"] = "verified"
+    manifest_path.write_text(json.dumps(manifest))
+
+    with ManifestStore(manifest_path) as store:
+        assert store.get("old")["verification_status"] == "verified"
+        assert store.get("unexported") is not None
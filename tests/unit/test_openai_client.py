@@ -0,0 +1,200 @@
+"""
+Unit tests for the shared OpenAI HTTP client.
+
+Runs against a local mock HTTP server (no network access, no real API keys).
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.openai_client import (
+    OpenAIClientError,
+    OpenAIHTTPClient,
+    parse_duration,
+    parse_retry_after
+)
+
+
+class MockOpenAIServer:
+    """Local HTTP/1.1 server answering with a queue of scripted responses."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+        self.client_ports = []
+        self.active = 0
+        self.max_active = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                with mock.lock:
+                    mock.requests.append({
+                        'path': self.path,
+                        'auth': self.headers.get('Authorization'),
+                        'body': json.loads(body) if body else None
+                    })
+                    mock.client_ports.append(self.client_address[1])
+                    mock.active += 1
+                    mock.max_active = max(mock.max_active, mock.active)
+                    status, headers, payload = (
+                        mock.responses.pop(0) if mock.responses
+                        else (200, {}, {'choices': [{'message': {'content': 'ok'}}]})
+                    )
+                time.sleep(mock.delay)
+                with mock.lock:
+                    mock.active -= 1
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def server():
+    mock = MockOpenAIServer()
+    yield mock
+    mock.stop()
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def client(server, sleeps):
+    client = OpenAIHTTPClient(base_url=server.url, sleep=sleeps.append,
+                              initial_backoff=1, max_concurrency_per_key=2)
+    yield client
+    client.close()
+
+
+def test_chat_completion_payload(client, server):
+    """Payload and auth header are sent; temperature is omitted when None."""
+    result = client.chat_completion("sk-test", [{"role": "user", "content": "hi"}],
+                                    model="gpt-4o-mini", max_tokens=10)
+
+    assert result['choices'][0]['message']['content'] == 'ok'
+    request = server.requests[0]
+    assert request['path'] == '/v1/chat/completions'
+    assert request['auth'] == 'Bearer sk-test'
+    assert request['body']['model'] == 'gpt-4o-mini'
+    assert request['body']['max_tokens'] == 10
+    assert 'temperature' not in request['body']
+
+
+def test_connections_are_reused(client, server):
+    """Sequential calls reuse one keep-alive connection."""
+    for _ in range(5):
+        client.request("GET", "/models", "sk-test")
+
+    assert len(set(server.client_ports)) == 1
+
+
+def test_retries_rate_limit_using_headers(client, server, sleeps):
+    """429 responses are retried after the server-requested delay."""
+    server.responses = [
+        (429, {'retry-after-ms': '2500'}, {'error': {'message': 'slow down'}}),
+        (503, {}, {'error': {'message': 'unavailable'}}),
+    ]
+
+    result = client.request("GET", "/models", "sk-test")
+
+    assert result == {'choices': [{'message': {'content': 'ok'}}]}
+    # Rate-limit header wins over backoff (2.5 > 1), then plain backoff (2)
+    assert sleeps == [2.5, 2]
+
+
+def test_non_retryable_error_raises_immediately(client, server, sleeps):
+    """4xx errors other than 408/409/429 are not retried."""
+    server.responses = [(401, {}, {'error': {'message': 'missing api.usage.read'}})]
+
+    with pytest.raises(OpenAIClientError) as exc_info:
+        client.request("GET", "/organization/usage/completions", "sk-test")
+
+    assert exc_info.value.status_code == 401
+    assert 'api.usage.read' in exc_info.value.response_text
+    assert sleeps == []
+    assert len(server.requests) == 1
+
+
+def test_retries_exhausted(client, server):
+    """The last error is raised once retries are used up."""
+    server.responses = [(500, {}, {})] * 3
+
+    with pytest.raises(OpenAIClientError):
+        client.request("GET", "/models", "sk-test", max_retries=2)
+    assert len(server.requests) == 3
+
+
+def test_async_calls_respect_per_key_limit(client, server):
+    """Concurrent async calls are capped per API key."""
+    server.delay = 0.1
+
+    async def run():
+        return await asyncio.gather(*[
+            client.achat_completion("sk-test", [], model="m") for _ in range(6)
+        ])
+
+    results = asyncio.run(run())
+
+    assert len(results) == 6
+    assert server.max_active == 2
+
+
+def test_exhausted_quota_pauses_key(client, server, sleeps):
+    """Remaining quota of zero delays the next request until the reset."""
+    server.responses = [
+        (200, {'x-ratelimit-remaining-requests': '0',
+               'x-ratelimit-reset-requests': '3s'}, {}),
+    ]
+
+    client.request("GET", "/models", "sk-test")
+    client.request("GET", "/models", "sk-test")
+
+    assert len(sleeps) == 1
+    assert 2.5 < sleeps[0] <= 3
+
+
+def test_parse_rate_limit_headers():
+    """Reset durations and Retry-After variants are understood."""
+    assert parse_duration("6m0s") == 360
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+    assert parse_retry_after({'retry-after': '7'}) == 7
+    assert parse_retry_after({'x-ratelimit-reset-requests': '1s',
+                              'x-ratelimit-reset-tokens': '4s'}) == 4
+    assert parse_retry_after({}) is None
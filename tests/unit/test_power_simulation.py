@@ -0,0 +1,66 @@
+"""
+Unit tests for the batched Monte Carlo power simulation.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from src.paper_generation.statistical_analyzer import StatisticalAnalyzer
+from src.utils.power_simulation import simulate_power, t_test_p_value
+
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(7)
+    return rng.lognormal(3.0, 0.5, size=12), rng.lognormal(3.4, 0.5, size=10)
+
+
+@pytest.mark.parametrize("equal_var", [True, False])
+def test_t_test_p_values_match_scipy(equal_var):
+    rng = np.random.default_rng(3)
+    x = rng.normal(0, 1, size=(50, 8))
+    y = rng.normal(0.5, 2, size=(50, 11))
+    expected = stats.ttest_ind(x, y, axis=1, equal_var=equal_var).pvalue
+    np.testing.assert_allclose(t_test_p_value(x, y, equal_var=equal_var), expected)
+
+
+@pytest.mark.parametrize("size", [5, None])
+def test_mann_whitney_power_matches_scipy_loop(groups, size):
+    x, y = groups[0][:size], groups[1][:size]
+    rng = np.random.RandomState(0)
+    rejections = 0
+    for _ in range(2000):
+        p = stats.mannwhitneyu(rng.choice(x, len(x)), rng.choice(y, len(y))).pvalue
+        rejections += p < 0.05
+
+    estimate = simulate_power(x, y, n_simulations=20000, random_state=1)
+    assert estimate.n_simulations == 20000
+    assert estimate.power == pytest.approx(rejections / 2000, abs=0.04)
+
+
+def test_early_stop_bounds_monte_carlo_error(groups):
+    x, y = groups
+    estimate = simulate_power(x, y, test='welch', n_simulations=50000,
+                              random_state=2, tolerance=0.01, batch_size=500)
+    assert estimate.n_simulations < 50000
+    assert estimate.n_simulations % 500 == 0
+    assert estimate.mc_half_width <= 0.01
+
+
+def test_reproducible_and_validated(groups):
+    x, y = groups
+    assert simulate_power(x, y, random_state=5) == simulate_power(x, y, random_state=5)
+    with pytest.raises(ValueError, match="Unknown"):
+        simulate_power(x, y, test='kruskal')
+    with pytest.raises(ValueError, match="at least 2"):
+        simulate_power([1.0], y, test='t_test')
+
+
+def test_analyzer_power_is_deterministic_for_seed(groups):
+    x, y = groups
+    analyzer = StatisticalAnalyzer()
+    first = analyzer._simulate_nonparametric_power(list(x), list(y), 0.8)
+    analyzer.rng = np.random.RandomState(analyzer.random_seed)
+    assert analyzer._simulate_nonparametric_power(list(x), list(y), 0.8) == first
+    assert 0.0 < first < 1.0
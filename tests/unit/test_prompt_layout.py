@@ -0,0 +1,111 @@
+"""
+Unit tests for the cache-friendly prompt layout of GHSpec per-task prompts.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.ghspec_adapter import TASK_PROMPT_FIELDS, GHSpecAdapter
+from src.adapters.prompt_layout import PromptLayout, split_template
+from src.utils.call_ledger import cache_hit_ratios
+
+TASK_TEMPLATE = """Implement this task:
+
+---
+TASK: {task_description}
+FILE: {file_path}
+
+CURRENT FILE CONTENT:
+```
+{current_file_content or "# new file"}
+
+```
+---
+
+**Instructions**:
+1. Implement the task goal
+
+**Output ONLY the complete final content of {file_path}**
+
+DO NOT include:
+- Explanations"""
+
+
+class TestSplitTemplate:
+    """Test separation of stable and per-call template blocks."""
+
+    def test_stable_blocks_move_first(self):
+        stable, variable = split_template(TASK_TEMPLATE, TASK_PROMPT_FIELDS)
+
+        assert stable == "**Instructions**:\n1. Implement the task goal\n\nDO NOT include:\n- Explanations"
+        # Labels stay with the block they introduce; fences are never split
+        assert variable.startswith("Implement this task:\n\n---\nTASK: {task_description}")
+        assert '{current_file_content or "# new file"}\n\n```\n---' in variable
+        assert variable.endswith("**Output ONLY the complete final content of {file_path}**")
+
+    def test_template_without_stable_blocks_is_unchanged(self):
+        template = "TASK: {task_description}\n\nCURRENT FILE CONTENT:"
+        assert split_template(template, TASK_PROMPT_FIELDS) == ("", template)
+
+
+def test_layout_keeps_prefix_identical():
+    layout = PromptLayout('implement', "system", ["", "previous code", "instructions"])
+    first, second = layout.user_prompt("task 1"), layout.user_prompt("task 2")
+
+    assert first == "previous code\n\ninstructions\n\ntask 1"
+    assert first[:-1] == second[:-1]
+    assert layout.prefix_key() == PromptLayout('implement', "system", ["", "previous code", "instructions"]).prefix_key()
+    assert layout.prefix_key() != PromptLayout('implement', "system", ["other code"]).prefix_key()
+
+
+def test_cache_hit_ratios_per_phase():
+    entries = [
+        {'phase': 'implement', 'prompt_tokens': 2000, 'cached_tokens': 0},
+        {'phase': 'implement', 'prompt_tokens': 2000, 'cached_tokens': 1536},
+        {'phase': 'plan', 'prompt_tokens': 500, 'cached_tokens': 0},
+        {'prompt_tokens': 100, 'cached_tokens': 0},
+    ]
+    ratios = cache_hit_ratios(entries)
+    assert ratios['implement'] == {'calls': 2, 'prompt_tokens': 4000, 'cached_tokens': 1536,
+                                   'cache_hit_ratio': pytest.approx(0.384)}
+    assert ratios['plan']['cache_hit_ratio'] == 0.0
+    assert set(ratios) == {'implement', 'plan'}
+
+
+def test_implementation_prompts_share_prefix(tmp_path):
+    (tmp_path / "spec.md").write_text("## Students\nStudent entity", encoding='utf-8')
+    (tmp_path / "plan.md").write_text("## Stack\nFastAPI", encoding='utf-8')
+    (tmp_path / "tasks.md").write_text("", encoding='utf-8')
+    adapter = GHSpecAdapter({'api_key_env': 'OPENAI_API_KEY_GHSPEC'}, 'test-run', str(tmp_path), sprint_num=2)
+    adapter.spec_md_path = tmp_path / "spec.md"
+    adapter.plan_md_path = tmp_path / "plan.md"
+    adapter.tasks_md_path = tmp_path / "tasks.md"
+    adapter.src_dir = tmp_path / "src"
+    adapter.constitution_excerpt = "Use type hints"
+    tasks = [
+        {'id': f"TASK-00{n}", 'file': f"models/m{n}.py", 'description': f"model {n}",
+         'goal': f"model {n}", 'label': str(n), 'depends_on': []}
+        for n in (1, 2)
+    ]
+    calls = []
+
+    def fake_call(system_prompt, user_prompt):
+        calls.append((adapter.current_phase, system_prompt, user_prompt))
+        return "code"
+
+    previous = {'code_files': "# previous sprint code", 'tech_stack': "FastAPI"}
+    with patch.object(GHSpecAdapter, '_load_prompt_template', return_value=("system", TASK_TEMPLATE)), \
+         patch.object(GHSpecAdapter, '_parse_tasks', return_value=tasks), \
+         patch.object(GHSpecAdapter, '_get_previous_sprint_context', return_value=previous) as context, \
+         patch.object(GHSpecAdapter, '_call_openai', side_effect=fake_call):
+        adapter._execute_task_implementation("Add models")
+
+    assert context.call_count == 1
+    (phase1, system1, user1), (phase2, system2, user2) = sorted(calls, key=lambda call: call[2])
+    assert phase1 == phase2 == 'implement'
+    assert system1 == system2 and "Use type hints" in system1
+    prefix = user1[:user1.index("Implement this task:")]
+    assert user2.startswith(prefix)
+    assert "# previous sprint code" in prefix and "**Instructions**" in prefix
+    assert "model 1" in user1[len(prefix):]
@@ -0,0 +1,100 @@
+"""
+Unit tests for the sort-based rank statistics kernel.
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from src.analysis.report_generator import (
+    _mann_whitney_u_test,
+    cliffs_delta as report_cliffs_delta,
+    kruskal_wallis_test
+)
+from src.utils.rank_statistics import (
+    cliffs_delta_ranked,
+    kruskal_wallis_h,
+    mann_whitney_p_value,
+    mann_whitney_u,
+    rank_rows
+)
+from src.utils.statistical_helpers import cliffs_delta
+
+
+def _pairwise_delta(x, y):
+    return float(np.sign(np.subtract.outer(x, y)).mean())
+
+
+@pytest.fixture
+def tied_samples():
+    rng = np.random.default_rng(11)
+    return [rng.integers(0, 4, size=n).astype(float) for n in (6, 5, 7)]
+
+
+class TestRanks:
+    """Test ranking with ties."""
+
+    def test_average_ranks_and_tie_term(self):
+        ranks, tie_term = rank_rows([3.0, 1.0, 3.0, 2.0, 3.0])
+        np.testing.assert_allclose(ranks, [4, 1, 4, 2, 4])
+        assert tie_term == 3 ** 3 - 3
+
+    def test_batched_rows_match_scipy(self):
+        values = np.random.default_rng(0).integers(0, 5, size=(50, 9))
+        ranks, _ = rank_rows(values)
+        np.testing.assert_allclose(ranks, stats.rankdata(values, axis=1))
+
+
+class TestStatistics:
+    """Test U, p-value, Cliff's delta and H against reference implementations."""
+
+    def test_mann_whitney_matches_scipy(self, tied_samples):
+        x, y, _ = tied_samples
+        u1, _ = mann_whitney_u(x, y)
+        reference = stats.mannwhitneyu(x, y, use_continuity=False, method='asymptotic')
+        assert u1 == reference.statistic
+        assert mann_whitney_p_value(x, y, use_continuity=False, method='asymptotic') == pytest.approx(reference.pvalue)
+
+    @pytest.mark.parametrize("sizes", [(5, 5), (3, 12), (8, 30), (9, 9), (12, 10)])
+    @pytest.mark.parametrize("tied", [False, True])
+    def test_mann_whitney_defaults_match_scipy(self, sizes, tied):
+        rng = np.random.default_rng(sum(sizes))
+        x, y = rng.normal(0, 1, size=(40, sizes[0])), rng.normal(0.7, 1, size=(40, sizes[1]))
+        if tied:
+            x, y = np.round(x), np.round(y)
+        expected = [stats.mannwhitneyu(x[i], y[i]).pvalue for i in range(40)]
+        np.testing.assert_allclose(mann_whitney_p_value(x, y), expected)
+        exact = [stats.mannwhitneyu(x[i], y[i], method='exact').pvalue for i in range(40)]
+        np.testing.assert_allclose(mann_whitney_p_value(x, y, method='exact'), exact)
+
+    def test_all_tied_p_value_is_one(self):
+        assert mann_whitney_p_value([1.0, 1.0], [1.0, 1.0, 1.0]) == 1.0
+
+    def test_cliffs_delta_matches_pairwise_count(self, tied_samples):
+        x, y, _ = tied_samples
+        assert cliffs_delta_ranked(x, y) == pytest.approx(_pairwise_delta(x, y))
+        assert cliffs_delta([1, 2, 3], [1, 2, 3]) == 0.0
+        assert cliffs_delta([4, 5], [1, 2]) == 1.0
+
+    def test_batched_cliffs_delta(self):
+        rng = np.random.default_rng(4)
+        x, y = rng.normal(size=(30, 8)), rng.normal(size=(30, 5))
+        expected = [_pairwise_delta(x[i], y[i]) for i in range(30)]
+        np.testing.assert_allclose(cliffs_delta_ranked(x, y), expected)
+
+    def test_kruskal_wallis_matches_scipy(self, tied_samples):
+        assert kruskal_wallis_h(tied_samples) == pytest.approx(stats.kruskal(*tied_samples).statistic)
+        assert kruskal_wallis_h([[2.0, 2.0], [2.0], [2.0, 2.0]]) == 0.0
+
+
+class TestReportGeneratorWrappers:
+    """Test the report generator entry points built on the kernel."""
+
+    def test_wrappers(self, tied_samples):
+        x, y, z = (list(sample) for sample in tied_samples)
+        assert report_cliffs_delta(x, y) == pytest.approx(_pairwise_delta(x, y))
+        assert report_cliffs_delta([], y) == 0.0
+        assert _mann_whitney_u_test(x, []) == 1.0
+        result = kruskal_wallis_test({'a': x, 'b': y, 'c': z})
+        assert result['H'] == pytest.approx(stats.kruskal(x, y, z).statistic)
+        assert result['n_total'] == len(x) + len(y) + len(z)
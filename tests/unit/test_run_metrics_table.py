@@ -0,0 +1,121 @@
+"""
+Unit tests for the columnar run metrics table and its incremental sidecar.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.utils import run_metrics_table
+from src.utils.run_metrics_table import (
+    RUN_METRICS_TABLE_FILENAME,
+    RunMetricsTable,
+    load_run_metrics_table,
+)
+
+
+def _write_run(runs_dir, framework, run_id, metrics):
+    run_dir = runs_dir / framework / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    path = run_dir / "metrics.json"
+    path.write_text(json.dumps(metrics))
+    return path
+
+
+def _metrics(tok_in, status="verified", durations=(1.5, 2.5)):
+    return {
+        'model': 'gpt-4o-mini',
+        'end_timestamp': '2025-01-01T01:00:00Z',
+        'aggregate_metrics': {'TOK_IN': tok_in, 'TOK_OUT': 10, 'label': 'n/a'},
+        'steps': [{'step_number': i + 1, 'duration_seconds': d} for i, d in enumerate(durations)],
+        'usage_api_reconciliation': {'verification_status': status, 'attempts': [{}, {}]},
+    }
+
+
+@pytest.fixture
+def runs_dir(tmp_path):
+    runs = tmp_path / "runs"
+    _write_run(runs, "baes", "run-1", _metrics(100))
+    _write_run(runs, "baes", "run-2", _metrics(300, status="pending", durations=(4.0,)))
+    _write_run(runs, "ghspec", "run-3", {'aggregate_metrics': {'TOK_IN': 50}})
+    return runs
+
+
+class TestColumns:
+    """Tests for the columns built from metrics.json files."""
+
+    def test_run_and_step_columns(self, runs_dir):
+        table = load_run_metrics_table(runs_dir, persist=False)
+
+        assert list(table['run_id']) == ["run-1", "run-2", "run-3"]
+        assert table.frameworks() == ["baes", "ghspec"]
+        assert list(table['reconciliation_status']) == ["verified", "pending", ""]
+        assert list(table['reconciliation_attempts']) == [2, 2, 0]
+        assert list(table.top_str('end_timestamp')) == ['2025-01-01T01:00:00Z'] * 2 + ['']
+        np.testing.assert_array_equal(table.aggregate('TOK_IN'), [100, 300, 50])
+        np.testing.assert_array_equal(table.aggregate('TOK_OUT', default=0), [10, 10, 0])
+        np.testing.assert_array_equal(table.step_sum('duration_seconds'), [4.0, 4.0, np.nan])
+
+    def test_aggregate_row_keeps_json_types(self, runs_dir):
+        table = load_run_metrics_table(runs_dir, persist=False)
+        assert table.aggregate_row(0) == {'TOK_IN': 100, 'TOK_OUT': 10, 'label': None}
+        assert table.aggregate_row(2) == {'TOK_IN': 50}
+        assert isinstance(table.aggregate_row(0)['TOK_IN'], int)
+
+    def test_where_keeps_steps_aligned(self, runs_dir):
+        table = load_run_metrics_table(runs_dir, persist=False)
+        pending = table.where(table['reconciliation_status'] == "pending")
+
+        assert list(pending['run_id']) == ["run-2"]
+        np.testing.assert_array_equal(pending.step('duration_seconds'), [4.0])
+        np.testing.assert_array_equal(pending.step_sum('duration_seconds'), [4.0])
+
+    def test_unreadable_file_is_skipped(self, runs_dir):
+        (runs_dir / "baes" / "run-2" / "metrics.json").write_text("{not json")
+        table = load_run_metrics_table(runs_dir, persist=False)
+        assert list(table['run_id']) == ["run-1", "run-3"]
+
+
+class TestSidecar:
+    """Tests for persistence and incremental updates."""
+
+    def test_round_trip(self, runs_dir, tmp_path):
+        table = load_run_metrics_table(runs_dir, persist=False)
+        table.save(tmp_path / "table.npz")
+        loaded = RunMetricsTable.load(tmp_path / "table.npz")
+
+        assert set(loaded.columns) == set(table.columns)
+        for name, values in table.columns.items():
+            np.testing.assert_array_equal(loaded[name], values)
+        np.testing.assert_array_equal(loaded.step('step_number'), table.step('step_number'))
+
+    def test_only_changed_files_are_reparsed(self, runs_dir):
+        load_run_metrics_table(runs_dir)
+        assert (runs_dir / RUN_METRICS_TABLE_FILENAME).exists()
+
+        changed = _write_run(runs_dir, "baes", "run-2", _metrics(999, durations=(1.0, 1.0, 1.0)))
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        _write_run(runs_dir, "chatdev", "run-4", _metrics(7))
+
+        parse = run_metrics_table._parse_metrics_file
+        with patch.object(run_metrics_table, '_parse_metrics_file', side_effect=parse) as spy:
+            table = load_run_metrics_table(runs_dir)
+
+        assert sorted(call.args[0].parent.name for call in spy.call_args_list) == ["run-2", "run-4"]
+        # Rows stay ordered by path: baes, chatdev, ghspec
+        assert list(table['run_id']) == ["run-1", "run-2", "run-4", "run-3"]
+        np.testing.assert_array_equal(table.aggregate('TOK_IN'), [100, 999, 7, 50])
+        np.testing.assert_array_equal(table.step_sum('duration_seconds'), [4.0, 3.0, 4.0, np.nan])
+        assert list(table['reconciliation_status']) == ["verified"] * 3 + [""]
+
+    def test_removed_runs_are_dropped(self, runs_dir):
+        load_run_metrics_table(runs_dir)
+        (runs_dir / "ghspec" / "run-3" / "metrics.json").unlink()
+
+        assert list(load_run_metrics_table(runs_dir)['run_id']) == ["run-1", "run-2"]
+        assert list(RunMetricsTable.load(runs_dir / RUN_METRICS_TABLE_FILENAME)['run_id']) == \
+            ["run-1", "run-2"]
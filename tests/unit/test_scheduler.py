@@ -0,0 +1,178 @@
+"""
+Unit tests for the concurrent RunScheduler.
+
+Uses a thread pool and a fake run job so no framework is actually executed.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.orchestrator.scheduler import RunScheduler, PORT_STRIDE
+
+
+@pytest.fixture
+def config():
+    """Minimal configuration with framework ports."""
+    return {
+        'frameworks': {
+            'baes': {'api_port': 8100, 'ui_port': 8600},
+            'chatdev': {'api_port': 8200, 'ui_port': 8700},
+        }
+    }
+
+
+def _metrics(value):
+    keys = ['AUTR', 'TOK_IN', 'T_WALL', 'CRUDe', 'ESR', 'MC']
+    return {'aggregate_metrics': {key: value for key in keys}}
+
+
+def _environment_job(framework, config_path, experiment_name, port_offset):
+    """Run job that reports and then pollutes its worker's environment."""
+    leaked = os.environ.get('SCHEDULER_TEST_LEAK')
+    os.environ['SCHEDULER_TEST_LEAK'] = framework
+    return {'status': 'success', 'run_id': None, 'metrics': _metrics(100.0),
+            'leaked': leaked, 'pid': os.getpid()}
+
+
+class FakeJob:
+    """Records job invocations and returns constant successful metrics."""
+
+    def __init__(self, fail_framework=None):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.active_offsets = set()
+        self.offset_collision = False
+        self.fail_framework = fail_framework
+
+    def __call__(self, framework, config_path, experiment_name, port_offset):
+        with self.lock:
+            self.calls.append((framework, port_offset))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            if port_offset in self.active_offsets:
+                self.offset_collision = True
+            self.active_offsets.add(port_offset)
+        try:
+            if framework == self.fail_framework:
+                return {'status': 'failed', 'run_id': None, 'error': 'boom'}
+            return {'status': 'success', 'run_id': f"{framework}-{len(self.calls)}",
+                    'metrics': _metrics(100.0)}
+        finally:
+            with self.lock:
+                self.active -= 1
+                self.active_offsets.discard(port_offset)
+
+
+def test_stops_each_framework_at_convergence(config):
+    """Constant metrics converge as soon as min_runs successes are in."""
+    job = FakeJob()
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=2,
+                             job_fn=job, executor_cls=ThreadPoolExecutor)
+
+    state = scheduler.run(['baes', 'chatdev'])
+
+    for framework in ('baes', 'chatdev'):
+        assert state[framework]['convergence']['should_stop'] is True
+        # At most (max_workers - 1) extra runs may already be in flight
+        assert 5 <= state[framework]['run_count'] <= 6
+        assert len(state[framework]['runs']) == state[framework]['run_count']
+        assert len(state[framework]['metrics']) == state[framework]['run_count']
+
+
+def test_port_offsets_are_distinct_slots(config):
+    """Concurrent runs never share a port slot."""
+    job = FakeJob()
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=3,
+                             job_fn=job, executor_cls=ThreadPoolExecutor)
+
+    scheduler.run(['baes', 'chatdev'])
+
+    assert not job.offset_collision
+    assert job.max_active <= 3
+    assert {offset for _, offset in job.calls} <= {0, PORT_STRIDE, 2 * PORT_STRIDE}
+
+
+def test_failed_framework_runs_until_max_runs(config):
+    """Failures never trigger convergence, so max_runs bounds the framework."""
+    job = FakeJob(fail_framework='chatdev')
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=2, max_runs=7,
+                             job_fn=job, executor_cls=ThreadPoolExecutor)
+
+    state = scheduler.run(['baes', 'chatdev'])
+
+    assert state['chatdev']['run_count'] == 7
+    assert state['chatdev']['metrics'] == []
+    assert state['chatdev']['convergence'] is None
+
+
+def test_worker_exception_recorded_as_failed_run(config):
+    """An exception escaping the job is recorded instead of aborting the pool."""
+    def crashing_job(framework, config_path, experiment_name, port_offset):
+        raise RuntimeError("worker died")
+
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=2, max_runs=2,
+                             job_fn=crashing_job, executor_cls=ThreadPoolExecutor)
+
+    state = scheduler.run(['baes'])
+
+    assert state['baes']['run_count'] == 2
+    assert all(run['status'] == 'failed' for run in state['baes']['runs'])
+    assert state['baes']['runs'][0]['error'] == "worker died"
+
+
+def test_rejects_invalid_max_workers(config):
+    """max_workers must be positive and fit in the port range."""
+    with pytest.raises(ValueError):
+        RunScheduler(config, 'config.yaml', max_workers=0)
+    with pytest.raises(ValueError):
+        RunScheduler(config, 'config.yaml', max_workers=100)
+
+
+def test_process_workers_are_not_reused(config):
+    """Each run gets a fresh process, so environment changes do not leak."""
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=1, max_runs=3, min_runs=10,
+                             job_fn=_environment_job)
+
+    state = scheduler.run(['baes'])
+
+    runs = state['baes']['runs']
+    assert [run['leaked'] for run in runs] == [None, None, None]
+    assert len({run['pid'] for run in runs}) == 3
+
+
+def test_bootstrap_check_uses_configured_stopping_rule(config, monkeypatch):
+    """The concurrent path passes the same threshold and metrics as serial runs."""
+    calls = []
+
+    def fake_check(metrics_history, framework, **kwargs):
+        calls.append(kwargs)
+        return {'should_stop': True, 'reason': 'converged', 'runs_completed': len(metrics_history),
+                'convergence_details': {}}
+
+    monkeypatch.setattr('src.orchestrator.scheduler.check_convergence', fake_check)
+    rule = {'max_half_width_pct': 5, 'metrics': ['AUTR']}
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=2, min_runs=1,
+                             job_fn=FakeJob(), executor_cls=ThreadPoolExecutor,
+                             stopping_rule=rule)
+
+    scheduler.run(['baes'])
+
+    assert calls
+    assert all(call['half_width_threshold'] == 0.05 for call in calls)
+    assert all(call['convergence_metrics'] == ['AUTR'] for call in calls)
+
+
+def test_config_validates_max_workers(config):
+    """scheduler.max_workers must be a positive int within the port slots."""
+    from src.orchestrator.config_loader import ConfigValidationError, validate_scheduler
+
+    validate_scheduler({'max_workers': 3}, config['frameworks'])
+    validate_scheduler({}, config['frameworks'])
+    for bad in (0, -1, 2.0, True, 'four', 100):
+        with pytest.raises(ConfigValidationError, match="max_workers"):
+            validate_scheduler({'max_workers': bad}, config['frameworks'])
@@ -0,0 +1,171 @@
+"""
+Unit tests for the sequential stopping engine (Welford statistics and
+alpha-spending comparisons).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.analysis.stopping_rule import (
+    RunningStats,
+    SequentialStoppingEngine,
+    alpha_spent,
+    get_convergence_summary,
+)
+from src.orchestrator.config_loader import ConfigValidationError, validate_stopping_rule
+from src.orchestrator.runner import OrchestratorRunner
+from src.orchestrator.scheduler import RunScheduler
+
+
+def _engine(**overrides):
+    settings = dict(frameworks=['baes', 'chatdev'], metrics=['TOK_IN'], min_runs=5, max_runs=50)
+    settings.update(overrides)
+    return SequentialStoppingEngine(**settings)
+
+
+def test_running_stats_match_numpy():
+    values = np.random.default_rng(1).normal(50, 7, size=40)
+    running = RunningStats()
+    for value in values:
+        running.update(value)
+    assert running.n == 40
+    assert running.mean == pytest.approx(values.mean())
+    assert running.variance == pytest.approx(values.var(ddof=1))
+
+
+@pytest.mark.parametrize("spending", ["obrien_fleming", "pocock"])
+def test_alpha_spending_is_monotone_and_total_is_alpha(spending):
+    spent = [alpha_spent(t, 0.05, spending) for t in np.linspace(0, 1, 11)]
+    assert spent[0] == 0.0
+    assert all(a <= b for a, b in zip(spent, spent[1:]))
+    assert spent[-1] == pytest.approx(0.05)
+    # O'Brien-Fleming spends less early than Pocock
+    assert alpha_spent(0.2, 0.05, 'obrien_fleming') < alpha_spent(0.2, 0.05, 'pocock')
+
+
+def test_conclusive_comparison_stops_noisy_frameworks():
+    rng = np.random.default_rng(2)
+    engine = _engine(alpha_spending='pocock')
+    for n in range(1, 51):
+        engine.record('baes', {'TOK_IN': rng.normal(1000, 400)})
+        engine.record('chatdev', {'TOK_IN': rng.normal(3000, 1200)})
+        result = engine.check('baes')
+        if result['should_stop']:
+            break
+
+    # CV of 40% never meets the 10% precision rule within 50 runs
+    assert result['reason'].startswith('All comparisons conclusive')
+    assert n < 50
+    assert result['comparisons'][0]['conclusive']
+    assert engine.check('chatdev')['should_stop']
+    assert "Comparisons:" in get_convergence_summary(result)
+
+
+def test_equal_frameworks_estimate_remaining_runs():
+    rng = np.random.default_rng(3)
+    engine = _engine()
+    for _ in range(6):
+        engine.record('baes', {'TOK_IN': rng.normal(1000, 300)})
+        engine.record('chatdev', {'TOK_IN': rng.normal(1000, 300)})
+    result = engine.check('baes')
+
+    assert not result['should_stop']
+    assert 0 < result['remaining_runs_estimate'] <= 44
+    assert 'more runs estimated' in result['reason']
+
+
+def test_precise_framework_converges_and_max_runs_bounds():
+    engine = _engine(frameworks=['baes'], max_runs=6)
+    for k in range(5):
+        engine.record('baes', {'TOK_IN': 1000 + k})
+    assert engine.check('baes')['reason'].startswith('Convergence achieved')
+
+    noisy = _engine(frameworks=['baes'], max_runs=6)
+    for value in (1, 100, 5, 300, 2, 250):
+        noisy.record('baes', {'TOK_IN': value})
+    assert noisy.check('baes')['reason'].startswith('Maximum runs reached')
+
+
+def test_false_conclusions_stay_below_alpha():
+    rng = np.random.default_rng(4)
+    false_stops = 0
+    for _ in range(200):
+        engine = _engine(max_runs=20)
+        for _ in range(20):
+            engine.record('baes', {'TOK_IN': rng.normal(100, 10)})
+            engine.record('chatdev', {'TOK_IN': rng.normal(100, 10)})
+        false_stops += any(c['conclusive'] for c in engine.comparisons.values())
+    assert false_stops / 200 <= 0.08
+
+
+def test_scheduler_stops_frameworks_with_conclusive_comparisons():
+    config = {'frameworks': {'baes': {'api_port': 8100, 'ui_port': 8600},
+                             'chatdev': {'api_port': 8200, 'ui_port': 8700}}}
+    rng = np.random.default_rng(5)
+    lock = threading.Lock()
+
+    def job(framework, config_path, experiment_name, port_offset):
+        with lock:
+            value = rng.normal(1000 if framework == 'baes' else 4000, 500)
+        return {'status': 'success', 'run_id': framework,
+                'metrics': {'aggregate_metrics': {'TOK_IN': value}}}
+
+    engine = _engine(alpha_spending='pocock')
+    scheduler = RunScheduler(config, 'config.yaml', max_workers=2, max_runs=50,
+                             job_fn=job, executor_cls=ThreadPoolExecutor, stopping_engine=engine)
+    state = scheduler.run(['baes', 'chatdev'])
+
+    for framework in ('baes', 'chatdev'):
+        assert state[framework]['convergence']['should_stop']
+        assert state[framework]['run_count'] < 50
+
+
+def test_config_rejects_unknown_method():
+    rule = {'min_runs': 5, 'max_runs': 50, 'confidence_level': 0.95,
+            'max_half_width_pct': 10, 'metrics': ['TOK_IN']}
+    validate_stopping_rule(rule)
+    with pytest.raises(ConfigValidationError, match="method"):
+        validate_stopping_rule({**rule, 'method': 'fixed'})
+    with pytest.raises(ConfigValidationError, match="alpha_spending"):
+        validate_stopping_rule({**rule, 'alpha_spending': 'linear'})
+    with pytest.raises(ConfigValidationError, match="alpha"):
+        validate_stopping_rule({**rule, 'alpha': '0.05'})
+
+
+def test_serial_runs_take_turns_across_frameworks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(3)
+    order = []
+
+    def execute_single_run(runner):
+        order.append(runner.framework_name)
+        value = rng.normal(1000 if runner.framework_name == 'baes' else 4000, 50)
+        return {'status': 'success', 'metrics': {'aggregate_metrics': {'TOK_IN': value}}}
+
+    monkeypatch.setattr(OrchestratorRunner, 'execute_single_run', execute_single_run)
+    runner = OrchestratorRunner('baes', 'config.yaml')
+    runner.config = {
+        'frameworks': {'baes': {}, 'chatdev': {}},
+        'stopping_rule': {'min_runs': 3, 'max_runs': 10, 'confidence_level': 0.95,
+                          'max_half_width_pct': 0.01, 'metrics': ['TOK_IN'], 'method': 'sequential'},
+    }
+    results = runner.execute_multi_framework(max_workers=1)
+
+    assert order[:6] == ['baes', 'chatdev'] * 3
+    for framework in ('baes', 'chatdev'):
+        assert results['frameworks'][framework]['convergence']['should_stop']
+        assert results['frameworks'][framework]['n_successful'] < 10
+
+
+def test_config_loader_does_not_import_numerical_stack():
+    """Validating stopping_rule names must not pull in NumPy/SciPy."""
+    import subprocess
+    import sys
+
+    code = ("import sys, src.orchestrator.config_loader; "
+            "print('src.analysis.stopping_rule' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
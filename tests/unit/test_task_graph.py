@@ -0,0 +1,174 @@
+"""
+Unit tests for dependency-aware parallel task execution (GHSpec Phase 4).
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.adapters.ghspec_adapter import GHSpecAdapter
+from src.adapters.task_graph import (
+    build_task_dependencies,
+    extract_task_references,
+    normalize_task_label,
+    run_task_graph
+)
+
+
+def _task(n, file, depends_on=None, label=None):
+    return {'id': f"TASK-{n:03d}", 'file': file, 'description': f"task {n}",
+            'goal': f"task {n}", 'label': label, 'depends_on': depends_on or []}
+
+
+class TestTaskDependencies:
+    """Test DAG construction from parsed tasks."""
+
+    def test_labels_normalize(self):
+        assert normalize_task_label("TASK-007") == "7"
+        assert normalize_task_label("001") == "1"
+        assert normalize_task_label("Task 1.2") == "1.2"
+        assert extract_task_references("Task 2 and TASK-004, T5") == ["2", "4", "5"]
+
+    def test_same_file_tasks_are_chained(self):
+        tasks = [_task(1, "models/a.py"), _task(2, "api/b.py"),
+                 _task(3, "/models/a.py"), _task(4, "models/a.py")]
+        assert build_task_dependencies(tasks) == [set(), set(), {0}, {2}]
+
+    def test_explicit_references_use_author_labels(self):
+        tasks = [_task(1, "a.py", label="1.1"), _task(2, "b.py", label="1.2"),
+                 _task(3, "c.py", depends_on=["1.2", "9"]),
+                 _task(4, "d.py", depends_on=["TASK-001"])]
+        assert build_task_dependencies(tasks) == [set(), set(), {1}, {0}]
+
+    def test_forward_references_ignored(self):
+        tasks = [_task(1, "a.py", depends_on=["2"]), _task(2, "b.py")]
+        assert build_task_dependencies(tasks) == [set(), set()]
+
+
+class TestRunTaskGraph:
+    """Test the scheduler's ordering and concurrency guarantees."""
+
+    def test_commits_in_task_order_with_parallelism(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def run(n):
+            with lock:
+                active.append(n)
+                peak.append(len(active))
+            time.sleep(0.05 * (5 - n))  # later tasks finish first
+            with lock:
+                active.remove(n)
+            return n * 10
+
+        committed = []
+        run_task_graph([0, 1, 2, 3, 4], [set()] * 5, run,
+                       lambda task, result: committed.append((task, result)),
+                       max_workers=3)
+
+        assert committed == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+        assert max(peak) == 3
+
+    def test_dependency_waits_for_commit(self):
+        committed = []
+
+        def run(n):
+            # Task 2 depends on task 0 and must see its commit
+            if n == 2:
+                assert 0 in committed
+            return n
+
+        run_task_graph([0, 1, 2], [set(), set(), {0}], run,
+                       lambda task, result: committed.append(task), max_workers=3)
+        assert committed == [0, 1, 2]
+
+    def test_earliest_failure_raised_after_committing_prefix(self):
+        committed = []
+
+        def run(n):
+            if n in (2, 3):
+                time.sleep(0.05 if n == 2 else 0)
+                raise RuntimeError(f"task {n} failed")
+            return n
+
+        with pytest.raises(RuntimeError, match="task 2 failed"):
+            run_task_graph([0, 1, 2, 3, 4], [set()] * 5, run,
+                           lambda task, result: committed.append(task), max_workers=4)
+        assert committed == [0, 1]
+
+
+class TestGHSpecParallelImplementation:
+    """Test Phase 4 integration in GHSpecAdapter."""
+
+    @pytest.fixture
+    def adapter(self, tmp_path):
+        feature_dir = tmp_path / "specs" / "001-feature"
+        feature_dir.mkdir(parents=True)
+        (feature_dir / "spec.md").write_text("## Students\nStudent entity", encoding='utf-8')
+        (feature_dir / "plan.md").write_text("## Stack\nFastAPI", encoding='utf-8')
+        (feature_dir / "tasks.md").write_text("""
+# Tasks
+
+- [ ] **Task 1**: Create student model
+  - **File**: `models/student.py`
+- [ ] **Task 2**: Create course model
+  - **File**: `models/course.py`
+- [ ] **Task 3**: Add student routes
+  - **File**: `api/students.py`
+  - **Depends on**: Task 1
+- [ ] **Task 4**: Extend student model
+  - **File**: `models/student.py`
+""", encoding='utf-8')
+
+        adapter = GHSpecAdapter({'api_key_env': 'OPENAI_API_KEY_GHSPEC',
+                                 'task_concurrency': 3},
+                                'test-run', str(tmp_path))
+        adapter.spec_md_path = feature_dir / "spec.md"
+        adapter.plan_md_path = feature_dir / "plan.md"
+        adapter.tasks_md_path = feature_dir / "tasks.md"
+        adapter.src_dir = tmp_path / "src"
+        adapter.constitution_excerpt = "Use type hints"
+        return adapter
+
+    def test_parse_tasks_captures_dependencies(self, adapter):
+        tasks = adapter._parse_tasks()
+        assert [t['label'] for t in tasks] == ["1", "2", "3", "4"]
+        assert tasks[2]['depends_on'] == ["1"]
+        assert build_task_dependencies(tasks) == [set(), set(), {0}, {0}]
+
+    def test_files_match_serial_execution(self, adapter):
+        def fake_call(system_prompt, user_prompt):
+            # Same-file task sees the previous version of its file
+            if "Extend student model" in user_prompt:
+                assert "v1 student" in user_prompt
+                return "v2 student"
+            if "Create student model" in user_prompt:
+                time.sleep(0.05)
+                return "v1 student"
+            return "code"
+
+        with patch.object(GHSpecAdapter, '_load_prompt_template',
+                          return_value=("system", "{task_description}\n{current_file_content}")), \
+             patch.object(GHSpecAdapter, '_call_openai', side_effect=fake_call):
+            adapter._execute_task_implementation("Add students")
+
+        src = Path(adapter.src_dir)
+        assert (src / "models/student.py").read_text() == "v2 student"
+        assert (src / "models/course.py").read_text() == "code"
+        assert (src / "api/students.py").read_text() == "code"
+
+
+@pytest.mark.parametrize("key", ['task_concurrency', 'excerpt_budget_tokens', 'previous_code_budget_tokens'])
+def test_config_rejects_invalid_ghspec_tuning(key):
+    from src.orchestrator.config_loader import ConfigValidationError, validate_framework_config
+
+    fw_config = {'repo_url': 'x', 'commit_hash': 'y', 'api_port': 8300, 'ui_port': 8800,
+                 'api_key_env': 'OPENAI_API_KEY_GHSPEC'}
+    validate_framework_config('ghspec', dict(fw_config, **{key: 2}))
+    for bad in (0, -1, "4", 2.5, True):
+        with pytest.raises(ConfigValidationError, match=key):
+            validate_framework_config('ghspec', dict(fw_config, **{key: bad}))
@@ -0,0 +1,125 @@
+"""
+Unit tests for batched, cached Usage API reconciliation.
+"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.orchestrator.usage_cache import UsageBucketCache, merge_windows
+from src.orchestrator.usage_reconciler import BUFFER_SECONDS, UsageReconciler
+
+# A fixed minute-aligned base time well in the past (all buckets settled)
+BASE = 1_700_000_040
+
+
+class FakeUsageClient:
+    """Serves minute buckets (one result of 10 tokens in / 1 out per minute) in pages."""
+
+    def __init__(self, page_size=3):
+        self.page_size = page_size
+        self.calls = []
+
+    def request(self, method, path, api_key, params=None, timeout=None):
+        self.calls.append(dict(params))
+        minutes = list(range(params['start_time'], params['end_time'], 60))
+        offset = int(params.get('page', 0))
+        page = minutes[offset:offset + self.page_size]
+        more = offset + self.page_size < len(minutes)
+        return {
+            'data': [
+                {'start_time': m, 'end_time': m + 60,
+                 'results': [{'input_tokens': 10, 'output_tokens': 1,
+                              'num_model_requests': 1, 'input_cached_tokens': 2}]}
+                for m in page
+            ],
+            'has_more': more,
+            'next_page': str(offset + self.page_size) if more else None
+        }
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _write_run(runs_dir, framework, run_id, start, end):
+    run_dir = runs_dir / framework / run_id
+    run_dir.mkdir(parents=True)
+    metrics = {
+        'start_timestamp': _iso(start),
+        'end_timestamp': _iso(end),
+        'steps': [{'start_timestamp': start, 'end_timestamp': end}],
+        'aggregate_metrics': {'AUTR': 1.0}
+    }
+    (run_dir / "metrics.json").write_text(json.dumps(metrics))
+    return {'run_id': run_id, 'framework': framework, 'start_time': _iso(start)}
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY_USAGE_TRACKING', 'sk-admin')
+    monkeypatch.setenv('OPENAI_API_KEY_BAES_ID', 'key_baes')
+    monkeypatch.setenv('OPENAI_API_KEY_GHSPEC_ID', 'key_ghspec')
+
+
+def test_merge_windows_aligns_and_merges():
+    assert merge_windows([(130, 200), (0, 61), (250, 300), (1000, 1000)]) == [(0, 300)]
+    assert merge_windows([(0, 60), (600, 610)]) == [(0, 60), (600, 660)]
+
+
+def test_cache_only_refetches_unsettled_minutes(tmp_path):
+    cache = UsageBucketCache(tmp_path)
+    # First minute fetched long after it ended (settled), second just after
+    cache.store("k", BASE, BASE + 60, {BASE: (1, 1, 1, 0)}, fetched_at=BASE + 7200)
+    cache.store("k", BASE + 60, BASE + 120, {}, fetched_at=BASE + 130)
+
+    assert cache.stale_ranges("k", [(BASE, BASE + 180)], fresh_since=BASE + 8000,
+                              settle_seconds=3600) == [(BASE + 60, BASE + 180)]
+    # Unsettled buckets fetched in the current sweep are reused
+    assert cache.stale_ranges("k", [(BASE, BASE + 120)], fresh_since=BASE + 100,
+                              settle_seconds=3600) == []
+
+    # Persisted across instances
+    assert UsageBucketCache(tmp_path).totals("k", BASE, BASE + 120) == (1, 1, 1, 0)
+
+
+def test_reconcile_all_pending_batches_per_key(tmp_path, monkeypatch, env):
+    monkeypatch.chdir(tmp_path)
+    runs_dir = tmp_path / "runs"
+    now = datetime.now(timezone.utc).timestamp()
+    start = int(now) // 60 * 60 - 3 * 3600
+
+    runs = [
+        _write_run(runs_dir, "baes", "run-1", start, start + 600),
+        _write_run(runs_dir, "baes", "run-2", start + 300, start + 900),
+        _write_run(runs_dir, "ghspec", "run-3", start, start + 600),
+    ]
+    (runs_dir / "manifest.json").write_text(json.dumps({'runs': runs}))
+
+    client = FakeUsageClient(page_size=10)
+    reconciler = UsageReconciler(runs_dir=runs_dir)
+    with patch('src.orchestrator.usage_reconciler.get_openai_client', return_value=client), \
+         patch('src.orchestrator.manifest_manager.update_manifest'), \
+         patch.object(UsageReconciler, '_trigger_analysis'):
+        reports = reconciler.reconcile_all_pending(max_age_hours=24)
+
+        # One merged window per key id, fetched across several pages
+        first_pages = [c for c in client.calls if 'page' not in c]
+        assert sorted(c['api_key_ids'][0] for c in first_pages) == ['key_baes', 'key_ghspec']
+        baes_call = next(c for c in first_pages if c['api_key_ids'] == ['key_baes'])
+        assert baes_call['start_time'] == start - BUFFER_SECONDS
+        assert baes_call['end_time'] == start + 900 + BUFFER_SECONDS
+        assert len(client.calls) > 2
+
+        # Each run's totals are sliced from its own window
+        by_run = {r['run_id']: r for r in reports}
+        assert by_run['run-1']['total_tokens_in'] == 10 * (600 + 2 * BUFFER_SECONDS) // 60
+        assert by_run['run-2']['total_tokens_in'] == 10 * (600 + 2 * BUFFER_SECONDS) // 60
+        assert by_run['run-3']['total_tokens_in'] == by_run['run-1']['total_tokens_in']
+
+        # Second pass: all minutes settled, nothing refetched
+        client.calls.clear()
+        reconciler.reconcile_all_pending(max_age_hours=24)
+        assert client.calls == []
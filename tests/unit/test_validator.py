@@ -0,0 +1,198 @@
+"""
+Unit tests for the Validator against a local in-process HTTP API.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.orchestrator.validator import LOAD_PROBE_METRICS, Validator, latency_summary, percentile
+from src.utils.metrics_config import MetricsConfig
+
+
+class CrudHandler(BaseHTTPRequestHandler):
+    """Minimal students/courses/teachers API with an artificial delay."""
+
+    delay = 0.0
+    unique_field = None  # Reject creates that repeat this field's value (409)
+    items = {}
+    lock = threading.Lock()
+    next_id = [1]
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _route(self):
+        time.sleep(self.delay)
+        parts = [part for part in self.path.split("/") if part]
+        if not parts:
+            return None, None
+        return parts[0], int(parts[1]) if len(parts) > 1 else None
+
+    def do_GET(self):
+        entity, item_id = self._route()
+        if entity is None:
+            return self._reply(200, {"status": "ok"})
+        with self.lock:
+            if item_id is None:
+                return self._reply(200, [v for (e, _), v in self.items.items() if e == entity])
+            item = self.items.get((entity, item_id))
+        self._reply(200, item) if item else self._reply(404)
+
+    def do_POST(self):
+        entity, _ = self._route()
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            if self.unique_field and any(
+                e == entity and v.get(self.unique_field) == body.get(self.unique_field)
+                for (e, _), v in self.items.items()
+            ) and self.unique_field in body:
+                return self._reply(409)
+            item_id = self.next_id[0]
+            self.next_id[0] += 1
+            self.items[(entity, item_id)] = {**body, "id": item_id}
+        self._reply(201, {**body, "id": item_id})
+
+    def do_PATCH(self):
+        entity, item_id = self._route()
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            self.items[(entity, item_id)].update(body)
+        self._reply(200, self.items[(entity, item_id)])
+
+    def do_DELETE(self):
+        entity, item_id = self._route()
+        with self.lock:
+            self.items.pop((entity, item_id), None)
+        self._reply(204)
+
+
+@pytest.fixture
+def api_server():
+    CrudHandler.items = {}
+    CrudHandler.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CrudHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestLatencySummary:
+    """Tests for percentile helpers."""
+
+    def test_nearest_rank_percentiles(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([7.0], 99) == 7.0
+
+    def test_empty_summary(self):
+        assert latency_summary([]) == {}
+
+
+class TestCrudValidation:
+    """Tests for concurrent CRUD chains."""
+
+    def test_all_operations_succeed(self, api_server):
+        validator = Validator(api_server, api_server, "run-1")
+        try:
+            assert validator.test_crud_endpoints() == (12, 1.0)
+            latencies = validator.latency_metrics()
+        finally:
+            validator.close()
+
+        assert set(latencies) == {
+            f"{method} /{entity}{suffix}"
+            for entity in ("students", "courses", "teachers")
+            for method, suffix in (("POST", ""), ("GET", "/{id}"), ("PATCH", "/{id}"), ("DELETE", "/{id}"))
+        }
+        assert all(summary['count'] == 1 and summary['p50_ms'] >= 0 for summary in latencies.values())
+        assert CrudHandler.items == {}
+
+    def test_entity_chains_run_concurrently(self, api_server):
+        CrudHandler.delay = 0.1
+        validator = Validator(api_server, api_server, "run-1")
+        started = time.monotonic()
+        try:
+            assert validator.test_crud_endpoints() == (12, 1.0)
+        finally:
+            validator.close()
+        # Sequential: 12 x 0.1s; concurrent: one chain of 4 requests
+        assert time.monotonic() - started < 0.9
+
+    def test_deadline_bounds_validation(self, api_server):
+        CrudHandler.delay = 0.3
+        validator = Validator(api_server, api_server, "run-1", validation_deadline=0.5)
+        started = time.monotonic()
+        try:
+            crude_score, esr = validator.test_crud_endpoints()
+        finally:
+            validator.close()
+        assert crude_score < 12 and esr < 1.0
+        assert time.monotonic() - started < 1.2
+
+    def test_unreachable_api_scores_zero(self):
+        validator = Validator("http://127.0.0.1:9", "http://127.0.0.1:9", "run-1", request_timeout=1)
+        try:
+            assert validator.test_crud_endpoints() == (0, 0.0)
+            assert validator.health_check() is False
+        finally:
+            validator.close()
+
+
+class TestLoadProbe:
+    """Tests for the load probe stage."""
+
+    def test_probe_reports_latency_throughput_and_errors(self, api_server):
+        validator = Validator(api_server, api_server, "run-1")
+        try:
+            metrics = validator.run_load_probe(concurrency=4, duration_seconds=0.5)
+        finally:
+            validator.close()
+
+        assert set(metrics) == set(LOAD_PROBE_METRICS)
+        assert metrics['LOAD_ERROR_RATE'] == 0.0
+        assert metrics['LOAD_RPS'] > 0
+        assert 0 < metrics['LOAD_P50_MS'] <= metrics['LOAD_P95_MS'] <= metrics['LOAD_P99_MS']
+        # Every created record was deleted again
+        assert CrudHandler.items == {}
+
+    def test_probe_against_unreachable_api(self):
+        validator = Validator("http://127.0.0.1:9", "http://127.0.0.1:9", "run-1")
+        try:
+            metrics = validator.run_load_probe(concurrency=2, duration_seconds=0.2)
+        finally:
+            validator.close()
+        # Failed requests never count as latency or throughput
+        assert metrics == {'LOAD_ERROR_RATE': 1.0}
+
+    def test_probe_creates_unique_records(self, api_server):
+        CrudHandler.unique_field = 'email'
+        validator = Validator(api_server, api_server, "run-1")
+        try:
+            metrics = validator.run_load_probe(concurrency=4, duration_seconds=0.3)
+        finally:
+            CrudHandler.unique_field = None
+            validator.close()
+        assert metrics['LOAD_ERROR_RATE'] == 0.0
+
+    def test_metrics_declared_in_default_config(self):
+        template = Path(__file__).parents[2] / "config_sets" / "default" / "experiment_template.yaml"
+        declared = MetricsConfig(template).get_all_metrics()
+        assert set(LOAD_PROBE_METRICS) <= set(declared)
+        assert declared['LOAD_RPS'].ideal_direction == 'maximize'